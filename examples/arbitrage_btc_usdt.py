@@ -24,6 +24,7 @@ import asyncio
 import os
 import logging
 from collections import deque
+from contextvars import ContextVar
 from decimal import Decimal
 from datetime import datetime, timedelta
 from typing import Optional
@@ -78,6 +79,36 @@ else:
     logger = console_logger
 
 
+class OrderLatencyHook:
+    """下单耗时分解：SDK 在执行下单的线程里调用 on_latency，交给发起该次下单的调用方"""
+
+    def __init__(self):
+        self._spans: ContextVar[Optional[dict]] = ContextVar("order_spans", default=None)
+
+    def on_request(self, method, url, headers):
+        pass
+
+    def on_response(self, method, url, status_code, duration_ms):
+        pass
+
+    def on_latency(self, operation: str, spans_ms: dict) -> None:
+        spans = self._spans.get()
+        if spans is not None and operation == "submit_order":
+            spans.update(spans_ms)
+
+    def submit_order(self, api_client, order: Order) -> tuple[dict, dict]:
+        """同步下单，返回 (结果, 本次下单的各阶段耗时 ms)"""
+        spans: dict = {}
+        token = self._spans.set(spans)
+        try:
+            return api_client.submit_order(order=order), spans
+        finally:
+            self._spans.reset(token)
+
+
+ORDER_LATENCY = OrderLatencyHook()
+
+
 # ============================================================
 # 停止程序辅助函数
 # ============================================================
@@ -1279,30 +1310,17 @@ class ArbitrageBot:
         return await asyncio.to_thread(paradex.api_client.submit_order, order=order)
 
     async def _submit_order_detailed(self, paradex: Paradex, order: Order) -> dict:
-        """提交订单（详细分解耗时）"""
-        import time as time_module
-
-        t_start = time_module.time()
-
-        # 1. 序列化
-        t_serialize_start = time_module.time()
-        order_data = order.dump_to_dict()
-        t_serialize = (time_module.time() - t_serialize_start) * 1000
+        """提交订单（详细分解耗时，由 SDK 的 latency 统计提供）"""
+        # 在线程池中执行同步的 submit_order；耗时来自这次下单自己的 on_latency 回调
+        result, spans = await asyncio.to_thread(ORDER_LATENCY.submit_order, paradex.api_client, order)
 
-        # 2. 签名
-        t_sign_start = time_module.time()
-        signature = paradex.account.sign_order(order)
-        order_data["signature"] = signature  # 把签名添加到 payload
-        t_sign = (time_module.time() - t_sign_start) * 1000
-
-        # 3. HTTP POST（使用线程池执行同步 HTTP 请求）
-        t_http_start = time_module.time()
-        result = await asyncio.to_thread(paradex.api_client._post_authorized, path="orders", payload=order_data)
-        t_http = (time_module.time() - t_http_start) * 1000
-
-        t_total = (time_module.time() - t_start) * 1000
-
-        logger.info(f"  📊 {str(paradex.account.l2_address)[:8]}... 序列化:{t_serialize:.0f}ms | 签名:{t_sign:.0f}ms | HTTP:{t_http:.0f}ms | 总:{t_total:.0f}ms")
+        sign_ms = spans.get("hash", 0) + spans.get("sign", 0)
+        http_ms = sum(spans.get(stage, 0) for stage in ("encode", "send", "server", "decode"))
+        logger.info(
+            f"  📊 {str(paradex.account.l2_address)[:8]}... 序列化:{spans.get('payload', 0):.0f}ms | "
+            f"签名:{sign_ms:.0f}ms | 认证:{spans.get('auth', 0):.0f}ms | HTTP:{http_ms:.0f}ms "
+            f"(服务端:{spans.get('server', 0):.0f}ms) | 总:{spans.get('total', 0):.0f}ms"
+        )
 
         return result
 
@@ -1378,12 +1396,13 @@ class ArbitrageBot:
 
         logger.info("WebSocket 连接成功")
 
-        # 订阅 BBO
+        # 订阅 BBO（合并模式：回调忙时只保留最新一条 BBO，避免积压旧行情）
         logger.info(f"订阅 {self.market} BBO...")
         await self.account1.ws_client.subscribe(
             ParadexWebsocketChannel.BBO,
             callback=self.on_bbo_update,
             params={"market": self.market},
+            conflate=True,
         )
 
         logger.info("✅ 监控已启动，等待套利机会...")
@@ -1493,6 +1512,8 @@ async def main():
             l1_address=ACCOUNT1_L1_ADDRESS,
             l1_private_key=ACCOUNT1_L1_PRIVATE_KEY,
             logger=logger,
+            request_hook=ORDER_LATENCY,
+            collect_latency=True,
         )
     else:
         account1 = ParadexSubkey(
@@ -1500,6 +1521,8 @@ async def main():
             l2_private_key=ACCOUNT1_L2_PRIVATE_KEY,
             l2_address=ACCOUNT1_L2_ADDRESS,
             logger=logger,
+            request_hook=ORDER_LATENCY,
+            collect_latency=True,
         )
 
     # 初始化账户2
@@ -1510,6 +1533,8 @@ async def main():
             l1_address=ACCOUNT2_L1_ADDRESS,
             l1_private_key=ACCOUNT2_L1_PRIVATE_KEY,
             logger=logger,
+            request_hook=ORDER_LATENCY,
+            collect_latency=True,
         )
     else:
         account2 = ParadexSubkey(
@@ -1517,6 +1542,8 @@ async def main():
             l2_private_key=ACCOUNT2_L2_PRIVATE_KEY,
             l2_address=ACCOUNT2_L2_ADDRESS,
             logger=logger,
+            request_hook=ORDER_LATENCY,
+            collect_latency=True,
         )
 
     # 创建套利机器人
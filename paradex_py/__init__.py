@@ -1,2 +1,3 @@
 from .paradex import *  # noqa: F403
+from .paradex_fleet import *  # noqa: F403
 from .paradex_subkey import *  # noqa: F403
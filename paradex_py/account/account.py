@@ -12,15 +12,24 @@ from starknet_py.hash.selector import get_selector_from_name
 from starknet_py.net.full_node_client import FullNodeClient
 from starknet_py.net.http_client import HttpMethod
 from starknet_py.net.signer.stark_curve_signer import KeyPair
+from starknet_py.utils.typed_data import TypedDataDict
 
+from paradex_py.account.keystore import KeyStore, KeyStoreEntry, key_check
+from paradex_py.account.order_hasher import OrderHasher
 from paradex_py.account.starknet import Account as StarknetAccount
-from paradex_py.account.utils import derive_stark_key, derive_stark_key_from_ledger, flatten_signature
+from paradex_py.account.typed_data import message_hash
+from paradex_py.account.utils import (
+    derive_stark_key,
+    derive_stark_key_from_ledger,
+    flatten_signature,
+    message_signature,
+)
 from paradex_py.api.models import SystemConfig
+from paradex_py.common.latency import HASH, SIGN, timed_stage
 from paradex_py.common.order import Order
 from paradex_py.message.auth import build_auth_message, build_fullnode_message
 from paradex_py.message.block_trades import BlockTrade, build_block_trade_message
 from paradex_py.message.onboarding import build_onboarding_message
-from paradex_py.message.order import build_modify_order_message, build_order_message
 from paradex_py.message.stark_key import build_stark_key_message
 from paradex_py.utils import raise_value_error
 
@@ -44,6 +53,8 @@ class ParadexAccount:
         l1_private_key (Optional[str], optional): Ethereum private key. Defaults to None.
         l2_private_key (Optional[str], optional): Paradex private key. Defaults to None.
         rpc_version (Optional[str], optional): RPC version (e.g., "v0_9"). If provided, constructs URL as {base_url}/rpc/{rpc_version}. Defaults to None.
+        keystore (Optional[KeyStore], optional): Cache of derived keys and addresses; used instead of
+            re-deriving when it has an entry for `l1_address`, updated otherwise. Defaults to None.
 
     Examples:
         >>> from paradex_py import Paradex
@@ -62,6 +73,7 @@ class ParadexAccount:
         l1_private_key: str | None = None,
         l2_private_key: str | None = None,
         rpc_version: str | None = None,
+        keystore: KeyStore | None = None,
     ):
         self.config = config
 
@@ -69,38 +81,102 @@ class ParadexAccount:
             return raise_value_error("Paradex: Provide Ethereum address")
         self.l1_address = l1_address
 
+        entry = keystore.get(l1_address, config) if keystore is not None else None
+        cached_key = None
+        if keystore is not None and entry is not None and (l1_private_key is not None or l1_private_key_from_ledger):
+            # Skips signing the stark key message (and the Ledger prompt)
+            cached_key = keystore.private_key(entry)
+
         if l1_private_key is not None:
             self.l1_private_key = int_from_hex(l1_private_key)
-            stark_key_msg = build_stark_key_message(int(config.l1_chain_id))
-            self.l2_private_key = derive_stark_key(self.l1_private_key, stark_key_msg)
+            if cached_key is not None:
+                self.l2_private_key = cached_key
+            else:
+                stark_key_msg = build_stark_key_message(int(config.l1_chain_id))
+                self.l2_private_key = derive_stark_key(self.l1_private_key, stark_key_msg)
         elif l1_private_key_from_ledger:
-            stark_key_msg = build_stark_key_message(int(config.l1_chain_id))
-            self.l2_private_key = derive_stark_key_from_ledger(l1_address, stark_key_msg)
+            if cached_key is not None:
+                self.l2_private_key = cached_key
+            else:
+                stark_key_msg = build_stark_key_message(int(config.l1_chain_id))
+                self.l2_private_key = derive_stark_key_from_ledger(l1_address, stark_key_msg)
         elif l2_private_key is not None:
             self.l2_private_key = int_from_hex(l2_private_key)
         else:
             return raise_value_error("Paradex: Provide Ethereum or Paradex private key")
 
-        key_pair = KeyPair.from_private_key(self.l2_private_key)
-        self.l2_public_key = key_pair.public_key
-        self.l2_address = self._account_address()
+        self.l2_chain_id = int_from_bytes(config.starknet_chain_id.encode())
+        # The public key, address and Starknet account are derived on first use
+        self._rpc_version = rpc_version
+
+        if keystore is not None:
+            self._sync_keystore(keystore, entry)
+
+    def _sync_keystore(self, keystore: KeyStore, entry: KeyStoreEntry | None) -> None:
+        if entry is not None and entry.key_check == key_check(self.l2_private_key):
+            self.l2_public_key = entry.l2_public_key
+            self.l2_address = entry.l2_address
+            if entry.encrypted_private_key is not None or not keystore.stores_private_keys:
+                return
+        keystore.add(self)
+
+    @property
+    def l2_public_key(self) -> int:
+        """Stark public key, derived from `l2_private_key` on first use."""
+        public_key: int | None = getattr(self, "_l2_public_key", None)
+        if public_key is None:
+            public_key = self._l2_public_key = KeyPair.from_private_key(self.l2_private_key).public_key
+        return public_key
+
+    @l2_public_key.setter
+    def l2_public_key(self, value: int) -> None:
+        self._l2_public_key = value
+
+    @property
+    def l2_address(self) -> int:
+        """Account contract address, computed from the public key on first use."""
+        address: int | None = getattr(self, "_l2_address", None)
+        if address is None:
+            address = self._l2_address = self._account_address()
+        return address
+
+    @l2_address.setter
+    def l2_address(self, value: int) -> None:
+        self._l2_address = value
+
+    @property
+    def starknet(self) -> StarknetAccount:
+        """Starknet account backed by the Paradex full node, created on first use.
+
+        Only on-chain calls and typed-data signing need it; accounts that just
+        trade over REST never build the full-node client.
+        """
+        account: StarknetAccount | None = getattr(self, "_starknet", None)
+        if account is None:
+            account = self._starknet = self._create_starknet_account()
+        return account
+
+    def _key_pair(self) -> KeyPair:
+        return KeyPair(private_key=self.l2_private_key, public_key=self.l2_public_key)
 
-        # Create starknet account
+    def _node_url(self) -> str:
+        rpc_version: str | None = getattr(self, "_rpc_version", None)
         if rpc_version:
-            node_url = f"{config.starknet_fullnode_rpc_base_url}/rpc/{rpc_version}"
-        else:
-            node_url = config.starknet_fullnode_rpc_url
-        client = FullNodeClient(node_url=node_url)
-        self.l2_chain_id = int_from_bytes(config.starknet_chain_id.encode())
-        self.starknet = StarknetAccount(
+            return f"{self.config.starknet_fullnode_rpc_base_url}/rpc/{rpc_version}"
+        return self.config.starknet_fullnode_rpc_url
+
+    def _create_starknet_account(self) -> StarknetAccount:
+        client = FullNodeClient(node_url=self._node_url())
+        account = StarknetAccount(
             client=client,
             address=self.l2_address,
-            key_pair=key_pair,
+            key_pair=self._key_pair(),
             chain=CustomStarknetChainId(self.l2_chain_id),  # type: ignore[arg-type]
         )
 
         # Apply the fullnode headers patch
         self._apply_fullnode_headers_patch(client)
+        return account
 
     # Monkey patch of _make_request method of starknet.py client
     # to inject http headers requested by Paradex full node:
@@ -152,12 +228,17 @@ class ParadexAccount:
     def set_jwt_token(self, jwt_token: str) -> None:
         self.jwt_token = jwt_token
 
+    def _sign_typed_data(self, typed_data: TypedDataDict) -> str:
+        # Same signature as `self.starknet.sign_message`, without building the Starknet account
+        msg_hash = message_hash(typed_data, self.l2_address)
+        r, s = message_signature(msg_hash=msg_hash, priv_key=self.l2_private_key)
+        return flatten_signature([r, s])
+
     def onboarding_signature(self) -> str:
         if self.config is None:
             return raise_value_error("Paradex: System config not loaded")
         message = build_onboarding_message(self.l2_chain_id)
-        sig = self.starknet.sign_message(message)
-        return flatten_signature(sig)
+        return self._sign_typed_data(message)
 
     def onboarding_headers(self) -> dict:
         return {
@@ -168,8 +249,7 @@ class ParadexAccount:
 
     def auth_signature(self, timestamp: int, expiry: int) -> str:
         message = build_auth_message(self.l2_chain_id, timestamp, expiry)
-        sig = self.starknet.sign_message(message)
-        return flatten_signature(sig)
+        return self._sign_typed_data(message)
 
     def auth_headers(self) -> dict:
         timestamp = int(time.time())
@@ -200,12 +280,20 @@ class ParadexAccount:
             "PARADEX-STARKNET-SIGNATURE-VERSION": FULLNODE_SIGNATURE_VERSION,
         }
 
+    @property
+    def order_hasher(self) -> OrderHasher:
+        """Order hasher bound to this account, created on first use."""
+        hasher: OrderHasher | None = getattr(self, "_order_hasher", None)
+        if hasher is None or hasher.account_address != self.l2_address or hasher.chain_id != self.l2_chain_id:
+            hasher = self._order_hasher = OrderHasher(self.l2_chain_id, self.l2_address)
+        return hasher
+
     def sign_order(self, order: Order) -> str:
-        if order.id:
-            sig = self.starknet.sign_message(build_modify_order_message(self.l2_chain_id, order))
-        else:
-            sig = self.starknet.sign_message(build_order_message(self.l2_chain_id, order))
-        return flatten_signature(sig)
+        with timed_stage(HASH):
+            msg_hash = self.order_hasher.order_hash(order)
+        with timed_stage(SIGN):
+            r, s = message_signature(msg_hash=msg_hash, priv_key=self.l2_private_key)
+        return flatten_signature([r, s])
 
     def sign_block_trade(self, block_trade_data: BlockTrade) -> str:
         """Sign block trade data using Starknet account.
@@ -216,8 +304,7 @@ class ParadexAccount:
         """
         # Convert block trade data to TypedData format
         typed_data = build_block_trade_message(self.l2_chain_id, block_trade_data)
-        sig = self.starknet.sign_message(typed_data)
-        return flatten_signature(sig)
+        return self._sign_typed_data(typed_data)
 
     def sign_block_offer(self, offer_data: BlockTrade) -> str:
         """Sign block offer data using Starknet account.
@@ -228,8 +315,7 @@ class ParadexAccount:
         """
         # Convert block offer data to TypedData format
         typed_data = build_block_trade_message(self.l2_chain_id, offer_data)
-        sig = self.starknet.sign_message(typed_data)
-        return flatten_signature(sig)
+        return self._sign_typed_data(typed_data)
 
     async def transfer_on_l2(self, target_l2_address: str, amount_decimal: Decimal):
         try:
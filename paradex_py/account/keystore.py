@@ -0,0 +1,230 @@
+"""
+Local cache of derived account keys.
+
+Deriving an account from an Ethereum key signs the stark key message with
+the L1 key and grinds SHA-256 (`derive_stark_key`), then the public key and
+the Pedersen-based account address are computed from the L2 key. None of
+it changes between runs, so a `KeyStore` keeps the results in one JSON file
+that is read in bulk at startup.
+
+Public values (L2 public key and address) are stored in the clear. L2
+private keys are only stored when the keystore has a password: a key is
+derived from it once per keystore with scrypt and each private key is
+encrypted with AES-128-CTR (as in Ethereum V3 keyfiles) and authenticated
+with HMAC-SHA256, so loading many accounts costs a single KDF.
+"""
+
+import contextlib
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from Crypto.Cipher import AES
+from Crypto.Util import Counter
+
+from paradex_py.api.models import SystemConfig
+from paradex_py.utils import raise_value_error
+
+if TYPE_CHECKING:
+    from paradex_py.account.account import ParadexAccount
+
+KEYSTORE_VERSION = 1
+SCRYPT_N = 2**14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+
+def config_fingerprint(config: SystemConfig) -> str:
+    """Identifies the config values account derivation depends on."""
+    values = "|".join(
+        [
+            str(config.l1_chain_id),
+            config.starknet_chain_id,
+            config.paraclear_account_hash,
+            config.paraclear_account_proxy_hash,
+        ]
+    )
+    return hashlib.sha256(values.encode()).hexdigest()[:16]
+
+
+def _aes_ctr(key: bytes, iv: bytes) -> Any:
+    # Same cipher setup as Ethereum V3 keyfiles: the IV is the initial 128-bit counter
+    return AES.new(key, AES.MODE_CTR, counter=Counter.new(128, initial_value=int.from_bytes(iv, "big")))
+
+
+def key_check(l2_private_key: int) -> str:
+    """Short digest of a private key, used to match entries without decrypting."""
+    return hashlib.sha256(b"paradex-keystore" + l2_private_key.to_bytes(32, "big")).hexdigest()[:16]
+
+
+@dataclass
+class KeyStoreEntry:
+    l1_address: str
+    fingerprint: str
+    l2_public_key: int
+    l2_address: int
+    key_check: str
+    encrypted_private_key: dict[str, str] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "l1_address": self.l1_address,
+            "fingerprint": self.fingerprint,
+            "l2_public_key": hex(self.l2_public_key),
+            "l2_address": hex(self.l2_address),
+            "key_check": self.key_check,
+            "encrypted_private_key": self.encrypted_private_key,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "KeyStoreEntry":
+        return cls(
+            l1_address=data["l1_address"],
+            fingerprint=data["fingerprint"],
+            l2_public_key=int(data["l2_public_key"], 16),
+            l2_address=int(data["l2_address"], 16),
+            key_check=data["key_check"],
+            encrypted_private_key=data.get("encrypted_private_key"),
+        )
+
+
+class KeyStore:
+    """Keystore of derived L2 keys and addresses, keyed by L1 address.
+
+    Pass it to `ParadexAccount` (or `Paradex`) to initialize accounts
+    without re-deriving; accounts derived while it is attached are added to
+    it. Changes are written by `save()`, which `Paradex` calls after
+    initializing an account that changed the keystore.
+
+    Args:
+        path: Keystore file; created on `save()` if missing.
+        password: Enables storing encrypted L2 private keys. Without it only
+            public keys and addresses are cached and the L2 key is derived
+            again (or passed in) on every start.
+
+    Examples:
+        >>> keystore = KeyStore("~/.paradex/keystore.json", password=os.environ["KEYSTORE_PASSWORD"])
+        >>> paradex = Paradex(env=PROD, l1_address="0x...", l1_private_key="0x...", keystore=keystore)
+        >>> keystore.save()
+    """
+
+    def __init__(self, path: str | Path, password: str | None = None):
+        self.path = Path(path).expanduser()
+        self.entries: dict[str, KeyStoreEntry] = {}
+        self.dirty = False
+        self._password = password
+        self._kdf: dict[str, Any] | None = None
+        self._key: bytes | None = None
+        if self.path.exists():
+            self._read()
+
+    @property
+    def stores_private_keys(self) -> bool:
+        """Whether L2 private keys are stored (a password was given)."""
+        return self._password is not None
+
+    def _read(self) -> None:
+        with open(self.path) as f:
+            data = json.load(f)
+        if data.get("version") != KEYSTORE_VERSION:
+            return raise_value_error(f"KeyStore: unsupported version {data.get('version')}")
+        self._kdf = data.get("kdf")
+        self.entries = {
+            address: KeyStoreEntry.from_dict(entry) for address, entry in (data.get("accounts") or {}).items()
+        }
+
+    def _derived_key(self) -> bytes | None:
+        if self._password is None:
+            return None
+        if self._key is None:
+            if self._kdf is None:
+                self._kdf = {"salt": secrets.token_hex(16), "n": SCRYPT_N, "r": SCRYPT_R, "p": SCRYPT_P}
+            kdf = self._kdf
+            self._key = hashlib.scrypt(
+                self._password.encode(),
+                salt=bytes.fromhex(kdf["salt"]),
+                n=kdf["n"],
+                r=kdf["r"],
+                p=kdf["p"],
+                maxmem=128 * kdf["n"] * kdf["r"] * 2,
+                dklen=32,
+            )
+        return self._key
+
+    def _encrypt(self, l1_address: str, l2_private_key: int) -> dict[str, str] | None:
+        key = self._derived_key()
+        if key is None:
+            return None
+        iv = secrets.token_bytes(16)
+        ciphertext = _aes_ctr(key[:16], iv).encrypt(l2_private_key.to_bytes(32, "big"))
+        mac = hmac.new(key[16:], l1_address.encode() + iv + ciphertext, hashlib.sha256).hexdigest()
+        return {"iv": iv.hex(), "ciphertext": ciphertext.hex(), "mac": mac}
+
+    def _decrypt(self, entry: KeyStoreEntry) -> int | None:
+        key = self._derived_key()
+        if key is None or entry.encrypted_private_key is None:
+            return None
+        iv = bytes.fromhex(entry.encrypted_private_key["iv"])
+        ciphertext = bytes.fromhex(entry.encrypted_private_key["ciphertext"])
+        mac = hmac.new(key[16:], entry.l1_address.encode() + iv + ciphertext, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(mac, entry.encrypted_private_key["mac"]):
+            return raise_value_error(f"KeyStore: wrong password or corrupt entry for {entry.l1_address}")
+        return int.from_bytes(_aes_ctr(key[:16], iv).decrypt(ciphertext), "big")
+
+    def get(self, l1_address: str, config: SystemConfig) -> KeyStoreEntry | None:
+        """Entry of `l1_address` derived under `config`, if any."""
+        entry = self.entries.get(l1_address.lower())
+        if entry is None or entry.fingerprint != config_fingerprint(config):
+            return None
+        return entry
+
+    def private_key(self, entry: KeyStoreEntry) -> int | None:
+        """Decrypted L2 private key of `entry`; None if not stored or no password was given.
+
+        Raises:
+            ValueError: If the password is wrong or the entry was tampered with.
+        """
+        return self._decrypt(entry)
+
+    def add(self, account: "ParadexAccount") -> KeyStoreEntry:
+        """Record the derived keys of `account` (computing them if needed)."""
+        entry = KeyStoreEntry(
+            l1_address=account.l1_address.lower(),
+            fingerprint=config_fingerprint(account.config),
+            l2_public_key=account.l2_public_key,
+            l2_address=account.l2_address,
+            key_check=key_check(account.l2_private_key),
+            encrypted_private_key=self._encrypt(account.l1_address.lower(), account.l2_private_key),
+        )
+        self.entries[entry.l1_address] = entry
+        self.dirty = True
+        return entry
+
+    def remove(self, l1_address: str) -> None:
+        if self.entries.pop(l1_address.lower(), None) is not None:
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the keystore atomically, readable by the owner only."""
+        data = {
+            "version": KEYSTORE_VERSION,
+            "kdf": self._kdf,
+            "accounts": {address: entry.to_dict() for address, entry in self.entries.items()},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+        self.dirty = False
@@ -0,0 +1,235 @@
+"""
+Pre-signed order cache.
+
+When price and size are known a few ticks before an order is sent (e.g.
+an arbitrage bot watching a spread), the signature can be computed ahead
+of time. `PresignedOrderCache` signs a ladder of candidate orders, keeps
+them keyed by (market, side, price, size) and hands out the matching one
+when the trigger fires, so only the HTTP request remains on the hot path.
+An entry is only handed out when its other order fields (order type,
+instruction, reduce-only, client id, ...) match the ones requested.
+
+`signature_timestamp` acts as a nonce, so entries expire after `ttl`
+seconds and every entry is handed out at most once.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from paradex_py.common.order import Order, OrderSide, OrderType
+from paradex_py.utils import raise_value_error, time_now_milli_secs
+
+if TYPE_CHECKING:
+    from paradex_py.account.account import ParadexAccount
+    from paradex_py.account.signing_executor import SigningExecutor
+
+PresignedKey = tuple[str, OrderSide, Decimal, Decimal]
+
+# `Order` fields outside of the key, with the values an order gets when they are not given
+_ORDER_FIELD_DEFAULTS: dict[str, Any] = {
+    name: parameter.default
+    for name, parameter in inspect.signature(Order).parameters.items()
+    if parameter.default is not inspect.Parameter.empty and name not in ("limit_price", "signature_timestamp")
+}
+_ORDER_FIELD_DEFAULTS["order_type"] = OrderType.Limit
+_ORDER_ATTRIBUTES = {"order_id": "id"}
+
+
+@dataclass(frozen=True)
+class PresignedOrder:
+    """A signed order and its request payload, rendered at signing time."""
+
+    order: Order
+    payload: dict[str, Any] = field(repr=False)
+
+    @property
+    def key(self) -> PresignedKey:
+        return (self.order.market, self.order.order_side, self.order.limit_price, self.order.size)
+
+
+@dataclass
+class PresignedStats:
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evicted: int = 0
+
+
+class PresignedOrderCache:
+    """Bounded cache of pre-signed orders keyed by (market, side, price, size).
+
+    The cache is thread safe: ladders may be signed in a worker thread
+    (see `presign_ladder_async`) while the event loop takes entries.
+
+    Args:
+        account: Account whose L2 key signs the orders.
+        max_size: Maximum number of entries; the oldest entry is evicted first.
+        ttl: Seconds after `signature_timestamp` an entry stays usable.
+        signing_executor: Optional `SigningExecutor` used to sign ladders in parallel.
+        logger: Optional logger.
+
+    Examples:
+        >>> cache = PresignedOrderCache(paradex.account, ttl=10)
+        >>> cache.presign_ladder("BTC-USD-PERP", prices=[Decimal("60000"), Decimal("60001")], size=Decimal("0.01"))
+        >>> presigned = cache.take("BTC-USD-PERP", OrderSide.Buy, Decimal("60000"), Decimal("0.01"))
+    """
+
+    def __init__(
+        self,
+        account: "ParadexAccount",
+        max_size: int = 256,
+        ttl: float = 30.0,
+        signing_executor: "SigningExecutor | None" = None,
+        logger: logging.Logger | None = None,
+    ):
+        if max_size < 1:
+            raise_value_error("max_size must be at least 1")
+        self.account = account
+        self.max_size = max_size
+        self.ttl_ms = int(ttl * 1_000)
+        self.signing_executor = signing_executor
+        self.logger = logger or logging.getLogger(__name__)
+        self._entries: OrderedDict[PresignedKey, PresignedOrder] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = PresignedStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_expired(self, entry: PresignedOrder, now_ms: int) -> bool:
+        return now_ms - entry.order.signature_timestamp > self.ttl_ms
+
+    def _store(self, orders: list[Order]) -> list[PresignedOrder]:
+        entries = [PresignedOrder(order, order.dump_to_dict()) for order in orders]
+        with self._lock:
+            for entry in entries:
+                self._entries.pop(entry.key, None)
+                self._entries[entry.key] = entry
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats.evicted += 1
+        return entries
+
+    def presign(self, orders: list[Order]) -> list[PresignedOrder]:
+        """Sign `orders` and add them to the cache, replacing entries with the same key.
+
+        Args:
+            orders: Orders to sign; `signature` is set on each of them.
+
+        Returns:
+            list[PresignedOrder]: The new entries, in the same order.
+        """
+        if self.signing_executor is not None:
+            signatures = self.signing_executor.sign_orders(self.account, orders)
+        else:
+            signatures = [self.account.sign_order(order) for order in orders]
+        for order, signature in zip(orders, signatures, strict=True):
+            order.signature = signature
+        return self._store(orders)
+
+    def presign_ladder(
+        self,
+        market: str,
+        prices: Iterable[Decimal],
+        size: Decimal,
+        sides: Iterable[OrderSide] = (OrderSide.Buy, OrderSide.Sell),
+        order_type: OrderType = OrderType.Limit,
+        **order_kwargs: Any,
+    ) -> list[PresignedOrder]:
+        """Pre-sign one order per (side, price) combination.
+
+        Args:
+            market: Market name, e.g. "BTC-USD-PERP".
+            prices: Candidate limit prices.
+            size: Order size.
+            sides: Sides to sign for. Defaults to both.
+            order_type: Order type. Defaults to `OrderType.Limit`.
+            **order_kwargs: Extra `Order` arguments (instruction, client_id, reduce_only, ...).
+
+        Returns:
+            list[PresignedOrder]: The new entries.
+        """
+        prices = list(prices)
+        orders = [
+            Order(
+                market=market,
+                order_type=order_type,
+                order_side=side,
+                size=size,
+                limit_price=price,
+                **order_kwargs,
+            )
+            for side in sides
+            for price in prices
+        ]
+        return self.presign(orders)
+
+    async def presign_ladder_async(self, *args: Any, **kwargs: Any) -> list[PresignedOrder]:
+        """`presign_ladder` in a worker thread, so the event loop keeps running while signing."""
+        return await asyncio.to_thread(self.presign_ladder, *args, **kwargs)
+
+    @staticmethod
+    def _matches(order: Order, order_fields: dict[str, Any]) -> bool:
+        expected = {**_ORDER_FIELD_DEFAULTS, **order_fields}
+        return all(getattr(order, _ORDER_ATTRIBUTES.get(name, name)) == value for name, value in expected.items())
+
+    def take(
+        self, market: str, side: OrderSide, price: Decimal, size: Decimal, **order_fields: Any
+    ) -> PresignedOrder | None:
+        """Remove and return the entry matching the key, or None if missing or expired.
+
+        Args:
+            market: Market name.
+            side: Order side.
+            price: Limit price.
+            size: Order size.
+            **order_fields: Other `Order` arguments (order_type, instruction, reduce_only, client_id, ...).
+                An entry signed with different values, including `Order` defaults for
+                fields not given, is a miss and stays in the cache.
+        """
+        key = (market, side, price, size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not self._matches(entry.order, order_fields):
+                self._stats.misses += 1
+                return None
+            del self._entries[key]
+            if self._is_expired(entry, time_now_milli_secs()):
+                self._stats.expired += 1
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+            return entry
+
+    def prune(self) -> int:
+        """Drop expired entries.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        now_ms = time_now_milli_secs()
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if self._is_expired(entry, now_ms)]
+            for key in expired:
+                del self._entries[key]
+            self._stats.expired += len(expired)
+        if expired and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("PresignedOrderCache: pruned %d expired orders", len(expired))
+        return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> PresignedStats:
+        return PresignedStats(**vars(self._stats))
+
+    def reset_stats(self) -> None:
+        self._stats = PresignedStats()
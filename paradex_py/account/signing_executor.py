@@ -0,0 +1,101 @@
+"""
+Parallel order signing.
+
+Signing an order is a Pedersen hash chain plus an ECDSA signature, all
+CPU bound. `SigningExecutor` spreads a batch over a process pool (or a
+thread pool, for signing backends that release the GIL) in contiguous
+chunks, and returns signatures in input order.
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from paradex_py.account.order_hasher import OrderHasher
+from paradex_py.account.utils import flatten_signature, message_signature
+from paradex_py.common.order import Order
+from paradex_py.utils import raise_value_error
+
+if TYPE_CHECKING:
+    from paradex_py.account.account import ParadexAccount
+
+# Per-worker hasher cache keyed by (chain_id, account_address)
+_HASHERS: dict[tuple[int, int], OrderHasher] = {}
+
+
+def _sign_chunk(private_key: int, chain_id: int, account_address: int, orders: list[Order]) -> list[str]:
+    hasher = _HASHERS.get((chain_id, account_address))
+    if hasher is None:
+        hasher = _HASHERS[(chain_id, account_address)] = OrderHasher(chain_id, account_address)
+    signatures = []
+    for order in orders:
+        r, s = message_signature(msg_hash=hasher.order_hash(order), priv_key=private_key)
+        signatures.append(flatten_signature([r, s]))
+    return signatures
+
+
+class SigningExecutor:
+    """Sign batches of orders in parallel.
+
+    Batches smaller than `min_batch_size` are signed inline, where the
+    pool's dispatch overhead would outweigh the gain.
+
+    Note that the process backend sends the account's L2 private key to
+    the worker processes with every chunk.
+
+    Args:
+        max_workers: Number of workers. Defaults to the number of CPUs.
+        backend: "process" (default) or "thread". Threads only help when the
+            signing library releases the GIL.
+        min_batch_size: Smallest batch that is dispatched to the pool.
+
+    Examples:
+        >>> executor = SigningExecutor(max_workers=4)
+        >>> paradex = Paradex(env=PROD, l1_address="0x...", l1_private_key="0x...", signing_executor=executor)
+        >>> paradex.api_client.submit_orders_batch(orders)
+    """
+
+    def __init__(self, max_workers: int | None = None, backend: str = "process", min_batch_size: int = 8):
+        if backend not in ("process", "thread"):
+            raise_value_error(f"Unknown signing backend: {backend}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.backend = backend
+        self.min_batch_size = min_batch_size
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.backend == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="paradex-sign")
+        return self._executor
+
+    def sign_orders(self, account: "ParadexAccount", orders: list[Order]) -> list[str]:
+        """Sign `orders` with `account`'s key.
+
+        Returns:
+            list[str]: Flattened signatures, in the same order as `orders`.
+        """
+        key = (account.l2_private_key, account.l2_chain_id, account.l2_address)
+        if len(orders) < self.min_batch_size or self.max_workers <= 1:
+            return _sign_chunk(*key, orders)
+
+        chunk_size = -(-len(orders) // self.max_workers)
+        executor = self._get_executor()
+        futures = [
+            executor.submit(_sign_chunk, *key, orders[start : start + chunk_size])
+            for start in range(0, len(orders), chunk_size)
+        ]
+        return [signature for future in futures for signature in future.result()]
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "SigningExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
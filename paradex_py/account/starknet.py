@@ -18,7 +18,8 @@ from starknet_py.proxy.contract_abi_resolver import ProxyConfig
 from starknet_py.proxy.proxy_check import ArgentProxyCheck, OpenZeppelinProxyCheck, ProxyCheck
 from starknet_py.utils.typed_data import TypedData, TypedDataDict
 
-from .utils import message_signature, typed_data_to_message_hash
+from .typed_data import message_hash
+from .utils import message_signature
 
 
 class Account(StarknetAccount):
@@ -143,7 +144,7 @@ class Account(StarknetAccount):
         print("---\n")
 
     def sign_message(self, typed_data: TypedData | TypedDataDict) -> list[int]:
-        msg_hash = typed_data_to_message_hash(typed_data, self.address)
+        msg_hash = message_hash(typed_data, self.address)
         r, s = message_signature(msg_hash=msg_hash, priv_key=self.signer.key_pair.private_key)  # type: ignore[attr-defined]
         return [r, s]
 
@@ -1,11 +1,8 @@
 from decimal import Decimal
 
 from starknet_py.common import int_from_bytes, int_from_hex
-from starknet_py.net.full_node_client import FullNodeClient
-from starknet_py.net.signer.stark_curve_signer import KeyPair
 
-from paradex_py.account.account import CustomStarknetChainId, ParadexAccount
-from paradex_py.account.starknet import Account as StarknetAccount
+from paradex_py.account.account import ParadexAccount
 from paradex_py.api.models import SystemConfig
 from paradex_py.utils import raise_value_error
 
@@ -53,28 +50,8 @@ class SubkeyAccount(ParadexAccount):
         self.l2_private_key = int_from_hex(l2_private_key)
         self.l2_address = int_from_hex(l2_address)
 
-        # Generate public key from private key
-        key_pair = KeyPair.from_private_key(self.l2_private_key)
-        self.l2_public_key = key_pair.public_key
-
-        # Create Starknet account for message signing only
-        self._setup_starknet_account()
-
-    def _setup_starknet_account(self):
-        """Set up the Starknet account for message signing only."""
-        # Create Starknet client and account
-        client = FullNodeClient(node_url=self.config.starknet_fullnode_rpc_url)
         self.l2_chain_id = int_from_bytes(self.config.starknet_chain_id.encode())
-
-        self.starknet = StarknetAccount(
-            client=client,
-            address=self.l2_address,
-            key_pair=KeyPair.from_private_key(self.l2_private_key),
-            chain=CustomStarknetChainId(self.l2_chain_id),  # type: ignore[arg-type]
-        )
-
-        # Apply the same monkey patch as ParadexAccount
-        self._apply_fullnode_headers_patch(client)
+        # The public key and Starknet account (message signing only) are created on first use
 
     def onboarding_headers(self) -> dict:
         """Override to prevent onboarding for subkeys."""
@@ -1,15 +1,37 @@
-from typing import cast
+"""
+Typed-data (SNIP-12 revision 0) hashing.
+
+`TypedData` is a starknet_py `TypedData` using Paradex's legacy
+(Pedersen, revision 0) encoding.
+
+`message_hash` is the fast path used for signing: `TypedData.from_dict(...)`
+validates the whole typed data through marshmallow and recomputes the type
+hashes and the domain struct hash on every call, although Paradex signs the
+same few message shapes (auth, onboarding, fullnode requests) on the same
+domain over and over. Each distinct (types, domain) pair is compiled once,
+caching its type hashes and domain struct hash, and only the variable
+message fields are hashed afterwards. Typed data using revision 1, or value
+types other than felts, strings, structs and arrays of those, falls back to
+starknet_py; the result is identical either way.
+"""
+
+import functools
+from collections.abc import Mapping
+from typing import Any, cast
 
 from starknet_py.cairo.felt import encode_shortstring
 from starknet_py.utils.typed_data import (
     TypeContext,
+    TypedDataDict,
     is_pointer,
     parse_felt,
     strip_pointer,
 )
 from starknet_py.utils.typed_data import TypedData as StarknetTypedDataDataclass
 
-from .utils import compute_hash_on_elements
+from paradex_py.utils import raise_value_error
+
+from .utils import compute_hash_on_elements, pedersen_hash
 
 
 class TypedData(StarknetTypedDataDataclass):
@@ -54,3 +76,131 @@ class TypedData(StarknetTypedDataDataclass):
         ]
 
         return compute_hash_on_elements(message)
+
+
+STARKNET_MESSAGE = encode_shortstring("StarkNet Message")
+_BASIC_TYPES = ("felt", "string")
+
+SchemaKey = tuple[str, tuple[tuple[str, tuple[tuple[str, str], ...]], ...], tuple[tuple[str, Any], ...]]
+
+
+@functools.lru_cache(maxsize=4096)
+def shortstring(value: str) -> int:
+    """Cached `encode_shortstring`."""
+    return encode_shortstring(value)
+
+
+def felt(value: int | str) -> int:
+    """Same interpretation as starknet_py's `parse_felt`, with cached short strings."""
+    if isinstance(value, int):
+        return value
+    if value.startswith("0x"):
+        return int(value, 16)
+    if value.isnumeric():
+        return int(value)
+    return shortstring(value)
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class CompiledTypedData:
+    """Type hashes and domain hash of one (types, domain) pair.
+
+    Args:
+        typed_data: Typed data dict; its message is ignored.
+
+    Raises:
+        ValueError: If the types use a revision or value type this engine does not handle.
+    """
+
+    def __init__(self, typed_data: TypedDataDict):
+        domain = typed_data["domain"]
+        types = typed_data["types"]
+        if "StarkNetDomain" not in types or str(domain.get("revision", "0")) != "0":
+            raise_value_error("CompiledTypedData: Only revision 0 typed data is supported")
+        self.fields: dict[str, tuple[tuple[str, str], ...]] = {
+            name: tuple((field["name"], field["type"]) for field in params) for name, params in types.items()
+        }
+        for params in self.fields.values():
+            for _, type_name in params:
+                if type_name.rstrip("*") not in self.fields and type_name.rstrip("*") not in _BASIC_TYPES:
+                    raise_value_error(f"CompiledTypedData: Unsupported type {type_name}")
+        # The reference implementation derives type hashes (dependency ordering) and the domain hash
+        reference = StarknetTypedDataDataclass.from_dict(cast(TypedDataDict, {**typed_data, "message": {}}))
+        self.type_hashes = {name: reference.type_hash(name) for name in self.fields}
+        self.domain_hash = self.struct_hash("StarkNetDomain", domain)
+        self._prefixes: dict[int, int] = {}
+
+    def struct_hash(self, type_name: str, data: Mapping[str, Any]) -> int:
+        elements = [self.type_hashes[type_name]]
+        for name, field_type in self.fields[type_name]:
+            elements.append(self._encode(field_type, data[name]))
+        return compute_hash_on_elements(elements)
+
+    def _encode(self, type_name: str, value: Any) -> int:
+        if isinstance(value, dict) and type_name in self.fields:
+            return self.struct_hash(type_name, value)
+        if type_name.endswith("*") and isinstance(value, list):
+            return compute_hash_on_elements([self._encode(type_name[:-1], item) for item in value])
+        if type_name in _BASIC_TYPES and isinstance(value, int | str):
+            return felt(value)
+        raise _Unsupported(type_name)
+
+    def message_hash(self, primary_type: str, message: Mapping[str, Any], account_address: int) -> int:
+        # compute_hash_on_elements([prefix, domain, address, struct]) with the first links cached per account
+        prefix = self._prefixes.get(account_address)
+        if prefix is None:
+            prefix = pedersen_hash(pedersen_hash(pedersen_hash(0, STARKNET_MESSAGE), self.domain_hash), account_address)
+            self._prefixes[account_address] = prefix
+        return pedersen_hash(pedersen_hash(prefix, self.struct_hash(primary_type, message)), 4)
+
+
+def _schema_key(typed_data: TypedDataDict) -> SchemaKey:
+    types = tuple(
+        (name, tuple((field["name"], field["type"]) for field in params))
+        for name, params in typed_data["types"].items()
+    )
+    return typed_data["primaryType"], types, tuple(typed_data["domain"].items())
+
+
+# Compiled (types, domain) pairs; Paradex only signs a handful of shapes
+_COMPILED: dict[SchemaKey, CompiledTypedData | None] = {}
+_MAX_COMPILED = 256
+
+
+def compile_typed_data(typed_data: TypedDataDict) -> CompiledTypedData | None:
+    """Compiled form of the types and domain of `typed_data`, cached; None if unsupported."""
+    key = _schema_key(typed_data)
+    try:
+        return _COMPILED[key]
+    except KeyError:
+        pass
+    try:
+        compiled: CompiledTypedData | None = CompiledTypedData(typed_data)
+    except (ValueError, KeyError):
+        compiled = None
+    if len(_COMPILED) >= _MAX_COMPILED:
+        _COMPILED.clear()
+    _COMPILED[key] = compiled
+    return compiled
+
+
+def message_hash(typed_data: StarknetTypedDataDataclass | TypedDataDict, account_address: int) -> int:
+    """SNIP-12 message hash of `typed_data` for `account_address`.
+
+    Equal to `StarknetTypedDataDataclass.from_dict(typed_data).message_hash(account_address)`.
+
+    Examples:
+        >>> msg_hash = message_hash(build_auth_message(chain_id, timestamp, expiry), account.l2_address)
+    """
+    if isinstance(typed_data, StarknetTypedDataDataclass):
+        return typed_data.message_hash(account_address)
+    compiled = compile_typed_data(typed_data)
+    if compiled is not None:
+        try:
+            return compiled.message_hash(typed_data["primaryType"], typed_data["message"], account_address)
+        except _Unsupported:
+            pass
+    return StarknetTypedDataDataclass.from_dict(typed_data).message_hash(account_address)
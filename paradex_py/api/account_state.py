@@ -0,0 +1,354 @@
+"""
+Local account state kept up to date from the private WebSocket channels.
+
+`AccountState` subscribes to ORDERS, FILLS, POSITIONS, ACCOUNT and
+BALANCE_EVENTS, seeds itself once from REST and then applies every update
+in place, so open orders, positions, balances and free collateral are
+plain dict lookups instead of REST round trips.
+
+Updates carry `last_updated_at`/`updated_at` timestamps; an update older
+than the record it would replace is dropped, so replays after a reconnect
+and the periodic REST reconciliation never roll state back.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from paradex_py.api.ws_client import ParadexWebsocketChannel, ParadexWebsocketClient
+
+# Order statuses that are no longer working on the book
+CLOSED_ORDER_STATUSES = ("CLOSED",)
+# Closed order ids remembered to reject late updates for them
+MAX_CLOSED_ORDERS = 10_000
+
+
+@dataclass
+class AccountStateStats:
+    updates: int = 0
+    stale_updates: int = 0
+    fills: int = 0
+    reconciles: int = 0
+    reconcile_corrections: int = 0
+
+
+def _as_dict(record: Any) -> dict:
+    if isinstance(record, dict):
+        return record
+    if hasattr(record, "model_dump"):
+        return record.model_dump()
+    return dict(vars(record))
+
+
+def _results(response: Any) -> list[dict]:
+    results = response.get("results") if isinstance(response, dict) else getattr(response, "results", None)
+    return [_as_dict(r) for r in results or []]
+
+
+def _updated_at(record: dict) -> int:
+    return record.get("last_updated_at") or record.get("updated_at") or 0
+
+
+def _is_newer(new: dict, old: dict | None) -> bool:
+    return old is None or _updated_at(new) >= _updated_at(old)
+
+
+class AccountState:
+    """In-memory view of the account driven by the private WebSocket channels.
+
+    Call `start()` after the WebSocket client is connected and authenticated.
+    State is seeded from REST once, then kept current from the WebSocket.
+    A background task reconciles against REST every `reconcile_interval`
+    seconds to repair anything a dropped connection may have missed.
+
+    Args:
+        ws_client: Connected, authenticated WebSocket client
+        api_client: `ParadexApiClient` or `AsyncParadexApiClient` used for REST seeding
+        market: Market filter of the ORDERS and FILLS channels. Defaults to "ALL".
+        reconcile_interval: Seconds between REST reconciliations, None to disable. Defaults to 60.
+        max_fills: Number of recent fills kept in `fills`. Defaults to 1000.
+        on_update: Optional callback `(ws_channel, data)`, sync or async, invoked after every applied update
+        logger: Optional logger
+
+    Examples:
+        >>> state = AccountState(paradex.ws_client, paradex.api_client)
+        >>> await state.start()
+        >>> state.order_by_client_id("my-order-1")
+        >>> state.position("BTC-USD-PERP")
+        >>> state.free_collateral()
+    """
+
+    def __init__(
+        self,
+        ws_client: ParadexWebsocketClient,
+        api_client: Any,
+        market: str = "ALL",
+        reconcile_interval: float | None = 60.0,
+        max_fills: int = 1000,
+        on_update: Callable[[ParadexWebsocketChannel, dict], Any] | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        self.ws_client = ws_client
+        self.api_client = api_client
+        self.market = market
+        self.reconcile_interval = reconcile_interval
+        self.max_fills = max_fills
+        self.on_update = on_update
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.orders: dict[str, dict] = {}
+        self.positions: dict[str, dict] = {}
+        self.balances: dict[str, dict] = {}
+        self.account: dict = {}
+        self.fills: OrderedDict[str, dict] = OrderedDict()
+        self._client_ids: dict[str, str] = {}
+        # Last update time of recently closed orders, so late OPEN updates do not resurrect them
+        self._closed: OrderedDict[str, int] = OrderedDict()
+        self._stats = AccountStateStats()
+        self._reconcile_task: asyncio.Task | None = None
+        self._handlers: dict[ParadexWebsocketChannel, Callable[[dict], bool]] = {
+            ParadexWebsocketChannel.ORDERS: self.apply_order,
+            ParadexWebsocketChannel.FILLS: self.apply_fill,
+            ParadexWebsocketChannel.POSITIONS: self.apply_position,
+            ParadexWebsocketChannel.ACCOUNT: self.apply_account,
+            ParadexWebsocketChannel.BALANCE_EVENTS: self.apply_balance_event,
+        }
+
+    def _channel_names(self) -> list[str]:
+        return [
+            ParadexWebsocketChannel.ORDERS.value.format(market=self.market),
+            ParadexWebsocketChannel.FILLS.value.format(market=self.market),
+            ParadexWebsocketChannel.POSITIONS.value,
+            ParadexWebsocketChannel.ACCOUNT.value,
+            ParadexWebsocketChannel.BALANCE_EVENTS.value,
+        ]
+
+    async def start(self) -> None:
+        """Subscribe to the private channels, seed from REST and start reconciling."""
+        for channel in self._handlers:
+            params = {"market": self.market} if "{market}" in channel.value else None
+            await self.ws_client.subscribe(channel, self._on_message, params=params)
+        # Subscribed first so that nothing between the snapshot and the first update is lost
+        await self.reconcile()
+        if self.reconcile_interval is not None:
+            self._reconcile_task = asyncio.create_task(self._reconcile_loop())
+
+    async def stop(self) -> None:
+        if self._reconcile_task is not None and not self._reconcile_task.done():
+            self._reconcile_task.cancel()
+        for channel_name in self._channel_names():
+            await self.ws_client.unsubscribe_by_name(channel_name)
+
+    async def _call(self, name: str, *args: Any) -> Any:
+        fetch = getattr(self.api_client, name)
+        if inspect.iscoroutinefunction(fetch):
+            return await fetch(*args)
+        return await asyncio.to_thread(fetch, *args)
+
+    async def reconcile(self) -> int:
+        """Reload orders, positions, balances and the account summary from REST.
+
+        Records changed by the WebSocket after the snapshot was requested are kept.
+
+        Returns:
+            int: Number of records the REST snapshot corrected.
+        """
+        requested_at = int(time.time() * 1000)
+        orders, positions, balances, summary = await asyncio.gather(
+            self._call("fetch_orders", {"market": self.market} if self.market != "ALL" else None),
+            self._call("fetch_positions"),
+            self._call("fetch_balances"),
+            self._call("fetch_account_summary"),
+        )
+        corrections = self._reconcile_orders(_results(orders), requested_at)
+        corrections += self._reconcile_positions(_results(positions), requested_at)
+        for balance in _results(balances):
+            token = balance.get("token", "")
+            if self._differs(self.balances.get(token), balance) and _is_newer(balance, self.balances.get(token)):
+                self.balances[token] = balance
+                corrections += 1
+
+        summary = _as_dict(summary)
+        if self._differs(self.account, summary):
+            corrections += self.apply_account(summary)
+
+        stats = self._stats
+        stats.reconciles += 1
+        # The first reconcile is the initial seed, not a correction
+        if stats.reconciles > 1:
+            stats.reconcile_corrections += corrections
+            if corrections:
+                self.logger.info("AccountState: reconcile corrected %s records", corrections)
+        return corrections
+
+    def _reconcile_orders(self, rest_orders: list[dict], requested_at: int) -> int:
+        corrections = 0
+        for order in rest_orders:
+            if self._differs(self.orders.get(order.get("id", "")), order):
+                corrections += self.apply_order(order)
+        # Orders missing from the snapshot were closed, unless they were updated after it was requested
+        live = {order.get("id") for order in rest_orders}
+        for order_id in [oid for oid, o in self.orders.items() if oid not in live and _updated_at(o) < requested_at]:
+            self._remove_order(order_id, requested_at)
+            corrections += 1
+        return corrections
+
+    def _reconcile_positions(self, rest_positions: list[dict], requested_at: int) -> int:
+        corrections = 0
+        open_positions = [position for position in rest_positions if position.get("status") != "CLOSED"]
+        for position in rest_positions:
+            current = self.positions.get(position.get("market", ""))
+            # The snapshot also lists closed positions; only those still held locally need removing
+            if current is None and position.get("status") == "CLOSED":
+                continue
+            if self._differs(current, position):
+                corrections += self.apply_position(position)
+        open_markets = {position.get("market") for position in open_positions}
+        for market in [m for m, p in self.positions.items() if m not in open_markets and _updated_at(p) < requested_at]:
+            del self.positions[market]
+            corrections += 1
+        return corrections
+
+    @staticmethod
+    def _differs(current: dict | None, snapshot: dict) -> bool:
+        return current is None or any(current.get(k) != v for k, v in snapshot.items() if v is not None)
+
+    async def _reconcile_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.reconcile_interval or 0)
+            try:
+                await self.reconcile()
+            except Exception:
+                self.logger.exception("AccountState: reconcile failed")
+
+    async def _on_message(self, ws_channel: ParadexWebsocketChannel, message: dict) -> None:
+        data = message["params"]["data"]
+        handler = self._handlers.get(ws_channel)
+        if handler is None or not handler(data):
+            return
+        if self.on_update is not None:
+            result = self.on_update(ws_channel, data)
+            if inspect.isawaitable(result):
+                await result
+
+    def _applied(self, applied: bool) -> bool:
+        if applied:
+            self._stats.updates += 1
+        else:
+            self._stats.stale_updates += 1
+        return applied
+
+    def apply_order(self, order: dict) -> bool:
+        """Apply an order update; returns False if it is older than the known state."""
+        order_id = order.get("id")
+        if not order_id:
+            return False
+        if not _is_newer(order, self.orders.get(order_id)) or _updated_at(order) < self._closed.get(order_id, 0):
+            return self._applied(False)
+        if order.get("status") in CLOSED_ORDER_STATUSES:
+            self._remove_order(order_id, _updated_at(order))
+        else:
+            self.orders[order_id] = order
+            if order.get("client_id"):
+                self._client_ids[order["client_id"]] = order_id
+        return self._applied(True)
+
+    def _remove_order(self, order_id: str, closed_at: int) -> None:
+        order = self.orders.pop(order_id, None)
+        if order is not None and order.get("client_id"):
+            self._client_ids.pop(order["client_id"], None)
+        self._closed[order_id] = max(closed_at, 1)
+        if len(self._closed) > MAX_CLOSED_ORDERS:
+            self._closed.popitem(last=False)
+
+    def apply_fill(self, fill: dict) -> bool:
+        """Record a fill; duplicates (same fill id) are ignored."""
+        fill_id = fill.get("id")
+        if not fill_id or fill_id in self.fills:
+            return self._applied(False)
+        self.fills[fill_id] = fill
+        if len(self.fills) > self.max_fills:
+            self.fills.popitem(last=False)
+        self._stats.fills += 1
+        return self._applied(True)
+
+    def apply_position(self, position: dict) -> bool:
+        """Apply a position update; closed positions are removed."""
+        market = position.get("market")
+        if not market:
+            return False
+        if not _is_newer(position, self.positions.get(market)):
+            return self._applied(False)
+        if position.get("status") == "CLOSED":
+            self.positions.pop(market, None)
+        else:
+            self.positions[market] = position
+        return self._applied(True)
+
+    def apply_account(self, account: dict) -> bool:
+        """Apply an account summary update."""
+        if not _is_newer(account, self.account or None):
+            return self._applied(False)
+        self.account = account
+        return self._applied(True)
+
+    def apply_balance_event(self, event: dict) -> bool:
+        """Update the settlement asset balance from a BALANCE_EVENTS payload."""
+        token = self.account.get("settlement_asset") or "USDC"
+        balance = self.balances.get(token)
+        created_at = event.get("created_at") or 0
+        if balance is not None and _updated_at(balance) > created_at:
+            return self._applied(False)
+        self.balances[token] = {
+            "token": token,
+            "size": event.get("settlement_asset_balance_after"),
+            "last_updated_at": created_at,
+        }
+        return self._applied(True)
+
+    def order(self, order_id: str) -> dict | None:
+        """Open order by Paradex order id."""
+        return self.orders.get(order_id)
+
+    def order_by_client_id(self, client_id: str) -> dict | None:
+        """Open order by client order id."""
+        order_id = self._client_ids.get(client_id)
+        return self.orders.get(order_id) if order_id is not None else None
+
+    def open_orders(self, market: str | None = None) -> list[dict]:
+        """Open orders, optionally of a single market."""
+        return [o for o in self.orders.values() if market is None or o.get("market") == market]
+
+    def position(self, market: str) -> dict | None:
+        """Open position of `market`."""
+        return self.positions.get(market)
+
+    def position_size(self, market: str) -> Decimal:
+        """Signed position size of `market` (negative when short), 0 without a position."""
+        position = self.positions.get(market)
+        if position is None:
+            return Decimal(0)
+        size = Decimal(position.get("size") or 0)
+        return -abs(size) if position.get("side") == "SHORT" else size
+
+    def balance(self, token: str | None = None) -> Decimal | None:
+        """Balance of `token`, by default the settlement asset."""
+        balance = self.balances.get(token or self.account.get("settlement_asset") or "USDC")
+        return Decimal(balance["size"]) if balance and balance.get("size") is not None else None
+
+    def free_collateral(self) -> Decimal | None:
+        """Free collateral from the latest account summary."""
+        value = self.account.get("free_collateral")
+        return Decimal(value) if value is not None else None
+
+    def stats(self) -> AccountStateStats:
+        return AccountStateStats(**vars(self._stats))
+
+    def reset_stats(self) -> None:
+        self._stats = AccountStateStats()
@@ -1,70 +1,73 @@
 import contextlib
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from typing import Any, cast
 
 import httpx
 
 from paradex_py.account.account import ParadexAccount
+from paradex_py.account.presigned_orders import PresignedOrderCache
+from paradex_py.account.signing_executor import SigningExecutor
 from paradex_py.api.block_trades_api import BlockTradesMixin
-from paradex_py.api.http_client import HttpClient, HttpMethod
-from paradex_py.api.models import AccountSummary, AccountSummarySchema, AuthSchema, SystemConfig, SystemConfigSchema
-from paradex_py.api.protocols import AuthProvider, Signer
-from paradex_py.common.order import Order
+from paradex_py.api.http_client import HttpClient, HttpMethod, HttpPoolConfig
+from paradex_py.api.models import (
+    ACCOUNT_SUMMARY_SCHEMA,
+    AUTH_SCHEMA,
+    SYSTEM_CONFIG_SCHEMA,
+    AccountSummary,
+    SystemConfig,
+)
+from paradex_py.api.protocols import AuthProvider, RequestHook, Signer
+from paradex_py.api.rate_limiter import RateLimiter
+from paradex_py.api.typed_responses import (
+    TypedBbo,
+    TypedFill,
+    TypedOrder,
+    TypedOrderBook,
+    TypedPosition,
+    TypedResponseDecoder,
+)
+from paradex_py.common.latency import AUTH, PAYLOAD, SIGN, LatencyRecorder, LatencySummary, timed_stage
+from paradex_py.common.order import Order, OrderSide, OrderType
 from paradex_py.environment import Environment
 from paradex_py.utils import raise_value_error
 
 
-class ParadexApiClient(BlockTradesMixin, HttpClient):
-    """Class to interact with Paradex REST API.
-        Initialized along with `Paradex` class.
-
-    Args:
-        env (Environment): Environment
-        logger (logging.Logger, optional): Logger. Defaults to None.
-        http_client (HttpClient, optional): Custom HTTP client for injection. Defaults to None.
-        api_base_url (str, optional): Custom base URL override. Defaults to None.
-        auto_auth (bool, optional): Whether to automatically handle onboarding/auth. Defaults to True.
-        auth_provider (AuthProvider, optional): Custom authentication provider. Defaults to None.
-        signer (Signer, optional): Custom order signer for submit/modify/batch operations. Defaults to None.
+class ParadexApiClientBase:
+    """Auth, signing and payload logic shared by the sync and async API clients.
 
-    Examples:
-        >>> from paradex_py import Paradex
-        >>> from paradex_py.environment import Environment
-        >>> paradex = Paradex(env=Environment.TESTNET)
+    Everything here is transport independent: building order payloads,
+    choosing the signer, deciding when the JWT must be refreshed and
+    applying a fresh token. `ParadexApiClient` and `AsyncParadexApiClient`
+    only add the (blocking or awaitable) request calls on top.
     """
 
     classname: str = "ParadexApiClient"
 
-    def __init__(
+    client: httpx.Client | httpx.AsyncClient
+    logger: logging.Logger
+    request_hook: RequestHook | None
+
+    def _init_api_config(
         self,
         env: Environment,
-        logger: logging.Logger | None = None,
-        http_client: HttpClient | None = None,
-        api_base_url: str | None = None,
-        auto_auth: bool = True,
-        auth_provider: AuthProvider | None = None,
-        signer: Signer | None = None,
-        use_interactive_token: bool = False,
-    ):
+        logger: logging.Logger | None,
+        api_base_url: str | None,
+        auto_auth: bool,
+        auth_provider: AuthProvider | None,
+        signer: Signer | None,
+        use_interactive_token: bool,
+        signing_executor: SigningExecutor | None = None,
+        collect_latency: bool = False,
+    ) -> None:
         self.env = env
         self.logger = logger or logging.getLogger(__name__)
         self.use_interactive_token = use_interactive_token  # Use interactive token (free, 500ms extra latency)
 
-        # Initialize parent with optional HTTP client injection
-        if http_client is not None:
-            # Extract the underlying httpx.Client if it's wrapped in HttpClient
-            if hasattr(http_client, "client"):
-                # http_client is another HttpClient instance, extract the underlying client
-                underlying_client = http_client.client
-            else:
-                # http_client is already an httpx.Client, cast to ensure type safety
-                underlying_client = cast(httpx.Client, http_client)
-            super().__init__(http_client=underlying_client)
-        else:
-            super().__init__()
-
         # Use custom base URL if provided, otherwise use default
         if api_base_url is not None:
             self.api_url = api_base_url
@@ -77,39 +80,50 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
         self._manual_token: str | None = None
         self.account: ParadexAccount | None = None
         self.auth_timestamp = 0
+        self._auth_lock = threading.Lock()
 
         # Signing configuration
         self.signer = signer
+        self.signing_executor = signing_executor
+        self._presigned_orders: PresignedOrderCache | None = None
 
-    async def __aexit__(self):
-        self.client.close()
+        # Decoder of the `fetch_*_typed` methods; replace it to register market precisions
+        self.response_decoder = TypedResponseDecoder()
 
-    def init_account(self, account: ParadexAccount):
-        self.account = account
-        if self.auto_auth:
-            with contextlib.suppress(Exception):
-                # Onboarding is not a critical step if the account has already been onboarded.
-                self.onboarding()
-            self.auth()
+        # Latency breakdown of order submissions, modifications and cancels
+        self.latency: LatencyRecorder | None = LatencyRecorder() if collect_latency else None
 
-    def onboarding(self):
+    def _onboarding_request(self) -> tuple[dict, dict]:
         if self.account is None:
             raise ValueError("Account not initialized")
         headers = self.account.onboarding_headers()
         payload = {"public_key": hex(self.account.l2_public_key)}
-        self.post(api_url=self.api_url, path="onboarding", headers=headers, payload=payload)
+        return headers, payload
 
-    def auth(self):
+    def _auth_request(self) -> tuple[str, dict]:
         if self.account is None:
             raise ValueError("Account not initialized")
         headers = self.account.auth_headers()
         # Use interactive token for free API access (500ms extra latency)
         token_param = "?token_usage=interactive" if self.use_interactive_token else ""
-        res = self.post(api_url=self.api_url, path=f"auth/{hex(self.account.l2_public_key)}{token_param}", headers=headers)
-        data = AuthSchema().load(res, unknown="exclude", partial=True)
+        return f"auth/{hex(self.account.l2_public_key)}{token_param}", headers
+
+    def _set_authorization(self, token: str) -> None:
+        """Install `token` on the client headers and the account.
+
+        The header is replaced in a single assignment, so requests built
+        concurrently (e.g. while `TokenManager` refreshes in the background)
+        carry either the old or the new token, never a missing one.
+        """
+        with self._auth_lock:
+            self.client.headers["Authorization"] = f"Bearer {token}"
+            if self.account is not None:
+                self.account.set_jwt_token(token)
+
+    def _apply_auth_response(self, res: dict) -> None:
+        data = AUTH_SCHEMA.load(res, unknown="exclude", partial=True)
         self.auth_timestamp = int(time.time())
-        self.account.set_jwt_token(data.jwt_token)
-        self.client.headers.update({"Authorization": f"Bearer {data.jwt_token}"})
+        self._set_authorization(data.jwt_token)
 
     def set_token(self, jwt: str) -> None:
         """Inject a JWT token without HTTP calls.
@@ -122,36 +136,285 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
         """
         self._manual_token = jwt
         self.auth_timestamp = int(time.time())
-        self.client.headers.update({"Authorization": f"Bearer {jwt}"})
-        if self.account:
-            self.account.set_jwt_token(jwt)
+        self._set_authorization(jwt)
 
-    def _validate_auth(self):
+    def _auth_refresh_needed(self) -> bool:
+        """Apply the current token source and report whether a full auth round trip is due."""
         # Skip auth validation if auto_auth is disabled and we have a manual token
         if not self.auto_auth and self._manual_token:
-            return
+            return False
 
         # Use custom auth provider if available
         if self.auth_provider:
             token = self.auth_provider.refresh_if_needed()
             if token:
-                self.client.headers.update({"Authorization": f"Bearer {token}"})
-                if self.account:
-                    self.account.set_jwt_token(token)
-                return
+                self._set_authorization(token)
+                return False
 
         # Fall back to standard account-based auth
         if self.account is None:
             if not self.auto_auth:
-                return  # Skip auth if disabled and no account
+                return False  # Skip auth if disabled and no account
             return raise_value_error(f"{self.classname}: Account not found")
 
         # Refresh JWT if it's older than 4 minutes
         if time.time() - self.auth_timestamp > 4 * 60:
             if self.auto_auth:
-                self.auth()
+                return True
+            self.logger.warning(f"{self.classname}: JWT expired but auto_auth disabled")
+        return False
+
+    def _latency_operation(self, operation: str) -> contextlib.AbstractContextManager:
+        """Time `operation` into `latency` (and the hook's `on_latency`) if latency is collected."""
+        if self.latency is None:
+            return contextlib.nullcontext()
+        return self.latency.operation(operation, getattr(self.request_hook, "on_latency", None))
+
+    def get_latency_stats(self) -> dict[str, dict[str, LatencySummary]] | None:
+        """Latency distribution per operation and stage, or None unless `collect_latency` is enabled.
+
+        Examples:
+            >>> stats = client.get_latency_stats()
+            >>> stats["submit_order"]["sign"].p99_ms, stats["submit_order"]["server"].p99_ms
+        """
+        return None if self.latency is None else self.latency.summary()
+
+    def reset_latency_stats(self) -> None:
+        if self.latency is not None:
+            self.latency.reset()
+
+    def _order_payload(self, order: Order, signer: Signer | None) -> dict:
+        # Use provided signer, instance signer, or account signer
+        signer = signer if signer is not None else self.signer
+        if signer is not None:
+            with timed_stage(PAYLOAD):
+                order_data = order.dump_to_dict()
+            with timed_stage(SIGN):
+                return signer.sign_order(order_data)
+        # Fall back to account signing
+        if self.account is None:
+            raise ValueError("Account not initialized and no signer provided")
+        order.signature = self.account.sign_order(order)
+        with timed_stage(PAYLOAD):
+            return order.dump_to_dict()
+
+    def _orders_batch_payload(self, orders: list[Order], signer: Signer | None) -> list[dict]:
+        # Use provided signer, instance signer, or account signer
+        signer = signer if signer is not None else self.signer
+        if signer is not None:
+            with timed_stage(PAYLOAD):
+                orders_data = [order.dump_to_dict() for order in orders]
+            with timed_stage(SIGN):
+                return signer.sign_batch(orders_data)
+        # Fall back to account signing
+        signed = self.sign_orders(orders)
+        with timed_stage(PAYLOAD):
+            return [order.dump_to_dict() for order in signed]
+
+    def sign_orders(self, orders: list[Order]) -> list[Order]:
+        """Sign orders with the account key, in parallel if a `signing_executor` is configured.
+
+        Used by `submit_orders_batch`; also useful to sign the orders of block trades and block offers.
+
+        Args:
+            orders: Orders to sign. `signature` is set on each of them.
+
+        Returns:
+            The same orders, in the same order.
+        """
+        if self.account is None:
+            raise ValueError("Account not initialized and no signer provided")
+        if self.signing_executor is not None:
+            with timed_stage(SIGN):
+                signatures = self.signing_executor.sign_orders(self.account, orders)
+        else:
+            signatures = [self.account.sign_order(order) for order in orders]
+        for order, signature in zip(orders, signatures, strict=True):
+            order.signature = signature
+        return orders
+
+    @property
+    def presigned_orders(self) -> PresignedOrderCache:
+        """Cache of pre-signed orders for the current account, used by `submit_presigned_order`.
+
+        Examples:
+            >>> client.presigned_orders.presign_ladder("BTC-USD-PERP", prices=[bid, ask], size=Decimal("0.01"))
+            >>> client.submit_presigned_order("BTC-USD-PERP", OrderSide.Buy, bid, Decimal("0.01"))
+        """
+        if self.account is None:
+            return raise_value_error("Account not initialized")
+        cache = self._presigned_orders
+        if cache is None or cache.account is not self.account:
+            cache = self._presigned_orders = PresignedOrderCache(
+                self.account, signing_executor=self.signing_executor, logger=self.logger
+            )
+        return cache
+
+    def _presigned_order_payload(
+        self, market: str, order_side: OrderSide, price: Decimal, size: Decimal, order_kwargs: dict
+    ) -> dict:
+        presigned = self.presigned_orders.take(market, order_side, price, size, **order_kwargs)
+        if presigned is not None:
+            return presigned.payload
+        # Cache miss: sign now
+        order = Order(
+            market=market,
+            order_type=order_kwargs.pop("order_type", OrderType.Limit),
+            order_side=order_side,
+            size=size,
+            limit_price=price,
+            **order_kwargs,
+        )
+        return self._order_payload(order, None)
+
+    def _cancel_batch_payload(self, order_ids: list[str] | None, client_order_ids: list[str] | None) -> dict:
+        if not order_ids and not client_order_ids:
+            return raise_value_error(f"{self.classname}: Must provide either order_ids or client_order_ids")
+
+        payload = {}
+        if order_ids:
+            payload["order_ids"] = order_ids
+        if client_order_ids:
+            payload["client_order_ids"] = client_order_ids
+        return payload
+
+    def _parse_system_config(self, res: dict) -> SystemConfig:
+        # Extract base URL from full URL if not provided in response
+        if "starknet_fullnode_rpc_base_url" not in res and "starknet_fullnode_rpc_url" in res:
+            base_url = re.sub(r"/rpc/v\d+[._]\d+.*$", "", res["starknet_fullnode_rpc_url"])
+            res["starknet_fullnode_rpc_base_url"] = base_url
+        return SYSTEM_CONFIG_SCHEMA.load(res, unknown="exclude", partial=True)
+
+    def _trades_params(self, params: dict) -> dict:
+        if "market" not in params:
+            return raise_value_error(f"{self.classname}: Market is required to fetch trades")
+        return params
+
+    def _klines_params(self, symbol: str, resolution: str, start_at: int, end_at: int, price_kind: str | None) -> dict:
+        params = {
+            "symbol": symbol,
+            "resolution": resolution,
+            "start_at": start_at,
+            "end_at": end_at,
+        }
+        if price_kind:
+            params["price_kind"] = price_kind
+        return params
+
+
+class ParadexApiClient(ParadexApiClientBase, BlockTradesMixin, HttpClient):
+    """Class to interact with Paradex REST API.
+        Initialized along with `Paradex` class.
+
+    Args:
+        env (Environment): Environment
+        logger (logging.Logger, optional): Logger. Defaults to None.
+        http_client (HttpClient, optional): Custom HTTP client for injection. Defaults to None.
+        api_base_url (str, optional): Custom base URL override. Defaults to None.
+        auto_auth (bool, optional): Whether to automatically handle onboarding/auth. Defaults to True.
+        auth_provider (AuthProvider, optional): Custom authentication provider. Defaults to None.
+        signer (Signer, optional): Custom order signer for submit/modify/batch operations. Defaults to None.
+        signing_executor (SigningExecutor, optional): Parallel signer for order batches. Defaults to None.
+        pool_config (HttpPoolConfig, optional): Connection pool / HTTP/2 settings of the default HTTP client; not allowed with `http_client`. Defaults to None.
+        collect_pool_stats (bool, optional): Count new vs reused connections. Defaults to False.
+        rate_limiter (RateLimiter, optional): Client-side per-endpoint rate limiter. Defaults to None.
+        collect_latency (bool, optional): Record the latency breakdown of order submissions, modifications
+            and cancels (see `get_latency_stats`). Defaults to False.
+
+    Examples:
+        >>> from paradex_py import Paradex
+        >>> from paradex_py.environment import Environment
+        >>> paradex = Paradex(env=Environment.TESTNET)
+    """
+
+    classname: str = "ParadexApiClient"
+
+    client: httpx.Client
+
+    def __init__(
+        self,
+        env: Environment,
+        logger: logging.Logger | None = None,
+        http_client: HttpClient | None = None,
+        api_base_url: str | None = None,
+        auto_auth: bool = True,
+        auth_provider: AuthProvider | None = None,
+        signer: Signer | None = None,
+        use_interactive_token: bool = False,
+        signing_executor: SigningExecutor | None = None,
+        pool_config: HttpPoolConfig | None = None,
+        collect_pool_stats: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        collect_latency: bool = False,
+    ):
+        # Initialize parent with optional HTTP client injection
+        if isinstance(http_client, HttpClient):
+            # Keep the options configured on the injected wrapper
+            HttpClient.__init__(
+                self,
+                http_client=http_client.client,
+                pool_config=pool_config,
+                default_timeout=http_client.default_timeout,
+                retry_strategy=http_client.retry_strategy,
+                request_hook=http_client.request_hook,
+                collect_pool_stats=collect_pool_stats or http_client.pool_stats is not None,
+                rate_limiter=rate_limiter or http_client.rate_limiter,
+            )
+        elif http_client is not None:
+            # Extract the underlying httpx.Client if it's wrapped in another client object
+            if hasattr(http_client, "client"):
+                underlying_client = http_client.client
             else:
-                self.logger.warning(f"{self.classname}: JWT expired but auto_auth disabled")
+                # http_client is already an httpx.Client, cast to ensure type safety
+                underlying_client = cast(httpx.Client, http_client)
+            HttpClient.__init__(
+                self,
+                http_client=underlying_client,
+                pool_config=pool_config,
+                collect_pool_stats=collect_pool_stats,
+                rate_limiter=rate_limiter,
+            )
+        else:
+            HttpClient.__init__(
+                self, pool_config=pool_config, collect_pool_stats=collect_pool_stats, rate_limiter=rate_limiter
+            )
+
+        self._init_api_config(
+            env=env,
+            logger=logger,
+            api_base_url=api_base_url,
+            auto_auth=auto_auth,
+            auth_provider=auth_provider,
+            signer=signer,
+            use_interactive_token=use_interactive_token,
+            signing_executor=signing_executor,
+            collect_latency=collect_latency,
+        )
+
+    async def __aexit__(self):
+        self.client.close()
+
+    def init_account(self, account: ParadexAccount):
+        self.account = account
+        if self.auto_auth:
+            with contextlib.suppress(Exception):
+                # Onboarding is not a critical step if the account has already been onboarded.
+                self.onboarding()
+            self.auth()
+
+    def onboarding(self):
+        headers, payload = self._onboarding_request()
+        self.post(api_url=self.api_url, path="onboarding", headers=headers, payload=payload)
+
+    def auth(self):
+        path, headers = self._auth_request()
+        res = self.post(api_url=self.api_url, path=path, headers=headers)
+        self._apply_auth_response(res)
+
+    def _validate_auth(self):
+        with timed_stage(AUTH):
+            if self._auth_refresh_needed():
+                self.auth()
 
     def _get(self, path: str, params: dict | None = None) -> dict:
         return self.get(api_url=self.api_url, path=path, params=params)
@@ -354,7 +617,7 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
         Private endpoint requires authorization.
         """
         res = self._get_authorized(path="account")
-        return AccountSummarySchema().load(res, unknown="exclude", partial=True)
+        return ACCOUNT_SUMMARY_SCHEMA.load(res, unknown="exclude", partial=True)
 
     def fetch_account_profile(self) -> dict:
         """Fetch profile for this account.
@@ -421,9 +684,7 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
             prev (str): The pointer to fetch previous set of records (null if there are no records left)
             results (list): List of Trades
         """
-        if "market" not in params:
-            return raise_value_error(f"{self.classname}: Market is required to fetch trades")
-        return self._get(path="trades", params=params)
+        return self._get(path="trades", params=self._trades_params(params))
 
     def fetch_subaccounts(self) -> dict:
         """Fetch list of sub-accounts for this account.
@@ -445,23 +706,9 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
             order: Order containing all required fields.
             signer: Optional custom signer. Uses instance signer or account signer if None.
         """
-        # Use provided signer, instance signer, or account signer
-        if signer is not None:
-            order_data = order.dump_to_dict()
-            signed_data = signer.sign_order(order_data)
-            order_payload = signed_data
-        elif self.signer is not None:
-            order_data = order.dump_to_dict()
-            signed_data = self.signer.sign_order(order_data)
-            order_payload = signed_data
-        else:
-            # Fall back to account signing
-            if self.account is None:
-                raise ValueError("Account not initialized and no signer provided")
-            order.signature = self.account.sign_order(order)
-            order_payload = order.dump_to_dict()
-
-        return self._post_authorized(path="orders", payload=order_payload)
+        with self._latency_operation("submit_order"):
+            order_payload = self._order_payload(order, signer)
+            return self._post_authorized(path="orders", payload=order_payload)
 
     def submit_orders_batch(self, orders: list[Order], signer: Signer | None = None) -> dict:
         """Send batch of orders to Paradex.
@@ -475,24 +722,27 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
             orders (list): List of Orders
             errors (list): List of Errors
         """
-        # Use provided signer, instance signer, or account signer
-        if signer is not None:
-            order_data_list = [order.dump_to_dict() for order in orders]
-            order_payloads = signer.sign_batch(order_data_list)
-        elif self.signer is not None:
-            order_data_list = [order.dump_to_dict() for order in orders]
-            order_payloads = self.signer.sign_batch(order_data_list)
-        else:
-            # Fall back to account signing
-            if self.account is None:
-                raise ValueError("Account not initialized and no signer provided")
-            order_payloads = []
-            for order in orders:
-                order.signature = self.account.sign_order(order)
-                order_payload = order.dump_to_dict()
-                order_payloads.append(order_payload)
+        with self._latency_operation("submit_orders_batch"):
+            order_payloads = self._orders_batch_payload(orders, signer)
+            return self._post_authorized(path="orders/batch", payload=order_payloads)
 
-        return self._post_authorized(path="orders/batch", payload=order_payloads)
+    def submit_presigned_order(
+        self, market: str, order_side: OrderSide, price: Decimal, size: Decimal, **order_kwargs: Any
+    ) -> dict:
+        """Send the matching order from `presigned_orders`, signing a new one on a miss.
+            Private endpoint requires authorization.
+
+        Args:
+            market: Market name
+            order_side: Order side
+            price: Limit price
+            size: Order size
+            **order_kwargs: Other `Order` arguments (order_type, instruction, ...); a cached order
+                signed with different values is not used.
+        """
+        with self._latency_operation("submit_presigned_order"):
+            order_payload = self._presigned_order_payload(market, order_side, price, size, order_kwargs)
+            return self._post_authorized(path="orders", payload=order_payload)
 
     def modify_order(self, order_id: str, order: Order, signer: Signer | None = None) -> dict:
         """Modify an open order previously sent to Paradex from this account.
@@ -503,23 +753,9 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
             order: Order update
             signer: Optional custom signer. Uses instance signer or account signer if None.
         """
-        # Use provided signer, instance signer, or account signer
-        if signer is not None:
-            order_data = order.dump_to_dict()
-            signed_data = signer.sign_order(order_data)
-            order_payload = signed_data
-        elif self.signer is not None:
-            order_data = order.dump_to_dict()
-            signed_data = self.signer.sign_order(order_data)
-            order_payload = signed_data
-        else:
-            # Fall back to account signing
-            if self.account is None:
-                raise ValueError("Account not initialized and no signer provided")
-            order.signature = self.account.sign_order(order)
-            order_payload = order.dump_to_dict()
-
-        return self._put_authorized(path=f"orders/{order_id}", payload=order_payload)
+        with self._latency_operation("modify_order"):
+            order_payload = self._order_payload(order, signer)
+            return self._put_authorized(path=f"orders/{order_id}", payload=order_payload)
 
     def cancel_order(self, order_id: str) -> None:
         """Cancel open order previously sent to Paradex from this account.
@@ -528,7 +764,8 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
         Args:
             order_id: Order Id
         """
-        self._delete_authorized(path=f"orders/{order_id}")
+        with self._latency_operation("cancel_order"):
+            self._delete_authorized(path=f"orders/{order_id}")
 
     def cancel_order_by_client_id(self, client_id: str) -> None:
         """Cancel open order previously sent to Paradex from this account.
@@ -537,7 +774,8 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
         Args:
             client_id: Order id as assigned by a trader.
         """
-        self._delete_authorized(path=f"orders/by_client_id/{client_id}")
+        with self._latency_operation("cancel_order_by_client_id"):
+            self._delete_authorized(path=f"orders/by_client_id/{client_id}")
 
     def cancel_all_orders(self, params: dict | None = None) -> None:
         """Cancel all open orders for specific market or for all markets.
@@ -547,7 +785,8 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
             params:
                 `market`: Market Name\n
         """
-        self._delete_authorized(path="orders", params=params)
+        with self._latency_operation("cancel_all_orders"):
+            self._delete_authorized(path="orders", params=params)
 
     def cancel_orders_batch(
         self, order_ids: list[str] | None = None, client_order_ids: list[str] | None = None
@@ -562,16 +801,9 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
         Returns:
             results (list): List of cancellation results for each order
         """
-        if not order_ids and not client_order_ids:
-            return raise_value_error(f"{self.classname}: Must provide either order_ids or client_order_ids")
-
-        payload = {}
-        if order_ids:
-            payload["order_ids"] = order_ids
-        if client_order_ids:
-            payload["client_order_ids"] = client_order_ids
-
-        return self._delete_authorized(path="orders/batch", payload=payload)
+        with self._latency_operation("cancel_orders_batch"):
+            payload = self._cancel_batch_payload(order_ids, client_order_ids)
+            return self._delete_authorized(path="orders/batch", payload=payload)
 
     # PUBLIC GET METHODS
     def fetch_system_config(self) -> SystemConfig:
@@ -586,11 +818,7 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
             url=f"{self.api_url}/system/config",
             http_method=HttpMethod.GET,
         )
-        # Extract base URL from full URL if not provided in response
-        if "starknet_fullnode_rpc_base_url" not in res and "starknet_fullnode_rpc_url" in res:
-            base_url = re.sub(r"/rpc/v\d+[._]\d+.*$", "", res["starknet_fullnode_rpc_url"])
-            res["starknet_fullnode_rpc_base_url"] = base_url
-        config = SystemConfigSchema().load(res, unknown="exclude", partial=True)
+        config = self._parse_system_config(res)
         # self.logger.info(f"{self.classname}: SystemConfig: {config}")
         return config
 
@@ -615,6 +843,22 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
         """
         return self._get(path="system/time")
 
+    def warm_up(self, connections: int = 1) -> None:
+        """Open pooled connections ahead of the first latency critical request.
+
+        Sends `connections` concurrent `system/time` requests, so that many
+        connections (TCP + TLS) are established and kept alive in the pool.
+
+        Args:
+            connections: Number of connections to open.
+        """
+        if connections <= 1:
+            self.fetch_system_time()
+            return
+        with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="paradex-warm-up") as executor:
+            for future in [executor.submit(self.fetch_system_time) for _ in range(connections)]:
+                future.result()
+
     def fetch_markets(self, params: dict | None = None) -> dict:
         """Fetch all markets information.
 
@@ -656,14 +900,7 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
         Returns:
             List of OHLCV candlestick data
         """
-        params = {
-            "symbol": symbol,
-            "resolution": resolution,
-            "start_at": start_at,
-            "end_at": end_at,
-        }
-        if price_kind:
-            params["price_kind"] = price_kind
+        params = self._klines_params(symbol, resolution, start_at, end_at, price_kind)
         return self._get(path="markets/klines", params=params)
 
     def fetch_orderbook(self, market: str, params: dict | None = None) -> dict:
@@ -684,6 +921,26 @@ class ParadexApiClient(BlockTradesMixin, HttpClient):
         """
         return self._get(path=f"bbo/{market}")
 
+    def fetch_bbo_typed(self, market: str) -> TypedBbo:
+        """Fetch best bid/offer as a `TypedBbo` with fixed-point prices, see `typed_responses`."""
+        return self.response_decoder.bbo(self.fetch_bbo(market))
+
+    def fetch_orderbook_typed(self, market: str, params: dict | None = None) -> TypedOrderBook:
+        """Fetch order-book as a `TypedOrderBook` with fixed-point levels."""
+        return self.response_decoder.orderbook(self.fetch_orderbook(market, params))
+
+    def fetch_orders_typed(self, params: dict | None = None) -> list[TypedOrder]:
+        """Fetch open orders as `TypedOrder`s. Private endpoint requires authorization."""
+        return self.response_decoder.orders(self.fetch_orders(params))
+
+    def fetch_fills_typed(self, params: dict | None = None) -> list[TypedFill]:
+        """Fetch one page of fills as `TypedFill`s. Private endpoint requires authorization."""
+        return self.response_decoder.fills(self.fetch_fills(params))
+
+    def fetch_positions_typed(self) -> list[TypedPosition]:
+        """Fetch positions as `TypedPosition`s. Private endpoint requires authorization."""
+        return self.response_decoder.positions(self.fetch_positions())
+
     def fetch_insurance_fund(self) -> dict:
         """Fetch insurance fund information"""
         return self._get(path="insurance")
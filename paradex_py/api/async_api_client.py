@@ -0,0 +1,418 @@
+import asyncio
+import contextlib
+import logging
+from decimal import Decimal
+from typing import Any
+
+import httpx
+
+from paradex_py.account.account import ParadexAccount
+from paradex_py.account.signing_executor import SigningExecutor
+from paradex_py.api.api_client import ParadexApiClientBase
+from paradex_py.api.async_http_client import AsyncHttpClient
+from paradex_py.api.block_trades_api import AsyncBlockTradesMixin
+from paradex_py.api.http_client import HttpMethod, HttpPoolConfig
+from paradex_py.api.models import ACCOUNT_SUMMARY_SCHEMA, AccountSummary, SystemConfig
+from paradex_py.api.protocols import AuthProvider, RequestHook, RetryStrategy, Signer
+from paradex_py.api.rate_limiter import RateLimiter
+from paradex_py.api.typed_responses import TypedBbo, TypedFill, TypedOrder, TypedOrderBook, TypedPosition
+from paradex_py.common.latency import AUTH, timed_stage
+from paradex_py.common.order import Order, OrderSide
+from paradex_py.environment import Environment
+
+
+class AsyncParadexApiClient(ParadexApiClientBase, AsyncBlockTradesMixin, AsyncHttpClient):
+    """Asyncio client for the Paradex REST API.
+
+    Mirrors `ParadexApiClient` method for method, but every request is a
+    coroutine running on `httpx.AsyncClient`, so order placement can share
+    the event loop with `ParadexWebsocketClient` instead of hopping to a
+    thread. Auth, JWT refresh and order signing are shared with the
+    synchronous client.
+
+    Args:
+        env (Environment): Environment
+        logger (logging.Logger, optional): Logger. Defaults to None.
+        http_client (AsyncHttpClient | httpx.AsyncClient, optional): Custom HTTP client for injection. Defaults to None.
+        api_base_url (str, optional): Custom base URL override. Defaults to None.
+        auto_auth (bool, optional): Whether to automatically handle onboarding/auth. Defaults to True.
+        auth_provider (AuthProvider, optional): Custom authentication provider. Defaults to None.
+        signer (Signer, optional): Custom order signer for submit/modify/batch operations. Defaults to None.
+        use_interactive_token (bool, optional): Use interactive token for free API access. Defaults to False.
+        default_timeout (float, optional): Default HTTP request timeout in seconds. Defaults to None.
+        retry_strategy (RetryStrategy, optional): Custom retry/backoff strategy. Defaults to None.
+        request_hook (RequestHook, optional): Hook for request/response observability. Defaults to None.
+        signing_executor (SigningExecutor, optional): Parallel signer for order batches. Defaults to None.
+        pool_config (HttpPoolConfig, optional): Connection pool / HTTP/2 settings of the default HTTP client; not allowed with `http_client`. Defaults to None.
+        collect_pool_stats (bool, optional): Count new vs reused connections. Defaults to False.
+        rate_limiter (RateLimiter, optional): Client-side per-endpoint rate limiter. Defaults to None.
+        collect_latency (bool, optional): Record the latency breakdown of order submissions, modifications
+            and cancels (see `get_latency_stats`). Defaults to False.
+
+    Examples:
+        >>> from paradex_py import Paradex
+        >>> from paradex_py.api.async_api_client import AsyncParadexApiClient
+        >>> from paradex_py.environment import Environment
+        >>> async def main():
+        ...     paradex = Paradex(env=Environment.TESTNET, l1_address="0x...", l1_private_key="0x...")
+        ...     async with AsyncParadexApiClient(env=Environment.TESTNET) as api_client:
+        ...         await api_client.init_account(paradex.account)
+        ...         await api_client.fetch_orders()
+    """
+
+    classname: str = "AsyncParadexApiClient"
+
+    client: httpx.AsyncClient
+
+    def __init__(
+        self,
+        env: Environment,
+        logger: logging.Logger | None = None,
+        http_client: AsyncHttpClient | httpx.AsyncClient | None = None,
+        api_base_url: str | None = None,
+        auto_auth: bool = True,
+        auth_provider: AuthProvider | None = None,
+        signer: Signer | None = None,
+        use_interactive_token: bool = False,
+        default_timeout: float | None = None,
+        retry_strategy: RetryStrategy | None = None,
+        request_hook: RequestHook | None = None,
+        signing_executor: SigningExecutor | None = None,
+        pool_config: HttpPoolConfig | None = None,
+        collect_pool_stats: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        collect_latency: bool = False,
+    ):
+        if isinstance(http_client, AsyncHttpClient):
+            # Keep the options configured on the injected wrapper unless overridden
+            AsyncHttpClient.__init__(
+                self,
+                http_client=http_client.client,
+                pool_config=pool_config,
+                default_timeout=default_timeout if default_timeout is not None else http_client.default_timeout,
+                retry_strategy=retry_strategy or http_client.retry_strategy,
+                request_hook=request_hook or http_client.request_hook,
+                collect_pool_stats=collect_pool_stats or http_client.pool_stats is not None,
+                rate_limiter=rate_limiter or http_client.rate_limiter,
+            )
+        else:
+            AsyncHttpClient.__init__(
+                self,
+                http_client=http_client,
+                default_timeout=default_timeout,
+                retry_strategy=retry_strategy,
+                request_hook=request_hook,
+                pool_config=pool_config,
+                collect_pool_stats=collect_pool_stats,
+                rate_limiter=rate_limiter,
+            )
+
+        self._init_api_config(
+            env=env,
+            logger=logger,
+            api_base_url=api_base_url,
+            auto_auth=auto_auth,
+            auth_provider=auth_provider,
+            signer=signer,
+            use_interactive_token=use_interactive_token,
+            signing_executor=signing_executor,
+            collect_latency=collect_latency,
+        )
+
+    async def __aenter__(self) -> "AsyncParadexApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def init_account(self, account: ParadexAccount) -> None:
+        self.account = account
+        if self.auto_auth:
+            with contextlib.suppress(Exception):
+                # Onboarding is not a critical step if the account has already been onboarded.
+                await self.onboarding()
+            await self.auth()
+
+    async def onboarding(self) -> None:
+        headers, payload = self._onboarding_request()
+        await self.post(api_url=self.api_url, path="onboarding", headers=headers, payload=payload)
+
+    async def auth(self) -> None:
+        path, headers = self._auth_request()
+        res = await self.post(api_url=self.api_url, path=path, headers=headers)
+        self._apply_auth_response(res)
+
+    async def _validate_auth(self) -> None:
+        with timed_stage(AUTH):
+            if self._auth_refresh_needed():
+                await self.auth()
+
+    async def _get(self, path: str, params: dict | None = None) -> dict:
+        return await self.get(api_url=self.api_url, path=path, params=params)
+
+    async def _get_authorized(self, path: str, params: dict | None = None) -> dict:
+        await self._validate_auth()
+        return await self._get(path=path, params=params)
+
+    async def _post_authorized(
+        self,
+        path: str,
+        payload: dict[str, Any] | list[dict[str, Any]] | None = None,
+        params: dict | None = None,
+        headers: dict | None = None,
+    ) -> dict:
+        await self._validate_auth()
+        return await self.post(api_url=self.api_url, path=path, payload=payload, params=params, headers=headers)
+
+    async def _put_authorized(
+        self,
+        path: str,
+        payload: dict[str, Any] | list[dict[str, Any]] | None = None,
+        params: dict | None = None,
+        headers: dict | None = None,
+    ) -> dict:
+        await self._validate_auth()
+        return await self.put(api_url=self.api_url, path=path, payload=payload, params=params, headers=headers)
+
+    async def _delete_authorized(self, path: str, params: dict | None = None, payload: dict | None = None) -> dict:
+        await self._validate_auth()
+        return await self.delete(api_url=self.api_url, path=path, params=params, payload=payload)
+
+    # PRIVATE GET METHODS
+    async def fetch_orders(self, params: dict | None = None) -> dict:
+        """Fetch open orders for the account. See `ParadexApiClient.fetch_orders`."""
+        return await self._get_authorized(path="orders", params=params)
+
+    async def fetch_orders_history(self, params: dict | None = None) -> dict:
+        """Fetch history of orders for the account. See `ParadexApiClient.fetch_orders_history`."""
+        return await self._get_authorized(path="orders-history", params=params)
+
+    async def fetch_order(self, order_id: str) -> dict:
+        """Fetch a state of specific order sent from this account."""
+        return await self._get_authorized(path=f"orders/{order_id}")
+
+    async def fetch_order_by_client_id(self, client_id: str) -> dict:
+        """Fetch a state of specific order by its client_id."""
+        return await self._get_authorized(path=f"orders/by_client_id/{client_id}")
+
+    async def fetch_fills(self, params: dict | None = None) -> dict:
+        """Fetch history of fills for this account. See `ParadexApiClient.fetch_fills`."""
+        return await self._get_authorized(path="fills", params=params)
+
+    async def fetch_tradebusts(self, params: dict | None = None) -> dict:
+        """Fetch history of tradebusts for this account. See `ParadexApiClient.fetch_tradebusts`."""
+        return await self._get_authorized(path="tradebusts", params=params)
+
+    async def fetch_funding_payments(self, params: dict | None = None) -> dict:
+        """Fetch history of funding payments for this account. See `ParadexApiClient.fetch_funding_payments`."""
+        return await self._get_authorized(path="funding/payments", params=params)
+
+    async def fetch_funding_data(self, params: dict | None = None) -> dict:
+        """List historical funding data by market. See `ParadexApiClient.fetch_funding_data`."""
+        return await self._get(path="funding/data", params=params)
+
+    async def fetch_transactions(self, params: dict | None = None) -> dict:
+        """Fetch history of transactions initiated by this account. See `ParadexApiClient.fetch_transactions`."""
+        return await self._get_authorized(path="transactions", params=params)
+
+    async def fetch_transfers(self, params: dict | None = None) -> dict:
+        """Fetch history of transfers initiated by this account. See `ParadexApiClient.fetch_transfers`."""
+        return await self._get_authorized(path="transfers", params=params)
+
+    async def fetch_account_summary(self) -> AccountSummary:
+        """Fetch current summary for this account."""
+        res = await self._get_authorized(path="account")
+        return ACCOUNT_SUMMARY_SCHEMA.load(res, unknown="exclude", partial=True)
+
+    async def fetch_account_profile(self) -> dict:
+        """Fetch profile for this account."""
+        return await self._get_authorized(path="account/profile")
+
+    async def fetch_balances(self) -> dict:
+        """Fetch all coin balances for this account."""
+        return await self._get_authorized(path="balance")
+
+    async def fetch_positions(self) -> dict:
+        """Fetch all derivatives positions for this account."""
+        return await self._get_authorized(path="positions")
+
+    async def fetch_points_data(self, market: str, program: str) -> dict:
+        """Fetch points program data for specific market."""
+        return await self._get_authorized(path=f"points_data/{market}/{program}")
+
+    async def fetch_liquidations(self, params: dict | None = None) -> dict:
+        """Fetch history of liquidations for this account."""
+        return await self._get(path="liquidations", params=params)
+
+    async def fetch_trades(self, params: dict) -> dict:
+        """Fetch Paradex exchange trades for specific market (`market` param is required)."""
+        return await self._get(path="trades", params=self._trades_params(params))
+
+    async def fetch_subaccounts(self) -> dict:
+        """Fetch list of sub-accounts for this account."""
+        return await self._get_authorized(path="account/subaccounts")
+
+    async def fetch_account_info(self) -> dict:
+        """Fetch info for this account."""
+        return await self._get_authorized(path="account/info")
+
+    async def submit_order(self, order: Order, signer: Signer | None = None) -> dict:
+        """Send order to Paradex.
+            Private endpoint requires authorization.
+
+        Args:
+            order: Order containing all required fields.
+            signer: Optional custom signer. Uses instance signer or account signer if None.
+        """
+        with self._latency_operation("submit_order"):
+            order_payload = self._order_payload(order, signer)
+            return await self._post_authorized(path="orders", payload=order_payload)
+
+    async def submit_presigned_order(
+        self, market: str, order_side: OrderSide, price: Decimal, size: Decimal, **order_kwargs: Any
+    ) -> dict:
+        """Send the matching order from `presigned_orders`, signing a new one on a miss.
+            Private endpoint requires authorization.
+
+        Args:
+            market: Market name
+            order_side: Order side
+            price: Limit price
+            size: Order size
+            **order_kwargs: Other `Order` arguments (order_type, instruction, ...); a cached order
+                signed with different values is not used.
+        """
+        with self._latency_operation("submit_presigned_order"):
+            order_payload = self._presigned_order_payload(market, order_side, price, size, order_kwargs)
+            return await self._post_authorized(path="orders", payload=order_payload)
+
+    async def submit_orders_batch(self, orders: list[Order], signer: Signer | None = None) -> dict:
+        """Send batch of orders to Paradex.
+            Private endpoint requires authorization.
+
+        Args:
+            orders: List of orders containing all required fields.
+            signer: Optional custom signer. Uses instance signer or account signer if None.
+
+        Returns:
+            orders (list): List of Orders
+            errors (list): List of Errors
+        """
+        with self._latency_operation("submit_orders_batch"):
+            if self.signing_executor is not None and signer is None and self.signer is None:
+                # Keep the event loop responsive while the pool signs
+                order_payloads = await asyncio.to_thread(self._orders_batch_payload, orders, signer)
+            else:
+                order_payloads = self._orders_batch_payload(orders, signer)
+            return await self._post_authorized(path="orders/batch", payload=order_payloads)
+
+    async def modify_order(self, order_id: str, order: Order, signer: Signer | None = None) -> dict:
+        """Modify an open order previously sent to Paradex from this account.
+            Private endpoint requires authorization.
+
+        Args:
+            order_id: Order Id
+            order: Order update
+            signer: Optional custom signer. Uses instance signer or account signer if None.
+        """
+        with self._latency_operation("modify_order"):
+            order_payload = self._order_payload(order, signer)
+            return await self._put_authorized(path=f"orders/{order_id}", payload=order_payload)
+
+    async def cancel_order(self, order_id: str) -> None:
+        """Cancel open order previously sent to Paradex from this account."""
+        with self._latency_operation("cancel_order"):
+            await self._delete_authorized(path=f"orders/{order_id}")
+
+    async def cancel_order_by_client_id(self, client_id: str) -> None:
+        """Cancel open order by the id assigned by a trader."""
+        with self._latency_operation("cancel_order_by_client_id"):
+            await self._delete_authorized(path=f"orders/by_client_id/{client_id}")
+
+    async def cancel_all_orders(self, params: dict | None = None) -> None:
+        """Cancel all open orders for specific market or for all markets."""
+        with self._latency_operation("cancel_all_orders"):
+            await self._delete_authorized(path="orders", params=params)
+
+    async def cancel_orders_batch(
+        self, order_ids: list[str] | None = None, client_order_ids: list[str] | None = None
+    ) -> dict:
+        """Cancel batch of orders by order IDs or client order IDs."""
+        with self._latency_operation("cancel_orders_batch"):
+            payload = self._cancel_batch_payload(order_ids, client_order_ids)
+            return await self._delete_authorized(path="orders/batch", payload=payload)
+
+    # PUBLIC GET METHODS
+    async def fetch_system_config(self) -> SystemConfig:
+        """Fetch Paradex system config."""
+        res = await self.request(
+            url=f"{self.api_url}/system/config",
+            http_method=HttpMethod.GET,
+        )
+        return self._parse_system_config(res)
+
+    async def fetch_system_state(self) -> dict:
+        """Fetch Paradex system status."""
+        return await self._get(path="system/state")
+
+    async def fetch_system_time(self) -> dict:
+        """Fetch Paradex system time."""
+        return await self._get(path="system/time")
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open pooled connections ahead of the first latency critical request.
+
+        Sends `connections` concurrent `system/time` requests, so that many
+        connections (TCP + TLS) are established and kept alive in the pool.
+
+        Args:
+            connections: Number of connections to open.
+        """
+        await asyncio.gather(*(self.fetch_system_time() for _ in range(max(connections, 1))))
+
+    async def fetch_markets(self, params: dict | None = None) -> dict:
+        """Fetch all markets information."""
+        return await self._get(path="markets", params=params)
+
+    async def fetch_markets_summary(self, params: dict | None = None) -> dict:
+        """Fetch ticker information for specific market."""
+        return await self._get(path="markets/summary", params=params)
+
+    async def fetch_klines(
+        self, symbol: str, resolution: str, start_at: int, end_at: int, price_kind: str | None = None
+    ) -> dict:
+        """Fetch OHLCV candlestick data for a symbol."""
+        params = self._klines_params(symbol, resolution, start_at, end_at, price_kind)
+        return await self._get(path="markets/klines", params=params)
+
+    async def fetch_orderbook(self, market: str, params: dict | None = None) -> dict:
+        """Fetch order-book for specific market."""
+        return await self._get(path=f"orderbook/{market}", params=params)
+
+    async def fetch_bbo(self, market: str) -> dict:
+        """Fetch best bid/offer for specific market."""
+        return await self._get(path=f"bbo/{market}")
+
+    async def fetch_bbo_typed(self, market: str) -> TypedBbo:
+        """Fetch best bid/offer as a `TypedBbo` with fixed-point prices."""
+        return self.response_decoder.bbo(await self.fetch_bbo(market))
+
+    async def fetch_orderbook_typed(self, market: str, params: dict | None = None) -> TypedOrderBook:
+        """Fetch order-book as a `TypedOrderBook` with fixed-point levels."""
+        return self.response_decoder.orderbook(await self.fetch_orderbook(market, params))
+
+    async def fetch_orders_typed(self, params: dict | None = None) -> list[TypedOrder]:
+        """Fetch open orders as `TypedOrder`s."""
+        return self.response_decoder.orders(await self.fetch_orders(params))
+
+    async def fetch_fills_typed(self, params: dict | None = None) -> list[TypedFill]:
+        """Fetch one page of fills as `TypedFill`s."""
+        return self.response_decoder.fills(await self.fetch_fills(params))
+
+    async def fetch_positions_typed(self) -> list[TypedPosition]:
+        """Fetch positions as `TypedPosition`s."""
+        return self.response_decoder.positions(await self.fetch_positions())
+
+    async def fetch_insurance_fund(self) -> dict:
+        """Fetch insurance fund information"""
+        return await self._get(path="insurance")
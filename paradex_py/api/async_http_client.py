@@ -0,0 +1,219 @@
+import asyncio
+import time
+from typing import Any
+
+import httpx
+
+from paradex_py.api.capture import CaptureWriter
+from paradex_py.api.http_client import HttpClientBase, HttpMethod, HttpPoolConfig, _AsyncConnectionTrace
+from paradex_py.api.protocols import RequestHook, RetryStrategy
+from paradex_py.api.rate_limiter import RateLimiter, classify_endpoint
+from paradex_py.common.latency import DECODE, current_spans, timed_stage
+from paradex_py.utils import raise_value_error
+
+
+class AsyncHttpClient(HttpClientBase):
+    """Asyncio counterpart of `HttpClient` built on `httpx.AsyncClient`.
+
+    Request preparation, header redaction, error handling, retry strategy
+    and request hooks behave exactly like the blocking client; only the
+    transport and the retry sleep are non-blocking.
+
+    Examples:
+        >>> from paradex_py.api.async_http_client import AsyncHttpClient
+        >>> client = AsyncHttpClient(default_timeout=5.0)
+    """
+
+    client: httpx.AsyncClient
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        default_timeout: float | None = None,
+        retry_strategy: RetryStrategy | None = None,
+        request_hook: RequestHook | None = None,
+        pool_config: HttpPoolConfig | None = None,
+        collect_pool_stats: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        capture: CaptureWriter | None = None,
+    ):
+        """Initialize async HTTP client with optional injection.
+
+        Args:
+            http_client: Optional httpx.AsyncClient instance for injection.
+                        If None, creates a default client.
+            default_timeout: Default timeout for requests in seconds.
+            retry_strategy: Strategy for retrying failed requests.
+            request_hook: Hook for request/response observability.
+            pool_config: Connection pool settings for the default client. Cannot be combined with `http_client`.
+            collect_pool_stats: Count new vs reused connections (see `get_pool_stats`).
+            rate_limiter: Client-side rate limiter applied before every request attempt.
+            capture: Record every response for offline replay, see `paradex_py.api.capture`.
+        """
+        if http_client is not None:
+            if pool_config is not None:
+                raise_value_error(
+                    "pool_config cannot be applied to an injected http_client; configure its limits instead"
+                )
+            self.client = http_client
+        else:
+            pool_kwargs = pool_config.client_kwargs() if pool_config is not None else {}
+            self.client = httpx.AsyncClient(verify=False, **pool_kwargs)
+
+        self._init_client_options(
+            default_timeout, retry_strategy, request_hook, collect_pool_stats, rate_limiter, capture
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    async def request(
+        self,
+        url: str,
+        http_method: HttpMethod,
+        params: dict | None = None,
+        payload: dict[str, Any] | list[dict[str, Any]] | None = None,
+        headers: Any | None = None,
+        timeout: float | None = None,
+    ):
+        """Make HTTP request with retry logic and observability hooks.
+
+        Args:
+            url: Request URL
+            http_method: HTTP method
+            params: Query parameters
+            payload: Request body payload
+            headers: Request headers
+            timeout: Request timeout in seconds (overrides default_timeout)
+        """
+        # Use provided timeout or default
+        request_timeout = timeout if timeout is not None else self.default_timeout
+
+        # Redact sensitive headers for logging
+        safe_headers = self._redact_headers(headers) if headers else None
+
+        # Call request hook
+        if self.request_hook:
+            self.request_hook.on_request(http_method.value, url, safe_headers)
+
+        attempt = 0
+        start_time = time.time()
+        endpoint_class = classify_endpoint(http_method.value, url) if self.rate_limiter else None
+
+        while True:
+            try:
+                if self.rate_limiter and endpoint_class:
+                    await self.rate_limiter.acquire_async(endpoint_class)
+                request_kwargs = self._prepare_request_kwargs(
+                    http_method, url, params, payload, headers, request_timeout
+                )
+                res = await self._send(http_method, url, request_kwargs)
+                if self.rate_limiter and endpoint_class:
+                    self.rate_limiter.update_from_headers(endpoint_class, res.status_code, res.headers)
+                self._capture_response(http_method, url, params, res)
+
+                # Call response hook
+                if self.request_hook:
+                    duration_ms = (time.time() - start_time) * 1000
+                    self.request_hook.on_response(http_method.value, url, res.status_code, duration_ms)
+
+                # Check if we should retry
+                if self.retry_strategy and self.retry_strategy.should_retry(attempt, res, None):
+                    delay = self.retry_strategy.get_delay(attempt)
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+                else:
+                    with timed_stage(DECODE):
+                        return self._handle_response(res, url, http_method)
+
+            except Exception as e:
+                # Check if we should retry on exception
+                if self.retry_strategy and self.retry_strategy.should_retry(attempt, None, e):
+                    delay = self.retry_strategy.get_delay(attempt)
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+                else:
+                    # Re-raise if no more retries
+                    raise
+
+    async def _send(self, http_method: HttpMethod, url: str, request_kwargs: dict) -> httpx.Response:
+        spans = current_spans()
+        if self.pool_stats is None and spans is None:
+            return await self.client.request(**request_kwargs)
+        trace = _AsyncConnectionTrace()
+        request_kwargs["extensions"] = {"trace": trace}
+        start_ns = time.perf_counter_ns()
+        res = await self.client.request(**request_kwargs)
+        if spans is not None:
+            trace.add_spans(spans, start_ns, time.perf_counter_ns())
+        self._record_connection(http_method, url, trace, res)
+        return res
+
+    async def get(self, api_url: str, path: str, params: dict | None = None, timeout: float | None = None) -> dict:
+        return await self.request(
+            url=f"{api_url}/{path}",
+            http_method=HttpMethod.GET,
+            params=params,
+            headers=self.client.headers,
+            timeout=timeout,
+        )
+
+    # post is always private, use either provided headers
+    # or the client headers with JWT token
+    async def post(
+        self,
+        api_url: str,
+        path: str,
+        payload: dict[str, Any] | list[dict[str, Any]] | None = None,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        use_headers = headers if headers else self.client.headers
+        return await self.request(
+            url=f"{api_url}/{path}",
+            http_method=HttpMethod.POST,
+            payload=payload,
+            params=params,
+            headers=use_headers,
+            timeout=timeout,
+        )
+
+    async def put(
+        self,
+        api_url: str,
+        path: str,
+        payload: dict[str, Any] | list[dict[str, Any]] | None = None,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        use_headers = headers if headers else self.client.headers
+        return await self.request(
+            url=f"{api_url}/{path}",
+            http_method=HttpMethod.PUT,
+            payload=payload,
+            params=params,
+            headers=use_headers,
+            timeout=timeout,
+        )
+
+    async def delete(
+        self,
+        api_url: str,
+        path: str,
+        params: dict | None = None,
+        payload: dict | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        return await self.request(
+            url=f"{api_url}/{path}",
+            http_method=HttpMethod.DELETE,
+            params=params,
+            payload=payload,
+            headers=self.client.headers,
+            timeout=timeout,
+        )
@@ -110,6 +110,8 @@ class BlockTradesMixin:
         self,
         status: str | None = None,
         market: str | None = None,
+        cursor: str | None = None,
+        page_size: int | None = None,
     ) -> PaginatedAPIResults:
         """Get a paginated list of block trades with filtering.
 
@@ -119,15 +121,21 @@ class BlockTradesMixin:
         Args:
             status: Block trade status filter (CREATED, OFFER_COLLECTION, READY_TO_EXECUTE, EXECUTING, COMPLETED, CANCELLED)
             market: Market symbol filter (e.g., BTC-USD-PERP)
+            cursor: Cursor of the page to fetch (`next` of the previous page)
+            page_size: Limit the number of results in the page
 
         Returns:
             Paginated list with block trade details and navigation metadata.
         """
-        params = {}
+        params: dict[str, Any] = {}
         if status:
             params["status"] = status
         if market:
             params["market"] = market
+        if cursor:
+            params["cursor"] = cursor
+        if page_size:
+            params["page_size"] = page_size
 
         response = self._get_authorized(path="block-trades", params=params)
         return self._parse_block_trade_list_response(response)
@@ -295,3 +303,173 @@ class BlockTradesMixin:
             path=f"block-trades/{block_trade_id}/offers/{offer_id}/execute", payload=payload
         )
         return self._parse_block_trade_response(response)
+
+
+class AsyncBlockTradesMixin(BlockTradesMixin):
+    """Asyncio variant of `BlockTradesMixin` for `AsyncParadexApiClient`.
+
+    Request methods are coroutines; response parsing is shared with the
+    synchronous mixin.
+    """
+
+    async def list_block_trades(  # type: ignore[override]
+        self,
+        status: str | None = None,
+        market: str | None = None,
+        cursor: str | None = None,
+        page_size: int | None = None,
+    ) -> PaginatedAPIResults:
+        """Get a paginated list of block trades with filtering.
+
+        Args:
+            status: Block trade status filter (CREATED, OFFER_COLLECTION, READY_TO_EXECUTE, EXECUTING, COMPLETED, CANCELLED)
+            market: Market symbol filter (e.g., BTC-USD-PERP)
+            cursor: Cursor of the page to fetch (`next` of the previous page)
+            page_size: Limit the number of results in the page
+
+        Returns:
+            Paginated list with block trade details and navigation metadata.
+        """
+        params: dict[str, Any] = {}
+        if status:
+            params["status"] = status
+        if market:
+            params["market"] = market
+        if cursor:
+            params["cursor"] = cursor
+        if page_size:
+            params["page_size"] = page_size
+
+        response = await self._get_authorized(path="block-trades", params=params)
+        return self._parse_block_trade_list_response(response)
+
+    async def create_block_trade(self, block_trade: BlockTradeRequest) -> BlockTradeDetailFullResponse:  # type: ignore[override]
+        """Create a parent block trade for multi-party execution.
+
+        Args:
+            block_trade: Block trade request with trade details and signatures
+
+        Returns:
+            Created block trade details
+        """
+        if not block_trade:
+            raise ValueError("BlockTradeRequest is required")
+
+        response = await self._post_authorized(path="block-trades", payload=block_trade.model_dump())
+        return self._parse_block_trade_response(response)
+
+    async def get_block_trade(self, block_trade_id: str) -> BlockTradeDetailFullResponse:  # type: ignore[override]
+        """Retrieve a specific block trade by ID with full details.
+
+        Args:
+            block_trade_id: Block Trade ID
+
+        Returns:
+            Block trade details with status, signatures, and offers
+        """
+        if not block_trade_id:
+            raise ValueError("block_id is required")
+
+        response = await self._get_authorized(path=f"block-trades/{block_trade_id}")
+        return self._parse_block_trade_response(response)
+
+    async def cancel_block_trade(self, block_trade_id: str) -> dict:  # type: ignore[override]
+        """Cancel a pending block trade.
+
+        Args:
+            block_trade_id: Block Trade ID
+
+        Returns:
+            Success message confirming cancellation
+        """
+        return await self._delete_authorized(path=f"block-trades/{block_trade_id}")
+
+    async def execute_block_trade(  # type: ignore[override]
+        self, block_trade_id: str, execution_request: BlockExecuteRequest
+    ) -> BlockTradeDetailFullResponse:
+        """Execute a block trade with selected offers.
+
+        Args:
+            block_trade_id: Block Trade ID
+            execution_request: Block execution parameters with selected offers
+
+        Returns:
+            Executed block trade with status and fill details
+        """
+        response = await self._post_authorized(
+            path=f"block-trades/{block_trade_id}/execute", payload=execution_request.model_dump()
+        )
+        return self._parse_block_trade_response(response)
+
+    async def get_block_trade_offers(self, block_trade_id: str) -> APIResults:  # type: ignore[override]
+        """Get all offers for a specific block trade.
+
+        Args:
+            block_trade_id: Parent Block Trade ID
+
+        Returns:
+            Array of offers with offer details and signatures
+        """
+        if block_trade_id and isinstance(block_trade_id, str):
+            response = await self._get_authorized(path=f"block-trades/{block_trade_id}/offers")
+            return self._parse_offers_response(response)
+        else:
+            raise ValueError("block_trade_id must be a non-empty string")
+
+    async def create_block_trade_offer(  # type: ignore[override]
+        self, block_trade_id: str, offer: BlockOfferRequest
+    ) -> BlockTradeDetailFullResponse:
+        """Create a sub-block offer for an existing block trade.
+
+        Args:
+            block_trade_id: Parent Block Trade ID
+            offer: Block offer content with order details and signatures
+
+        Returns:
+            Created offer with unique ID and parent reference
+        """
+        response = await self._post_authorized(path=f"block-trades/{block_trade_id}/offers", payload=offer.model_dump())
+        return self._parse_block_trade_response(response)
+
+    async def get_block_trade_offer(self, block_trade_id: str, offer_id: str) -> BlockTradeDetailFullResponse:  # type: ignore[override]
+        """Get a specific offer by ID for a block trade.
+
+        Args:
+            block_trade_id: Parent Block Trade ID
+            offer_id: Offer ID
+
+        Returns:
+            Offer details with market-specific order information
+        """
+        response = await self._get_authorized(path=f"block-trades/{block_trade_id}/offers/{offer_id}")
+        return self._parse_block_trade_response(response)
+
+    async def cancel_block_trade_offer(self, block_trade_id: str, offer_id: str) -> dict:  # type: ignore[override]
+        """Cancel a pending offer for a block trade.
+
+        Args:
+            block_trade_id: Parent Block Trade ID
+            offer_id: Offer ID
+
+        Returns:
+            Success message confirming offer cancellation
+        """
+        return await self._delete_authorized(path=f"block-trades/{block_trade_id}/offers/{offer_id}")
+
+    async def execute_block_trade_offer(  # type: ignore[override]
+        self, block_trade_id: str, offer_id: str, execution_request: BlockExecuteRequest
+    ) -> BlockTradeDetailFullResponse:
+        """Execute a specific offer independently of the parent block trade.
+
+        Args:
+            block_trade_id: Parent Block Trade ID
+            offer_id: Offer ID
+            execution_request: Offer execution parameters
+
+        Returns:
+            Executed offer with status, fill details, and timestamps
+        """
+        response = await self._post_authorized(
+            path=f"block-trades/{block_trade_id}/offers/{offer_id}/execute", payload=execution_request.model_dump()
+        )
+        return self._parse_block_trade_response(response)
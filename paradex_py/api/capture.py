@@ -0,0 +1,282 @@
+"""
+Capture and deterministic replay of WebSocket and REST traffic.
+
+A capture file is an 8-byte header (`b"PDXCAP"`, format version, flags)
+followed by append-only records:
+
+    kind: u8 | flags: u8 | length: u32 | timestamp: u64 | payload
+
+little-endian, where `timestamp` is nanoseconds of `time.perf_counter_ns()`
+since the writer was opened (monotonic, so replay timing never jumps with
+the wall clock). WebSocket records hold the raw frame as received, HTTP
+records a small JSON document with the method, URL, query parameters,
+status and response body. Request headers and bodies are not recorded,
+and JWTs (`jwt_token`) in response bodies are redacted.
+
+With `compress=True` the records are written as a zstd stream (requires
+the `zstandard` package). A file cut short by a crash reads up to its last
+complete record.
+"""
+
+import asyncio
+import json
+import re
+import struct
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, NamedTuple
+
+import httpx
+
+from paradex_py.utils import raise_value_error
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    ZSTD_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from paradex_py.api.ws_client import ParadexWebsocketClient
+
+MAGIC = b"PDXCAP"
+FORMAT_VERSION = 1
+FILE_COMPRESSED = 0x01
+HEADER = struct.Struct("<6sBB")
+RECORD = struct.Struct("<BBIQ")
+
+# Record kinds
+WS_FRAME = 1
+HTTP_RESPONSE = 2
+
+# Record flags
+BINARY = 0x01
+
+REDACTED = "<redacted>"
+_JWT_TOKEN = re.compile(r'("jwt_token"\s*:\s*")[^"]*(")')
+
+
+class CaptureRecord(NamedTuple):
+    kind: int
+    timestamp_ns: int
+    payload: str | bytes
+    flags: int = 0
+
+    def http(self) -> dict[str, Any]:
+        """Decoded HTTP record: `method`, `url`, `params`, `status` and `body`."""
+        return json.loads(self.payload)
+
+
+class CaptureWriter:
+    """Append-only capture file.
+
+    Pass it as `capture=` to `ParadexWebsocketClient` (received frames),
+    `HttpClient` or `AsyncHttpClient` (responses). Records are buffered;
+    call `close()` (or use it as a context manager) to flush them. A writer
+    may be shared between threads.
+
+    Args:
+        path: Capture file; appended to if it already exists.
+        compress: Write records as a zstd stream. Requires `zstandard`.
+        level: zstd compression level.
+
+    Examples:
+        >>> with CaptureWriter("session.pdxcap") as capture:
+        ...     ws_client = ParadexWebsocketClient(env=PROD, capture=capture)
+        ...     http_client = HttpClient(capture=capture)
+    """
+
+    def __init__(self, path: str | Path, compress: bool = False, level: int = 3):
+        if compress and not ZSTD_AVAILABLE:
+            raise_value_error("CaptureWriter: compression requires the zstandard package")
+        self.path = Path(path)
+        self.records = 0
+        self._start_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._file = open(self.path, "ab")  # noqa: SIM115
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, FILE_COMPRESSED if compress else 0))
+        elif _read_header(self.path) != compress:
+            self._file.close()
+            raise_value_error(f"CaptureWriter: {self.path} was not written with compress={compress}")
+        self._out: IO[bytes] = self._file
+        self._compressor: Any = None
+        if compress:
+            self._compressor = zstandard.ZstdCompressor(level=level).stream_writer(self._file, closefd=False)
+            self._out = self._compressor
+
+    def write(self, kind: int, payload: str | bytes, flags: int = 0, timestamp_ns: int | None = None) -> None:
+        """Append a record stamped with the time since the writer was opened, or `timestamp_ns`."""
+        if isinstance(payload, str):
+            payload = payload.encode()
+        if timestamp_ns is None:
+            timestamp_ns = time.perf_counter_ns() - self._start_ns
+        record = RECORD.pack(kind, flags, len(payload), timestamp_ns) + payload
+        with self._lock:
+            self._out.write(record)
+            self.records += 1
+
+    def ws_frame(self, frame: str | bytes) -> None:
+        self.write(WS_FRAME, frame, BINARY if isinstance(frame, bytes) else 0)
+
+    def http_response(self, method: str, url: str, params: dict | None, status_code: int, body: str) -> None:
+        if "jwt_token" in body:
+            body = _JWT_TOKEN.sub(rf"\g<1>{REDACTED}\g<2>", body)
+        record = {"method": method, "url": url, "params": params, "status": status_code, "body": body}
+        self.write(HTTP_RESPONSE, json.dumps(record, separators=(",", ":")))
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._compressor is not None:
+                self._compressor.flush(zstandard.FLUSH_FRAME)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            if self._compressor is not None:
+                self._compressor.close()
+            self._file.close()
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _read_header(path: Path) -> bool:
+    """Whether the capture at `path` is compressed."""
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return raise_value_error(f"Capture: {path} is not a capture file")
+    magic, version, flags = HEADER.unpack(header)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return raise_value_error(f"Capture: {path} is not a version {FORMAT_VERSION} capture file")
+    return bool(flags & FILE_COMPRESSED)
+
+
+def read_capture(path: str | Path) -> Iterator[CaptureRecord]:
+    """Iterate over the records of a capture file.
+
+    Text WebSocket frames are returned as `str`, binary frames and other
+    payloads as they were written.
+    """
+    path = Path(path)
+    compressed = _read_header(path)
+    with open(path, "rb") as f:
+        f.seek(HEADER.size)
+        stream: Any = f
+        if compressed:
+            if not ZSTD_AVAILABLE:
+                raise_value_error("Capture: reading compressed captures requires the zstandard package")
+            stream = zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+        while True:
+            header = stream.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            kind, flags, length, timestamp_ns = RECORD.unpack(header)
+            payload = stream.read(length)
+            if len(payload) < length:
+                return
+            text = kind == HTTP_RESPONSE or (kind == WS_FRAME and not flags & BINARY)
+            yield CaptureRecord(kind, timestamp_ns, payload.decode() if text else payload, flags)
+
+
+@dataclass
+class ReplayStats:
+    frames: int = 0
+    elapsed: float = 0.0
+    max_lag: float = 0.0
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / self.elapsed if self.elapsed else 0.0
+
+
+class CaptureReplayer:
+    """Feed a capture back to the SDK.
+
+    WebSocket frames go through `ParadexWebsocketClient.inject()`, i.e. the
+    same decode and dispatch path as live frames; REST responses are served
+    by an `httpx.MockTransport`.
+
+    Args:
+        path: Capture file
+        speed: 1.0 replays at the original pace, 10.0 ten times faster,
+            None as fast as possible.
+
+    Examples:
+        >>> replayer = CaptureReplayer("session.pdxcap", speed=None)
+        >>> stats = await replayer.replay_ws(paradex.ws_client)
+        >>> stats.frames_per_second
+    """
+
+    def __init__(self, path: str | Path, speed: float | None = 1.0):
+        if speed is not None and speed <= 0:
+            raise_value_error("CaptureReplayer: speed must be positive or None")
+        self.path = Path(path)
+        self.speed = speed
+
+    def records(self, kind: int | None = None) -> Iterator[CaptureRecord]:
+        for record in read_capture(self.path):
+            if kind is None or record.kind == kind:
+                yield record
+
+    async def replay_ws(self, ws_client: "ParadexWebsocketClient") -> ReplayStats:
+        """Inject every captured WebSocket frame, keeping the recorded spacing scaled by `speed`.
+
+        Sessions appended to the same file restart their clock; they are
+        replayed back to back.
+        """
+        stats = ReplayStats()
+        speed = self.speed
+        offset_ns: int | None = None
+        last_ns = 0
+        start = time.perf_counter()
+        for record in self.records(WS_FRAME):
+            if speed is not None:
+                if offset_ns is None:
+                    offset_ns = -record.timestamp_ns
+                elif record.timestamp_ns + offset_ns < last_ns:
+                    offset_ns = last_ns - record.timestamp_ns
+                last_ns = record.timestamp_ns + offset_ns
+                due = start + last_ns / 1e9 / speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    stats.max_lag = max(stats.max_lag, -delay)
+            await ws_client.inject(record.payload)
+            stats.frames += 1
+        stats.elapsed = time.perf_counter() - start
+        return stats
+
+    def http_transport(self) -> httpx.MockTransport:
+        """Transport answering requests with the captured responses.
+
+        Responses are matched by method, URL and query parameters and
+        served in capture order; the last one repeats once they run out.
+        Unknown requests get a 404.
+        """
+        responses: dict[tuple[str, str], deque[dict]] = defaultdict(deque)
+        for record in self.records(HTTP_RESPONSE):
+            data = record.http()
+            url = httpx.URL(data["url"], params=data["params"] or None)
+            responses[(data["method"], str(url))].append(data)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            queue = responses.get((request.method, str(request.url)))
+            if not queue:
+                return httpx.Response(404, json={"error": "NOT_CAPTURED", "message": str(request.url)})
+            data = queue.popleft() if len(queue) > 1 else queue[0]
+            return httpx.Response(data["status"], text=data["body"])
+
+        return httpx.MockTransport(handler)
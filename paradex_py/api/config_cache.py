@@ -0,0 +1,122 @@
+"""
+On-disk cache of the Paradex system config.
+
+`Paradex` fetches `/system/config` on construction, which dominates startup
+when a process creates many clients. The config changes rarely, so it can
+be read from a local file instead and refreshed once it is older than the
+cache TTL. Entries are keyed by API URL and record a format version plus
+the `SystemConfig` field names, so a cache written by a different library
+version is ignored rather than loaded into the wrong shape.
+"""
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from paradex_py.api.models import SYSTEM_CONFIG_SCHEMA, SystemConfig
+
+# Bump when the file layout changes
+CACHE_FORMAT_VERSION = 1
+DEFAULT_TTL = 3600.0
+
+
+def default_cache_dir() -> Path:
+    """`$XDG_CACHE_HOME/paradex_py`, or `~/.cache/paradex_py`."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "paradex_py"
+
+
+def _schema_version() -> str:
+    names = ",".join(field.name for field in dataclasses.fields(SystemConfig))
+    return f"{CACHE_FORMAT_VERSION}:{hashlib.sha256(names.encode()).hexdigest()[:16]}"
+
+
+class SystemConfigCache:
+    """File cache of `SystemConfig` per API URL.
+
+    Args:
+        cache_dir: Directory of the cache files. Defaults to `default_cache_dir()`.
+        ttl: Seconds a cached config stays valid. Defaults to one hour.
+        logger: Optional logger.
+
+    Examples:
+        >>> cache = SystemConfigCache(ttl=6 * 3600)
+        >>> paradex = Paradex(env=PROD, l1_address="0x...", l2_private_key="0x...", config_cache=cache)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        ttl: float = DEFAULT_TTL,
+        logger: logging.Logger | None = None,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.ttl = ttl
+        self.logger = logger or logging.getLogger(__name__)
+        self.version = _schema_version()
+
+    def path(self, api_url: str) -> Path:
+        """Cache file of `api_url`."""
+        digest = hashlib.sha256(api_url.encode()).hexdigest()[:16]
+        return self.cache_dir / f"system_config_{digest}.json"
+
+    def load(self, api_url: str) -> SystemConfig | None:
+        """Cached config of `api_url`, or None if missing, expired or from another version."""
+        try:
+            with open(self.path(api_url)) as f:
+                entry = json.load(f)
+            if entry.get("version") != self.version or entry.get("api_url") != api_url:
+                return None
+            if time.time() - float(entry["fetched_at"]) > self.ttl:
+                return None
+            return SYSTEM_CONFIG_SCHEMA.load(entry["config"], unknown="exclude")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # A corrupt cache only costs a fetch
+            self.logger.debug(f"SystemConfigCache: ignoring {self.path(api_url)}: {e}")
+            return None
+
+    def store(self, api_url: str, config: SystemConfig) -> None:
+        """Write `config` for `api_url`; failures are logged and ignored."""
+        entry = {
+            "version": self.version,
+            "api_url": api_url,
+            "fetched_at": time.time(),
+            "config": SYSTEM_CONFIG_SCHEMA.dump(config),
+        }
+        path = self.path(api_url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent readers never see a partial file
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entry, f)
+                os.replace(tmp, path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+                raise
+        except OSError as e:
+            self.logger.warning(f"SystemConfigCache: failed to write {path}: {e}")
+
+    def invalidate(self, api_url: str) -> None:
+        """Remove the cached config of `api_url`."""
+        with contextlib.suppress(FileNotFoundError):
+            self.path(api_url).unlink()
+
+    def get(self, api_url: str, fetch: Callable[[], SystemConfig]) -> SystemConfig:
+        """Cached config of `api_url`, calling `fetch` and storing the result on a miss."""
+        config = self.load(api_url)
+        if config is None:
+            config = fetch()
+            self.store(api_url, config)
+        return config
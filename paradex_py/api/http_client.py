@@ -1,14 +1,24 @@
+import importlib.util
+import json
 import ssl
 import time
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
 import httpx
 
-from paradex_py.api.models import ApiErrorSchema
+from paradex_py.api.capture import CaptureWriter
+from paradex_py.api.models import API_ERROR_SCHEMA
 from paradex_py.api.protocols import RequestHook, RetryStrategy
+from paradex_py.api.rate_limiter import RateLimiter, classify_endpoint
+from paradex_py.common.latency import DECODE, ENCODE, SEND, SERVER, LatencySpans, current_spans, timed_stage
 from paradex_py.utils import raise_value_error
 
+# HTTP/2 support is the optional `httpx[http2]` extra
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+HTTP2_MISSING = "HTTP/2 requires the h2 package: pip install 'httpx[http2]'"
+
 
 class HttpMethod(Enum):
     GET = "GET"
@@ -17,28 +27,110 @@ class HttpMethod(Enum):
     DELETE = "DELETE"
 
 
-class HttpClient:
-    def __init__(
-        self,
-        http_client: httpx.Client | None = None,
-        default_timeout: float | None = None,
-        retry_strategy: RetryStrategy | None = None,
-        request_hook: RequestHook | None = None,
-    ):
-        """Initialize HTTP client with optional injection.
+@dataclass
+class HttpPoolConfig:
+    """Connection pool settings for the default httpx client.
 
-        Args:
-            http_client: Optional httpx.Client instance for injection.
-                        If None, creates a default client.
-            default_timeout: Default timeout for requests in seconds.
-            retry_strategy: Strategy for retrying failed requests.
-            request_hook: Hook for request/response observability.
+    Args:
+        max_connections: Maximum number of open connections.
+        max_keepalive_connections: Maximum number of idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        http2: Multiplex requests over HTTP/2 connections. Requires `httpx[http2]`.
+
+    Examples:
+        >>> client = HttpClient(pool_config=HttpPoolConfig(max_keepalive_connections=10, http2=True))
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 60.0
+    http2: bool = False
+
+    def client_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for `httpx.Client` / `httpx.AsyncClient`."""
+        if self.http2 and not HTTP2_AVAILABLE:
+            raise ImportError(HTTP2_MISSING)
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        return {"limits": limits, "http2": self.http2}
+
+
+@dataclass
+class PoolStats:
+    """Connection usage of the requests sent so far."""
+
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    tls_handshakes: int = 0
+    http2_requests: int = 0
+
+
+class _ConnectionTrace:
+    """httpcore `trace` extension recording whether a request opened a connection, and when it was sent."""
+
+    __slots__ = ("connected", "headers_ns", "sent_ns", "tls")
+
+    def __init__(self) -> None:
+        self.connected = False
+        self.tls = False
+        self.sent_ns = 0
+        self.headers_ns = 0
+
+    def _record(self, event_name: str) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.connected = True
+        elif event_name == "connection.start_tls.complete":
+            self.tls = True
+        elif event_name.endswith(".send_request_body.complete"):
+            self.sent_ns = time.perf_counter_ns()
+        elif event_name.endswith(".receive_response_headers.complete"):
+            self.headers_ns = time.perf_counter_ns()
+
+    def add_spans(self, spans: LatencySpans, start_ns: int, end_ns: int) -> None:
+        """Split `start_ns..end_ns` into send, server and (body) decode time.
+
+        Transports without trace events (e.g. `httpx.MockTransport`) count as server time.
         """
-        if http_client is not None:
-            self.client = http_client
-        else:
-            self.client = httpx.Client(verify=False)
+        sent_ns = self.sent_ns or start_ns
+        headers_ns = self.headers_ns or end_ns
+        spans.add(SEND, sent_ns - start_ns)
+        spans.add(SERVER, headers_ns - sent_ns)
+        spans.add(DECODE, end_ns - headers_ns)
+
+    def __call__(self, event_name: str, info: dict) -> None:
+        self._record(event_name)
+
+
+class _AsyncConnectionTrace(_ConnectionTrace):
+    __slots__ = ()
+
+    async def __call__(self, event_name: str, info: dict) -> None:  # type: ignore[override]
+        self._record(event_name)
+
 
+class HttpClientBase:
+    """Transport-independent request preparation and response handling.
+
+    Shared by the blocking `HttpClient` and the asyncio `AsyncHttpClient`
+    so that both clients build requests, redact headers and parse errors
+    in exactly the same way.
+    """
+
+    client: httpx.Client | httpx.AsyncClient
+
+    def _init_client_options(
+        self,
+        default_timeout: float | None,
+        retry_strategy: RetryStrategy | None,
+        request_hook: RequestHook | None,
+        collect_pool_stats: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        capture: CaptureWriter | None = None,
+    ) -> None:
         # Only set default headers if they're not already set
         if "Content-Type" not in self.client.headers:
             self.client.headers.update({"Content-Type": "application/json"})
@@ -46,6 +138,40 @@ class HttpClient:
         self.default_timeout = default_timeout
         self.retry_strategy = retry_strategy
         self.request_hook = request_hook
+        self.pool_stats: PoolStats | None = PoolStats() if collect_pool_stats else None
+        self.rate_limiter = rate_limiter
+        self.capture = capture
+
+    def _capture_response(self, http_method: HttpMethod, url: str, params: dict | None, res: httpx.Response) -> None:
+        if self.capture is not None:
+            self.capture.http_response(http_method.value, url, params, res.status_code, res.text)
+
+    def _record_connection(
+        self, http_method: HttpMethod, url: str, trace: _ConnectionTrace, res: httpx.Response
+    ) -> None:
+        stats = self.pool_stats
+        if stats is None:
+            return
+        stats.requests += 1
+        if trace.connected:
+            stats.new_connections += 1
+        else:
+            stats.reused_connections += 1
+        if trace.tls:
+            stats.tls_handshakes += 1
+        if res.http_version == "HTTP/2":
+            stats.http2_requests += 1
+        on_connection = getattr(self.request_hook, "on_connection", None)
+        if on_connection is not None:
+            on_connection(http_method.value, url, not trace.connected, stats)
+
+    def get_pool_stats(self) -> PoolStats | None:
+        """Connection usage counters, or None unless `collect_pool_stats` is enabled."""
+        return None if self.pool_stats is None else PoolStats(**vars(self.pool_stats))
+
+    def reset_pool_stats(self) -> None:
+        if self.pool_stats is not None:
+            self.pool_stats = PoolStats()
 
     def _prepare_request_kwargs(
         self,
@@ -66,6 +192,11 @@ class HttpClient:
         }
         if request_timeout is not None:
             request_kwargs["timeout"] = request_timeout
+        if payload is not None and current_spans() is not None:
+            # Encode here so that the encoding shows up as its own stage
+            with timed_stage(ENCODE):
+                request_kwargs["content"] = json.dumps(payload, separators=(",", ":")).encode()
+            del request_kwargs["json"]
         return request_kwargs
 
     def _handle_response(self, res: httpx.Response, url: str, http_method: HttpMethod) -> Any:
@@ -74,7 +205,7 @@ class HttpClient:
         if res.status_code == 429:
             return raise_value_error("Rate limit exceeded")
         if res.status_code >= 300:
-            error = ApiErrorSchema().loads(res.text)
+            error = API_ERROR_SCHEMA.loads(res.text)
             return raise_value_error(str(error))
 
         # Return successful response
@@ -84,6 +215,63 @@ class HttpClient:
             print(f"HttpClient: No response request({url}, {http_method.value})")
             return None
 
+    def _redact_headers(self, headers: dict[str, Any]) -> dict[str, Any]:
+        """Redact sensitive information from headers for logging."""
+        if not headers:
+            return {}
+
+        safe_headers = headers.copy()
+        sensitive_keys = ["authorization", "x-api-key", "jwt", "token"]
+
+        for key in safe_headers:
+            if key.lower() in sensitive_keys:
+                safe_headers[key] = "[REDACTED]"
+
+        return safe_headers
+
+
+class HttpClient(HttpClientBase):
+    client: httpx.Client
+
+    def __init__(
+        self,
+        http_client: httpx.Client | None = None,
+        default_timeout: float | None = None,
+        retry_strategy: RetryStrategy | None = None,
+        request_hook: RequestHook | None = None,
+        pool_config: HttpPoolConfig | None = None,
+        collect_pool_stats: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        capture: CaptureWriter | None = None,
+    ):
+        """Initialize HTTP client with optional injection.
+
+        Args:
+            http_client: Optional httpx.Client instance for injection.
+                        If None, creates a default client.
+            default_timeout: Default timeout for requests in seconds.
+            retry_strategy: Strategy for retrying failed requests.
+            request_hook: Hook for request/response observability.
+            pool_config: Connection pool settings for the default client. Cannot be combined with `http_client`.
+            collect_pool_stats: Count new vs reused connections (see `get_pool_stats`).
+                        A `request_hook` with an `on_connection` method is notified of every request.
+            rate_limiter: Client-side rate limiter applied before every request attempt.
+            capture: Record every response for offline replay, see `paradex_py.api.capture`.
+        """
+        if http_client is not None:
+            if pool_config is not None:
+                raise_value_error(
+                    "pool_config cannot be applied to an injected http_client; configure its limits instead"
+                )
+            self.client = http_client
+        else:
+            pool_kwargs = pool_config.client_kwargs() if pool_config is not None else {}
+            self.client = httpx.Client(verify=False, **pool_kwargs)
+
+        self._init_client_options(
+            default_timeout, retry_strategy, request_hook, collect_pool_stats, rate_limiter, capture
+        )
+
     def request(
         self,
         url: str,
@@ -115,13 +303,19 @@ class HttpClient:
 
         attempt = 0
         start_time = time.time()
+        endpoint_class = classify_endpoint(http_method.value, url) if self.rate_limiter else None
 
         while True:
             try:
+                if self.rate_limiter and endpoint_class:
+                    self.rate_limiter.acquire(endpoint_class)
                 request_kwargs = self._prepare_request_kwargs(
                     http_method, url, params, payload, headers, request_timeout
                 )
-                res = self.client.request(**request_kwargs)
+                res = self._send(http_method, url, request_kwargs)
+                if self.rate_limiter and endpoint_class:
+                    self.rate_limiter.update_from_headers(endpoint_class, res.status_code, res.headers)
+                self._capture_response(http_method, url, params, res)
 
                 # Call response hook
                 if self.request_hook:
@@ -135,7 +329,8 @@ class HttpClient:
                     attempt += 1
                     continue
                 else:
-                    return self._handle_response(res, url, http_method)
+                    with timed_stage(DECODE):
+                        return self._handle_response(res, url, http_method)
 
             except Exception as e:
                 # Check if we should retry on exception
@@ -148,19 +343,18 @@ class HttpClient:
                     # Re-raise if no more retries
                     raise
 
-    def _redact_headers(self, headers: dict[str, Any]) -> dict[str, Any]:
-        """Redact sensitive information from headers for logging."""
-        if not headers:
-            return {}
-
-        safe_headers = headers.copy()
-        sensitive_keys = ["authorization", "x-api-key", "jwt", "token"]
-
-        for key in safe_headers:
-            if key.lower() in sensitive_keys:
-                safe_headers[key] = "[REDACTED]"
-
-        return safe_headers
+    def _send(self, http_method: HttpMethod, url: str, request_kwargs: dict) -> httpx.Response:
+        spans = current_spans()
+        if self.pool_stats is None and spans is None:
+            return self.client.request(**request_kwargs)
+        trace = _ConnectionTrace()
+        request_kwargs["extensions"] = {"trace": trace}
+        start_ns = time.perf_counter_ns()
+        res = self.client.request(**request_kwargs)
+        if spans is not None:
+            trace.add_spans(spans, start_ns, time.perf_counter_ns())
+        self._record_connection(http_method, url, trace, res)
+        return res
 
     def get(self, api_url: str, path: str, params: dict | None = None, timeout: float | None = None) -> dict:
         return self.request(
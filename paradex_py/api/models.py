@@ -64,3 +64,9 @@ ApiErrorSchema = marshmallow_dataclass.class_schema(ApiError)
 SystemConfigSchema = marshmallow_dataclass.class_schema(SystemConfig)
 AuthSchema = marshmallow_dataclass.class_schema(Auth)
 AccountSummarySchema = marshmallow_dataclass.class_schema(AccountSummary)
+
+# Schemas are stateless; reuse one instance instead of building one per response
+API_ERROR_SCHEMA = ApiErrorSchema()
+SYSTEM_CONFIG_SCHEMA = SystemConfigSchema()
+AUTH_SCHEMA = AuthSchema()
+ACCOUNT_SUMMARY_SCHEMA = AccountSummarySchema()
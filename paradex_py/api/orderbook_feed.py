@@ -0,0 +1,105 @@
+import asyncio
+import contextlib
+import inspect
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from paradex_py.api.ws_client import ParadexWebsocketChannel, ParadexWebsocketClient, format_channel_name
+from paradex_py.common.orderbook import OrderBook
+
+
+class OrderBookFeed:
+    """Keep a local `OrderBook` in sync with the ORDER_BOOK deltas channel.
+
+    The book is seeded from the REST snapshot and resynced automatically
+    whenever a sequence gap is detected; deltas received meanwhile are
+    buffered by the book and replayed on top of the fresh snapshot.
+
+    Args:
+        ws_client: Connected WebSocket client
+        api_client: `ParadexApiClient` or `AsyncParadexApiClient` used for REST snapshots
+        market: Market symbol
+        price_decimals: Fractional digits kept for prices
+        size_decimals: Fractional digits kept for sizes
+        refresh_rate: ORDER_BOOK refresh rate ("50ms" or "100ms")
+        on_update: Optional callback `(book)`, sync or async, invoked after every applied update
+        logger: Optional logger
+
+    Examples:
+        >>> feed = OrderBookFeed(paradex.ws_client, paradex.api_client, "BTC-USD-PERP", price_decimals=1)
+        >>> await feed.start()
+        >>> feed.book.best_bid()
+    """
+
+    def __init__(
+        self,
+        ws_client: ParadexWebsocketClient,
+        api_client: Any,
+        market: str,
+        price_decimals: int = 8,
+        size_decimals: int = 8,
+        refresh_rate: str = "100ms",
+        on_update: Callable[[OrderBook], Any] | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        self.ws_client = ws_client
+        self.api_client = api_client
+        self.market = market
+        self.refresh_rate = refresh_rate
+        self.on_update = on_update
+        self.logger = logger or logging.getLogger(__name__)
+        self.book = OrderBook(market, price_decimals, size_decimals, logger=self.logger)
+        self.resyncs = 0
+        self._syncing = False
+        self._resync_task: asyncio.Task | None = None
+
+    def _channel_params(self) -> dict[str, str]:
+        return {"market": self.market, "feed_type": "deltas", "refresh_rate": self.refresh_rate}
+
+    async def start(self) -> None:
+        """Subscribe to the deltas feed and seed the book from REST."""
+        await self.ws_client.subscribe(
+            ParadexWebsocketChannel.ORDER_BOOK, self._on_message, params=self._channel_params()
+        )
+        await self.resync()
+
+    async def stop(self) -> None:
+        if self._resync_task is not None and not self._resync_task.done():
+            self._resync_task.cancel()
+            # A resync still running after stop() would write into the book
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._resync_task
+        await self.ws_client.unsubscribe_by_name(
+            format_channel_name(ParadexWebsocketChannel.ORDER_BOOK, self._channel_params())
+        )
+
+    async def resync(self) -> None:
+        """Reload the REST snapshot and replay buffered deltas."""
+        self.resyncs += 1
+        self._syncing = True
+        try:
+            fetch = self.api_client.fetch_orderbook
+            if inspect.iscoroutinefunction(fetch):
+                snapshot = await fetch(self.market)
+            else:
+                snapshot = await asyncio.to_thread(fetch, self.market)
+            self.book.load_snapshot(snapshot)
+        finally:
+            self._syncing = False
+        self.logger.info("OrderBookFeed %s: synced at seq_no:%s", self.market, self.book.seq_no)
+
+    async def _on_message(self, ws_channel: ParadexWebsocketChannel, message: dict) -> None:
+        if self.book.apply_update(message["params"]["data"]):
+            if self.on_update is not None:
+                result = self.on_update(self.book)
+                if inspect.isawaitable(result):
+                    await result
+        elif not self._syncing and (self._resync_task is None or self._resync_task.done()):
+            self._resync_task = asyncio.create_task(self._resync_safely())
+
+    async def _resync_safely(self) -> None:
+        try:
+            await self.resync()
+        except Exception:
+            self.logger.exception("OrderBookFeed %s: resync failed", self.market)
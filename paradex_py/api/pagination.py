@@ -0,0 +1,229 @@
+"""
+Cursor pagination helpers.
+
+Paginated endpoints (`fetch_orders_history`, `fetch_fills`,
+`fetch_funding_payments`, `fetch_transactions`, `fetch_transfers`,
+`fetch_tradebusts`, `list_block_trades`) return a page of `results` and a
+`next` cursor. The iterators here follow the cursors and fetch the next
+page while the current one is being consumed.
+
+For long backfills, `split_time_range` cuts a `start_at`/`end_at` range
+into disjoint windows and the `*_windowed` iterators page through all
+windows concurrently, still yielding results window by window.
+"""
+
+import asyncio
+import queue
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from paradex_py.utils import raise_value_error
+
+Page = Any  # dict, or a PaginatedAPIResults model
+FetchPage = Callable[[dict], Page]
+AsyncFetchPage = Callable[[dict], Awaitable[Page]]
+
+_DONE = object()
+
+
+def _page_field(page: Page, name: str) -> Any:
+    return page.get(name) if isinstance(page, dict) else getattr(page, name, None)
+
+
+def _first_params(params: dict | None, page_size: int | None) -> dict:
+    params = dict(params or {})
+    if page_size is not None:
+        params["page_size"] = page_size
+    return params
+
+
+def split_time_range(start_at: int, end_at: int, windows: int) -> list[tuple[int, int]]:
+    """Split [start_at, end_at] (unix ms, inclusive) into disjoint consecutive windows.
+
+    Args:
+        start_at: Start time (unix time millisecond)
+        end_at: End time (unix time millisecond)
+        windows: Number of windows. Fewer are returned if the range is shorter than that many ms.
+
+    Returns:
+        list[tuple[int, int]]: Inclusive (start_at, end_at) pairs, oldest first.
+    """
+    if windows < 1:
+        raise_value_error("windows must be at least 1")
+    if end_at < start_at:
+        raise_value_error("end_at must not be before start_at")
+    span = end_at - start_at + 1
+    windows = min(windows, span)
+    bounds = [start_at + span * i // windows for i in range(windows + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(windows)]
+
+
+def iter_pages(fetch: FetchPage, params: dict | None = None, page_size: int | None = None) -> Iterator[Page]:
+    """Yield pages, following `next` cursors; the next page is fetched in the background.
+
+    Args:
+        fetch: Endpoint method taking a params dict, e.g. `api_client.fetch_fills`.
+        params: Query parameters of the first request.
+        page_size: Optional `page_size` parameter.
+
+    Examples:
+        >>> for page in iter_pages(paradex.api_client.fetch_fills, {"market": "BTC-USD-PERP"}, page_size=100):
+        ...     print(len(page["results"]))
+    """
+    params = _first_params(params, page_size)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="paradex-prefetch") as executor:
+        pending: Future | None = executor.submit(fetch, params)
+        while pending is not None:
+            page = pending.result()
+            cursor = _page_field(page, "next")
+            pending = executor.submit(fetch, {**params, "cursor": cursor}) if cursor else None
+            yield page
+
+
+def iter_results(fetch: FetchPage, params: dict | None = None, page_size: int | None = None) -> Iterator[Any]:
+    """Yield the `results` of every page; see `iter_pages`."""
+    for page in iter_pages(fetch, params, page_size):
+        yield from _page_field(page, "results") or []
+
+
+async def aiter_pages(
+    fetch: AsyncFetchPage, params: dict | None = None, page_size: int | None = None
+) -> AsyncIterator[Page]:
+    """Async variant of `iter_pages`; the next page is fetched by a task.
+
+    Examples:
+        >>> async for page in aiter_pages(api_client.fetch_fills, {"market": "BTC-USD-PERP"}):
+        ...     print(len(page["results"]))
+    """
+    params = _first_params(params, page_size)
+    pending: asyncio.Task | None = asyncio.ensure_future(fetch(params))
+    try:
+        while pending is not None:
+            page = await pending
+            cursor = _page_field(page, "next")
+            pending = asyncio.ensure_future(fetch({**params, "cursor": cursor})) if cursor else None
+            yield page
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def aiter_results(
+    fetch: AsyncFetchPage, params: dict | None = None, page_size: int | None = None
+) -> AsyncIterator[Any]:
+    """Yield the `results` of every page; see `aiter_pages`."""
+    async for page in aiter_pages(fetch, params, page_size):
+        for result in _page_field(page, "results") or []:
+            yield result
+
+
+def _put_unless_stopped(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _produce_window(fetch: FetchPage, params: dict, q: queue.Queue, stop: threading.Event) -> None:
+    # Runs in a worker thread: pages of one window go to `q`, followed by _DONE or the error
+    try:
+        while not stop.is_set():
+            page = fetch(params)
+            if not _put_unless_stopped(q, page, stop):
+                return
+            cursor = _page_field(page, "next")
+            if not cursor:
+                break
+            params = {**params, "cursor": cursor}
+    except Exception as e:
+        _put_unless_stopped(q, e, stop)
+        return
+    _put_unless_stopped(q, _DONE, stop)
+
+
+def iter_results_windowed(
+    fetch: FetchPage,
+    start_at: int,
+    end_at: int,
+    windows: int,
+    params: dict | None = None,
+    page_size: int | None = None,
+    max_buffered_pages: int = 4,
+) -> Iterator[Any]:
+    """Page through `windows` disjoint time windows concurrently, one thread per window.
+
+    Results are yielded window by window, oldest window first. Each window
+    buffers at most `max_buffered_pages` pages ahead of the consumer.
+
+    Args:
+        fetch: Endpoint method taking a params dict.
+        start_at: Start time (unix time millisecond)
+        end_at: End time (unix time millisecond)
+        windows: Number of windows fetched concurrently.
+        params: Other query parameters.
+        page_size: Optional `page_size` parameter.
+        max_buffered_pages: Pages fetched ahead per window.
+    """
+    ranges = split_time_range(start_at, end_at, windows)
+    queues: list[queue.Queue] = [queue.Queue(maxsize=max_buffered_pages) for _ in ranges]
+    stop = threading.Event()
+
+    with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="paradex-backfill") as executor:
+        for q, window in zip(queues, ranges, strict=True):
+            window_params = {**(params or {}), "start_at": window[0], "end_at": window[1]}
+            executor.submit(_produce_window, fetch, _first_params(window_params, page_size), q, stop)
+        try:
+            for q in queues:
+                while (item := q.get()) is not _DONE:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield from _page_field(item, "results") or []
+        finally:
+            stop.set()
+
+
+async def aiter_results_windowed(
+    fetch: AsyncFetchPage,
+    start_at: int,
+    end_at: int,
+    windows: int,
+    params: dict | None = None,
+    page_size: int | None = None,
+    max_buffered_pages: int = 4,
+) -> AsyncIterator[Any]:
+    """Async variant of `iter_results_windowed`, one task per window.
+
+    Examples:
+        >>> month_ms = 30 * 24 * 3600 * 1000
+        >>> async for fill in aiter_results_windowed(api_client.fetch_fills, now - 3 * month_ms, now, windows=6):
+        ...     process(fill)
+    """
+    ranges = split_time_range(start_at, end_at, windows)
+    queues: list[asyncio.Queue] = [asyncio.Queue(maxsize=max_buffered_pages) for _ in ranges]
+
+    async def produce(q: asyncio.Queue, window: tuple[int, int]) -> None:
+        window_params = {**(params or {}), "start_at": window[0], "end_at": window[1]}
+        try:
+            async for page in aiter_pages(fetch, window_params, page_size):
+                await q.put(page)
+        except Exception as e:
+            await q.put(e)
+            return
+        await q.put(_DONE)
+
+    tasks = [asyncio.create_task(produce(q, window)) for q, window in zip(queues, ranges, strict=True)]
+    try:
+        for q in queues:
+            while (item := await q.get()) is not _DONE:
+                if isinstance(item, Exception):
+                    raise item
+                for result in _page_field(item, "results") or []:
+                    yield result
+    finally:
+        for task in tasks:
+            task.cancel()
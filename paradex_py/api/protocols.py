@@ -5,10 +5,14 @@ This module exports all the protocols that define injection points
 for custom implementations in simulation, testing, and production environments.
 """
 
-from typing import Any, Protocol
+import random
+from typing import TYPE_CHECKING, Any, Protocol
 
 import httpx
 
+if TYPE_CHECKING:
+    from paradex_py.api.http_client import PoolStats
+
 
 # WebSocket protocols
 class WebSocketConnection(Protocol):
@@ -127,6 +131,40 @@ class RequestHook(Protocol):
         ...
 
 
+class ConnectionHook(RequestHook, Protocol):
+    """Request hook that is also notified of connection reuse.
+
+    Only called when the HTTP client collects pool statistics.
+    """
+
+    def on_connection(self, method: str, url: str, reused: bool, stats: "PoolStats") -> None:
+        """Called after each request.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            reused: False if the request had to open a new connection
+            stats: Pool statistics so far
+        """
+        ...
+
+
+class LatencyHook(RequestHook, Protocol):
+    """Request hook that is also given the latency breakdown of order operations.
+
+    Only called when the API client collects latency (`collect_latency=True`).
+    """
+
+    def on_latency(self, operation: str, spans_ms: dict[str, float]) -> None:
+        """Called after each order submission, modification or cancel.
+
+        Args:
+            operation: API client method, e.g. "submit_order"
+            spans_ms: Milliseconds per stage (see `paradex_py.common.latency`), including "total"
+        """
+        ...
+
+
 class AuthProvider(Protocol):
     """Protocol for custom authentication flows."""
 
@@ -202,6 +240,31 @@ class DefaultRetryStrategy:
         return min(delay, self.max_delay)
 
 
+class JitteredBackoffStrategy(DefaultRetryStrategy):
+    """Exponential backoff with full jitter.
+
+    The delay of attempt `n` is drawn uniformly from
+    `[0, min(max_delay, base_delay * 2**n)]`, so clients that lost the
+    same connection do not retry in lockstep. Used by
+    `ParadexWebsocketClient` to reconnect; `max_retries=None` retries forever.
+    """
+
+    def __init__(self, max_retries: int | None = None, base_delay: float = 0.1, max_delay: float = 30.0):
+        super().__init__(max_retries=max_retries or 0, base_delay=base_delay, max_delay=max_delay)
+        self.unlimited = max_retries is None
+
+    def should_retry(self, attempt: int, response: Any | None, exception: Exception | None) -> bool:
+        if self.unlimited:
+            return exception is not None or (
+                response is not None and (response.status_code >= 500 or response.status_code == 429)
+            )
+        return super().should_retry(attempt, response, exception)
+
+    def get_delay(self, attempt: int) -> float:
+        # Past ~64 doublings every delay is max_delay anyway; the cap keeps 2**attempt a sane size
+        return random.uniform(0, super().get_delay(min(attempt, 64)))  # noqa: S311
+
+
 class NoOpSigner:
     """No-op signer for full simulation scenarios."""
 
@@ -230,6 +293,8 @@ __all__ = [
     "TransportLike",
     "RetryStrategy",
     "RequestHook",
+    "ConnectionHook",
+    "LatencyHook",
     # Auth protocols
     "AuthProvider",
     # Signing protocols
@@ -237,4 +302,5 @@ __all__ = [
     "NoOpSigner",
     # Default implementations
     "DefaultRetryStrategy",
+    "JitteredBackoffStrategy",
 ]
@@ -0,0 +1,226 @@
+"""
+Client-side rate limiting.
+
+`RateLimiter` keeps one GCRA (generic cell rate algorithm, a token bucket
+expressed as a single "theoretical arrival time") per endpoint class, so
+acquiring is O(1) and needs no per-request history. Requests that would
+exceed the limit wait (blocking or `asyncio.sleep`) instead of being
+rejected by the server with a 429.
+
+An optional shared bucket models an account-wide limit across classes.
+Lower priority classes cannot use the last `reserve` slots of the shared
+bucket, and waiters re-check instead of queueing reservations, so a
+cancel is never stuck behind a backlog of reads.
+
+Rate-limit response headers (`Retry-After`, `X-RateLimit-Remaining`,
+`X-RateLimit-Reset`) tighten the matching bucket when the server reports
+less capacity than the client expected.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import Enum
+from urllib.parse import urlsplit
+
+
+class EndpointClass(Enum):
+    ORDERS = "orders"
+    CANCELS = "cancels"
+    PRIVATE_GET = "private_get"
+    PUBLIC_GET = "public_get"
+
+
+# Paths (relative to /v1/) that do not need authentication
+PUBLIC_PATHS = ("system/", "markets", "bbo/", "orderbook/", "trades", "insurance", "funding/data")
+
+
+def classify_endpoint(method: str, url: str) -> EndpointClass:
+    """Map an HTTP method and URL to its `EndpointClass`."""
+    if method == "DELETE":
+        return EndpointClass.CANCELS
+    if method != "GET":
+        return EndpointClass.ORDERS
+    path = urlsplit(url).path
+    path = path[path.find("/v1/") + 4 :] if "/v1/" in path else path.lstrip("/")
+    return EndpointClass.PUBLIC_GET if path.startswith(PUBLIC_PATHS) else EndpointClass.PRIVATE_GET
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Sustained `rate` (requests per second) with bursts of up to `burst` requests."""
+
+    rate: float
+    burst: int = 1
+
+
+# Conservative defaults; override with the limits of your account tier
+DEFAULT_LIMITS: dict[EndpointClass, RateLimit] = {
+    EndpointClass.ORDERS: RateLimit(rate=800, burst=800),
+    EndpointClass.CANCELS: RateLimit(rate=800, burst=800),
+    EndpointClass.PRIVATE_GET: RateLimit(rate=120, burst=120),
+    EndpointClass.PUBLIC_GET: RateLimit(rate=25, burst=50),
+}
+
+
+class Gcra:
+    """Single GCRA bucket. Not thread safe; `RateLimiter` serializes access."""
+
+    __slots__ = ("interval", "tat", "tolerance")
+
+    def __init__(self, limit: RateLimit):
+        self.interval = 1.0 / limit.rate
+        self.tolerance = self.interval * (max(limit.burst, 1) - 1)
+        self.tat = 0.0
+
+    def delay(self, now: float, reserve: int = 0) -> float:
+        """Seconds until a request fits, keeping `reserve` slots free."""
+        return max(self.tat, now) - (self.tolerance - reserve * self.interval) - now
+
+    def take(self, now: float) -> None:
+        self.tat = max(self.tat, now) + self.interval
+
+    def block_until(self, when: float) -> None:
+        self.tat = max(self.tat, when + self.tolerance)
+
+    def limit_remaining(self, now: float, remaining: int) -> None:
+        # At most `remaining` more requests may go out right now
+        self.tat = max(self.tat, now + self.tolerance - (remaining - 1) * self.interval)
+
+
+@dataclass
+class RateLimiterStats:
+    acquired: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    server_throttles: int = 0
+
+
+class RateLimiter:
+    """Per-endpoint-class request rate limiter with sync and async waits.
+
+    Args:
+        limits: Limit per endpoint class. Classes without a limit are not throttled.
+            Defaults to `DEFAULT_LIMITS`.
+        shared: Optional account-wide limit applied to every class in `shared_classes`.
+        shared_classes: Classes counted against `shared`. Defaults to all but public reads.
+        reserve: Shared-bucket slots each class must leave free (priority lanes).
+            For example `{EndpointClass.PRIVATE_GET: 5, EndpointClass.ORDERS: 2}` keeps two
+            slots that only cancels can use and five that reads cannot use.
+
+    Examples:
+        >>> limiter = RateLimiter(shared=RateLimit(rate=100, burst=20), reserve={EndpointClass.PRIVATE_GET: 5})
+        >>> paradex = Paradex(env=TESTNET, rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[EndpointClass, RateLimit] | None = None,
+        shared: RateLimit | None = None,
+        shared_classes: frozenset[EndpointClass] = frozenset(
+            {EndpointClass.ORDERS, EndpointClass.CANCELS, EndpointClass.PRIVATE_GET}
+        ),
+        reserve: Mapping[EndpointClass, int] | None = None,
+    ):
+        limits = DEFAULT_LIMITS if limits is None else limits
+        self.buckets: dict[EndpointClass, Gcra] = {cls: Gcra(limit) for cls, limit in limits.items()}
+        self.shared = Gcra(shared) if shared is not None else None
+        self.shared_classes = shared_classes
+        self.reserve = dict(reserve or {})
+        self._lock = threading.Lock()
+        self._stats = RateLimiterStats()
+
+    def try_acquire(self, endpoint_class: EndpointClass) -> float:
+        """Claim a slot for `endpoint_class` if one is free right now.
+
+        Returns:
+            float: 0 if the slot was claimed, otherwise the seconds to wait before trying again.
+        """
+        bucket = self.buckets.get(endpoint_class)
+        shared = self.shared if endpoint_class in self.shared_classes else None
+        with self._lock:
+            now = time.monotonic()
+            wait = bucket.delay(now) if bucket is not None else 0.0
+            if shared is not None:
+                wait = max(wait, shared.delay(now, self.reserve.get(endpoint_class, 0)))
+            if wait > 0:
+                return wait
+            if bucket is not None:
+                bucket.take(now)
+            if shared is not None:
+                shared.take(now)
+            return 0.0
+
+    def _record_wait(self, waited: float) -> None:
+        with self._lock:
+            stats = self._stats
+            stats.acquired += 1
+            if waited > 0:
+                stats.delayed += 1
+                stats.total_wait += waited
+
+    def acquire(self, endpoint_class: EndpointClass) -> float:
+        """Block until a request of `endpoint_class` may be sent.
+
+        Waiters re-check after sleeping, so a higher priority request arriving
+        meanwhile is not queued behind them.
+
+        Returns:
+            float: Seconds waited.
+        """
+        waited = 0.0
+        while (wait := self.try_acquire(endpoint_class)) > 0:
+            time.sleep(wait)
+            waited += wait
+        self._record_wait(waited)
+        return waited
+
+    async def acquire_async(self, endpoint_class: EndpointClass) -> float:
+        """Wait without blocking the event loop until a request of `endpoint_class` may be sent.
+
+        Returns:
+            float: Seconds waited.
+        """
+        waited = 0.0
+        while (wait := self.try_acquire(endpoint_class)) > 0:
+            await asyncio.sleep(wait)
+            waited += wait
+        self._record_wait(waited)
+        return waited
+
+    def update_from_headers(self, endpoint_class: EndpointClass, status_code: int, headers: Mapping[str, str]) -> None:
+        """Tighten the bucket of `endpoint_class` from rate-limit response headers."""
+        retry_after = headers.get("retry-after")
+        remaining = headers.get("x-ratelimit-remaining")
+        if retry_after is None and remaining is None and status_code != 429:
+            return
+        bucket = self.buckets.get(endpoint_class)
+        if bucket is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if status_code == 429:
+                self._stats.server_throttles += 1
+            try:
+                if retry_after is not None:
+                    bucket.block_until(now + float(retry_after))
+                elif remaining is not None:
+                    left = int(remaining)
+                    reset = headers.get("x-ratelimit-reset")
+                    if left <= 0 and reset is not None:
+                        bucket.block_until(now + float(reset))
+                    else:
+                        bucket.limit_remaining(now, max(left, 0))
+                elif status_code == 429:
+                    bucket.block_until(now + bucket.interval)
+            except ValueError:
+                # Unparseable header values (e.g. HTTP dates) are ignored
+                return
+
+    def stats(self) -> RateLimiterStats:
+        return RateLimiterStats(**vars(self._stats))
+
+    def reset_stats(self) -> None:
+        self._stats = RateLimiterStats()
@@ -0,0 +1,263 @@
+"""
+Background JWT refresh.
+
+By default the API clients check the JWT age on every private request
+and, once it is older than four minutes, run a full auth round trip
+(sign + POST) before the request itself. `TokenManager` moves that round
+trip off the request path: it refreshes the token on a background thread
+(sync client) or task (async client) ahead of its expiry and plugs into
+the client as its `AuthProvider`, so requests only read the current token.
+"""
+
+import asyncio
+import base64
+import binascii
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Union
+
+from paradex_py.utils import raise_value_error
+
+if TYPE_CHECKING:
+    from paradex_py.api.api_client import ParadexApiClient
+    from paradex_py.api.async_api_client import AsyncParadexApiClient
+    from paradex_py.api.ws_client import ParadexWebsocketClient
+
+# Paradex JWTs are valid for five minutes
+DEFAULT_TOKEN_LIFETIME = 5 * 60
+
+
+def jwt_expiry(token: str) -> float | None:
+    """Return the `exp` claim of a JWT (not verified), or None if it cannot be read."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return None
+
+
+@dataclass
+class TokenStats:
+    refreshes: int = 0
+    failures: int = 0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+    last_refresh_at: float = 0.0
+    last_error: str | None = None
+
+
+class TokenManager:
+    """Refresh the JWT of an API client ahead of its expiry.
+
+    `start()` installs the manager as the client's `auth_provider` and
+    starts the refresh loop. While the token is fresh, requests use it as
+    is; if a background refresh keeps failing and the token gets close to
+    expiry, `refresh_if_needed` returns None and the client falls back to
+    its usual refresh-on-request path.
+
+    The new token is written to the client headers and to the account, so
+    `ParadexWebsocketClient` uses it when it (re)connects. A `ws_client`
+    can also be passed to re-authenticate its live connection after every
+    refresh; with a sync client the re-auth is scheduled on the event loop
+    the WebSocket client runs on.
+
+    Args:
+        api_client: `ParadexApiClient` or `AsyncParadexApiClient` with an initialized account.
+        refresh_margin: Seconds before expiry at which the token is refreshed.
+        retry_delay: Seconds between attempts after a failed refresh.
+        ws_client: Optional WebSocket client to re-authenticate.
+        logger: Optional logger.
+
+    Examples:
+        >>> paradex = Paradex(env=TESTNET, l1_address="0x...", l1_private_key="0x...")
+        >>> token_manager = TokenManager(paradex.api_client)
+        >>> token_manager.start()
+        >>> paradex.api_client.submit_order(order)  # no auth round trip on the request path
+        >>> token_manager.stop()
+    """
+
+    def __init__(
+        self,
+        api_client: Union["ParadexApiClient", "AsyncParadexApiClient"],
+        refresh_margin: float = 60.0,
+        retry_delay: float = 5.0,
+        ws_client: "ParadexWebsocketClient | None" = None,
+        logger: logging.Logger | None = None,
+    ):
+        self.api_client = api_client
+        self.refresh_margin = refresh_margin
+        self.retry_delay = retry_delay
+        self.ws_client = ws_client
+        self.logger = logger or logging.getLogger(__name__)
+        self._token: str | None = None
+        self._expires_at = 0.0
+        self._stats = TokenStats()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._task: asyncio.Task | None = None
+        self._ws_loop: asyncio.AbstractEventLoop | None = None
+
+    # AuthProvider protocol
+
+    def get_token(self) -> str | None:
+        return self._token
+
+    def refresh_if_needed(self) -> str | None:
+        """Return the current token, or None if it is missing or about to expire."""
+        self._adopt_account_token()
+        token, expires_at = self._token, self._expires_at
+        if token is None or time.time() >= expires_at - self.retry_delay:
+            return None
+        return token
+
+    # Refresh
+
+    def seconds_until_refresh(self) -> float:
+        return max(0.0, self._expires_at - self.refresh_margin - time.time())
+
+    def _account_token(self) -> str | None:
+        account = self.api_client.account
+        return getattr(account, "jwt_token", None) if account is not None else None
+
+    def _adopt_account_token(self) -> None:
+        # Pick up tokens obtained outside the manager (init_account(), fallback refreshes)
+        token = self._account_token()
+        if token and token != self._token:
+            self._set_token(token, self.api_client.auth_timestamp or time.time())
+
+    def _set_token(self, token: str, issued_at: float) -> None:
+        self._expires_at = jwt_expiry(token) or issued_at + DEFAULT_TOKEN_LIFETIME
+        self._token = token
+
+    def _record(self, started: float, error: Exception | None) -> None:
+        latency = time.perf_counter() - started
+        stats = self._stats
+        if error is not None:
+            stats.failures += 1
+            stats.last_error = repr(error)
+            self.logger.warning("TokenManager: JWT refresh failed: %r", error)
+            return
+        stats.refreshes += 1
+        stats.last_latency = latency
+        stats.max_latency = max(stats.max_latency, latency)
+        stats.total_latency += latency
+        stats.last_refresh_at = time.time()
+        stats.last_error = None
+        token = self._account_token()
+        if token:
+            self._set_token(token, time.time())
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("TokenManager: JWT refreshed in %.1fms", latency * 1_000)
+
+    async def _reauth_ws(self) -> None:
+        ws_client = self.ws_client
+        if ws_client is not None and ws_client.ws is not None and self._token:
+            try:
+                await ws_client._send_auth_id(ws_client.ws, self._token)
+            except Exception as e:
+                self.logger.warning("TokenManager: WebSocket re-auth failed: %r", e)
+
+    def refresh(self) -> bool:
+        """Run one auth round trip with a synchronous client.
+
+        The `ws_client` re-auth is scheduled on its event loop and not waited for.
+
+        Returns:
+            bool: True if the token was refreshed.
+        """
+        started = time.perf_counter()
+        try:
+            self.api_client.auth()
+        except Exception as e:
+            self._record(started, e)
+            return False
+        self._record(started, None)
+        if self.ws_client is not None and self._ws_loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._reauth_ws(), self._ws_loop)
+            except RuntimeError as e:  # Loop closed
+                self.logger.warning("TokenManager: WebSocket re-auth failed: %r", e)
+        return True
+
+    async def refresh_async(self) -> bool:
+        """Run one auth round trip with an async client and re-authenticate `ws_client`.
+
+        Returns:
+            bool: True if the token was refreshed.
+        """
+        started = time.perf_counter()
+        try:
+            await self.api_client.auth()
+        except Exception as e:
+            self._record(started, e)
+            return False
+        self._record(started, None)
+        await self._reauth_ws()
+        return True
+
+    def _run(self) -> None:
+        delay = self.seconds_until_refresh()
+        while not self._stop_event.wait(delay):
+            delay = self.seconds_until_refresh() if self.refresh() else self.retry_delay
+
+    async def _run_async(self) -> None:
+        delay = self.seconds_until_refresh()
+        while True:
+            await asyncio.sleep(delay)
+            delay = self.seconds_until_refresh() if await self.refresh_async() else self.retry_delay
+
+    # Lifecycle
+
+    def _find_ws_loop(self) -> asyncio.AbstractEventLoop | None:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        reader_task = self.ws_client._reader_task if self.ws_client is not None else None
+        return reader_task.get_loop() if reader_task is not None else None
+
+    def start(self) -> None:
+        """Install as the client's `auth_provider` and start refreshing in the background.
+
+        With an async client, or a sync client and a `ws_client`, this must be
+        called from the running event loop (or, for the sync client, once the
+        WebSocket client is connected).
+        """
+        if self._thread is not None or self._task is not None:
+            return
+        is_async = asyncio.iscoroutinefunction(self.api_client.auth)
+        if self.ws_client is not None and not is_async:
+            self._ws_loop = self._find_ws_loop()
+            if self._ws_loop is None:
+                raise_value_error("TokenManager: ws_client re-auth needs the event loop of the WebSocket client")
+        self._adopt_account_token()
+        self.api_client.auth_provider = self
+        if is_async:
+            self._task = asyncio.get_running_loop().create_task(self._run_async())
+        else:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="paradex-token-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the refresh loop and uninstall from the client."""
+        if self.api_client.auth_provider is self:
+            self.api_client.auth_provider = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> TokenStats:
+        return TokenStats(**vars(self._stats))
+
+    def reset_stats(self) -> None:
+        self._stats = TokenStats()
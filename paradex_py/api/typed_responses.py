@@ -0,0 +1,254 @@
+"""
+Compact typed models for the hot REST endpoints.
+
+The `fetch_*` methods return the decoded JSON as plain dicts. The
+`fetch_*_typed` variants decode BBO, order book, positions, orders and
+fills into slotted dataclasses instead: attribute access is faster, the
+objects are much smaller than dicts, and prices and sizes are stored as
+integers scaled by the market's precision (see `fixed_point`), so the
+values can be compared and summed without creating `Decimal`s.
+
+Values that are not aligned to the market precision (average prices,
+PnL, fees) are kept as the decimal strings sent by the API.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from paradex_py.common.fixed_point import decimals_of, from_fixed, to_fixed
+
+# Fractional digits used for markets without a registered precision
+DEFAULT_DECIMALS = 8
+
+
+@dataclass(slots=True)
+class TypedBbo:
+    market: str
+    bid: int | None
+    bid_size: int | None
+    ask: int | None
+    ask_size: int | None
+    seq_no: int
+    last_updated_at: int
+    price_decimals: int
+    size_decimals: int
+
+    def bid_price(self) -> Decimal | None:
+        return from_fixed(self.bid, self.price_decimals) if self.bid is not None else None
+
+    def ask_price(self) -> Decimal | None:
+        return from_fixed(self.ask, self.price_decimals) if self.ask is not None else None
+
+
+@dataclass(slots=True)
+class TypedOrderBook:
+    """Levels are (price, size) pairs, best first."""
+
+    market: str
+    bids: list[tuple[int, int]]
+    asks: list[tuple[int, int]]
+    seq_no: int
+    last_updated_at: int
+    price_decimals: int
+    size_decimals: int
+
+
+@dataclass(slots=True)
+class TypedOrder:
+    id: str
+    client_id: str
+    market: str
+    side: str
+    type: str
+    status: str
+    price: int
+    size: int
+    remaining_size: int
+    avg_fill_price: str | None
+    created_at: int
+    last_updated_at: int
+    seq_no: int | None
+    price_decimals: int
+    size_decimals: int
+
+
+@dataclass(slots=True)
+class TypedFill:
+    id: str
+    order_id: str
+    client_id: str
+    market: str
+    side: str
+    liquidity: str
+    price: int
+    size: int
+    fee: str | None
+    fee_currency: str | None
+    realized_pnl: str | None
+    created_at: int
+    price_decimals: int
+    size_decimals: int
+
+
+@dataclass(slots=True)
+class TypedPosition:
+    """`size` is signed: negative for short positions."""
+
+    market: str
+    side: str
+    status: str
+    size: int
+    average_entry_price: str | None
+    unrealized_pnl: str | None
+    liquidation_price: str | None
+    leverage: str | None
+    last_updated_at: int
+    seq_no: int | None
+    size_decimals: int
+
+
+class TypedResponseDecoder:
+    """Decode REST responses into the typed models above.
+
+    Precision is looked up per market; markets without a registered
+    precision use `default_decimals` for both prices and sizes.
+
+    Args:
+        precisions: Optional `{market: (price_decimals, size_decimals)}`
+        default_decimals: Fallback number of fractional digits
+
+    Examples:
+        >>> decoder = TypedResponseDecoder.from_markets(paradex.api_client.fetch_markets())
+        >>> paradex.api_client.response_decoder = decoder
+        >>> bbo = paradex.api_client.fetch_bbo_typed("BTC-USD-PERP")
+    """
+
+    def __init__(
+        self,
+        precisions: Mapping[str, tuple[int, int]] | None = None,
+        default_decimals: int = DEFAULT_DECIMALS,
+    ):
+        self.precisions: dict[str, tuple[int, int]] = dict(precisions or {})
+        self.default = (default_decimals, default_decimals)
+
+    @classmethod
+    def from_markets(cls, markets: Any, default_decimals: int = DEFAULT_DECIMALS) -> "TypedResponseDecoder":
+        """Build a decoder from a `fetch_markets` response (tick size and size increment)."""
+        precisions = {}
+        for market in markets.get("results") or []:
+            tick, increment = market.get("price_tick_size"), market.get("order_size_increment")
+            if market.get("symbol") and tick and increment:
+                precisions[market["symbol"]] = (decimals_of(tick), decimals_of(increment))
+        return cls(precisions, default_decimals)
+
+    def precision(self, market: str) -> tuple[int, int]:
+        """(price_decimals, size_decimals) of `market`."""
+        return self.precisions.get(market, self.default)
+
+    def bbo(self, data: dict) -> TypedBbo:
+        market = data.get("market") or ""
+        price_decimals, size_decimals = self.precision(market)
+        return TypedBbo(
+            market,
+            _fixed(data.get("bid"), price_decimals),
+            _fixed(data.get("bid_size"), size_decimals),
+            _fixed(data.get("ask"), price_decimals),
+            _fixed(data.get("ask_size"), size_decimals),
+            data.get("seq_no") or 0,
+            data.get("last_updated_at") or 0,
+            price_decimals,
+            size_decimals,
+        )
+
+    def orderbook(self, data: dict) -> TypedOrderBook:
+        market = data.get("market") or ""
+        price_decimals, size_decimals = self.precision(market)
+        return TypedOrderBook(
+            market,
+            _levels(data.get("bids"), price_decimals, size_decimals),
+            _levels(data.get("asks"), price_decimals, size_decimals),
+            data.get("seq_no") or 0,
+            data.get("last_updated_at") or 0,
+            price_decimals,
+            size_decimals,
+        )
+
+    def order(self, data: dict) -> TypedOrder:
+        market = data.get("market") or ""
+        price_decimals, size_decimals = self.precision(market)
+        return TypedOrder(
+            data.get("id") or "",
+            data.get("client_id") or "",
+            market,
+            data.get("side") or "",
+            data.get("type") or "",
+            data.get("status") or "",
+            _fixed(data.get("price"), price_decimals) or 0,
+            _fixed(data.get("size"), size_decimals) or 0,
+            _fixed(data.get("remaining_size"), size_decimals) or 0,
+            data.get("avg_fill_price") or None,
+            data.get("created_at") or 0,
+            data.get("last_updated_at") or 0,
+            data.get("seq_no"),
+            price_decimals,
+            size_decimals,
+        )
+
+    def fill(self, data: dict) -> TypedFill:
+        market = data.get("market") or ""
+        price_decimals, size_decimals = self.precision(market)
+        return TypedFill(
+            data.get("id") or "",
+            data.get("order_id") or "",
+            data.get("client_id") or "",
+            market,
+            data.get("side") or "",
+            data.get("liquidity") or "",
+            _fixed(data.get("price"), price_decimals) or 0,
+            _fixed(data.get("size"), size_decimals) or 0,
+            data.get("fee"),
+            data.get("fee_currency"),
+            data.get("realized_pnl"),
+            data.get("created_at") or 0,
+            price_decimals,
+            size_decimals,
+        )
+
+    def position(self, data: dict) -> TypedPosition:
+        market = data.get("market") or ""
+        size_decimals = self.precision(market)[1]
+        size = _fixed(data.get("size"), size_decimals) or 0
+        side = data.get("side") or ""
+        return TypedPosition(
+            market,
+            side,
+            data.get("status") or "",
+            -abs(size) if side == "SHORT" else size,
+            data.get("average_entry_price") or None,
+            data.get("unrealized_pnl") or None,
+            data.get("liquidation_price") or None,
+            data.get("leverage") or None,
+            data.get("last_updated_at") or 0,
+            data.get("seq_no"),
+            size_decimals,
+        )
+
+    def orders(self, response: dict) -> list[TypedOrder]:
+        return [self.order(r) for r in response.get("results") or []]
+
+    def fills(self, response: dict) -> list[TypedFill]:
+        return [self.fill(r) for r in response.get("results") or []]
+
+    def positions(self, response: dict) -> list[TypedPosition]:
+        return [self.position(r) for r in response.get("results") or []]
+
+
+def _fixed(value: str | None, decimals: int) -> int | None:
+    # Empty sides of the book are sent as "" or omitted
+    return to_fixed(value, decimals) if value else None
+
+
+def _levels(levels: list[list[str]] | None, price_decimals: int, size_decimals: int) -> list[tuple[int, int]]:
+    return [(to_fixed(p, price_decimals), to_fixed(s, size_decimals)) for p, s in levels or []]
@@ -1,11 +1,13 @@
 import asyncio
 import contextlib
+import itertools
 import json
 import logging
 import time
 import traceback
 from collections.abc import Callable
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Protocol
 
 import websockets
@@ -13,8 +15,15 @@ from pydantic import BaseModel
 from websockets import ClientConnection, State
 
 from paradex_py.account.account import ParadexAccount
+from paradex_py.api.capture import CaptureWriter
+from paradex_py.api.protocols import JitteredBackoffStrategy, RetryStrategy
+from paradex_py.api.ws_conflation import ConflatingCallback
+from paradex_py.api.ws_decoder import WsDecoder, get_decoder
+from paradex_py.api.ws_dispatcher import ChannelDispatcher, OverflowPolicy
+from paradex_py.api.ws_stats import ReconnectStats, WsStats
 from paradex_py.constants import WS_TIMEOUT
 from paradex_py.environment import Environment
+from paradex_py.utils import raise_value_error
 
 # Optional typed message models
 try:
@@ -99,10 +108,54 @@ class ParadexWebsocketChannel(Enum):
     TRANSFERS = "transfers"
 
 
+# Snapshot-style channels where only the latest state per market matters
+CONFLATABLE_CHANNELS = frozenset(
+    {
+        ParadexWebsocketChannel.BBO,
+        ParadexWebsocketChannel.ORDER_BOOK,
+        ParadexWebsocketChannel.MARKETS_SUMMARY,
+    }
+)
+
+
+def format_channel_name(channel: ParadexWebsocketChannel, params: dict | None = None) -> str:
+    """Exact channel name subscribed to for `channel` and `params`, with the defaults `subscribe()` applies.
+
+    Examples:
+        >>> format_channel_name(ParadexWebsocketChannel.ORDER_BOOK, {"market": "BTC-USD-PERP"})
+        'order_book.BTC-USD-PERP.snapshot@15@100ms'
+    """
+    if params is None:
+        params = {}
+    # Note: Set default to all markets if no params are provided which
+    # allows backward compatibility with old market_summary where
+    # no params were required.
+    if channel == ParadexWebsocketChannel.MARKETS_SUMMARY and not params:
+        params = {"market": "ALL"}
+
+    # Handle ORDER_BOOK channel with optional parameters
+    if channel == ParadexWebsocketChannel.ORDER_BOOK:
+        # Set defaults for required parameters
+        format_params = params.copy()
+        if "feed_type" not in format_params:
+            format_params["feed_type"] = "snapshot"
+        if "refresh_rate" not in format_params:
+            format_params["refresh_rate"] = "100ms"
+        # price_tick is optional - if not provided or empty, omit it
+        if "price_tick" not in format_params or not format_params["price_tick"]:
+            format_params.pop("price_tick", None)
+            base_format = "order_book.{market}.{feed_type}@15@{refresh_rate}"
+        else:
+            base_format = "order_book.{market}.{feed_type}@15@{refresh_rate}@{price_tick}"
+        return base_format.format(**format_params)
+    return channel.value.format(**params)
+
+
 def _paradex_channel_prefix(value: str) -> str:
     return value.split(".")[0]
 
 
+@lru_cache(maxsize=4096)
 def _get_ws_channel_from_name(message_channel: str) -> ParadexWebsocketChannel | None:
     for channel in ParadexWebsocketChannel:
         if message_channel.startswith(_paradex_channel_prefix(channel.value)):
@@ -126,6 +179,19 @@ class ParadexWebsocketClient:
         validate_messages (bool, optional): Enable pydantic message validation. Requires pydantic. Defaults to False.
         ping_interval (float, optional): WebSocket ping interval in seconds. None uses websockets default. Defaults to None.
         disable_reconnect (bool, optional): Disable automatic reconnection for tight simulation control. Defaults to False.
+        decoder (Optional[WsDecoder | str], optional): Frame decoder instance or name ("json", "orjson", "msgspec").
+            Defaults to None (fastest installed decoder).
+        collect_stats (bool, optional): Collect per-channel frame, byte, decode and callback time counters,
+            see `get_stats()`. Defaults to False.
+        dispatch_queue_size (Optional[int], optional): Enable per-channel dispatch: each channel gets a bounded
+            queue of this size and its own worker task, so a slow callback only delays its own channel.
+            Defaults to None (callbacks are awaited inline by the reader).
+        overflow_policy (OverflowPolicy | str, optional): Default policy when a channel queue is full
+            ("block", "drop_oldest", "conflate_latest"). Defaults to OverflowPolicy.BLOCK.
+        reconnect_strategy (Optional[RetryStrategy], optional): Delays between failed reconnection attempts,
+            see `get_reconnect_stats()`. Defaults to None (`JitteredBackoffStrategy()`, retrying forever).
+        capture (Optional[CaptureWriter], optional): Record every received frame for offline replay,
+            see `paradex_py.api.capture`. Defaults to None.
 
     Examples:
         >>> from paradex_py import Paradex
@@ -142,6 +208,12 @@ class ParadexWebsocketClient:
         ...                                   reader_sleep_on_error=0, reader_sleep_on_no_connection=0)
         >>> # With typed message validation
         >>> ws_client = ParadexWebsocketClient(env=Environment.TESTNET, validate_messages=True)
+        >>> # Force the stdlib decoder
+        >>> ws_client = ParadexWebsocketClient(env=Environment.TESTNET, decoder="json")
+        >>> # Independent per-channel callback queues
+        >>> ws_client = ParadexWebsocketClient(
+        ...     env=Environment.TESTNET, dispatch_queue_size=1000, overflow_policy="drop_oldest"
+        ... )
     """
 
     classname: str = "ParadexWebsocketClient"
@@ -159,6 +231,12 @@ class ParadexWebsocketClient:
         validate_messages: bool = False,
         ping_interval: float | None = None,
         disable_reconnect: bool = False,
+        decoder: WsDecoder | str | None = None,
+        collect_stats: bool = False,
+        dispatch_queue_size: int | None = None,
+        overflow_policy: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        reconnect_strategy: RetryStrategy | None = None,
+        capture: CaptureWriter | None = None,
     ):
         self.env = env
         self.api_url = ws_url_override or f"wss://ws.api.{self.env}.paradex.trade/v1"
@@ -167,6 +245,10 @@ class ParadexWebsocketClient:
         self.account: ParadexAccount | None = None
         self.callbacks: dict[str, Callable] = {}
         self.subscribed_channels: dict[str, bool] = {}
+        # Channels whose frames are decoded straight into a typed model
+        self.channel_models: dict[str, type] = {}
+        # Latest-state wrappers of conflated subscriptions
+        self.conflators: dict[str, ConflatingCallback] = {}
         self.ws_timeout = ws_timeout if ws_timeout is not None else WS_TIMEOUT
         self.connector = connector
         self.auto_start_reader = auto_start_reader
@@ -183,10 +265,36 @@ class ParadexWebsocketClient:
         # Heartbeat and reconnection control
         self.ping_interval = ping_interval
         self.disable_reconnect = disable_reconnect
+        self.reconnect_strategy: RetryStrategy = reconnect_strategy or JitteredBackoffStrategy()
+        self.reconnect_stats = ReconnectStats()
+        self.capture = capture
+        self._reconnecting = False
+        self._closed = False
+
+        # Request ids of unacknowledged subscribe frames, and when the current resubscription started
+        self._request_ids = itertools.count(int(time.time() * 1_000_000))
+        self._pending_subscribes: dict[int, str] = {}
+        self._resubscribe_started: float | None = None
 
         # Optional message validation
         self.validate_messages = validate_messages and TYPED_MODELS_AVAILABLE
 
+        # Frame decoder (msgspec/orjson when installed, stdlib json otherwise)
+        self.decoder = decoder if isinstance(decoder, WsDecoder) else get_decoder(decoder)
+
+        # Optional hot-path counters
+        self.stats: WsStats | None = WsStats() if collect_stats else None
+
+        # Optional per-channel callback queues
+        self.dispatcher: ChannelDispatcher | None = None
+        if dispatch_queue_size is not None:
+            self.dispatcher = ChannelDispatcher(
+                self._invoke_callback,
+                maxsize=dispatch_queue_size,
+                overflow_policy=OverflowPolicy(overflow_policy),
+                logger=self.logger,
+            )
+
         if auto_start_reader:
             try:
                 loop = asyncio.get_event_loop()
@@ -222,23 +330,10 @@ class ParadexWebsocketClient:
         """
 
         try:
+            self._closed = False
             self.subscribed_channels = {}
-            extra_headers = {}
-            if self.account:
-                extra_headers.update({"Authorization": f"Bearer {self.account.jwt_token}"})
-
-            # Use custom connector if provided, otherwise use default websockets.connect
-            if self.connector is not None:
-                self.ws = await self.connector(self.api_url, extra_headers)
-            else:
-                connect_kwargs: dict[str, Any] = {
-                    "additional_headers": extra_headers,
-                    "ssl": False,  # Disable SSL verification for macOS SIP compatibility
-                }
-                if self.ping_interval is not None:
-                    connect_kwargs["ping_interval"] = int(self.ping_interval)
-
-                self.ws = await websockets.connect(self.api_url, **connect_kwargs)
+            self._pending_subscribes.clear()
+            self.ws = await self._open_connection()
 
             self.logger.debug(f"{self.classname}: Connected to {self.api_url}")
 
@@ -266,6 +361,24 @@ class ParadexWebsocketClient:
 
         return is_connected
 
+    async def _open_connection(self) -> WebSocketConnection | ClientConnection:
+        extra_headers = {}
+        if self.account:
+            extra_headers.update({"Authorization": f"Bearer {self.account.jwt_token}"})
+
+        # Use custom connector if provided, otherwise use default websockets.connect
+        if self.connector is not None:
+            return await self.connector(self.api_url, extra_headers)
+
+        connect_kwargs: dict[str, Any] = {
+            "additional_headers": extra_headers,
+            "ssl": False,  # Disable SSL verification for macOS SIP compatibility
+        }
+        if self.ping_interval is not None:
+            connect_kwargs["ping_interval"] = int(self.ping_interval)
+
+        return await websockets.connect(self.api_url, **connect_kwargs)
+
     async def close(self):
         """Close the WebSocket connection and clean up resources.
 
@@ -285,7 +398,12 @@ class ParadexWebsocketClient:
             ...         await ws_client.close()
             >>> asyncio.run(main())
         """
+        self._closed = True
         await self._close_connection()
+        if self.dispatcher is not None:
+            await self.dispatcher.close()
+        for conflator in self.conflators.values():
+            await conflator.close()
 
     async def _close_connection(self):
         try:
@@ -315,23 +433,87 @@ class ParadexWebsocketClient:
         if self.disable_reconnect:
             self.logger.info(f"{self.classname}: Reconnection disabled, skipping...")
             return
+        if self._reconnecting:
+            # The reader and a failed send can both notice the same dead socket
+            return
 
+        self._reconnecting = True
+        started = time.perf_counter()
         try:
             self.logger.info(f"{self.classname}: Reconnect websocket...")
-            # Acquire lock to ensure no concurrent recv() operations during reconnection
-            async with self._recv_lock:
-                await self._close_connection()
-                await self.connect()
-            await self._resubscribe()
+            self.reconnect_stats.reconnects += 1
+            ws = await self._open_connection_with_backoff()
+            if ws is None:
+                return
+            if self._closed:
+                await ws.close()
+                return
+            self.reconnect_stats.last_connect_time = time.perf_counter() - started
+
+            # Swap sockets without waiting for a reader blocked in recv() on the old one:
+            # closing it below wakes the reader, which then drops the stale error.
+            old_ws, self.ws = self.ws, ws
+            self.subscribed_channels = {}
+            self._pending_subscribes.clear()
+            if old_ws is not None and old_ws is not ws:
+                with contextlib.suppress(Exception):
+                    await old_ws.close()
+            self.logger.info(f"{self.classname}: Reconnected in {self.reconnect_stats.last_connect_time:.3f}s")
+
+            if self.auto_start_reader and self._reader_task is None:
+                self._reader_task = asyncio.create_task(self._read_messages())
+            if self.account:
+                await self._send_auth_id(ws, self.account.jwt_token)
+            await self._resubscribe(started)
         except Exception:
             self.logger.exception(f"{self.classname}: Reconnect failed {traceback.format_exc()}")
+        finally:
+            self._reconnecting = False
 
-    async def _resubscribe(self):
-        if self.ws and self.ws.state == State.OPEN:
-            for channel_name in self.callbacks:
-                await self._subscribe_to_channel_by_name(channel_name)
-        else:
+    async def _open_connection_with_backoff(self) -> WebSocketConnection | ClientConnection | None:
+        """Open a new socket, sleeping `reconnect_strategy.get_delay()` between failed attempts."""
+        attempt = 0
+        while not self._closed:
+            try:
+                return await self._open_connection()
+            except Exception as e:
+                self.reconnect_stats.failed_attempts += 1
+                if not self.reconnect_strategy.should_retry(attempt, None, e):
+                    self.logger.exception(f"{self.classname}: Reconnect failed after {attempt + 1} attempts")
+                    return None
+                delay = self.reconnect_strategy.get_delay(attempt)
+                self.logger.warning(
+                    f"{self.classname}: Reconnect attempt {attempt + 1} failed ({e!r}), retrying in {delay:.2f}s"
+                )
+                attempt += 1
+                await asyncio.sleep(delay)
+        return None
+
+    async def _resubscribe(self, started: float | None = None) -> None:
+        """Send the subscribe frames of every channel in one burst.
+
+        Frames are not sent one round trip at a time: acknowledgements are
+        matched to channels by request id as the reader receives them, and
+        `reconnect_stats.last_resubscribe_time` is set once the last one
+        arrives.
+
+        Args:
+            started: `time.perf_counter()` value the resubscription time is measured from.
+                Defaults to now.
+        """
+        ws = self.ws
+        if ws is None or not self._is_connection_open():
             self.logger.warning(f"{self.classname}: Resubscribe - No connection")
+            return
+
+        frames = [self._subscribe_frame(channel_name) for channel_name in self.callbacks]
+        self.reconnect_stats.last_resubscribed_channels = len(frames)
+        if not frames:
+            return
+        self._resubscribe_started = started if started is not None else time.perf_counter()
+        for frame in frames:
+            await ws.send(frame)
+        self.logger.info(f"{self.classname}: Resubscribing to {len(frames)} channels")
 
     async def _send_auth_id(
         self,
@@ -344,7 +526,7 @@ class ParadexWebsocketClient:
         await websocket.send(
             json.dumps(
                 {
-                    "id": int(time.time() * 1_000_000),
+                    "id": next(self._request_ids),
                     "jsonrpc": "2.0",
                     "method": "auth",
                     "params": {"bearer": paradex_jwt},
@@ -354,18 +536,29 @@ class ParadexWebsocketClient:
 
     def _check_subscribed_channel(self, message: dict) -> None:
         if "id" in message:
+            pending_channel = self._pending_subscribes.pop(message["id"], None)
             # Check for successful subscription
             channel_subscribed: str | None = message.get("result", {}).get("channel")
             if channel_subscribed:
-                self.logger.debug(f"{self.classname}: Subscribed to channel:{channel_subscribed}")
+                self.logger.debug("%s: Subscribed to channel:%s", self.classname, channel_subscribed)
                 self.subscribed_channels[channel_subscribed] = True
             # Check for subscription error
             error_info = message.get("error")
             if error_info:
                 error_code = error_info.get("code", "unknown")
                 error_message = error_info.get("message", "unknown error")
-                self.logger.error(f"{self.classname}: Subscription failed - code:{error_code} message:{error_message}")
+                self.logger.error(
+                    f"{self.classname}: Subscription failed - channel:{pending_channel} code:{error_code}"
+                    f" message:{error_message}"
+                )
                 # Note: We don't mark the channel as subscribed since it failed
+                if pending_channel is not None:
+                    self.reconnect_stats.subscribe_errors += 1
+            if pending_channel is not None and not self._pending_subscribes and self._resubscribe_started is not None:
+                elapsed = time.perf_counter() - self._resubscribe_started
+                self._resubscribe_started = None
+                self.reconnect_stats.record_resubscribed(elapsed)
+                self.logger.info(f"{self.classname}: Resubscribed in {elapsed:.3f}s")
 
     def _is_connection_open(self) -> bool:
         """Check if WebSocket connection is open - handle both websockets and custom connections."""
@@ -382,17 +575,24 @@ class ParadexWebsocketClient:
 
     async def _receive_and_process_message(self) -> None:
         """Receive and process a single WebSocket message."""
-        if self.ws is None:
+        ws = self.ws
+        if ws is None:
             raise RuntimeError("WebSocket connection must be established before receiving messages")
         async with self._recv_lock:
-            response = await asyncio.wait_for(self.ws.recv(), timeout=self.ws_timeout)
-        if isinstance(response, bytes):
-            response = response.decode("utf-8")
+            try:
+                response = await asyncio.wait_for(ws.recv(), timeout=self.ws_timeout)
+            except websockets.exceptions.ConnectionClosed:
+                if ws is not self.ws:
+                    # The socket was replaced by a reconnect while we were waiting on it
+                    return
+                raise
+        if self.capture is not None:
+            self.capture.ws_frame(response)
         await self._process_message(response)
 
     async def _handle_message_receive_error(self, error: Exception) -> None:
         """Handle errors that occur while receiving messages."""
-        if isinstance(error, (websockets.exceptions.ConnectionClosedError, websockets.exceptions.ConnectionClosedOK)):
+        if isinstance(error, websockets.exceptions.ConnectionClosed):
             # Don't reconnect if we're intentionally closing the connection
             if self._is_closing:
                 self.logger.info(
@@ -413,7 +613,9 @@ class ParadexWebsocketClient:
 
     async def _read_messages(self) -> None:
         try:
-            while True:
+            # Also checks the closing flag: on Python < 3.12 `asyncio.wait_for` swallows a
+            # cancellation that arrives together with a frame, which would leave close() waiting
+            while not self._is_closing:
                 if self._is_connection_open() and self.ws is not None:
                     try:
                         await self._receive_and_process_message()
@@ -429,51 +631,167 @@ class ParadexWebsocketClient:
             self.logger.exception(f"{self.classname}: Unexpected error in reader task: {traceback.format_exc()}")
             raise
 
-    async def _process_message(self, response: str) -> None:
+    async def _process_message(self, response: str | bytes) -> None:
         """Process a single WebSocket message."""
-        message = json.loads(response)
+        if not self.validate_messages and await self._process_message_fast_path(response):
+            return
+
+        stats = self.stats
+        decode_start = time.perf_counter() if stats is not None else 0.0
+        message = self.decoder.decode(response)
+        message_channel = message["params"].get("channel") if "params" in message else None
+        if stats is not None:
+            stats.record_frame(message_channel, len(response), time.perf_counter() - decode_start)
+
         self._check_subscribed_channel(message)
         if "params" not in message:
-            self.logger.debug(f"{self.classname}: Non-actionable message:{message}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("%s: Non-actionable message:%s", self.classname, message)
         else:
-            message_channel = message["params"].get("channel")
             ws_channel: ParadexWebsocketChannel | None = _get_ws_channel_from_name(message_channel)
 
             # Optional WebSocket RPC message validation
             if self.validate_messages:
-                validated_message = validate_ws_message(message)
-                if validated_message is not None:
-                    # Use validated message structure
-                    message = validated_message.model_dump() if hasattr(validated_message, "model_dump") else message
-                    self.logger.debug(f"{self.classname}: WebSocket RPC message validated")
-                else:
-                    self.logger.warning(f"{self.classname}: WebSocket RPC message validation failed")
-
-                # Validate payload against AsyncAPI models
-                if "params" in message and "data" in message:
-                    channel_name = message["params"].get("channel", "")
-                    payload_data = message["data"]
-                    validated_payload = validate_ws_payload(channel_name, payload_data)
-                    if validated_payload is not None:
-                        # Replace data with validated payload
-                        message["data"] = validated_payload.model_dump()
-                        self.logger.debug(f"{self.classname}: WebSocket payload validated for channel {channel_name}")
-                    else:
-                        self.logger.warning(
-                            f"{self.classname}: WebSocket payload validation failed for channel {channel_name}"
-                        )
+                message = self._validate_message(message)
 
             if ws_channel is None:
-                self.logger.debug(f"{self.classname}: unregistered channel:{message_channel} message:{message}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "%s: unregistered channel:%s message:%s", self.classname, message_channel, message
+                    )
             elif message_channel in self.callbacks:
-                self.logger.debug(
-                    f"{self.classname}: channel:{message_channel}"
-                    f" callback:{self.callbacks[message_channel]}"
-                    f" message:{message}"
-                )
-                await self.callbacks[message_channel](ws_channel, message)
+                callback = self.callbacks[message_channel]
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "%s: channel:%s callback:%s message:%s", self.classname, message_channel, callback, message
+                    )
+                await self._deliver(message_channel, callback, ws_channel, message)
+            else:
+                self.logger.info("%s: Non-callback channel:%s", self.classname, message_channel)
+
+    def _validate_message(self, message: dict) -> dict:
+        validated_message = validate_ws_message(message)
+        if validated_message is not None:
+            # Use validated message structure
+            message = validated_message.model_dump() if hasattr(validated_message, "model_dump") else message
+            self.logger.debug("%s: WebSocket RPC message validated", self.classname)
+        else:
+            self.logger.warning("%s: WebSocket RPC message validation failed", self.classname)
+
+        # Validate payload against AsyncAPI models
+        if "params" in message and "data" in message:
+            channel_name = message["params"].get("channel", "")
+            payload_data = message["data"]
+            validated_payload = validate_ws_payload(channel_name, payload_data)
+            if validated_payload is not None:
+                # Replace data with validated payload
+                message["data"] = validated_payload.model_dump()
+                self.logger.debug("%s: WebSocket payload validated for channel %s", self.classname, channel_name)
             else:
-                self.logger.info(f"{self.classname}: Non-callback channel:{message_channel}")
+                self.logger.warning(
+                    "%s: WebSocket payload validation failed for channel %s", self.classname, channel_name
+                )
+        return message
+
+    async def _process_message_fast_path(self, response: str | bytes) -> bool:
+        """Route a subscription notification on its channel name alone.
+
+        Frames nobody listens to are dropped without being decoded, and
+        channels subscribed with a model are decoded straight into it.
+
+        Returns:
+            bool: True if the frame was handled, False if it needs the full decode.
+        """
+        message_channel = self.decoder.peek_channel(response)
+        if message_channel is None:
+            return False
+        callback = self.callbacks.get(message_channel)
+        if callback is None:
+            if self.stats is not None:
+                self.stats.record_frame(message_channel, len(response))
+            self.logger.info("%s: Non-callback channel:%s", self.classname, message_channel)
+            return True
+        model = self.channel_models.get(message_channel)
+        ws_channel = _get_ws_channel_from_name(message_channel)
+        if model is None or ws_channel is None:
+            return False
+
+        stats = self.stats
+        decode_start = time.perf_counter() if stats is not None else 0.0
+        message = self.decoder.decode_typed(response, model)
+        if stats is not None:
+            stats.record_frame(message_channel, len(response), time.perf_counter() - decode_start)
+        await self._deliver(message_channel, callback, ws_channel, message)
+        return True
+
+    async def _deliver(
+        self, channel_name: str, callback: Callable, ws_channel: ParadexWebsocketChannel, message: Any
+    ) -> None:
+        if self.dispatcher is None:
+            await self._invoke_callback(channel_name, callback, ws_channel, message)
+        else:
+            await self.dispatcher.dispatch(channel_name, callback, ws_channel, message)
+
+    async def _invoke_callback(
+        self, channel_name: str, callback: Callable, ws_channel: ParadexWebsocketChannel, message: Any
+    ) -> None:
+        stats = self.stats
+        if stats is None:
+            await callback(ws_channel, message)
+            return
+        start = time.perf_counter()
+        try:
+            await callback(ws_channel, message)
+        except Exception:
+            stats.record_callback(channel_name, time.perf_counter() - start, failed=True)
+            raise
+        stats.record_callback(channel_name, time.perf_counter() - start)
+
+    def get_stats(self) -> dict:
+        """Return hot-path counters collected since start or the last `reset_stats()`.
+
+        Returns:
+            dict: Totals (`frames_received`, `bytes_received`, `decode_time`, `callback_time`)
+                and per-channel counters under `channels`. Empty if `collect_stats` is disabled.
+
+        Examples:
+            >>> ws_client = ParadexWebsocketClient(env=Environment.TESTNET, collect_stats=True)
+            >>> ws_client.get_stats()["frames_received"]
+            0
+        """
+        return self.stats.snapshot() if self.stats is not None else {}
+
+    def reset_stats(self) -> None:
+        """Reset hot-path and dispatch queue counters."""
+        if self.stats is not None:
+            self.stats.reset()
+        if self.dispatcher is not None:
+            self.dispatcher.reset_stats()
+        for conflator in self.conflators.values():
+            conflator.reset_stats()
+
+    def get_reconnect_stats(self) -> dict:
+        """Return reconnection counters.
+
+        Returns:
+            dict: `reconnects`, `failed_attempts`, `subscribe_errors`, `last_resubscribed_channels`,
+                `last_connect_time` (seconds until the new socket was open), `last_resubscribe_time`
+                (seconds until every channel was acknowledged again) and `max_resubscribe_time`.
+        """
+        return self.reconnect_stats.snapshot()
+
+    def get_pending_subscriptions(self) -> list[str]:
+        """Channels whose subscribe frame has not been acknowledged yet."""
+        return list(self._pending_subscribes.values())
+
+    def get_queue_stats(self) -> dict[str, dict[str, int]]:
+        """Return per-channel dispatch queue counters.
+
+        Returns:
+            dict: Channel name to `depth`, `max_depth`, `enqueued`, `processed`, `dropped`,
+                `conflated` and `errors`. Empty if `dispatch_queue_size` is not set.
+        """
+        return self.dispatcher.stats() if self.dispatcher is not None else {}
 
     async def pump_once(self) -> bool:
         """Manually pump one message from the WebSocket connection.
@@ -494,16 +812,16 @@ class ParadexWebsocketClient:
             self.logger.exception(f"{self.classname}: Error in pump_once: {traceback.format_exc()}")
             return False
         else:
-            if isinstance(response, bytes):
-                response = response.decode("utf-8")
+            if self.capture is not None:
+                self.capture.ws_frame(response)
             await self._process_message(response)
             return True
 
-    async def inject(self, message: str) -> None:
+    async def inject(self, message: str | bytes) -> None:
         """Inject a raw message string into the message processing pipeline.
 
         Args:
-            message: Raw JSON string to process as if received from WebSocket.
+            message: Raw JSON string (or bytes) to process as if received from WebSocket.
         """
         try:
             await self._process_message(message)
@@ -528,6 +846,8 @@ class ParadexWebsocketClient:
         channel: ParadexWebsocketChannel,
         callback: Callable,
         params: dict | None = None,
+        model: type | None = None,
+        conflate: bool = False,
     ) -> None:
         """Subscribe to a websocket channel with optional parameters.
             Callback function is invoked when a message is received.
@@ -536,6 +856,13 @@ class ParadexWebsocketClient:
             channel (ParadexWebsocketChannel): Channel to subscribe
             callback (Callable): Callback function
             params (Optional[dict], optional): Parameters for the channel. Defaults to None.
+            model (Optional[type], optional): Pydantic model (or msgspec Struct with the msgspec decoder)
+                describing the whole frame. When set, the callback receives an instance of it instead of a dict.
+                Defaults to None.
+            conflate (bool, optional): Deliver only the latest state. Updates received while the callback
+                is busy are collapsed per market and the freshest one is delivered once it is free; the
+                callback no longer blocks the reader. Supported for BBO, ORDER_BOOK snapshots and
+                MARKETS_SUMMARY. See `get_conflation_stats()`. Defaults to False.
 
         Examples:
         >>> from paradex_py import Paradex
@@ -550,32 +877,20 @@ class ParadexWebsocketClient:
         >>> import asyncio
         >>> asyncio.run(main())
         """
-        if params is None:
-            params = {}
-        # Note: Set default to all markets if no params are provided which
-        # allows backward compatibility with old market_summary where
-        # no params were required.
-        if channel == ParadexWebsocketChannel.MARKETS_SUMMARY and not params:
-            params = {"market": "ALL"}
-
-        # Handle ORDER_BOOK channel with optional parameters
-        if channel == ParadexWebsocketChannel.ORDER_BOOK:
-            # Set defaults for required parameters
-            format_params = params.copy()
-            if "feed_type" not in format_params:
-                format_params["feed_type"] = "snapshot"
-            if "refresh_rate" not in format_params:
-                format_params["refresh_rate"] = "100ms"
-            # price_tick is optional - if not provided or empty, omit it
-            if "price_tick" not in format_params or not format_params["price_tick"]:
-                format_params.pop("price_tick", None)
-                base_format = "order_book.{market}.{feed_type}@15@{refresh_rate}"
-            else:
-                base_format = "order_book.{market}.{feed_type}@15@{refresh_rate}@{price_tick}"
-            channel_name = base_format.format(**format_params)
-        else:
-            channel_name = channel.value.format(**params)
+        if conflate and channel not in CONFLATABLE_CHANNELS:
+            raise_value_error(f"{self.classname}: Conflation is not supported for channel {channel.name}")
+        channel_name = format_channel_name(channel, params)
+        if (
+            conflate
+            and channel == ParadexWebsocketChannel.ORDER_BOOK
+            and (params or {}).get("feed_type", "snapshot") != "snapshot"
+        ):
+            raise_value_error(f"{self.classname}: Conflation requires the order book snapshot feed")
+        await self._close_conflator(channel_name)
+        if conflate:
+            callback = self.conflators[channel_name] = ConflatingCallback(callback, logger=self.logger)
         self.callbacks[channel_name] = callback
+        self._set_channel_model(channel_name, model)
         self.logger.debug(f"{self.classname}: Subscribe channel:{channel_name}")
         await self._subscribe_to_channel_by_name(channel_name)
 
@@ -583,6 +898,7 @@ class ParadexWebsocketClient:
         self,
         channel_name: str,
         callback: Callable | None = None,
+        model: type | None = None,
     ) -> None:
         """Subscribe to a channel by exact name string.
 
@@ -592,9 +908,11 @@ class ParadexWebsocketClient:
         Args:
             channel_name: Exact channel name (e.g., "bbo.BTC-USD-PERP")
             callback: Optional callback function. If provided, registers the callback.
+            model: Optional frame model, see `subscribe`.
         """
         if callback is not None:
             self.callbacks[channel_name] = callback
+            self._set_channel_model(channel_name, model)
             self.logger.debug(f"{self.classname}: Subscribe channel:{channel_name}")
 
         await self._subscribe_to_channel_by_name(channel_name)
@@ -610,6 +928,8 @@ class ParadexWebsocketClient:
         # Remove from subscribed channels and callbacks
         self.subscribed_channels.pop(channel_name, None)
         self.callbacks.pop(channel_name, None)
+        self.channel_models.pop(channel_name, None)
+        await self._close_conflator(channel_name)
 
         self.logger.info(f"{self.classname}: Unsubscribe by name channel:{channel_name}")
 
@@ -618,9 +938,34 @@ class ParadexWebsocketClient:
             "jsonrpc": "2.0",
             "method": "unsubscribe",
             "params": {"channel": channel_name},
-            "id": str(int(time.time() * 1_000_000)),
+            "id": str(next(self._request_ids)),
         }
-        await self._send(json.dumps(unsubscribe_message))
+        try:
+            await self._send(json.dumps(unsubscribe_message))
+        finally:
+            # Drop the channel's queued messages and worker; last, as a callback may unsubscribe its own channel
+            if self.dispatcher is not None:
+                await self.dispatcher.remove(channel_name)
+
+    async def _close_conflator(self, channel_name: str) -> None:
+        conflator = self.conflators.pop(channel_name, None)
+        if conflator is not None:
+            await conflator.close()
+
+    def get_conflation_stats(self) -> dict[str, dict[str, Any]]:
+        """Return counters of conflated subscriptions.
+
+        Returns:
+            dict: Channel name to `delivered`, `coalesced` (updates replaced by a fresher one before
+                delivery), `pending` and `coalesced_by_key` (per market).
+        """
+        return {channel_name: conflator.stats() for channel_name, conflator in self.conflators.items()}
+
+    def _set_channel_model(self, channel_name: str, model: type | None) -> None:
+        if model is None:
+            self.channel_models.pop(channel_name, None)
+        else:
+            self.channel_models[channel_name] = model
 
     def get_subscriptions(self) -> dict[str, bool]:
         """Get current subscription map.
@@ -683,17 +1028,20 @@ class ParadexWebsocketClient:
 
         return message_count
 
+    def _subscribe_frame(self, channel_name: str) -> str:
+        request_id = next(self._request_ids)
+        self._pending_subscribes[request_id] = channel_name
+        return json.dumps(
+            {
+                "id": request_id,
+                "jsonrpc": "2.0",
+                "method": "subscribe",
+                "params": {"channel": channel_name},
+            }
+        )
+
     async def _subscribe_to_channel_by_name(
         self,
         channel_name: str,
     ) -> None:
-        await self._send(
-            json.dumps(
-                {
-                    "id": int(time.time() * 1_000_000),
-                    "jsonrpc": "2.0",
-                    "method": "subscribe",
-                    "params": {"channel": channel_name},
-                }
-            )
-        )
+        await self._send(self._subscribe_frame(channel_name))
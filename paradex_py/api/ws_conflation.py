@@ -0,0 +1,109 @@
+"""
+Latest-state delivery for snapshot-style WebSocket channels.
+
+Strategies reacting to best bid/ask or book snapshots only need the most
+recent state. `ConflatingCallback` wraps a subscription callback so that
+updates arriving while the callback is still busy are collapsed per market:
+when the callback becomes free it receives only the freshest update of each
+market, and the number of skipped (coalesced) updates is counted.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from typing import Any
+
+
+def market_key(message: Any) -> str:
+    """Return the market a channel message refers to, or "" if it cannot be determined cheaply."""
+    if isinstance(message, dict):
+        data = message.get("params", {}).get("data")
+        if isinstance(data, dict):
+            return data.get("market") or ""
+        return ""
+    # Typed frames (pydantic models / msgspec structs)
+    data = getattr(getattr(message, "params", None), "data", None)
+    return getattr(data, "market", None) or ""
+
+
+class ConflatingCallback:
+    """Callback wrapper delivering only the latest pending update per market.
+
+    The wrapper returns to the reader immediately; a drain task feeds the
+    wrapped callback one update at a time. Markets are served round-robin,
+    so a busy market cannot starve the others.
+
+    Args:
+        callback: Wrapped coroutine callback `(ws_channel, message)`.
+        key_fn: Function returning the conflation key of a message.
+        logger: Logger for callback errors.
+    """
+
+    def __init__(
+        self,
+        callback: Callable,
+        key_fn: Callable[[Any], str] = market_key,
+        logger: logging.Logger | None = None,
+    ):
+        self.callback = callback
+        self.key_fn = key_fn
+        self.logger = logger or logging.getLogger(__name__)
+        self.delivered = 0
+        self.coalesced = 0
+        self.coalesced_by_key: dict[str, int] = {}
+        self._pending: dict[str, tuple[Any, Any]] = {}
+        self._drain_task: asyncio.Task | None = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    async def __call__(self, ws_channel: Any, message: Any) -> None:
+        key = self.key_fn(message)
+        if key in self._pending:
+            self.coalesced += 1
+            self.coalesced_by_key[key] = self.coalesced_by_key.get(key, 0) + 1
+        self._pending[key] = (ws_channel, message)
+        if self._drain_task is None or self._drain_task.done():
+            self._idle.clear()
+            self._drain_task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        try:
+            while self._pending:
+                # Oldest key first; a key updated again re-enters at the back
+                key = next(iter(self._pending))
+                ws_channel, message = self._pending.pop(key)
+                try:
+                    await self.callback(ws_channel, message)
+                except Exception:
+                    self.logger.exception("ConflatingCallback: callback failed for key:%s", key)
+                self.delivered += 1
+        finally:
+            self._idle.set()
+
+    async def join(self) -> None:
+        """Wait until every pending update has been delivered."""
+        await self._idle.wait()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "pending": len(self._pending),
+            "coalesced_by_key": dict(self.coalesced_by_key),
+        }
+
+    def reset_stats(self) -> None:
+        self.delivered = 0
+        self.coalesced = 0
+        self.coalesced_by_key.clear()
+
+    async def close(self) -> None:
+        """Stop delivering and discard pending updates."""
+        self._pending.clear()
+        if self._drain_task is not None and not self._drain_task.done():
+            self._drain_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._drain_task
+        self._drain_task = None
+        self._idle.set()
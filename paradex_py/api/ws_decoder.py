@@ -0,0 +1,185 @@
+"""
+Pluggable JSON decoders for WebSocket frames.
+
+The WebSocket client only needs the channel name to decide whether a frame
+is interesting at all, so every decoder can `peek_channel()` on the raw
+frame without parsing it. Frames that nobody subscribed to are dropped
+before the full decode, and channels registered with a model are decoded
+straight into that type instead of going through an intermediate dict.
+
+`orjson` and `msgspec` are used when installed; the stdlib `json` module
+is always available as a fallback.
+"""
+
+import json
+import re
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel
+
+from paradex_py.utils import raise_value_error
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    MSGSPEC_AVAILABLE = False
+
+
+_SUBSCRIPTION_STR = re.compile(r'"method"\s*:\s*"subscription"')
+_CHANNEL_STR = re.compile(r'"channel"\s*:\s*"([^"]+)"')
+_SUBSCRIPTION_BYTES = re.compile(rb'"method"\s*:\s*"subscription"')
+_CHANNEL_BYTES = re.compile(rb'"channel"\s*:\s*"([^"]+)"')
+
+
+def peek_channel(raw: str | bytes) -> str | None:
+    """Extract the channel of a subscription notification without decoding the frame.
+
+    Only the part of the frame preceding the `data` payload is searched, so a
+    `channel` key inside the payload can never be mistaken for the routing key.
+
+    Args:
+        raw: Raw WebSocket frame
+
+    Returns:
+        Channel name, or None if the frame is not a subscription notification
+        (RPC responses, errors) or the channel could not be located cheaply.
+    """
+    if isinstance(raw, bytes):
+        if _SUBSCRIPTION_BYTES.search(raw) is None:
+            return None
+        end = raw.find(b'"data"')
+        match_bytes = _CHANNEL_BYTES.search(raw, 0, end if end >= 0 else len(raw))
+        return match_bytes.group(1).decode() if match_bytes else None
+
+    if _SUBSCRIPTION_STR.search(raw) is None:
+        return None
+    end = raw.find('"data"')
+    match = _CHANNEL_STR.search(raw, 0, end if end >= 0 else len(raw))
+    return match.group(1) if match else None
+
+
+class WsDecoder:
+    """Stdlib `json` decoder; base class for the optional fast decoders.
+
+    Subclasses override `decode` and, where the backend supports it,
+    `decode_typed` for direct decoding into a target type.
+    """
+
+    name: str = "json"
+
+    def peek_channel(self, raw: str | bytes) -> str | None:
+        return peek_channel(raw)
+
+    def decode(self, raw: str | bytes) -> Any:
+        return json.loads(raw)
+
+    def decode_typed(self, raw: str | bytes, model: type) -> Any:
+        """Decode a frame directly into `model`.
+
+        Pydantic models are validated from the JSON text by pydantic's own
+        parser, which avoids building an intermediate dict. msgspec structs
+        are supported by `MsgspecDecoder`.
+
+        Args:
+            raw: Raw WebSocket frame
+            model: Target type for the whole frame
+
+        Returns:
+            Instance of `model`
+        """
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            return model.model_validate_json(raw)
+        return raise_value_error(f"{self.name} decoder cannot decode into {model!r}")
+
+
+class OrjsonDecoder(WsDecoder):
+    """Decoder backed by `orjson`.
+
+    Frames orjson refuses (e.g. integers wider than 64 bits on recent orjson
+    releases) are decoded with the stdlib instead. Paradex encodes prices and
+    sizes as strings, so integer width is not a concern for market data.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not ORJSON_AVAILABLE:
+            raise_value_error("OrjsonDecoder requires the orjson package")
+
+    def decode(self, raw: str | bytes) -> Any:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return json.loads(raw)
+
+
+class MsgspecDecoder(WsDecoder):
+    """Decoder backed by `msgspec`, with typed decoding into `msgspec.Struct` types."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if not MSGSPEC_AVAILABLE:
+            raise_value_error("MsgspecDecoder requires the msgspec package")
+        self._decoder = msgspec.json.Decoder()
+
+    def decode(self, raw: str | bytes) -> Any:
+        return self._decoder.decode(raw)
+
+    def decode_typed(self, raw: str | bytes, model: type) -> Any:
+        if isinstance(model, type) and issubclass(model, msgspec.Struct):
+            return _msgspec_typed_decoder(model).decode(raw)
+        return super().decode_typed(raw, model)
+
+
+@cache
+def _msgspec_typed_decoder(model: type) -> Any:
+    return msgspec.json.Decoder(type=model)
+
+
+_DECODERS: dict[str, type[WsDecoder]] = {
+    "json": WsDecoder,
+    "orjson": OrjsonDecoder,
+    "msgspec": MsgspecDecoder,
+}
+
+
+def get_decoder(name: str | None = None) -> WsDecoder:
+    """Return a decoder by name, or the fastest available one.
+
+    Args:
+        name: "json", "orjson" or "msgspec". If None, prefers msgspec, then orjson, then json.
+
+    Returns:
+        Decoder instance
+    """
+    if name is not None:
+        if name not in _DECODERS:
+            raise_value_error(f"Unknown WebSocket decoder: {name}")
+        return _DECODERS[name]()
+    if MSGSPEC_AVAILABLE:
+        return MsgspecDecoder()
+    if ORJSON_AVAILABLE:
+        return OrjsonDecoder()
+    return WsDecoder()
+
+
+__all__ = [
+    "MSGSPEC_AVAILABLE",
+    "ORJSON_AVAILABLE",
+    "MsgspecDecoder",
+    "OrjsonDecoder",
+    "WsDecoder",
+    "get_decoder",
+    "peek_channel",
+]
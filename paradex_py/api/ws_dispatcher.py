@@ -0,0 +1,328 @@
+"""
+Per-channel callback dispatch for the WebSocket client.
+
+By default `ParadexWebsocketClient` awaits every callback inline in its
+reader task, so one slow handler delays every other channel on the same
+connection. `ChannelDispatcher` instead gives each channel its own bounded
+queue and worker task: messages of a channel are still delivered
+in order, but channels progress independently of each other.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import Any
+
+from paradex_py.utils import raise_value_error
+
+
+class OverflowPolicy(Enum):
+    """What to do when a channel queue is full.
+
+    - BLOCK: wait for the worker to make room (backpressure on the reader).
+    - DROP_OLDEST: discard the oldest queued message.
+    - CONFLATE_LATEST: keep only the most recent pending message; suitable for
+      snapshot-style channels (BBO, markets summary) where stale frames are useless.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    CONFLATE_LATEST = "conflate_latest"
+
+
+@dataclass
+class QueueStats:
+    """Counters for a single channel queue."""
+
+    depth: int = 0
+    max_depth: int = 0
+    enqueued: int = 0
+    processed: int = 0
+    dropped: int = 0
+    conflated: int = 0
+    errors: int = 0
+
+
+# Delivers one message: (channel_name, callback, ws_channel, message)
+DeliverFn = Callable[[str, Callable, Any, Any], Awaitable[None]]
+
+
+class _ChannelQueue:
+    """Bounded FIFO of one channel whose capacity can change while its worker runs.
+
+    `asyncio.Queue` cannot be resized, so the dispatcher owns this small
+    queue instead: a deque plus events that wake the worker when an item
+    arrives and a blocked producer when room is made.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._items: deque[tuple[Callable, Any, Any]] = deque()
+        self._unfinished = 0
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def full(self) -> bool:
+        return len(self._items) >= self.maxsize
+
+    def _update(self) -> None:
+        if self._items:
+            self._not_empty.set()
+        else:
+            self._not_empty.clear()
+        if self.full():
+            self._not_full.clear()
+        else:
+            self._not_full.set()
+
+    async def put(self, item: tuple[Callable, Any, Any]) -> None:
+        """Append `item`, waiting until the queue is below its capacity."""
+        while self.full():
+            await self._not_full.wait()
+        self.put_nowait(item)
+
+    def put_nowait(self, item: tuple[Callable, Any, Any]) -> None:
+        """Append `item` regardless of the capacity; callers make room first."""
+        self._items.append(item)
+        self._unfinished += 1
+        self._finished.clear()
+        self._update()
+
+    async def get(self) -> tuple[Callable, Any, Any]:
+        while not self._items:
+            await self._not_empty.wait()
+        item = self._items.popleft()
+        self._update()
+        return item
+
+    def drop_oldest(self) -> bool:
+        """Discard the oldest queued item; False if the queue is empty."""
+        if not self._items:
+            return False
+        self._items.popleft()
+        self.task_done()
+        self._update()
+        return True
+
+    def task_done(self) -> None:
+        self._unfinished -= 1
+        if not self._unfinished:
+            self._finished.set()
+
+    async def join(self) -> None:
+        """Wait until every item put so far has been processed or dropped."""
+        await self._finished.wait()
+
+    def resize(self, maxsize: int, trim: bool) -> int:
+        """Set the capacity; with `trim`, drop the oldest items that no longer fit.
+
+        Without `trim`, a queue above its new capacity drains normally and
+        producers wait until it is below it.
+
+        Returns:
+            int: Number of items dropped.
+        """
+        dropped = 0
+        while trim and len(self._items) > maxsize:
+            self.drop_oldest()
+            dropped += 1
+        self.maxsize = maxsize
+        self._update()
+        return dropped
+
+
+class ChannelDispatcher:
+    """Route WebSocket messages to per-channel queues drained by worker tasks.
+
+    Workers are started lazily on the first message of a channel and live
+    until `remove()` or `close()`. Exceptions raised by callbacks are logged and counted;
+    they never stop the worker. Changing `maxsize`, `overflow_policy` or a
+    channel policy resizes the existing queues too.
+
+    Args:
+        deliver: Coroutine function invoking the callback for one message.
+        maxsize: Capacity of each channel queue.
+        overflow_policy: Default policy applied when a queue is full.
+        logger: Logger for callback errors.
+
+    Examples:
+        >>> dispatcher = ChannelDispatcher(deliver, maxsize=1000, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        >>> dispatcher.set_overflow_policy("bbo.BTC-USD-PERP", OverflowPolicy.CONFLATE_LATEST)
+    """
+
+    def __init__(
+        self,
+        deliver: DeliverFn,
+        maxsize: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        logger: logging.Logger | None = None,
+    ):
+        if maxsize < 1:
+            raise_value_error("maxsize must be at least 1")
+        self.deliver = deliver
+        self._maxsize = maxsize
+        self._overflow_policy = overflow_policy
+        self.logger = logger or logging.getLogger(__name__)
+        self._policies: dict[str, OverflowPolicy] = {}
+        self._queues: dict[str, _ChannelQueue] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._stats: dict[str, QueueStats] = {}
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise_value_error("maxsize must be at least 1")
+        self._maxsize = maxsize
+        for channel_name in self._queues:
+            self._resize(channel_name)
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        return self._overflow_policy
+
+    @overflow_policy.setter
+    def overflow_policy(self, policy: OverflowPolicy) -> None:
+        self._overflow_policy = policy
+        for channel_name in self._queues:
+            self._resize(channel_name)
+
+    def set_overflow_policy(self, channel_name: str, policy: OverflowPolicy | None) -> None:
+        """Override the overflow policy of one channel (None restores the default).
+
+        Conflating channels use a queue of size one: switching a running
+        channel to CONFLATE_LATEST keeps only its latest pending message.
+        """
+        if policy is None:
+            self._policies.pop(channel_name, None)
+        else:
+            self._policies[channel_name] = policy
+        if channel_name in self._queues:
+            self._resize(channel_name)
+
+    def get_overflow_policy(self, channel_name: str) -> OverflowPolicy:
+        return self._policies.get(channel_name, self._overflow_policy)
+
+    def _capacity(self, policy: OverflowPolicy) -> int:
+        return 1 if policy is OverflowPolicy.CONFLATE_LATEST else self._maxsize
+
+    def _resize(self, channel_name: str) -> None:
+        policy = self.get_overflow_policy(channel_name)
+        # BLOCK never discards messages: an oversized queue drains instead
+        dropped = self._queues[channel_name].resize(self._capacity(policy), trim=policy is not OverflowPolicy.BLOCK)
+        if dropped:
+            stats = self._stats[channel_name]
+            if policy is OverflowPolicy.CONFLATE_LATEST:
+                stats.conflated += dropped
+            else:
+                stats.dropped += dropped
+
+    async def dispatch(self, channel_name: str, callback: Callable, ws_channel: Any, message: Any) -> None:
+        """Queue a message for its channel worker, applying the overflow policy."""
+        queue = self._queues.get(channel_name)
+        if queue is None:
+            queue = self._start_worker(channel_name)
+        stats = self._stats[channel_name]
+        item = (callback, ws_channel, message)
+
+        if queue.full():
+            policy = self.get_overflow_policy(channel_name)
+            if policy is OverflowPolicy.BLOCK:
+                await queue.put(item)
+                self._record_enqueued(stats, queue)
+                return
+            if queue.drop_oldest():
+                if policy is OverflowPolicy.CONFLATE_LATEST:
+                    stats.conflated += 1
+                else:
+                    stats.dropped += 1
+
+        queue.put_nowait(item)
+        self._record_enqueued(stats, queue)
+
+    def _record_enqueued(self, stats: QueueStats, queue: _ChannelQueue) -> None:
+        stats.enqueued += 1
+        depth = queue.qsize()
+        if depth > stats.max_depth:
+            stats.max_depth = depth
+
+    def _start_worker(self, channel_name: str) -> _ChannelQueue:
+        queue = _ChannelQueue(self._capacity(self.get_overflow_policy(channel_name)))
+        self._queues[channel_name] = queue
+        self._stats.setdefault(channel_name, QueueStats())
+        self._workers[channel_name] = asyncio.create_task(self._worker(channel_name, queue))
+        return queue
+
+    async def _worker(self, channel_name: str, queue: _ChannelQueue) -> None:
+        while True:
+            callback, ws_channel, message = await queue.get()
+            stats = self._stats[channel_name]
+            try:
+                await self.deliver(channel_name, callback, ws_channel, message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                stats.errors += 1
+                self.logger.exception("ChannelDispatcher: callback failed for channel:%s", channel_name)
+            finally:
+                stats.processed += 1
+                queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every queued message has been processed."""
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return per-channel queue counters, including the current depth."""
+        result = {}
+        for channel_name, stats in self._stats.items():
+            queue = self._queues.get(channel_name)
+            stats.depth = queue.qsize() if queue is not None else 0
+            result[channel_name] = asdict(stats)
+        return result
+
+    def reset_stats(self) -> None:
+        for channel_name in list(self._stats):
+            self._stats[channel_name] = QueueStats()
+
+    async def remove(self, channel_name: str) -> None:
+        """Cancel the worker of `channel_name` and discard its pending messages and counters.
+
+        The channel's overflow policy is kept for a later subscription. Called
+        from the channel's own callback, the worker is cancelled at the
+        callback's next await instead of being waited for.
+        """
+        self._queues.pop(channel_name, None)
+        self._stats.pop(channel_name, None)
+        worker = self._workers.pop(channel_name, None)
+        if worker is None:
+            return
+        worker.cancel()
+        if worker is not asyncio.current_task():
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+
+    async def close(self) -> None:
+        """Cancel all workers and discard pending messages."""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        for worker in workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        self._workers.clear()
+        self._queues.clear()
@@ -0,0 +1,335 @@
+"""
+Sharded pool of WebSocket connections.
+
+A single `ParadexWebsocketClient` reads every channel through one socket and
+one reader task. `ParadexWebsocketPool` spreads channels over several
+clients instead: all channels of a market go to the same connection (so
+their relative order is kept), markets are placed by a stable hash unless
+pinned to a connection, and connections whose message rate runs well above
+the others hand markets over to the quietest one.
+"""
+
+import asyncio
+import logging
+import time
+import zlib
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from paradex_py.account.account import ParadexAccount
+from paradex_py.api.ws_client import ParadexWebsocketChannel, ParadexWebsocketClient, format_channel_name
+from paradex_py.environment import Environment
+from paradex_py.utils import raise_value_error
+
+
+@dataclass
+class PoolSubscription:
+    channel: ParadexWebsocketChannel
+    params: dict
+    callback: Callable
+    model: type | None
+    conflate: bool
+    shard_key: str
+    connection: int
+
+
+def shard_key(channel_name: str, params: dict) -> str:
+    """Placement key of a channel: its market, or the channel name for account-wide and ALL channels."""
+    market = params.get("market")
+    return market if market and market != "ALL" else channel_name
+
+
+class ParadexWebsocketPool:
+    """Several WebSocket connections behind one subscription API.
+
+    Every connection is a `ParadexWebsocketClient` with its own socket and
+    reader task. Channels are placed by market (see `shard_key`): a stable
+    hash picks the connection unless the market is pinned with `groups` or
+    `assign()`. `rebalance()` measures per-market message rates since its
+    previous call and, while the busiest connection receives more than
+    `rebalance_ratio` times the average of the others, moves its markets to
+    the quietest connection. A moved channel is unsubscribed before it is
+    subscribed again, so a few updates may be missed while it moves (order
+    book snapshots resend the whole book; `OrderBookFeed` resyncs deltas).
+
+    Args:
+        env (Environment): Environment
+        connections (int, optional): Number of connections. Defaults to 4.
+        groups (Optional[dict[str, int]], optional): Markets (or channel names) pinned to a connection index.
+            Pinned markets are never moved by rebalancing. Defaults to None.
+        rebalance_ratio (float, optional): Rebalance while the busiest connection's message rate is above this
+            multiple of the average rate of the other connections. Defaults to 2.0.
+        rebalance_interval (Optional[float], optional): Seconds between automatic `rebalance()` calls while
+            connected. Defaults to None (only when called).
+        logger (Optional[logging.Logger], optional): Logger. Defaults to None.
+        **client_kwargs: Passed to every `ParadexWebsocketClient` (`ws_timeout`, `connector`, `decoder`,
+            `dispatch_queue_size`, ...). `collect_stats` is always enabled, rates are computed from it.
+
+    Examples:
+        >>> from paradex_py.api.ws_pool import ParadexWebsocketPool
+        >>> pool = ParadexWebsocketPool(env=PROD, connections=4, rebalance_interval=30)
+        >>> await pool.connect()
+        >>> for market in markets:
+        ...     await pool.subscribe(ParadexWebsocketChannel.BBO, on_bbo, params={"market": market})
+        >>> pool.get_stats()["connections"]
+    """
+
+    classname: str = "ParadexWebsocketPool"
+
+    def __init__(
+        self,
+        env: Environment,
+        connections: int = 4,
+        groups: dict[str, int] | None = None,
+        rebalance_ratio: float = 2.0,
+        rebalance_interval: float | None = None,
+        logger: logging.Logger | None = None,
+        **client_kwargs: Any,
+    ):
+        if connections < 1:
+            raise_value_error(f"{self.classname}: connections must be at least 1")
+        self.logger = logger or logging.getLogger(__name__)
+        client_kwargs["collect_stats"] = True
+        self.clients = [
+            ParadexWebsocketClient(env=env, logger=self.logger, **client_kwargs) for _ in range(connections)
+        ]
+        self.rebalance_ratio = rebalance_ratio
+        self.rebalance_interval = rebalance_interval
+        self.subscriptions: dict[str, PoolSubscription] = {}
+        # Shard key to connection index: pinned groups, then hashed or rebalanced placements
+        self.groups: dict[str, int] = {}
+        self.placement: dict[str, int] = {}
+        self.moves = 0
+        self._lock = asyncio.Lock()
+        self._last_frames: dict[str, int] = {}
+        self._last_check = time.perf_counter()
+        self._rebalance_task: asyncio.Task | None = None
+        for key, connection in (groups or {}).items():
+            self.assign(key, connection)
+
+    async def __aenter__(self) -> "ParadexWebsocketPool":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def init_account(self, account: ParadexAccount) -> None:
+        """Authenticate every connection with `account` (needed for private channels)."""
+        for client in self.clients:
+            client.init_account(account)
+
+    def assign(self, key: str, connection: int) -> None:
+        """Pin a market (or channel name) to a connection; call before subscribing to it."""
+        if not 0 <= connection < len(self.clients):
+            raise_value_error(f"{self.classname}: no connection {connection}")
+        self.groups[key] = connection
+        self.placement[key] = connection
+
+    def shard_for(self, key: str) -> int:
+        """Connection index channels with shard key `key` are (or will be) placed on."""
+        connection = self.placement.get(key)
+        if connection is None:
+            connection = self.placement[key] = zlib.crc32(key.encode()) % len(self.clients)
+        return connection
+
+    def client_for(self, channel_name: str) -> ParadexWebsocketClient:
+        """Connection a subscribed channel is read from."""
+        subscription = self.subscriptions.get(channel_name)
+        if subscription is None:
+            return raise_value_error(f"{self.classname}: not subscribed to {channel_name}")
+        return self.clients[subscription.connection]
+
+    async def connect(self) -> bool:
+        """Connect every connection.
+
+        Returns:
+            bool: True if all connections are open.
+        """
+        results = await asyncio.gather(*(client.connect() for client in self.clients))
+        if self.rebalance_interval and self._rebalance_task is None:
+            self._rebalance_task = asyncio.create_task(self._rebalance_loop())
+        return all(results)
+
+    async def close(self) -> None:
+        if self._rebalance_task is not None:
+            self._rebalance_task.cancel()
+            self._rebalance_task = None
+        await asyncio.gather(*(client.close() for client in self.clients))
+
+    async def subscribe(
+        self,
+        channel: ParadexWebsocketChannel,
+        callback: Callable,
+        params: dict | None = None,
+        model: type | None = None,
+        conflate: bool = False,
+    ) -> int:
+        """Subscribe on the connection the channel's market is placed on.
+
+        Arguments are those of `ParadexWebsocketClient.subscribe`.
+
+        Returns:
+            int: Index of the connection.
+        """
+        params = params or {}
+        channel_name = format_channel_name(channel, params)
+        key = shard_key(channel_name, params)
+        async with self._lock:
+            connection = self.shard_for(key)
+            await self.clients[connection].subscribe(channel, callback, params=params, model=model, conflate=conflate)
+            self.subscriptions[channel_name] = PoolSubscription(
+                channel=channel,
+                params=params,
+                callback=callback,
+                model=model,
+                conflate=conflate,
+                shard_key=key,
+                connection=connection,
+            )
+        return connection
+
+    async def unsubscribe_by_name(self, channel_name: str) -> None:
+        async with self._lock:
+            subscription = self.subscriptions.pop(channel_name, None)
+            if subscription is not None:
+                self._last_frames.pop(channel_name, None)
+                await self.clients[subscription.connection].unsubscribe_by_name(channel_name)
+
+    def get_subscriptions(self) -> dict[str, bool]:
+        """Subscription status of every channel, across connections."""
+        subscriptions: dict[str, bool] = {}
+        for client in self.clients:
+            subscriptions.update(client.get_subscriptions())
+        return subscriptions
+
+    def get_stats(self) -> dict:
+        """Hot-path counters summed over connections.
+
+        Returns:
+            dict: The totals and per-channel counters of `ParadexWebsocketClient.get_stats()`,
+                plus `connections`: per connection `channels`, `frames_received` and `connected`.
+        """
+        totals: dict[str, Any] = {
+            "frames_received": 0,
+            "bytes_received": 0,
+            "decode_time": 0.0,
+            "callback_time": 0.0,
+            "channels": {},
+            "connections": [],
+        }
+        for client in self.clients:
+            stats = client.get_stats()
+            for name in ("frames_received", "bytes_received", "decode_time", "callback_time"):
+                totals[name] += stats[name]
+            for channel_name, counters in stats["channels"].items():
+                merged = totals["channels"].setdefault(channel_name, dict.fromkeys(counters, 0))
+                for name, value in counters.items():
+                    merged[name] += value
+            totals["connections"].append(
+                {
+                    "channels": len(client.callbacks),
+                    "frames_received": stats["frames_received"],
+                    "connected": client._is_connection_open(),
+                }
+            )
+        return totals
+
+    def get_reconnect_stats(self) -> list[dict]:
+        """`ParadexWebsocketClient.get_reconnect_stats()` of each connection."""
+        return [client.get_reconnect_stats() for client in self.clients]
+
+    def reset_stats(self) -> None:
+        for client in self.clients:
+            client.reset_stats()
+        self._last_frames.clear()
+        self._last_check = time.perf_counter()
+
+    def _channel_frames(self, channel_name: str, connection: int) -> int:
+        stats = self.clients[connection].stats
+        counters = stats.channels.get(channel_name) if stats is not None else None
+        return counters.frames if counters is not None else 0
+
+    def _key_rates(self) -> dict[str, float]:
+        """Messages per second of each shard key since the previous call."""
+        now = time.perf_counter()
+        elapsed = max(now - self._last_check, 1e-9)
+        self._last_check = now
+        rates: dict[str, float] = defaultdict(float)
+        for channel_name, subscription in self.subscriptions.items():
+            frames = self._channel_frames(channel_name, subscription.connection)
+            rates[subscription.shard_key] += max(frames - self._last_frames.get(channel_name, 0), 0) / elapsed
+            self._last_frames[channel_name] = frames
+        return rates
+
+    async def rebalance(self) -> list[tuple[str, int, int]]:
+        """Move markets off connections receiving far more messages than the others.
+
+        Rates are measured since the previous call (or `reset_stats()`).
+        The busiest market of the busiest connection that still narrows the
+        gap to the quietest connection is moved, until the busiest
+        connection is within `rebalance_ratio` of the others' average.
+
+        Returns:
+            list: `(shard key, from connection, to connection)` of each move.
+        """
+        moves: list[tuple[str, int, int]] = []
+        async with self._lock:
+            key_rates = self._key_rates()
+            count = len(self.clients)
+            if count < 2:
+                return moves
+            load = [0.0] * count
+            for key, rate in key_rates.items():
+                load[self.placement[key]] += rate
+
+            while True:
+                busiest = max(range(count), key=load.__getitem__)
+                quietest = min(range(count), key=load.__getitem__)
+                others = (sum(load) - load[busiest]) / (count - 1)
+                if load[busiest] <= self.rebalance_ratio * others:
+                    break
+                # Moving a key slower than the gap strictly evens the load, so this terminates
+                gap = load[busiest] - load[quietest]
+                candidates = [
+                    (rate, key)
+                    for key, rate in key_rates.items()
+                    if self.placement[key] == busiest and key not in self.groups and 0 < rate < gap
+                ]
+                if not candidates:
+                    break
+                rate, key = max(candidates)
+                await self._move(key, quietest)
+                load[busiest] -= rate
+                load[quietest] += rate
+                moves.append((key, busiest, quietest))
+        return moves
+
+    async def _move(self, key: str, connection: int) -> None:
+        source = self.placement[key]
+        self.placement[key] = connection
+        for channel_name, subscription in self.subscriptions.items():
+            if subscription.shard_key != key:
+                continue
+            await self.clients[source].unsubscribe_by_name(channel_name)
+            await self.clients[connection].subscribe(
+                subscription.channel,
+                subscription.callback,
+                params=subscription.params,
+                model=subscription.model,
+                conflate=subscription.conflate,
+            )
+            subscription.connection = connection
+            self._last_frames[channel_name] = self._channel_frames(channel_name, connection)
+        self.moves += 1
+        self.logger.info(f"{self.classname}: Moved {key} from connection {source} to {connection}")
+
+    async def _rebalance_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.rebalance_interval or 0)
+            try:
+                await self.rebalance()
+            except Exception:
+                self.logger.exception(f"{self.classname}: Rebalance failed")
@@ -0,0 +1,225 @@
+"""
+Multi-process fan-out of WebSocket market data.
+
+Decoding frames and running strategy code for many markets on one event
+loop is limited to one core. `SharedMarketDataProcess` moves the
+WebSocket connection(s) to a dedicated process that decodes BBO or order
+book snapshot frames and publishes the levels into a `SharedBookTable`;
+worker processes attach to the table by name and read the latest state of
+any market from shared memory, without pickling or pipes.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from multiprocessing.synchronize import Event
+from typing import Any
+
+from paradex_py.api.ws_client import ParadexWebsocketChannel, ParadexWebsocketClient
+from paradex_py.api.ws_pool import ParadexWebsocketPool
+from paradex_py.common.fixed_point import to_fixed
+from paradex_py.common.shared_book import SharedBookTable
+from paradex_py.environment import Environment
+
+
+class SharedBookPublisher:
+    """Write WebSocket BBO or order book snapshot updates into a `SharedBookTable`.
+
+    Tables with `depth == 1` are fed from the BBO channel, deeper tables
+    from ORDER_BOOK snapshots (at most 15 levels).
+
+    Args:
+        table: Table created by this process
+        logger: Optional logger
+
+    Examples:
+        >>> publisher = SharedBookPublisher(table)
+        >>> await publisher.subscribe(paradex.ws_client)
+    """
+
+    def __init__(self, table: SharedBookTable, logger: logging.Logger | None = None):
+        self.table = table
+        self.logger = logger or logging.getLogger(__name__)
+        self.updates = 0
+        self.errors = 0
+
+    async def subscribe(
+        self, ws_client: ParadexWebsocketClient | ParadexWebsocketPool, refresh_rate: str = "100ms"
+    ) -> None:
+        """Subscribe `ws_client` to every market of the table."""
+        for market in self.table.markets:
+            if self.table.depth == 1:
+                await ws_client.subscribe(ParadexWebsocketChannel.BBO, self.on_bbo, params={"market": market})
+            else:
+                await ws_client.subscribe(
+                    ParadexWebsocketChannel.ORDER_BOOK,
+                    self.on_order_book,
+                    params={"market": market, "refresh_rate": refresh_rate},
+                )
+
+    async def on_bbo(self, ws_channel: ParadexWebsocketChannel, message: dict) -> None:
+        data = message["params"]["data"]
+        decimals = self.table.decimals
+        try:
+            bids = [(to_fixed(data["bid"], decimals), to_fixed(data["bid_size"], decimals))] if data.get("bid") else []
+            asks = [(to_fixed(data["ask"], decimals), to_fixed(data["ask_size"], decimals))] if data.get("ask") else []
+            self.table.write(data["market"], bids, asks, data.get("seq_no") or 0, data.get("last_updated_at") or 0)
+        except (KeyError, ValueError):
+            self.errors += 1
+            self.logger.exception(f"SharedBookPublisher: invalid BBO update {data}")
+            return
+        self.updates += 1
+
+    async def on_order_book(self, ws_channel: ParadexWebsocketChannel, message: dict) -> None:
+        data = message["params"]["data"]
+        decimals = self.table.decimals
+        try:
+            bids: list[tuple[int, int]] = []
+            asks: list[tuple[int, int]] = []
+            for level in data.get("inserts") or []:
+                price, size = to_fixed(level["price"], decimals), to_fixed(level["size"], decimals)
+                (bids if level["side"] == "BUY" else asks).append((price, size))
+            bids.sort(reverse=True)
+            asks.sort()
+            self.table.write(data["market"], bids, asks, data.get("seq_no") or 0, data.get("last_updated_at") or 0)
+        except (KeyError, ValueError):
+            self.errors += 1
+            self.logger.exception(f"SharedBookPublisher: invalid order book update for {data.get('market')}")
+            return
+        self.updates += 1
+
+
+async def _publish(
+    table: SharedBookTable,
+    env: Environment,
+    refresh_rate: str,
+    connections: int,
+    ws_kwargs: dict[str, Any],
+    stop: Event,
+) -> None:
+    ws_client: ParadexWebsocketClient | ParadexWebsocketPool
+    if connections > 1:
+        ws_client = ParadexWebsocketPool(env=env, connections=connections, **ws_kwargs)
+    else:
+        ws_client = ParadexWebsocketClient(env=env, **ws_kwargs)
+    try:
+        await ws_client.connect()
+        await SharedBookPublisher(table).subscribe(ws_client, refresh_rate)
+        while not stop.is_set():
+            await asyncio.sleep(0.1)
+    finally:
+        await ws_client.close()
+
+
+def run_publisher(
+    table_name: str,
+    env: Environment,
+    refresh_rate: str,
+    connections: int,
+    ws_kwargs: dict[str, Any],
+    stop: Event,
+) -> None:
+    """Entry point of the reader process: publish into `table_name` until `stop` is set."""
+    table = SharedBookTable.attach(table_name)
+    try:
+        asyncio.run(_publish(table, env, refresh_rate, connections, ws_kwargs, stop))
+    finally:
+        table.close()
+
+
+class SharedMarketDataProcess:
+    """Dedicated WebSocket reader process publishing market data to shared memory.
+
+    The table is created (and finally unlinked) by this object; the reader
+    process and any number of workers attach to it by `name`.
+
+    Args:
+        env (Environment): Environment
+        markets (list[str]): Markets to publish
+        depth (int, optional): Levels per side; 1 uses the BBO channel, more use ORDER_BOOK
+            snapshots. Defaults to 1.
+        decimals (int, optional): Fractional digits of the published prices and sizes. Defaults to 8.
+        refresh_rate (str, optional): ORDER_BOOK refresh rate. Defaults to "100ms".
+        connections (int, optional): WebSocket connections of the reader process; more than one uses
+            `ParadexWebsocketPool`. Defaults to 1.
+        ws_kwargs (Optional[dict], optional): Extra `ParadexWebsocketClient` arguments. They are sent to a
+            spawned process, so they must be picklable. Defaults to None.
+        logger (logging.Logger, optional): Logger. Defaults to None.
+
+    Examples:
+        >>> with SharedMarketDataProcess(env=PROD, markets=["BTC-USD-PERP", "ETH-USD-PERP"]) as feed:
+        ...     workers = [multiprocessing.Process(target=strategy, args=(feed.name,)) for _ in range(4)]
+        >>> def strategy(table_name):
+        ...     table = SharedBookTable.attach(table_name)
+        ...     bid, bid_size, ask, ask_size = table.bbo("BTC-USD-PERP")
+    """
+
+    def __init__(
+        self,
+        env: Environment,
+        markets: list[str],
+        depth: int = 1,
+        decimals: int = 8,
+        refresh_rate: str = "100ms",
+        connections: int = 1,
+        ws_kwargs: dict[str, Any] | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        self.env = env
+        self.logger = logger or logging.getLogger(__name__)
+        self.refresh_rate = refresh_rate
+        self.connections = connections
+        self.ws_kwargs = ws_kwargs or {}
+        self.table = SharedBookTable.create(markets, depth=depth, decimals=decimals)
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = self._context.Event()
+        self._process: Any = None
+
+    @property
+    def name(self) -> str:
+        """Shared memory name workers pass to `SharedBookTable.attach()`."""
+        return self.table.name
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Start the reader process."""
+        if self.is_alive():
+            return
+        self._stop.clear()
+        self._process = self._context.Process(
+            target=run_publisher,
+            args=(self.table.name, self.env, self.refresh_rate, self.connections, self.ws_kwargs, self._stop),
+            name="paradex-market-data",
+            daemon=True,
+        )
+        self._process.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask the reader process to close its connections and exit."""
+        if self._process is None:
+            return
+        self._stop.set()
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._process = None
+        # A killed (or crashed) writer can leave a slot mid-write, which readers would wait on
+        repaired = self.table.repair()
+        if repaired:
+            self.logger.warning("SharedMarketDataProcess: cleared half-written books of %s", repaired)
+
+    def close(self) -> None:
+        """Stop the reader process and free the table."""
+        self.stop()
+        self.table.close()
+        self.table.unlink()
+
+    def __enter__(self) -> "SharedMarketDataProcess":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,97 @@
+"""
+Lightweight counters for the WebSocket message hot path.
+
+Collection is opt-in (`ParadexWebsocketClient(collect_stats=True)`); when it
+is off the client never touches these objects, so monitoring costs nothing
+unless it is requested.
+"""
+
+from dataclasses import asdict, dataclass, field
+
+
+@dataclass
+class ChannelStats:
+    """Counters for a single WebSocket channel."""
+
+    frames: int = 0
+    bytes: int = 0
+    decode_time: float = 0.0
+    callback_time: float = 0.0
+    callback_errors: int = 0
+
+
+@dataclass
+class WsStats:
+    """Aggregated counters for a WebSocket client.
+
+    Times are cumulative seconds measured with `time.perf_counter()`;
+    sizes are frame lengths (characters for text frames).
+    Frames that are not subscription notifications (RPC responses,
+    errors) are counted in the totals only.
+    """
+
+    frames_received: int = 0
+    bytes_received: int = 0
+    decode_time: float = 0.0
+    callback_time: float = 0.0
+    channels: dict[str, ChannelStats] = field(default_factory=dict)
+
+    def channel(self, channel_name: str) -> ChannelStats:
+        stats = self.channels.get(channel_name)
+        if stats is None:
+            stats = self.channels[channel_name] = ChannelStats()
+        return stats
+
+    def record_frame(self, channel_name: str | None, size: int, decode_seconds: float = 0.0) -> None:
+        """Count a received frame and the time spent decoding it."""
+        self.frames_received += 1
+        self.bytes_received += size
+        self.decode_time += decode_seconds
+        if channel_name is not None:
+            stats = self.channel(channel_name)
+            stats.frames += 1
+            stats.bytes += size
+            stats.decode_time += decode_seconds
+
+    def record_callback(self, channel_name: str, seconds: float, failed: bool = False) -> None:
+        self.callback_time += seconds
+        stats = self.channel(channel_name)
+        stats.callback_time += seconds
+        if failed:
+            stats.callback_errors += 1
+
+    def snapshot(self) -> dict:
+        """Return a plain-dict copy of the counters."""
+        return asdict(self)
+
+    def reset(self) -> None:
+        self.frames_received = 0
+        self.bytes_received = 0
+        self.decode_time = 0.0
+        self.callback_time = 0.0
+        self.channels.clear()
+
+
+@dataclass
+class ReconnectStats:
+    """Reconnections of a WebSocket client.
+
+    Times are seconds from the moment the connection was found dead:
+    `last_connect_time` until the new socket was open, and
+    `last_resubscribe_time` until every channel was acknowledged again.
+    """
+
+    reconnects: int = 0
+    failed_attempts: int = 0
+    subscribe_errors: int = 0
+    last_resubscribed_channels: int = 0
+    last_connect_time: float | None = None
+    last_resubscribe_time: float | None = None
+    max_resubscribe_time: float = 0.0
+
+    def record_resubscribed(self, seconds: float) -> None:
+        self.last_resubscribe_time = seconds
+        self.max_resubscribe_time = max(self.max_resubscribe_time, seconds)
+
+    def snapshot(self) -> dict:
+        return asdict(self)
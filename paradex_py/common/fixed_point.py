@@ -0,0 +1,67 @@
+"""
+Scaled-integer helpers for prices and sizes.
+
+Paradex transmits prices and sizes as decimal strings. Converting them to
+`Decimal` on every update is comparatively slow, so latency-sensitive code
+(e.g. the local order book) stores them as integers scaled by
+`10 ** decimals` and converts back only at the edges.
+"""
+
+from decimal import Decimal
+
+from paradex_py.utils import raise_value_error
+
+
+def decimals_of(increment: str | Decimal) -> int:
+    """Number of fractional digits of a tick size or size increment.
+
+    Examples:
+        >>> decimals_of("0.01")
+        2
+        >>> decimals_of("1")
+        0
+    """
+    exponent = Decimal(increment).normalize().as_tuple().exponent
+    return max(-int(exponent), 0)
+
+
+def to_fixed(value: str | Decimal | int, decimals: int) -> int:
+    """Convert a decimal value to an integer scaled by `10 ** decimals`.
+
+    Args:
+        value: Decimal string (as sent by the API), Decimal or int
+        decimals: Number of fractional digits kept
+
+    Returns:
+        Scaled integer
+
+    Raises:
+        ValueError: If `value` has more significant fractional digits than `decimals`
+
+    Examples:
+        >>> to_fixed("65000.25", 2)
+        6500025
+    """
+    if isinstance(value, str) and "e" not in value and "E" not in value:
+        whole, _, frac = value.partition(".")
+        if len(frac) > decimals:
+            if frac[decimals:].strip("0"):
+                raise_value_error(f"{value} has more than {decimals} decimals")
+            frac = frac[:decimals]
+        return int((whole or "0") + frac.ljust(decimals, "0"))
+    if isinstance(value, int):
+        return value * 10**decimals
+    scaled = Decimal(value).scaleb(decimals)
+    if scaled != scaled.to_integral_value():
+        raise_value_error(f"{value} has more than {decimals} decimals")
+    return int(scaled)
+
+
+def from_fixed(units: int, decimals: int) -> Decimal:
+    """Convert a scaled integer back to a Decimal.
+
+    Examples:
+        >>> from_fixed(6500025, 2)
+        Decimal('65000.25')
+    """
+    return Decimal(units).scaleb(-decimals)
@@ -0,0 +1,278 @@
+"""
+Latency breakdown of order operations.
+
+An operation (`submit_order`, `cancel_order`, ...) is timed as a whole and
+split into stages. Code on the request path marks its stages with
+`timed_stage()`; the durations are collected in the `LatencySpans` of the
+operation that is currently running (tracked per thread / asyncio task in
+a context variable) and recorded into one `LatencyHistogram` per operation
+and stage when the operation ends. Outside of an operation `timed_stage()`
+only costs a context variable lookup.
+"""
+
+import math
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+# Stages
+PAYLOAD = "payload"  # building the order payload
+HASH = "hash"  # typed-data message hash
+SIGN = "sign"  # ECDSA signature; hash and signature together for custom signers and executors
+AUTH = "auth"  # JWT validation, including a refresh round trip
+ENCODE = "encode"  # JSON encoding of the request body
+SEND = "send"  # connection checkout / setup and writing the request
+SERVER = "server"  # waiting for the response headers
+DECODE = "decode"  # reading and decoding the response body
+TOTAL = "total"  # the whole operation, including retries, rate limiting and hooks
+
+STAGES = (PAYLOAD, HASH, SIGN, AUTH, ENCODE, SEND, SERVER, DECODE, TOTAL)
+
+# Values below 2**SUB_BUCKET_BITS ns are counted exactly, larger ones in
+# buckets of 1/64 of their power of two (less than 1.6% relative error).
+SUB_BUCKET_BITS = 7
+_HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+
+def _bucket_index(value: int) -> int:
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    if shift <= 0:
+        return value
+    return _HALF * shift + (value >> shift)
+
+
+def _bucket_upper(index: int) -> int:
+    """Largest value counted in bucket `index`."""
+    if index < 2 * _HALF:
+        return index
+    shift = index // _HALF - 1
+    return ((index - _HALF * shift + 1) << shift) - 1
+
+
+@dataclass
+class LatencySummary:
+    """Distribution of one stage, in milliseconds."""
+
+    count: int = 0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p90_ms: float = 0.0
+    p99_ms: float = 0.0
+    p999_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of durations in nanoseconds.
+
+    Recording is O(1) and memory grows with the logarithm of the largest
+    value, not with the number of samples. Percentiles are reported as the
+    upper bound of their bucket.
+
+    Examples:
+        >>> histogram = LatencyHistogram()
+        >>> histogram.record(1_500_000)
+        >>> histogram.percentile(99) / 1e6
+    """
+
+    __slots__ = ("count", "counts", "max", "min", "total")
+
+    def __init__(self) -> None:
+        self.counts: list[int] = []
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value_ns: int) -> None:
+        value_ns = max(value_ns, 0)
+        index = _bucket_index(value_ns)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        if not self.count or value_ns < self.min:
+            self.min = value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+        self.count += 1
+        self.total += value_ns
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the samples of `other` to this histogram."""
+        if not other.count:
+            return
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.min = min(self.min, other.min) if self.count else other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, percentile: float) -> int:
+        """Value in nanoseconds at or below which `percentile` percent of the samples fall."""
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(max(_bucket_upper(index), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> LatencySummary:
+        return LatencySummary(
+            count=self.count,
+            mean_ms=self.mean / 1e6,
+            p50_ms=self.percentile(50) / 1e6,
+            p90_ms=self.percentile(90) / 1e6,
+            p99_ms=self.percentile(99) / 1e6,
+            p999_ms=self.percentile(99.9) / 1e6,
+            max_ms=self.max / 1e6,
+        )
+
+
+class LatencySpans:
+    """Stage durations (nanoseconds) of one running operation."""
+
+    __slots__ = ("durations", "operation")
+
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+        self.durations: dict[str, int] = {}
+
+    def add(self, stage: str, duration_ns: int) -> None:
+        """Add to `stage`; a stage entered more than once (retries, batches) accumulates."""
+        self.durations[stage] = self.durations.get(stage, 0) + duration_ns
+
+    def to_ms(self) -> dict[str, float]:
+        return {stage: duration / 1e6 for stage, duration in self.durations.items()}
+
+
+_current_spans: ContextVar[LatencySpans | None] = ContextVar("paradex_latency_spans", default=None)
+
+
+def current_spans() -> LatencySpans | None:
+    """Spans of the operation running in this context, if latency is being recorded."""
+    return _current_spans.get()
+
+
+class _StageTimer:
+    __slots__ = ("spans", "stage", "start_ns", "token")
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+
+    def __enter__(self) -> None:
+        spans = self.spans = _current_spans.get()
+        if spans is not None:
+            # Work nested in a stage (e.g. the auth round trip) is not split further
+            self.token = _current_spans.set(None)
+            self.start_ns = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        spans = self.spans
+        if spans is not None:
+            spans.add(self.stage, time.perf_counter_ns() - self.start_ns)
+            _current_spans.reset(self.token)
+
+
+def timed_stage(stage: str) -> _StageTimer:
+    """Context manager adding the time spent in its block to `stage` of the current operation.
+
+    Examples:
+        >>> with timed_stage(SIGN):
+        ...     signature = sign(order)
+    """
+    return _StageTimer(stage)
+
+
+class _OperationTimer:
+    __slots__ = ("on_latency", "recorder", "spans", "start_ns", "token")
+
+    def __init__(
+        self, recorder: "LatencyRecorder", operation: str, on_latency: Callable[[str, dict[str, float]], None] | None
+    ) -> None:
+        self.recorder = recorder
+        self.spans = LatencySpans(operation)
+        self.on_latency = on_latency
+
+    def __enter__(self) -> LatencySpans:
+        self.token = _current_spans.set(self.spans)
+        self.start_ns = time.perf_counter_ns()
+        return self.spans
+
+    def __exit__(self, *exc_info: Any) -> None:
+        spans = self.spans
+        spans.durations[TOTAL] = time.perf_counter_ns() - self.start_ns
+        _current_spans.reset(self.token)
+        self.recorder.record(spans.operation, spans.durations)
+        if self.on_latency is not None:
+            self.on_latency(spans.operation, spans.to_ms())
+
+
+class LatencyRecorder:
+    """Histograms of operation latency, per operation and stage.
+
+    Operations are recorded whether they succeed or raise.
+
+    Examples:
+        >>> recorder = LatencyRecorder()
+        >>> with recorder.operation("submit_order"):
+        ...     with timed_stage(SIGN):
+        ...         ...
+        >>> recorder.summary()["submit_order"]["sign"].p99_ms
+    """
+
+    def __init__(self) -> None:
+        self.histograms: dict[str, dict[str, LatencyHistogram]] = {}
+        self._last: dict[str, dict[str, int]] = {}
+
+    def operation(
+        self, operation: str, on_latency: Callable[[str, dict[str, float]], None] | None = None
+    ) -> _OperationTimer:
+        """Context manager timing `operation`; `on_latency` receives its stages in milliseconds."""
+        return _OperationTimer(self, operation, on_latency)
+
+    def record(self, operation: str, durations: dict[str, int]) -> None:
+        histograms = self.histograms.get(operation)
+        if histograms is None:
+            histograms = self.histograms[operation] = {}
+        for stage, duration in durations.items():
+            histogram = histograms.get(stage)
+            if histogram is None:
+                histogram = histograms[stage] = LatencyHistogram()
+            histogram.record(duration)
+        self._last[operation] = durations
+
+    def histogram(self, operation: str, stage: str = TOTAL) -> LatencyHistogram | None:
+        return self.histograms.get(operation, {}).get(stage)
+
+    def last(self, operation: str) -> dict[str, float] | None:
+        """Stages of the most recent `operation`, in milliseconds."""
+        durations = self._last.get(operation)
+        return None if durations is None else {stage: duration / 1e6 for stage, duration in durations.items()}
+
+    def summary(self) -> dict[str, dict[str, LatencySummary]]:
+        """Distribution of every recorded operation and stage, stages in `STAGES` order."""
+        order = {stage: i for i, stage in enumerate(STAGES)}
+        return {
+            operation: {
+                stage: histograms[stage].summary()
+                for stage in sorted(histograms, key=lambda stage: order.get(stage, len(order)))
+            }
+            for operation, histograms in self.histograms.items()
+        }
+
+    def reset(self) -> None:
+        self.histograms = {}
+        self._last = {}
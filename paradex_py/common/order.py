@@ -2,10 +2,15 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any
 
-from paradex_py.utils import time_now_milli_secs
+from paradex_py.common.fixed_point import to_fixed
+from paradex_py.utils import raise_value_error, time_now_milli_secs
 
 decimal_zero = Decimal(0)
 
+# Prices and sizes are signed as quantums with 8 decimals
+QUANTUM_DECIMALS = 8
+_QUANTUM = 10**QUANTUM_DECIMALS
+
 
 class OrderAction(Enum):
     NAN = "NAN"
@@ -113,7 +118,7 @@ class Order:
         order_dict: dict[Any, Any] = {
             "market": self.market,
             "side": self.order_side.value,
-            "size": str(self.size),
+            "size": self._size_str(),
             "type": self.order_type.value,
             "client_id": self.client_id,
             "instruction": self.instruction,
@@ -123,9 +128,10 @@ class Order:
             "stp": self.stp,
         }
         if self.is_limit_type():
-            order_dict["price"] = str(self.limit_price)
-        if self.trigger_price:
-            order_dict["trigger_price"] = str(self.trigger_price)
+            order_dict["price"] = self._price_str()
+        trigger_price = self._trigger_price_str()
+        if trigger_price:
+            order_dict["trigger_price"] = trigger_price
         if self.reduce_only:
             order_dict["flags"] = ["REDUCE_ONLY"]
 
@@ -134,13 +140,30 @@ class Order:
             order_dict["id"] = self.id
         return order_dict
 
-    def chain_price(self) -> str:
+    def _size_str(self) -> str:
+        return str(self.size)
+
+    def _price_str(self) -> str:
+        return str(self.limit_price)
+
+    def _trigger_price_str(self) -> str | None:
+        return str(self.trigger_price) if self.trigger_price else None
+
+    def price_quantums(self) -> int:
+        """Limit price in quantums (8 decimals) as signed; 0 for market orders."""
         if self.order_type == OrderType.Market:
-            return "0"
-        return str(int(self.limit_price.scaleb(8)))
+            return 0
+        return int(self.limit_price.scaleb(QUANTUM_DECIMALS))
+
+    def size_quantums(self) -> int:
+        """Size in quantums (8 decimals) as signed."""
+        return int(self.size.scaleb(QUANTUM_DECIMALS))
+
+    def chain_price(self) -> str:
+        return str(self.price_quantums())
 
     def chain_size(self) -> str:
-        return str(int(self.size.scaleb(8)))
+        return str(self.size_quantums())
 
     def is_limit_type(self) -> bool:
         return self.order_type in [
@@ -149,3 +172,164 @@ class Order:
             OrderType.TakeProfitLimit,
             OrderType.StopLossLimit,
         ]
+
+
+def to_quantums(value: Decimal | str | int | float) -> int:
+    """Convert a price or size to quantums (8 decimals) exactly.
+
+    Floats are converted through their shortest repr, so `0.1` becomes
+    10000000 rather than the binary approximation.
+
+    Raises:
+        ValueError: If `value` has more than 8 significant decimals
+    """
+    if isinstance(value, float):
+        value = repr(value)
+    return to_fixed(value, QUANTUM_DECIMALS)
+
+
+def format_quantums(quantums: int) -> str:
+    """Decimal string of a quantum amount without trailing zeros.
+
+    Examples:
+        >>> format_quantums(6500010000000)
+        '65000.1'
+    """
+    whole, frac = divmod(abs(quantums), _QUANTUM)
+    sign = "-" if quantums < 0 else ""
+    if not frac:
+        return f"{sign}{whole}"
+    return f"{sign}{whole}.{frac:08d}".rstrip("0")
+
+
+def round_quantums(quantums: int, increment: int, up: bool = False) -> int:
+    """Round `quantums` to a multiple of `increment` (down, or up if `up`)."""
+    if increment <= 0:
+        raise_value_error("increment must be positive")
+    remainder = quantums % increment
+    if not remainder:
+        return quantums
+    return quantums - remainder + (increment if up else 0)
+
+
+class FixedPointOrder(Order):
+    """`Order` that keeps size, limit price and trigger price as 8-decimal quantums.
+
+    Values are converted once, at construction (or assignment), from
+    `Decimal`, `str`, `int` or `float`. Signing and `dump_to_dict` then
+    work on the integers directly instead of repeating `Decimal` scaling
+    for every signature and payload. `size`, `limit_price` and
+    `trigger_price` still read as `Decimal` for compatibility.
+
+    Examples:
+        >>> order = FixedPointOrder("BTC-USD-PERP", OrderType.Limit, OrderSide.Buy, size="0.0123", limit_price=65000.17)
+        >>> order.round_to_market({"price_tick_size": "0.1", "order_size_increment": "0.001"})
+        >>> order.chain_price(), order.dump_to_dict()["size"]
+        ('6500010000000', '0.012')
+    """
+
+    _size_q: int
+    _size_s: str
+    _price_q: int
+    _price_s: str
+    _trigger_q: int | None
+    _trigger_s: str | None
+
+    def __init__(
+        self,
+        market: str,
+        order_type: OrderType,
+        order_side: OrderSide,
+        size: Decimal | str | int | float,
+        limit_price: Decimal | str | int | float = 0,
+        client_id: str = "",
+        signature_timestamp: int | None = None,
+        instruction: str = "GTC",
+        reduce_only: bool = False,
+        recv_window: int | None = None,
+        stp: str | None = None,
+        trigger_price: Decimal | str | int | float | None = None,
+        order_id: str | None = None,
+    ) -> None:
+        super().__init__(
+            market=market,
+            order_type=order_type,
+            order_side=order_side,
+            size=size,  # type: ignore[arg-type]
+            limit_price=limit_price,  # type: ignore[arg-type]
+            client_id=client_id,
+            signature_timestamp=signature_timestamp,
+            instruction=instruction,
+            reduce_only=reduce_only,
+            recv_window=recv_window,
+            stp=stp,
+            trigger_price=trigger_price,  # type: ignore[arg-type]
+            order_id=order_id,
+        )
+        self.remaining = self.size
+
+    # Payload strings are formatted together with the quantums, once per value
+    def _set_size_q(self, quantums: int) -> None:
+        self._size_q, self._size_s = quantums, format_quantums(quantums)
+
+    def _set_price_q(self, quantums: int) -> None:
+        self._price_q, self._price_s = quantums, format_quantums(quantums)
+
+    def _set_trigger_q(self, quantums: int | None) -> None:
+        self._trigger_q = quantums
+        self._trigger_s = format_quantums(quantums) if quantums else None
+
+    @property
+    def size(self) -> Decimal:
+        return Decimal(self._size_s)
+
+    @size.setter
+    def size(self, value: Decimal | str | int | float) -> None:
+        self._set_size_q(to_quantums(value))
+
+    @property
+    def limit_price(self) -> Decimal:
+        return Decimal(self._price_s)
+
+    @limit_price.setter
+    def limit_price(self, value: Decimal | str | int | float) -> None:
+        self._set_price_q(to_quantums(value))
+
+    @property
+    def trigger_price(self) -> Decimal | None:
+        return Decimal(format_quantums(self._trigger_q)) if self._trigger_q is not None else None
+
+    @trigger_price.setter
+    def trigger_price(self, value: Decimal | str | int | float | None) -> None:
+        self._set_trigger_q(to_quantums(value) if value is not None else None)
+
+    def round_to_market(self, market: dict) -> "FixedPointOrder":
+        """Round to the tick size and size increment of a `fetch_markets` result entry.
+
+        Prices are rounded away from the other side of the book (buy down,
+        sell up) and sizes down, so rounding never makes an order more
+        aggressive or larger.
+        """
+        tick = to_quantums(market["price_tick_size"])
+        up = self.order_side == OrderSide.Sell
+        self._set_size_q(round_quantums(self._size_q, to_quantums(market["order_size_increment"])))
+        self._set_price_q(round_quantums(self._price_q, tick, up=up))
+        if self._trigger_q is not None:
+            self._set_trigger_q(round_quantums(self._trigger_q, tick, up=up))
+        self.remaining = self.size
+        return self
+
+    def _size_str(self) -> str:
+        return self._size_s
+
+    def _price_str(self) -> str:
+        return self._price_s
+
+    def _trigger_price_str(self) -> str | None:
+        return self._trigger_s
+
+    def price_quantums(self) -> int:
+        return 0 if self.order_type == OrderType.Market else self._price_q
+
+    def size_quantums(self) -> int:
+        return self._size_q
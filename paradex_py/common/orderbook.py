@@ -0,0 +1,364 @@
+"""
+Local L2 order book maintained from REST snapshots and WebSocket updates.
+
+Prices and sizes are stored as scaled integers (see `fixed_point`) in
+sorted parallel arrays, one pair per side, ordered so that the best level
+is at the end of the array: updates near the top of the book are cheap and
+best bid/ask are O(1). Sizes and notionals are summed in Fenwick trees, so
+size changes and depth/VWAP queries are O(log n); adding or removing a
+level shifts the arrays and rebuilds the trees in O(n) (see `BookSide`).
+"""
+
+import bisect
+import logging
+from collections import deque
+from decimal import Decimal
+from typing import Any
+
+from paradex_py.common.fixed_point import from_fixed, to_fixed
+from paradex_py.common.order import OrderSide
+
+
+class BookSide:
+    """One side of the book keyed by integer price.
+
+    Bids are stored by price and asks by negated price, both ascending,
+    so the best level of either side is the last element.
+
+    Sizes and notionals are also kept in Fenwick (binary indexed) trees
+    over the level positions. Complexity for n levels:
+
+    - changing the size of an existing level: O(log n)
+    - inserting or removing a level: O(n) list shift, and the trees are
+      rebuilt in O(n) on the next depth query
+    - best level and `size_at`: O(1) and O(log n)
+    - `cumulative_size`, `depth_to_price`, `notional_for_size`: O(log n)
+
+    `scripts/bench_orderbook.py` measures updates and queries.
+    """
+
+    def __init__(self, side: OrderSide):
+        self.side = side
+        self._sign = 1 if side == OrderSide.Buy else -1
+        self._keys: list[int] = []
+        self._sizes: list[int] = []
+        # 1-based Fenwick trees over positions in `_keys`
+        self._tree_sizes: list[int] = [0]
+        self._tree_notionals: list[int] = [0]
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._sizes.clear()
+        self._dirty = True
+
+    def set(self, price: int, size: int) -> None:
+        """Set the size at a price level; a size of zero removes the level."""
+        key = price * self._sign
+        index = bisect.bisect_left(self._keys, key)
+        exists = index < len(self._keys) and self._keys[index] == key
+        if size > 0:
+            if exists:
+                delta = size - self._sizes[index]
+                self._sizes[index] = size
+                if not self._dirty and delta:
+                    self._tree_add(index, delta, delta * price)
+            else:
+                self._keys.insert(index, key)
+                self._sizes.insert(index, size)
+                self._dirty = True
+        elif exists:
+            del self._keys[index]
+            del self._sizes[index]
+            self._dirty = True
+
+    def best(self) -> tuple[int, int] | None:
+        """Best (price, size), or None if the side is empty."""
+        if not self._keys:
+            return None
+        return self._keys[-1] * self._sign, self._sizes[-1]
+
+    def size_at(self, price: int) -> int:
+        """Resting size at an exact price (0 if there is no level)."""
+        key = price * self._sign
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return self._sizes[index]
+        return 0
+
+    def levels(self, depth: int | None = None) -> list[tuple[int, int]]:
+        """(price, size) levels, best first."""
+        count = len(self._keys) if depth is None else min(depth, len(self._keys))
+        sign = self._sign
+        return [(self._keys[-1 - i] * sign, self._sizes[-1 - i]) for i in range(count)]
+
+    def _build_trees(self) -> None:
+        n = len(self._keys)
+        sign = self._sign
+        tree_sizes = [0, *self._sizes]
+        tree_notionals = [0] + [size * key * sign for key, size in zip(self._keys, self._sizes, strict=True)]
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree_sizes[parent] += tree_sizes[i]
+                tree_notionals[parent] += tree_notionals[i]
+        self._tree_sizes = tree_sizes
+        self._tree_notionals = tree_notionals
+        self._dirty = False
+
+    def _tree_add(self, index: int, size: int, notional: int) -> None:
+        tree_sizes, tree_notionals = self._tree_sizes, self._tree_notionals
+        n = len(tree_sizes) - 1
+        i = index + 1
+        while i <= n:
+            tree_sizes[i] += size
+            tree_notionals[i] += notional
+            i += i & -i
+
+    @staticmethod
+    def _prefix(tree: list[int], count: int) -> int:
+        """Sum of the first `count` positions (the `count` worst levels)."""
+        total = 0
+        while count > 0:
+            total += tree[count]
+            count -= count & -count
+        return total
+
+    def _suffix(self, tree: list[int], count: int) -> int:
+        """Sum over the best `count` levels."""
+        n = len(self._keys)
+        return self._prefix(tree, n) - self._prefix(tree, n - count)
+
+    def cumulative_size(self, levels: int) -> int:
+        """Total size of the best `levels` levels."""
+        if self._dirty:
+            self._build_trees()
+        if levels <= 0 or not self._keys:
+            return 0
+        return self._suffix(self._tree_sizes, min(levels, len(self._keys)))
+
+    def depth_to_price(self, price: int) -> int:
+        """Total size at prices equal to or better than `price`."""
+        if self._dirty:
+            self._build_trees()
+        # Levels better than or equal to price have keys >= price * sign
+        count = len(self._keys) - bisect.bisect_left(self._keys, price * self._sign)
+        return self._suffix(self._tree_sizes, count) if count else 0
+
+    def notional_for_size(self, size: int) -> int | None:
+        """Notional (price units x size units) to fill `size` walking from the best level.
+
+        Returns None if the side does not hold `size`.
+        """
+        if self._dirty:
+            self._build_trees()
+        if size <= 0:
+            return 0
+        n = len(self._keys)
+        tree_sizes = self._tree_sizes
+        total = self._prefix(tree_sizes, n)
+        if total < size:
+            return None
+        # Descend the tree to the last position `index` whose prefix stays within
+        # total - size: the best levels above it are filled entirely, `index` partially
+        remaining = total - size
+        index = 0
+        step = 1 << n.bit_length()
+        while step:
+            candidate = index + step
+            if candidate <= n and tree_sizes[candidate] <= remaining:
+                index = candidate
+                remaining -= tree_sizes[candidate]
+            step >>= 1
+        filled = self._suffix(tree_sizes, n - index - 1)
+        notional = self._suffix(self._tree_notionals, n - index - 1)
+        return notional + (size - filled) * self._keys[index] * self._sign
+
+
+class OrderBook:
+    """L2 order book for one market with sequence gap detection.
+
+    Seed the book from `fetch_orderbook()` with `load_snapshot()`, then feed
+    the `data` payload of every ORDER_BOOK WebSocket message to
+    `apply_update()`. A delta whose `seq_no` does not follow the book's marks
+    the book out of sync (`apply_update` returns False); deltas received
+    while out of sync are buffered and replayed on the next snapshot.
+
+    Query methods take and return scaled integers; use `price()`/`size()`
+    (or `to_price_units()`/`to_size_units()`) to convert at the edges.
+
+    Args:
+        market: Market symbol
+        price_decimals: Fractional digits kept for prices
+        size_decimals: Fractional digits kept for sizes
+        max_buffered_updates: Maximum deltas kept while waiting for a snapshot
+
+    Examples:
+        >>> book = OrderBook("BTC-USD-PERP", price_decimals=1, size_decimals=3)
+        >>> book.load_snapshot({"seq_no": 1, "bids": [["65000.1", "0.5"]], "asks": [["65000.2", "1"]]})
+        >>> book.best_bid()
+        (650001, 500)
+    """
+
+    def __init__(
+        self,
+        market: str,
+        price_decimals: int = 8,
+        size_decimals: int = 8,
+        max_buffered_updates: int = 1000,
+        logger: logging.Logger | None = None,
+    ):
+        self.market = market
+        self.price_decimals = price_decimals
+        self.size_decimals = size_decimals
+        self.logger = logger or logging.getLogger(__name__)
+        self.bids = BookSide(OrderSide.Buy)
+        self.asks = BookSide(OrderSide.Sell)
+        self.seq_no: int | None = None
+        self.last_updated_at: int | None = None
+        self.in_sync = False
+        self.gaps = 0
+        self._buffer: deque[dict[str, Any]] = deque(maxlen=max_buffered_updates)
+
+    # Conversions
+
+    def to_price_units(self, value: str | Decimal | int) -> int:
+        return to_fixed(value, self.price_decimals)
+
+    def to_size_units(self, value: str | Decimal | int) -> int:
+        return to_fixed(value, self.size_decimals)
+
+    def price(self, units: int) -> Decimal:
+        return from_fixed(units, self.price_decimals)
+
+    def size(self, units: int) -> Decimal:
+        return from_fixed(units, self.size_decimals)
+
+    # Updates
+
+    def clear(self) -> None:
+        self.bids.clear()
+        self.asks.clear()
+
+    def load_snapshot(self, snapshot: dict[str, Any]) -> None:
+        """Replace the book with a REST snapshot (`fetch_orderbook()` response).
+
+        Buffered deltas newer than the snapshot are replayed.
+        """
+        self.clear()
+        to_price, to_size = self.to_price_units, self.to_size_units
+        for price, size in snapshot.get("bids") or []:
+            self.bids.set(to_price(price), to_size(size))
+        for price, size in snapshot.get("asks") or []:
+            self.asks.set(to_price(price), to_size(size))
+        self.seq_no = snapshot.get("seq_no")
+        self.last_updated_at = snapshot.get("last_updated_at")
+        self.in_sync = True
+
+        buffered = list(self._buffer)
+        self._buffer.clear()
+        for index, data in enumerate(buffered):
+            if not self.apply_update(data):
+                # Gap inside the buffer: keep the rest for the next snapshot
+                self._buffer.extend(buffered[index + 1 :])
+                break
+
+    def apply_update(self, data: dict[str, Any]) -> bool:
+        """Apply the `data` payload of an ORDER_BOOK WebSocket message.
+
+        Snapshot payloads (`update_type` "s") replace the book. Deltas
+        (`update_type` "d") must follow the current `seq_no`.
+
+        Returns:
+            bool: False if a sequence gap was detected or the book is waiting
+                for a snapshot, True otherwise.
+        """
+        seq_no = data.get("seq_no")
+        if data.get("update_type") == "s":
+            self.clear()
+            self._apply_levels(data)
+            self.seq_no = seq_no
+            self.last_updated_at = data.get("last_updated_at")
+            self.in_sync = True
+            self._buffer.clear()
+            return True
+
+        if not self.in_sync:
+            self._buffer.append(data)
+            return False
+        if self.seq_no is not None and seq_no is not None:
+            if seq_no <= self.seq_no:
+                # Already covered by the snapshot
+                return True
+            if seq_no != self.seq_no + 1:
+                self.gaps += 1
+                self.in_sync = False
+                self._buffer.append(data)
+                self.logger.warning(
+                    "OrderBook %s: sequence gap, expected %s got %s", self.market, self.seq_no + 1, seq_no
+                )
+                return False
+
+        self._apply_levels(data)
+        self.seq_no = seq_no
+        self.last_updated_at = data.get("last_updated_at")
+        return True
+
+    def _apply_levels(self, data: dict[str, Any]) -> None:
+        to_price, to_size = self.to_price_units, self.to_size_units
+        bids, asks = self.bids, self.asks
+        for level in data.get("deletes") or []:
+            (bids if level["side"] == "BUY" else asks).set(to_price(level["price"]), 0)
+        for key in ("inserts", "updates"):
+            for level in data.get(key) or []:
+                (bids if level["side"] == "BUY" else asks).set(to_price(level["price"]), to_size(level["size"]))
+
+    # Queries
+
+    def best_bid(self) -> tuple[int, int] | None:
+        return self.bids.best()
+
+    def best_ask(self) -> tuple[int, int] | None:
+        return self.asks.best()
+
+    def spread(self) -> int | None:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def side(self, side: OrderSide) -> BookSide:
+        return self.bids if side == OrderSide.Buy else self.asks
+
+    def depth_at_price(self, side: OrderSide, price: int) -> int:
+        """Resting size at an exact price level."""
+        return self.side(side).size_at(price)
+
+    def cumulative_depth(self, side: OrderSide, price: int) -> int:
+        """Total size resting at prices equal to or better than `price`."""
+        return self.side(side).depth_to_price(price)
+
+    def vwap(self, side: OrderSide, size: int) -> Decimal | None:
+        """Average price to fill `size` units against a side of the book.
+
+        Use `OrderSide.Sell` (the asks) to price a buy and `OrderSide.Buy`
+        (the bids) to price a sell.
+
+        Returns:
+            Decimal | None: Average price, or None if the side is not deep enough.
+        """
+        if size <= 0:
+            return None
+        notional = self.side(side).notional_for_size(size)
+        if notional is None:
+            return None
+        return self.price(notional) / size
+
+    def __repr__(self) -> str:
+        return (
+            f"OrderBook({self.market}, seq_no={self.seq_no}, in_sync={self.in_sync},"
+            f" bid={self.best_bid()}, ask={self.best_ask()})"
+        )
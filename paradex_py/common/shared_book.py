@@ -0,0 +1,291 @@
+"""
+Top-of-book state shared between processes.
+
+A `SharedBookTable` is a `multiprocessing.shared_memory` segment holding,
+for a fixed list of markets, the best `depth` price levels of each side as
+scaled integers (see `fixed_point`). One process writes (see
+`paradex_py.api.ws_shared`); any number of processes attach by name and
+read without locks or messages.
+
+Each market slot is guarded by a seqlock: the writer makes the slot's
+sequence odd, writes the levels, then makes it even again. Readers copy the
+slot and retry if the sequence was odd or changed meanwhile, so they never
+see a half-written book and never block the writer. A slot that stays odd
+for `WRITER_TIMEOUT` seconds (a writer killed mid-write) makes the read
+raise instead of spinning; the owner clears such slots with `repair()`.
+Slots start on and are padded to a 64-byte cache line so markets written
+at once do not contend.
+
+Layout (native-endian int64 words): an 8-word header, 4 words of UTF-8
+name per market padded to a cache line, then one slot per market:
+`[sequence, seq_no, last_updated_at, bid_count, ask_count,
+bid_price_0, bid_size_0, ..., ask_price_0, ask_size_0, ...]`.
+"""
+
+import sys
+import time
+from collections.abc import Iterable, Sequence
+from multiprocessing import resource_tracker, shared_memory
+from typing import NamedTuple
+
+from paradex_py.utils import raise_value_error
+
+MAGIC = 0x50445842_4F4F4B31  # "PDXBOOK1"
+VERSION = 2
+HEADER_WORDS = 8
+NAME_WORDS = 4
+NAME_BYTES = NAME_WORDS * 8
+CACHE_LINE_WORDS = 8
+SLOT_HEADER_WORDS = 5
+# A write takes microseconds; a slot odd for longer was left by a dead writer
+WRITER_TIMEOUT = 1.0
+
+
+class SharedBook(NamedTuple):
+    """Copy of a market slot: levels are `(price, size)` scaled by `10 ** decimals`, best first."""
+
+    market: str
+    sequence: int
+    seq_no: int
+    last_updated_at: int
+    bids: list[tuple[int, int]]
+    asks: list[tuple[int, int]]
+
+
+def _cache_lines(words: int) -> int:
+    """`words` rounded up to whole cache lines."""
+    return -(-words // CACHE_LINE_WORDS) * CACHE_LINE_WORDS
+
+
+def _slot_words(depth: int) -> int:
+    return _cache_lines(SLOT_HEADER_WORDS + 4 * depth)
+
+
+def _slots_start(capacity: int) -> int:
+    """Word offset of the first slot; the segment itself is page aligned."""
+    return _cache_lines(HEADER_WORDS + capacity * NAME_WORDS)
+
+
+def _open_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to a segment without tracking it: the creator owns (and unlinks) it.
+
+    Before Python 3.13 attaching registers the segment with this process's
+    resource tracker, which unlinks it when the process exits.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    if shm.buf is None:
+        return raise_value_error(f"SharedBookTable: {shm.name} is closed")
+    return shm.buf
+
+
+class SharedBookTable:
+    """Seqlock-protected per-market book levels in shared memory.
+
+    Create the table in the owning process with `create()` and pass its
+    `name` to other processes, which `attach()`. There must be a single
+    writer per table.
+
+    Examples:
+        >>> table = SharedBookTable.create(["BTC-USD-PERP", "ETH-USD-PERP"], depth=1)
+        >>> table.write("BTC-USD-PERP", bids=[(6500000000000, 100000)], asks=[(6500100000000, 200000)])
+        >>> reader = SharedBookTable.attach(table.name)
+        >>> reader.bbo("BTC-USD-PERP")
+        (6500000000000, 100000, 6500100000000, 200000)
+        >>> reader.close()
+        >>> table.close()
+        >>> table.unlink()
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self.owner = owner
+        buf = _buffer(shm)
+        self._words = buf.cast("q")
+        words = self._words
+        if words[0] != MAGIC or words[1] != VERSION:
+            self.close()
+            raise_value_error(f"SharedBookTable: {shm.name} is not a version {VERSION} book table")
+        self.depth = words[3]
+        self.decimals = words[4]
+        self.slot_words = _slot_words(self.depth)
+        capacity = words[2]
+        names = bytes(buf[HEADER_WORDS * 8 : (HEADER_WORDS + capacity * NAME_WORDS) * 8])
+        self.markets = [names[i : i + NAME_BYTES].rstrip(b"\0").decode() for i in range(0, len(names), NAME_BYTES)]
+        self._index = {market: i for i, market in enumerate(self.markets)}
+        self._slots_start = _slots_start(capacity)
+
+    @classmethod
+    def create(
+        cls, markets: Iterable[str], depth: int = 1, decimals: int = 8, name: str | None = None
+    ) -> "SharedBookTable":
+        """Allocate a zeroed table for `markets`.
+
+        Args:
+            markets: Market symbols, at most 32 bytes each.
+            depth: Price levels kept per side (1 for BBO).
+            decimals: Fractional digits of the scaled prices and sizes.
+            name: Shared memory name. Defaults to a random one.
+        """
+        markets = list(dict.fromkeys(markets))
+        if not markets or depth < 1:
+            raise_value_error("SharedBookTable: needs at least one market and depth >= 1")
+        encoded = [market.encode() for market in markets]
+        if any(len(market) > NAME_BYTES for market in encoded):
+            raise_value_error(f"SharedBookTable: market names are limited to {NAME_BYTES} bytes")
+        words = _slots_start(len(markets)) + len(markets) * _slot_words(depth)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=words * 8)
+        buf = _buffer(shm)
+        header = buf.cast("q")
+        header[1], header[2], header[3], header[4] = VERSION, len(markets), depth, decimals
+        names = b"".join(market.ljust(NAME_BYTES, b"\0") for market in encoded)
+        buf[HEADER_WORDS * 8 : HEADER_WORDS * 8 + len(names)] = names
+        # Written last: attachers check it
+        header[0] = MAGIC
+        header.release()
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedBookTable":
+        """Open a table created by another process."""
+        return cls(_open_shared_memory(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def index(self, market: str) -> int:
+        """Slot number of `market`; reading by slot number skips the name lookup."""
+        index = self._index.get(market)
+        if index is None:
+            return raise_value_error(f"SharedBookTable: unknown market {market}")
+        return index
+
+    def _base(self, market: str | int) -> int:
+        index = market if isinstance(market, int) else self.index(market)
+        return self._slots_start + index * self.slot_words
+
+    def write(
+        self,
+        market: str | int,
+        bids: Sequence[tuple[int, int]],
+        asks: Sequence[tuple[int, int]],
+        seq_no: int = 0,
+        last_updated_at: int = 0,
+    ) -> None:
+        """Publish the levels of a market, best first; levels beyond `depth` are ignored."""
+        words = self._words
+        base = self._base(market)
+        depth = self.depth
+        bids, asks = bids[:depth], asks[:depth]
+        words[base] += 1  # odd: write in progress
+        words[base + 1] = seq_no
+        words[base + 2] = last_updated_at
+        words[base + 3] = len(bids)
+        words[base + 4] = len(asks)
+        offset = base + SLOT_HEADER_WORDS
+        for price, size in bids:
+            words[offset] = price
+            words[offset + 1] = size
+            offset += 2
+        offset = base + SLOT_HEADER_WORDS + 2 * depth
+        for price, size in asks:
+            words[offset] = price
+            words[offset + 1] = size
+            offset += 2
+        words[base] += 1
+
+    def sequence(self, market: str | int) -> int:
+        """Slot sequence number; it changes on every write, so readers can skip unchanged markets."""
+        return self._words[self._base(market)]
+
+    def _copy(self, base: int) -> tuple[int, list[int]]:
+        words = self._words
+        end = base + SLOT_HEADER_WORDS + 4 * self.depth
+        deadline = 0.0
+        while True:
+            sequence = words[base]
+            if sequence & 1:
+                if not deadline:
+                    deadline = time.monotonic() + WRITER_TIMEOUT
+                elif time.monotonic() > deadline:
+                    market = self.markets[(base - self._slots_start) // self.slot_words]
+                    raise_value_error(f"SharedBookTable: {market} was left mid-write; the writer died")
+                # Let the writer finish (it may be waiting for this core)
+                time.sleep(0)
+                continue
+            values = words[base + 1 : end].tolist()
+            if words[base] == sequence:
+                return sequence, values
+
+    def read(self, market: str | int) -> SharedBook | None:
+        """Consistent copy of a market's levels; None if it was never written."""
+        base = self._base(market)
+        sequence, values = self._copy(base)
+        if sequence == 0:
+            return None
+        seq_no, last_updated_at, bid_count, ask_count = values[:4]
+        levels = values[SLOT_HEADER_WORDS - 1 :]
+        depth = self.depth
+        return SharedBook(
+            market=self.markets[market] if isinstance(market, int) else market,
+            sequence=sequence,
+            seq_no=seq_no,
+            last_updated_at=last_updated_at,
+            bids=[(levels[2 * i], levels[2 * i + 1]) for i in range(bid_count)],
+            asks=[(levels[2 * (depth + i)], levels[2 * (depth + i) + 1]) for i in range(ask_count)],
+        )
+
+    def bbo(self, market: str | int) -> tuple[int, int, int, int] | None:
+        """`(bid, bid_size, ask, ask_size)` of a market; None unless both sides are present."""
+        sequence, values = self._copy(self._base(market))
+        if sequence == 0 or not values[2] or not values[3]:
+            return None
+        ask = SLOT_HEADER_WORDS - 1 + 2 * self.depth
+        return values[4], values[5], values[ask], values[ask + 1]
+
+    def repair(self) -> list[str]:
+        """Clear slots left mid-write by a writer that was killed (no writer may be running).
+
+        Their levels are dropped and the sequence is made even again, so
+        readers see an empty book until the next write.
+
+        Returns:
+            list[str]: Markets whose slot was cleared.
+        """
+        words = self._words
+        repaired = []
+        for index, market in enumerate(self.markets):
+            base = self._slots_start + index * self.slot_words
+            if words[base] & 1:
+                words[base + 3] = 0
+                words[base + 4] = 0
+                words[base] += 1
+                repaired.append(market)
+        return repaired
+
+    def close(self) -> None:
+        """Detach from the segment (every process, including the owner)."""
+        self._words.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the segment once every process has closed it (owner only)."""
+        if self.owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedBookTable":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        self.unlink()
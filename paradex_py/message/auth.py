@@ -1,9 +1,13 @@
 from typing import cast
 
 from poseidon_py.poseidon_hash import poseidon_hash_many
-from starknet_py.serialization.data_serializers.byte_array_serializer import ByteArraySerializer
 from starknet_py.utils.typed_data import TypedDataDict
 
+from paradex_py.utils import raise_value_error
+
+# Bytes per full word of a Cairo ByteArray
+BYTES_31_SIZE = 31
+
 
 def build_auth_message(chain_id: int, timestamp: int, expiry: int) -> TypedDataDict:
     message = {
@@ -34,10 +38,26 @@ def build_auth_message(chain_id: int, timestamp: int, expiry: int) -> TypedDataD
     return cast(TypedDataDict, message)
 
 
+def byte_array_felts(value: str) -> list[int]:
+    """Serialize `value` as a Cairo ByteArray, like starknet_py's `ByteArraySerializer`.
+
+    The serializer validates and encodes every 31-character chunk as a
+    separate short string; the ASCII bytes are encoded once here instead.
+    """
+    try:
+        data = value.encode("ascii")
+    except UnicodeEncodeError:
+        # The UnicodeEncodeError stays chained as the context
+        raise_value_error(f"Expected an ascii string. Found: {value!r}.")
+    full_words = len(data) // BYTES_31_SIZE
+    end = full_words * BYTES_31_SIZE
+    words = [int.from_bytes(data[i : i + BYTES_31_SIZE], "big") for i in range(0, end, BYTES_31_SIZE)]
+    pending = data[end:]
+    return [full_words, *words, int.from_bytes(pending, "big"), len(pending)]
+
+
 def poseidon_hash(input_str: str) -> int:
-    byte_array_serializer = ByteArraySerializer()
-    input_felts = byte_array_serializer.serialize(input_str)
-    return poseidon_hash_many(input_felts)
+    return poseidon_hash_many(byte_array_felts(input_str))
 
 
 def build_fullnode_message(
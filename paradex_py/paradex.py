@@ -9,7 +9,10 @@ from paradex_py.environment import Environment
 from paradex_py.utils import raise_value_error
 
 if TYPE_CHECKING:
-    from paradex_py.api.http_client import HttpClient
+    from paradex_py.account.keystore import KeyStore
+    from paradex_py.account.signing_executor import SigningExecutor
+    from paradex_py.api.config_cache import SystemConfigCache
+    from paradex_py.api.http_client import HttpClient, HttpPoolConfig
     from paradex_py.api.models import SystemConfig
     from paradex_py.api.protocols import (
         AuthProvider,
@@ -18,6 +21,7 @@ if TYPE_CHECKING:
         Signer,
         WebSocketConnector,
     )
+    from paradex_py.api.rate_limiter import RateLimiter
 
 
 class Paradex:
@@ -35,6 +39,11 @@ class Paradex:
         default_timeout (float, optional): Default HTTP request timeout in seconds. Defaults to None.
         retry_strategy (RetryStrategy, optional): Custom retry/backoff strategy. Defaults to None.
         request_hook (RequestHook, optional): Hook for request/response observability. Defaults to None.
+        pool_config (HttpPoolConfig, optional): Connection pool / HTTP/2 settings of the HTTP client; not allowed with `http_client`. Defaults to None.
+        collect_pool_stats (bool, optional): Count new vs reused HTTP connections. Defaults to False.
+        rate_limiter (RateLimiter, optional): Client-side per-endpoint rate limiter. Defaults to None.
+        collect_latency (bool, optional): Record the latency breakdown of order operations, see
+            `api_client.get_latency_stats()`. Defaults to False.
         auto_start_ws_reader (bool, optional): Whether to automatically start WS message reader. Defaults to True.
         ws_connector (WebSocketConnector, optional): Custom WebSocket connector for injection. Defaults to None.
         ws_url_override (str, optional): Custom WebSocket URL override. Defaults to None.
@@ -46,8 +55,11 @@ class Paradex:
         auto_auth (bool, optional): Whether to automatically handle onboarding/auth. Defaults to True.
         auth_provider (AuthProvider, optional): Custom authentication provider. Defaults to None.
         signer (Signer, optional): Custom order signer for submit/modify/batch operations. Defaults to None.
+        signing_executor (SigningExecutor, optional): Parallel signer for order batches. Defaults to None.
         rpc_version (str, optional): RPC version (e.g., "v0_9"). If provided, constructs URL as {base_url}/rpc/{rpc_version}. Defaults to None.
         config (SystemConfig, optional): System configuration. If provided, uses this config instead of fetching from API. Defaults to None.
+        config_cache (SystemConfigCache, optional): On-disk cache consulted before fetching the system config. Defaults to None.
+        keystore (KeyStore, optional): Cache of derived L2 keys and addresses used to initialize the account. Defaults to None.
         use_interactive_token (bool, optional): Use interactive token for free API access (500ms extra latency). Defaults to False.
 
     Examples:
@@ -76,6 +88,10 @@ class Paradex:
         default_timeout: float | None = None,
         retry_strategy: "RetryStrategy | None" = None,
         request_hook: "RequestHook | None" = None,
+        pool_config: "HttpPoolConfig | None" = None,
+        collect_pool_stats: bool = False,
+        rate_limiter: "RateLimiter | None" = None,
+        collect_latency: bool = False,
         # WebSocket client injection and configuration
         auto_start_ws_reader: bool = True,
         ws_connector: "WebSocketConnector | None" = None,
@@ -90,9 +106,12 @@ class Paradex:
         auth_provider: "AuthProvider | None" = None,
         # Signing configuration
         signer: "Signer | None" = None,
+        signing_executor: "SigningExecutor | None" = None,
         # RPC configuration
         rpc_version: str | None = None,
         config: "SystemConfig | None" = None,
+        config_cache: "SystemConfigCache | None" = None,
+        keystore: "KeyStore | None" = None,
         use_interactive_token: bool = False,
     ):
         if env is None:
@@ -100,14 +119,18 @@ class Paradex:
         self.env = env
         self.logger: logging.Logger = logger or logging.getLogger(__name__)
 
+        if http_client is not None and pool_config is not None:
+            raise_value_error("Paradex: pool_config cannot be applied to an injected http_client")
+
         # Create enhanced HTTP client if needed
-        if http_client is None and (default_timeout or retry_strategy or request_hook):
+        if http_client is None and (default_timeout or retry_strategy or request_hook or pool_config):
             from paradex_py.api.http_client import HttpClient
 
             http_client = HttpClient(
                 default_timeout=default_timeout,
                 retry_strategy=retry_strategy,
                 request_hook=request_hook,
+                pool_config=pool_config,
             )
 
         # Load api client and system config with all optional injection
@@ -120,6 +143,10 @@ class Paradex:
             auth_provider=auth_provider,
             signer=signer,
             use_interactive_token=use_interactive_token,
+            signing_executor=signing_executor,
+            collect_pool_stats=collect_pool_stats,
+            rate_limiter=rate_limiter,
+            collect_latency=collect_latency,
         )
 
         # Initialize WebSocket client with all optional injection
@@ -139,6 +166,8 @@ class Paradex:
 
         if config is not None:
             self.config = config
+        elif config_cache is not None:
+            self.config = config_cache.get(self.api_client.api_url, self.api_client.fetch_system_config)
         else:
             self.config = self.api_client.fetch_system_config()
         self.account: ParadexAccount | None = None
@@ -150,6 +179,7 @@ class Paradex:
                 l1_private_key=l1_private_key,
                 l2_private_key=l2_private_key,
                 rpc_version=rpc_version,
+                keystore=keystore,
             )
 
     def init_account(
@@ -158,6 +188,7 @@ class Paradex:
         l1_private_key: str | None = None,
         l2_private_key: str | None = None,
         rpc_version: str | None = None,
+        keystore: "KeyStore | None" = None,
     ):
         """Initialize paradex account with l1 or l2 private keys.
         Cannot be called if account is already initialized.
@@ -167,6 +198,7 @@ class Paradex:
             l1_private_key (str): L1 private key
             l2_private_key (str): L2 private key
             rpc_version (str, optional): RPC version (e.g., "v0_9"). If provided, constructs URL as {base_url}/rpc/{rpc_version}. Defaults to None.
+            keystore (KeyStore, optional): Cache of derived L2 keys and addresses; saved if the account was added to it. Defaults to None.
         """
         if self.account is not None:
             return raise_value_error("Paradex: Account already initialized")
@@ -176,7 +208,10 @@ class Paradex:
             l1_private_key=l1_private_key,
             l2_private_key=l2_private_key,
             rpc_version=rpc_version,
+            keystore=keystore,
         )
+        if keystore is not None and keystore.dirty:
+            keystore.save()
         self.api_client.init_account(self.account)
         self.ws_client.init_account(self.account)
 
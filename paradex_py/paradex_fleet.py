@@ -0,0 +1,310 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import httpx
+
+from paradex_py.account.account import ParadexAccount
+from paradex_py.api.async_api_client import AsyncParadexApiClient
+from paradex_py.api.http_client import HttpPoolConfig
+from paradex_py.api.ws_client import ParadexWebsocketClient
+from paradex_py.common.latency import TOTAL, LatencyRecorder, LatencySummary
+from paradex_py.common.order import Order
+from paradex_py.environment import Environment
+from paradex_py.utils import raise_value_error
+
+if TYPE_CHECKING:
+    from paradex_py.account.keystore import KeyStore
+    from paradex_py.account.signing_executor import SigningExecutor
+    from paradex_py.api.config_cache import SystemConfigCache
+    from paradex_py.api.models import SystemConfig
+    from paradex_py.api.protocols import RequestHook, RetryStrategy, WebSocketConnector
+
+T = TypeVar("T")
+
+
+@dataclass
+class FleetAccount:
+    """One account of a `ParadexFleet`: its keys, its REST client (own JWT, shared pool) and optional private WS.
+
+    `latency` holds the latency of the calls made through the fleet for
+    this account, per operation; `errors` counts the calls that raised.
+    """
+
+    name: str
+    account: ParadexAccount
+    api_client: AsyncParadexApiClient
+    latency: LatencyRecorder = field(default_factory=LatencyRecorder)
+    errors: int = 0
+    ws_client: ParadexWebsocketClient | None = None
+
+
+class ParadexFleet:
+    """Manage many Paradex accounts from one process.
+
+    Compared to one `Paradex` instance per account, the fleet fetches the
+    system config once, sends every account's REST traffic through a single
+    connection pool and serves public market data from one WebSocket
+    connection (`ws_client`). Each account keeps its own JWT, REST client
+    and, on request, its own private WebSocket connection. Calls made
+    through `call`, `gather` and `submit_orders` run concurrently across
+    accounts and their latencies are recorded per account.
+
+    Args:
+        env (Environment): Environment
+        config (SystemConfig, optional): System config; fetched once on first use if not provided. Defaults to None.
+        config_cache (SystemConfigCache, optional): On-disk cache consulted before fetching the config. Defaults to None.
+        keystore (KeyStore, optional): Cache of derived L2 keys and addresses. Defaults to None.
+        logger (logging.Logger, optional): Logger. Defaults to None.
+        api_base_url (str, optional): Custom API base URL override. Defaults to None.
+        pool_config (HttpPoolConfig, optional): Settings of the shared connection pool. Defaults to None.
+        transport (httpx.AsyncBaseTransport, optional): Custom shared transport for injection; replaces the pool. Defaults to None.
+        default_timeout (float, optional): Default HTTP request timeout in seconds. Defaults to None.
+        retry_strategy (RetryStrategy, optional): Retry/backoff strategy of every account. Defaults to None.
+        request_hook (RequestHook, optional): Hook for request/response observability. Defaults to None.
+        signing_executor (SigningExecutor, optional): Parallel signer shared by the accounts. Defaults to None.
+        auto_auth (bool, optional): Onboard and authenticate accounts when they are added. Defaults to True.
+        ws_connector (WebSocketConnector, optional): Custom WebSocket connector for injection. Defaults to None.
+        ws_url_override (str, optional): Custom WebSocket URL override. Defaults to None.
+
+    Examples:
+        >>> async def main():
+        ...     async with ParadexFleet(env=PROD) as fleet:
+        ...         await fleet.add_accounts({"a": {"l1_address": "0x...", "l2_private_key": "0x..."},
+        ...                                   "b": {"l1_address": "0x...", "l2_private_key": "0x..."}})
+        ...         await fleet.ws_client.connect()
+        ...         results = await fleet.submit_orders({"a": buy_order, "b": sell_order})
+        ...         print(fleet.stats())
+    """
+
+    def __init__(
+        self,
+        env: Environment,
+        config: "SystemConfig | None" = None,
+        config_cache: "SystemConfigCache | None" = None,
+        keystore: "KeyStore | None" = None,
+        logger: logging.Logger | None = None,
+        api_base_url: str | None = None,
+        pool_config: HttpPoolConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        default_timeout: float | None = None,
+        retry_strategy: "RetryStrategy | None" = None,
+        request_hook: "RequestHook | None" = None,
+        signing_executor: "SigningExecutor | None" = None,
+        auto_auth: bool = True,
+        ws_connector: "WebSocketConnector | None" = None,
+        ws_url_override: str | None = None,
+    ):
+        if env is None:
+            raise_value_error("ParadexFleet: Invalid environment")
+        self.env = env
+        self.logger: logging.Logger = logger or logging.getLogger(__name__)
+        self.config = config
+        self.config_cache = config_cache
+        self.keystore = keystore
+        self.api_base_url = api_base_url
+        self.default_timeout = default_timeout
+        self.retry_strategy = retry_strategy
+        self.request_hook = request_hook
+        self.signing_executor = signing_executor
+        self.auto_auth = auto_auth
+        self.ws_connector = ws_connector
+        self.ws_url_override = ws_url_override
+
+        # One pool for every account; each account's httpx client only carries its own headers (JWT)
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(verify=False, **(pool_config or HttpPoolConfig()).client_kwargs())
+        self.transport = transport
+        self.public_api = self._api_client(auto_auth=False)
+        self.ws_client = self._ws_client()
+        self.accounts: dict[str, FleetAccount] = {}
+        self._config_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "ParadexFleet":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def __getitem__(self, name: str) -> FleetAccount:
+        try:
+            return self.accounts[name]
+        except KeyError:
+            return raise_value_error(f"ParadexFleet: Unknown account {name}")
+
+    def __iter__(self) -> Iterator[FleetAccount]:
+        return iter(self.accounts.values())
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    def _api_client(self, auto_auth: bool) -> AsyncParadexApiClient:
+        return AsyncParadexApiClient(
+            env=self.env,
+            logger=self.logger,
+            http_client=httpx.AsyncClient(transport=self.transport),
+            api_base_url=self.api_base_url,
+            auto_auth=auto_auth,
+            default_timeout=self.default_timeout,
+            retry_strategy=self.retry_strategy,
+            request_hook=self.request_hook,
+            signing_executor=self.signing_executor,
+        )
+
+    def _ws_client(self) -> ParadexWebsocketClient:
+        return ParadexWebsocketClient(
+            env=self.env,
+            logger=self.logger,
+            connector=self.ws_connector,
+            ws_url_override=self.ws_url_override,
+        )
+
+    async def load_config(self) -> "SystemConfig":
+        """System config shared by all accounts, fetched (or read from the cache) once."""
+        async with self._config_lock:
+            if self.config is None:
+                url = self.public_api.api_url
+                config = self.config_cache.load(url) if self.config_cache is not None else None
+                if config is None:
+                    config = await self.public_api.fetch_system_config()
+                    if self.config_cache is not None:
+                        self.config_cache.store(url, config)
+                self.config = config
+        return self.config
+
+    async def add_account(
+        self,
+        name: str,
+        l1_address: str | None = None,
+        l1_private_key: str | None = None,
+        l2_private_key: str | None = None,
+        account: ParadexAccount | None = None,
+    ) -> FleetAccount:
+        """Add an account and authenticate it (unless `auto_auth` is off).
+
+        Args:
+            name: Key of the account in the fleet.
+            l1_address: L1 address; required unless `account` is given.
+            l1_private_key: L1 private key.
+            l2_private_key: L2 private key.
+            account: Prebuilt account (e.g. a `SubkeyAccount`) instead of keys.
+        """
+        if name in self.accounts:
+            return raise_value_error(f"ParadexFleet: Account {name} already added")
+        if account is None:
+            if not l1_address:
+                return raise_value_error("ParadexFleet: Provide l1_address or account")
+            account = ParadexAccount(
+                config=await self.load_config(),
+                l1_address=l1_address,
+                l1_private_key=l1_private_key,
+                l2_private_key=l2_private_key,
+                keystore=self.keystore,
+            )
+        member = FleetAccount(name=name, account=account, api_client=self._api_client(auto_auth=self.auto_auth))
+        self.accounts[name] = member
+        try:
+            await member.api_client.init_account(account)
+        except Exception:
+            del self.accounts[name]
+            raise
+        return member
+
+    async def add_accounts(self, accounts: Mapping[str, Mapping[str, Any]]) -> dict[str, FleetAccount]:
+        """Add several accounts (`{name: add_account kwargs}`), authenticating them concurrently."""
+        await self.load_config()
+        members = await asyncio.gather(*(self.add_account(name, **kwargs) for name, kwargs in accounts.items()))
+        if self.keystore is not None and self.keystore.dirty:
+            self.keystore.save()
+        return dict(zip(accounts, members, strict=True))
+
+    async def connect_private_ws(self, name: str) -> ParadexWebsocketClient:
+        """Open (once) the private WebSocket connection of account `name`, authenticated with its JWT."""
+        member = self[name]
+        if member.ws_client is None:
+            member.ws_client = self._ws_client()
+            member.ws_client.init_account(member.account)
+        if member.ws_client.ws is None:
+            await member.ws_client.connect()
+        return member.ws_client
+
+    async def call(self, name: str, fn: Callable[[FleetAccount], Awaitable[T]], operation: str = "call") -> T:
+        """Await `fn(account)` for account `name`, recording its latency under `operation`."""
+        member = self[name]
+        try:
+            with member.latency.operation(operation):
+                return await fn(member)
+        except Exception:
+            member.errors += 1
+            raise
+
+    async def gather(
+        self,
+        fn: Callable[[FleetAccount], Awaitable[T]],
+        names: Iterable[str] | None = None,
+        operation: str = "call",
+    ) -> dict[str, T | BaseException]:
+        """Run `fn` for several accounts (all by default) concurrently.
+
+        Failures are returned in place of the result, so one account's error
+        does not hide the others' outcome.
+
+        Examples:
+            >>> summaries = await fleet.gather(lambda m: m.api_client.fetch_account_summary())
+        """
+        selected = list(names) if names is not None else list(self.accounts)
+        results = await asyncio.gather(*(self.call(name, fn, operation) for name in selected), return_exceptions=True)
+        return dict(zip(selected, results, strict=True))
+
+    async def submit_orders(self, orders: Mapping[str, Order | Sequence[Order]]) -> dict[str, dict | BaseException]:
+        """Submit orders for several accounts concurrently.
+
+        Args:
+            orders: `{name: order}`, or `{name: [orders]}` to use one batch request per account.
+
+        Returns:
+            `{name: response}`, with the exception in place of the response for failed accounts.
+        """
+
+        def submit(name: str, batch: Order | Sequence[Order]) -> Awaitable[dict]:
+            if isinstance(batch, Order):
+                return self.call(name, lambda member: member.api_client.submit_order(batch), "submit_order")
+            return self.call(
+                name, lambda member: member.api_client.submit_orders_batch(list(batch)), "submit_orders_batch"
+            )
+
+        results = await asyncio.gather(*(submit(name, batch) for name, batch in orders.items()), return_exceptions=True)
+        return dict(zip(orders, results, strict=True))
+
+    async def cancel_all_orders(self, params: dict | None = None, names: Iterable[str] | None = None) -> dict:
+        """Cancel all open orders of several accounts (all by default) concurrently."""
+        return await self.gather(lambda member: member.api_client.cancel_all_orders(params), names, "cancel_all_orders")
+
+    def stats(self) -> dict[str, dict[str, LatencySummary]]:
+        """Latency distribution per account and operation (`submit_order`, `call`, ...).
+
+        Examples:
+            >>> fleet.stats()["a"]["submit_order"].p99_ms
+        """
+        return {
+            name: {
+                operation: histograms[TOTAL].summary() for operation, histograms in member.latency.histograms.items()
+            }
+            for name, member in self.accounts.items()
+        }
+
+    def reset_stats(self) -> None:
+        for member in self.accounts.values():
+            member.latency.reset()
+            member.errors = 0
+
+    async def close(self) -> None:
+        """Close every WebSocket connection and the shared connection pool."""
+        await self.ws_client.close()
+        for member in self.accounts.values():
+            if member.ws_client is not None:
+                await member.ws_client.close()
+        # The account clients share the transport; closing it closes the pool once
+        await self.transport.aclose()
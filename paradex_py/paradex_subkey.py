@@ -1,11 +1,17 @@
 import logging
+from typing import TYPE_CHECKING
 
 from paradex_py.account.subkey_account import SubkeyAccount
 from paradex_py.api.api_client import ParadexApiClient
+from paradex_py.api.http_client import HttpClient
 from paradex_py.api.ws_client import ParadexWebsocketClient
 from paradex_py.environment import Environment
 from paradex_py.utils import raise_value_error
 
+if TYPE_CHECKING:
+    from paradex_py.api.config_cache import SystemConfigCache
+    from paradex_py.api.protocols import RequestHook
+
 
 class ParadexSubkey:
     """ParadexSubkey class for L2-only authentication using subkeys.
@@ -20,6 +26,10 @@ class ParadexSubkey:
         logger (logging.Logger, optional): Logger. Defaults to None.
         ws_timeout (int, optional): WebSocket read timeout in seconds. Defaults to None (uses default).
         use_interactive_token (bool, optional): Use interactive token for free API access (500ms extra latency). Defaults to False.
+        config_cache (SystemConfigCache, optional): On-disk cache consulted before fetching the system config. Defaults to None.
+        request_hook (RequestHook, optional): Hook for request/response observability. Defaults to None.
+        collect_latency (bool, optional): Record the latency breakdown of order operations, see
+            `api_client.get_latency_stats()`. Defaults to False.
 
     Examples:
         >>> from paradex_py import ParadexSubkey
@@ -46,6 +56,9 @@ class ParadexSubkey:
         logger: logging.Logger | None = None,
         ws_timeout: int | None = None,
         use_interactive_token: bool = False,
+        config_cache: "SystemConfigCache | None" = None,
+        request_hook: "RequestHook | None" = None,
+        collect_latency: bool = False,
     ):
         if env is None:
             return raise_value_error("ParadexSubkey: Invalid environment")
@@ -60,9 +73,19 @@ class ParadexSubkey:
         self.logger: logging.Logger = logger or logging.getLogger(__name__)
 
         # Load api client and system config
-        self.api_client = ParadexApiClient(env=env, logger=logger, use_interactive_token=use_interactive_token)
+        http_client = HttpClient(request_hook=request_hook) if request_hook is not None else None
+        self.api_client = ParadexApiClient(
+            env=env,
+            logger=logger,
+            http_client=http_client,
+            use_interactive_token=use_interactive_token,
+            collect_latency=collect_latency,
+        )
         self.ws_client = ParadexWebsocketClient(env=env, logger=logger, ws_timeout=ws_timeout)
-        self.config = self.api_client.fetch_system_config()
+        if config_cache is not None:
+            self.config = config_cache.get(self.api_client.api_url, self.api_client.fetch_system_config)
+        else:
+            self.config = self.api_client.fetch_system_config()
 
         # Initialize SubkeyAccount with L2-only credentials
         self.account = SubkeyAccount(
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark `BookSide` updates and depth queries.
+
+For each book depth, applies a stream of size changes to existing levels
+(the common case of ORDER_BOOK deltas) and a stream that also inserts and
+removes levels, each followed by a VWAP query the way a strategy would
+price its next order. Reports operations per second and the time of a
+single query.
+"""
+
+import argparse
+import random
+import time
+
+from paradex_py.common.order import OrderSide
+from paradex_py.common.orderbook import BookSide
+
+BASE_PRICE = 65_000 * 10
+SIZE = 10**3
+
+
+def make_side(depth: int) -> BookSide:
+    side = BookSide(OrderSide.Sell)
+    for i in range(depth):
+        side.set(BASE_PRICE + i, SIZE)
+    return side
+
+
+def run(depth: int, operations: int, churn: float, seed: int = 1) -> float:
+    """Updates followed by a VWAP query per second; `churn` is the share of inserts/removals."""
+    rng = random.Random(seed)
+    side = make_side(depth)
+    query_size = SIZE * max(1, depth // 10)
+    updates = [
+        (BASE_PRICE + rng.randrange(depth), 0 if rng.random() < churn else rng.randint(1, 2 * SIZE))
+        for _ in range(operations)
+    ]
+    start = time.perf_counter()
+    for price, size in updates:
+        side.set(price, size)
+        if not size:
+            side.set(price, SIZE)  # Put the level back so the depth stays constant
+        side.notional_for_size(query_size)
+    return operations / (time.perf_counter() - start)
+
+
+def query_time(depth: int, queries: int = 10_000) -> float:
+    """Seconds per depth query on an unchanged book."""
+    side = make_side(depth)
+    side.cumulative_size(1)
+    start = time.perf_counter()
+    for i in range(queries):
+        side.notional_for_size(SIZE * (1 + i % depth))
+    return (time.perf_counter() - start) / queries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark order book updates and queries")
+    parser.add_argument("--depths", type=int, nargs="+", default=[50, 500, 5000], help="Levels per side")
+    parser.add_argument("--operations", type=int, default=20_000, help="Updates per run")
+    parser.add_argument("--churn", type=float, default=0.1, help="Share of updates removing and re-adding a level")
+    args = parser.parse_args()
+
+    print(f"{'levels':>8}  {'size changes/s':>15}  {'with churn/s':>13}  {'query us':>9}")
+    for depth in args.depths:
+        steady = run(depth, args.operations, churn=0.0)
+        churned = run(depth, args.operations, churn=args.churn)
+        print(f"{depth:>8}  {steady:>15,.0f}  {churned:>13,.0f}  {query_time(depth) * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
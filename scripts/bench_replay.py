@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark the WebSocket decode path on recorded traffic.
+
+`record` subscribes to the public BBO, order book and trades channels of
+the given markets and writes every received frame to a capture file.
+`synth` writes a capture of synthetic frames instead. `replay` feeds a
+capture through `ParadexWebsocketClient.inject()` with `CaptureReplayer`
+for every installed decoder, as fast as possible and, with `--speed`, at
+a multiple of the recorded pace, reporting frames per second and the
+largest lag behind the recorded schedule.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+
+from paradex_py.api.capture import WS_FRAME, CaptureReplayer, CaptureWriter
+from paradex_py.api.ws_client import ParadexWebsocketChannel, ParadexWebsocketClient
+from paradex_py.api.ws_decoder import MSGSPEC_AVAILABLE, ORJSON_AVAILABLE
+from paradex_py.environment import PROD, TESTNET
+
+CHANNELS = ["bbo.{market}", "order_book.{market}.snapshot@15@100ms", "trades.{market}"]
+
+
+async def record(path: str, env: str, markets: list[str], duration: float, compress: bool) -> None:
+    async def callback(ws_channel, message):
+        return None
+
+    with CaptureWriter(path, compress=compress) as capture:
+        client = ParadexWebsocketClient(env=PROD if env == "prod" else TESTNET, capture=capture)
+        await client.connect()
+        for market in markets:
+            await client.subscribe(ParadexWebsocketChannel.BBO, callback, params={"market": market})
+            await client.subscribe(
+                ParadexWebsocketChannel.ORDER_BOOK, callback, params={"market": market, "refresh_rate": "100ms"}
+            )
+            await client.subscribe(ParadexWebsocketChannel.TRADES, callback, params={"market": market})
+        await asyncio.sleep(duration)
+        await client.close()
+    print(f"recorded {capture.records} frames to {path}")
+
+
+def synth(path: str, markets: list[str], frames: int, rate: float, compress: bool) -> None:
+    with CaptureWriter(path, compress=compress) as capture:
+        for i in range(frames):
+            market = markets[i % len(markets)]
+            kind = i // len(markets) % 3
+            if kind == 0:
+                data = {"market": market, "bid": f"{65000 + i % 100}.1", "bid_size": "1.5", "ask": "65100.2"}
+            elif kind == 1:
+                levels = [{"side": "BUY", "price": f"{3000 - j}.5", "size": "2.1"} for j in range(15)]
+                data = {"market": market, "seq_no": i, "inserts": levels, "updates": [], "deletes": []}
+            else:
+                data = {"id": str(i), "market": market, "side": "SELL", "size": "10", "price": "150.25"}
+            channel = CHANNELS[kind].format(market=market)
+            frame = {"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}}
+            # Stamp records at the requested rate instead of the wall clock
+            capture.write(WS_FRAME, json.dumps(frame), timestamp_ns=int(i / rate * 1e9))
+    print(f"wrote {frames} synthetic frames to {path}")
+
+
+async def replay(path: str, decoder: str, speed: float | None, markets: list[str]):
+    client = ParadexWebsocketClient(env=TESTNET, decoder=decoder, auto_start_reader=False)
+
+    async def callback(ws_channel, message):
+        return None
+
+    for market in markets:
+        for channel in CHANNELS:
+            client.callbacks[channel.format(market=market)] = callback
+    return await CaptureReplayer(path, speed=speed).replay_ws(client)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record and replay WebSocket traffic")
+    parser.add_argument("mode", choices=["record", "synth", "replay"])
+    parser.add_argument("--path", default="session.pdxcap", help="Capture file")
+    parser.add_argument("--markets", nargs="+", default=["BTC-USD-PERP", "ETH-USD-PERP"], help="Markets")
+    parser.add_argument("--env", choices=["prod", "testnet"], default="prod", help="record: environment")
+    parser.add_argument("--duration", type=float, default=60.0, help="record: seconds to record")
+    parser.add_argument("--frames", type=int, default=60_000, help="synth: number of frames")
+    parser.add_argument("--rate", type=float, default=20_000.0, help="synth: recorded frames per second")
+    parser.add_argument("--compress", action="store_true", help="record/synth: zstd-compress the capture")
+    parser.add_argument("--speed", type=float, help="replay: also replay at this multiple of the recorded pace")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    if args.mode == "record":
+        asyncio.run(record(args.path, args.env, args.markets, args.duration, args.compress))
+        return
+    if args.mode == "synth":
+        synth(args.path, args.markets, args.frames, args.rate, args.compress)
+        return
+
+    decoders = ["json"] + (["orjson"] if ORJSON_AVAILABLE else []) + (["msgspec"] if MSGSPEC_AVAILABLE else [])
+    speeds: list[float | None] = [None] + ([args.speed] if args.speed else [])
+    print(f"{'decoder':>8}  {'speed':>6}  {'frames':>8}  {'frames/s':>10}  {'max lag ms':>10}")
+    for decoder in decoders:
+        for speed in speeds:
+            stats = asyncio.run(replay(args.path, decoder, speed, args.markets))
+            label = "max" if speed is None else f"{speed:g}x"
+            print(
+                f"{decoder:>8}  {label:>6}  {stats.frames:>8}  {stats.frames_per_second:>10,.0f}"
+                f"  {stats.max_lag * 1e3:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
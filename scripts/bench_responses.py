@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark REST response decoding.
+
+Decodes synthetic BBO, order book, orders, fills and positions responses
+as plain dicts (what `fetch_*` returns), as the generated pydantic models,
+and as the slotted models of `typed_responses` (what `fetch_*_typed`
+returns), and reports responses per second. The account summary is
+decoded with a marshmallow schema built per call (the previous behaviour)
+and with the cached schema instance.
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from paradex_py.api.generated.responses import BBOResp, FillResult, OrderResp, PositionResp
+from paradex_py.api.models import ACCOUNT_SUMMARY_SCHEMA, AccountSummarySchema
+from paradex_py.api.typed_responses import TypedResponseDecoder
+
+MARKET = "BTC-USD-PERP"
+DECODER = TypedResponseDecoder({MARKET: (1, 5)})
+
+
+def make_payloads(levels: int, page: int) -> dict[str, str]:
+    order = {
+        "id": "1681462103821101699438490000",
+        "client_id": "mm-bid-17",
+        "account": "0x4638e3041366aa71720be63e32e53e1223316c7f0d56f7aa617542ed1e7512",
+        "market": MARKET,
+        "side": "BUY",
+        "type": "LIMIT",
+        "instruction": "POST_ONLY",
+        "status": "OPEN",
+        "price": "65000.1",
+        "size": "0.01",
+        "remaining_size": "0.00500",
+        "avg_fill_price": "65000.1",
+        "created_at": 1700000000000,
+        "last_updated_at": 1700000000100,
+        "timestamp": 1700000000000,
+        "seq_no": 1700000000100000000,
+        "flags": [],
+    }
+    fill = {
+        "id": "1681462103821101699438490001",
+        "order_id": order["id"],
+        "client_id": "mm-bid-17",
+        "market": MARKET,
+        "side": "BUY",
+        "liquidity": "MAKER",
+        "price": "65000.1",
+        "size": "0.005",
+        "fee": "0.0162",
+        "fee_currency": "USDC",
+        "realized_pnl": "0",
+        "realized_funding": "0",
+        "created_at": 1700000000100,
+    }
+    position = {
+        "market": MARKET,
+        "side": "LONG",
+        "status": "OPEN",
+        "size": "0.25",
+        "average_entry_price": "64321.12345",
+        "unrealized_pnl": "169.72",
+        "liquidation_price": "41000.2",
+        "leverage": "5",
+        "last_updated_at": 1700000000100,
+        "seq_no": 42,
+    }
+    summary = {
+        "account": order["account"],
+        "initial_margin_requirement": "1300.2",
+        "maintenance_margin_requirement": "650.1",
+        "account_value": "25000.5",
+        "total_collateral": "25000.5",
+        "free_collateral": "23700.3",
+        "margin_cushion": "24350.4",
+        "settlement_asset": "USDC",
+        "updated_at": 1700000000100,
+        "status": "ACTIVE",
+        "seq_no": 42,
+    }
+    return {
+        "bbo": json.dumps({"market": MARKET, "bid": "65000.1", "bid_size": "1.2", "ask": "65000.2", "ask_size": "0.8"}),
+        "orderbook": json.dumps(
+            {
+                "market": MARKET,
+                "seq_no": 42,
+                "bids": [[f"{65000 - i / 10:.1f}", "0.5"] for i in range(levels)],
+                "asks": [[f"{65000.1 + i / 10:.1f}", "0.5"] for i in range(levels)],
+            }
+        ),
+        "orders": json.dumps({"results": [order] * page}),
+        "fills": json.dumps({"next": "c", "results": [fill] * page}),
+        "positions": json.dumps({"results": [position] * 20}),
+        "account_summary": json.dumps(summary),
+    }
+
+
+def results_of(model: Any) -> Callable[[dict], Any]:
+    return lambda data: [model.model_validate(r) for r in data["results"]]
+
+
+DECODERS: dict[str, dict[str, Callable[[dict], Any]]] = {
+    "bbo": {"pydantic": BBOResp.model_validate, "typed": DECODER.bbo},
+    "orderbook": {"typed": DECODER.orderbook},
+    "orders": {"pydantic": results_of(OrderResp), "typed": DECODER.orders},
+    "fills": {"pydantic": results_of(FillResult), "typed": DECODER.fills},
+    "positions": {"pydantic": results_of(PositionResp), "typed": DECODER.positions},
+    "account_summary": {
+        "marshmallow (new schema)": lambda data: AccountSummarySchema().load(data, unknown="exclude", partial=True),
+        "marshmallow (cached)": lambda data: ACCOUNT_SUMMARY_SCHEMA.load(data, unknown="exclude", partial=True),
+    },
+}
+
+
+def rate(raw: str, decode: Callable[[dict], Any], seconds: float) -> float:
+    count = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        for _ in range(10):
+            decode(json.loads(raw))
+        count += 10
+    return count / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark REST response decoding")
+    parser.add_argument("--levels", type=int, default=100, help="Order book levels per side")
+    parser.add_argument("--page", type=int, default=100, help="Orders and fills per page")
+    parser.add_argument("--seconds", type=float, default=1.0, help="Time per measurement")
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.levels, args.page)
+    print(f"{'endpoint':<18}{'decoder':<26}{'responses/s':>14}")
+    for endpoint, raw in payloads.items():
+        decoders = {"dict": lambda data: data, **DECODERS[endpoint]}
+        for name, decode in decoders.items():
+            print(f"{endpoint:<18}{name:<26}{rate(raw, decode, args.seconds):>14,.0f}")
+
+    order = json.loads(payloads["orders"])["results"][0]
+    typed = DECODER.order(order)
+    print(f"\norder size in memory: dict {sys.getsizeof(order)} bytes, typed {sys.getsizeof(typed)} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark strategy throughput over a shared-memory book table.
+
+A writer process publishes BBO updates for every market into a
+`SharedBookTable` in a tight loop, the way `SharedMarketDataProcess` does
+after decoding frames. 1, 2 and 4 worker processes split the markets
+between them, read every changed BBO from shared memory and run a small
+CPU-bound "strategy" on it. Reports the updates evaluated per second,
+summed over workers; scaling needs at least workers + 1 cores.
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+
+from paradex_py.common.shared_book import SharedBookTable
+
+PRICE = 65_000 * 10**8
+SIZE = 10**8
+
+
+def writer(table_name: str, markets: int, stop) -> None:
+    table = SharedBookTable.attach(table_name)
+    n = 0
+    while not stop.is_set():
+        for index in range(markets):
+            n += 1
+            table.write(index, bids=[(PRICE + n, SIZE)], asks=[(PRICE + n + 10**8, SIZE)], seq_no=n)
+    table.close()
+
+
+def strategy(bid: int, bid_size: int, ask: int, ask_size: int, work: int) -> int:
+    microprice = (bid * ask_size + ask * bid_size) // (bid_size + ask_size)
+    signal = 0
+    for i in range(work):
+        signal = (signal * 31 + microprice + i) % 1_000_003
+    return signal
+
+
+def worker(table_name: str, markets: list[int], work: int, duration: float, results) -> None:
+    table = SharedBookTable.attach(table_name)
+    seen = dict.fromkeys(markets, 0)
+    evaluated = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        for index in markets:
+            sequence = table.sequence(index)
+            if sequence == seen[index]:
+                continue
+            seen[index] = sequence
+            bbo = table.bbo(index)
+            if bbo is not None:
+                strategy(*bbo, work)
+                evaluated += 1
+    table.close()
+    results.put(evaluated)
+
+
+def run(workers: int, markets: int, work: int, duration: float) -> float:
+    context = multiprocessing.get_context("spawn")
+    table = SharedBookTable.create([f"M{i}-USD-PERP" for i in range(markets)])
+    stop = context.Event()
+    results = context.Queue()
+    try:
+        publisher = context.Process(target=writer, args=(table.name, markets, stop))
+        publisher.start()
+        shards = [list(range(i, markets, workers)) for i in range(workers)]
+        processes = [
+            context.Process(target=worker, args=(table.name, shard, work, duration, results)) for shard in shards
+        ]
+        for process in processes:
+            process.start()
+        evaluated = sum(results.get() for _ in processes)
+        for process in processes:
+            process.join()
+        stop.set()
+        publisher.join()
+    finally:
+        table.close()
+        table.unlink()
+    return evaluated / duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark shared-memory BBO fan-out")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker process counts")
+    parser.add_argument("--markets", type=int, default=64, help="Number of markets")
+    parser.add_argument("--work", type=int, default=200, help="Strategy loop iterations per update")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds per run")
+    args = parser.parse_args()
+
+    print(f"cpus: {os.cpu_count()}, markets: {args.markets}, work: {args.work}")
+    print(f"{'workers':>8}  {'updates/s':>12}  {'scaling':>8}")
+    baseline = None
+    for workers in args.workers:
+        rate = run(workers, args.markets, args.work, args.duration)
+        baseline = baseline or rate
+        print(f"{workers:>8}  {rate:>12,.0f}  {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark order hashing and serial vs parallel order signing.
+
+Compares the per-order message hash of the generic typed-data path with
+`OrderHasher`, then signs batches of 10/100/1000 limit orders with a throwaway L2 key, first
+serially with `ParadexAccount.sign_order`, then through `SigningExecutor`
+with the process and thread backends, and reports orders per second.
+"""
+
+import argparse
+import time
+from decimal import Decimal
+
+from paradex_py.account.account import ParadexAccount
+from paradex_py.account.signing_executor import SigningExecutor
+from paradex_py.account.utils import typed_data_to_message_hash
+from paradex_py.api.models import SystemConfigSchema
+from paradex_py.common.order import Order, OrderSide, OrderType
+from paradex_py.message.order import build_order_message
+
+# Offline config (no network access needed); values of the testnet config
+CONFIG = {
+    "starknet_gateway_url": "https://potc-testnet-sepolia.starknet.io",
+    "starknet_fullnode_rpc_url": "https://pathfinder.api.testnet.paradex.trade/rpc/v0.5",
+    "starknet_fullnode_rpc_base_url": "https://pathfinder.api.testnet.paradex.trade",
+    "starknet_chain_id": "PRIVATE_SN_POTC_SEPOLIA",
+    "block_explorer_url": "https://voyager.testnet.paradex.trade/",
+    "paraclear_address": "0x286003f7c7bfc3f94e8f0af48b48302e7aee2fb13c23b141479ba00832ef2c6",
+    "paraclear_decimals": 8,
+    "paraclear_account_proxy_hash": "0x3530cc4759d78042f1b543bf797f5f3d647cde0388c33734cf91b7f7b9314a9",
+    "paraclear_account_hash": "0x41cb0280ebadaa75f996d8d92c6f265f6d040bb3ba442e5f86a554f1765244e",
+    "oracle_address": "0x2c6a867917ef858d6b193a0ff9e62b46d0dc760366920d631715d58baeaca1f",
+    "bridged_tokens": [],
+    "l1_core_contract_address": "0x582CC5d9b509391232cd544cDF9da036e55833Af",
+    "l1_operator_address": "0x11bACdFbBcd3Febe5e8CEAa75E0Ef6444d9B45FB",
+    "l1_chain_id": "11155111",
+    "liquidation_fee": "0.2",
+}
+L1_ADDRESS = "0xd2c7314539dCe7752c8120af4eC2AA750Cf2035e"
+L2_PRIVATE_KEY = "0x543b6cf6c91817a87174aaea4fb370ac1c694e864d7740d728f8344d53e815"
+
+
+def make_orders(count: int) -> list[Order]:
+    return [
+        Order(
+            market="BTC-USD-PERP",
+            order_type=OrderType.Limit,
+            order_side=OrderSide.Buy if i % 2 else OrderSide.Sell,
+            size=Decimal("0.01"),
+            limit_price=Decimal(60000 + i),
+        )
+        for i in range(count)
+    ]
+
+
+def bench_hash(account: ParadexAccount, count: int) -> None:
+    orders = make_orders(count)
+    hasher = account.order_hasher
+    hasher.order_hash(orders[0])  # Warm caches
+
+    start = time.perf_counter()
+    expected = [
+        typed_data_to_message_hash(build_order_message(account.l2_chain_id, o), account.l2_address) for o in orders
+    ]
+    generic = (time.perf_counter() - start) / count
+
+    start = time.perf_counter()
+    hashes = [hasher.order_hash(order) for order in orders]
+    fast = (time.perf_counter() - start) / count
+    if hashes != expected:
+        raise RuntimeError("OrderHasher hashes differ from typed-data hashes")
+    print(f"order hash: typed data {generic * 1e6:.0f}us, OrderHasher {fast * 1e6:.0f}us ({generic / fast:.1f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batch order signing")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Batch sizes")
+    parser.add_argument("--workers", type=int, default=None, help="Pool size (default: CPU count)")
+    parser.add_argument("--hash-orders", type=int, default=200, help="Orders hashed per path")
+    args = parser.parse_args()
+
+    config = SystemConfigSchema().load(CONFIG)
+    account = ParadexAccount(config=config, l1_address=L1_ADDRESS, l2_private_key=L2_PRIVATE_KEY)
+    bench_hash(account, args.hash_orders)
+    executors = {
+        "process": SigningExecutor(max_workers=args.workers, backend="process", min_batch_size=1),
+        "thread": SigningExecutor(max_workers=args.workers, backend="thread", min_batch_size=1),
+    }
+    # Start the pools outside the timed section
+    for executor in executors.values():
+        executor.sign_orders(account, make_orders(executor.max_workers))
+
+    print(f"{'orders':>8}{'serial/s':>12}{'process/s':>12}{'thread/s':>12}")
+    for size in args.sizes:
+        orders = make_orders(size)
+        start = time.perf_counter()
+        serial = [account.sign_order(order) for order in orders]
+        rates = [size / (time.perf_counter() - start)]
+        for name, executor in executors.items():
+            start = time.perf_counter()
+            signatures = executor.sign_orders(account, orders)
+            rates.append(size / (time.perf_counter() - start))
+            if signatures != serial:
+                raise RuntimeError(f"{name} signatures differ from serial signatures")
+        print(f"{size:>8}" + "".join(f"{rate:>12,.0f}" for rate in rates))
+
+    for executor in executors.values():
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
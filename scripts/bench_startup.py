@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark client startup for many accounts.
+
+Constructs and authenticates (onboarding + JWT) `Paradex` clients for 1,
+10 and 100 accounts against a mocked HTTP transport that answers every
+request after a simulated round trip, and reports the wall time of each
+strategy:
+
+- fetch: every client fetches the system config (no cache)
+- disk cache: configs are read from a warm `SystemConfigCache`
+- disk cache + eager: as above, then the account address and Starknet
+  account are derived immediately (what every constructor used to do)
+"""
+
+import argparse
+import tempfile
+import time
+
+import httpx
+
+from paradex_py import Paradex
+from paradex_py.api.config_cache import SystemConfigCache
+from paradex_py.api.http_client import HttpClient
+from paradex_py.environment import TESTNET
+
+L1_ADDRESS = "0xd2c7314539dCe7752c8120af4eC2AA750Cf2035e"
+SYSTEM_CONFIG = {
+    "starknet_gateway_url": "https://potc-testnet-sepolia.starknet.io",
+    "starknet_fullnode_rpc_url": "https://pathfinder.api.testnet.paradex.trade/rpc/v0.5",
+    "starknet_fullnode_rpc_base_url": "https://pathfinder.api.testnet.paradex.trade",
+    "starknet_chain_id": "PRIVATE_SN_POTC_SEPOLIA",
+    "block_explorer_url": "https://voyager.testnet.paradex.trade/",
+    "paraclear_address": "0x286003f7c7bfc3f94e8f0af48b48302e7aee2fb13c23b141479ba00832ef2c6",
+    "paraclear_decimals": 8,
+    "paraclear_account_proxy_hash": "0x3530cc4759d78042f1b543bf797f5f3d647cde0388c33734cf91b7f7b9314a9",
+    "paraclear_account_hash": "0x41cb0280ebadaa75f996d8d92c6f265f6d040bb3ba442e5f86a554f1765244e",
+    "oracle_address": "0x2c6a867917ef858d6b193a0ff9e62b46d0dc760366920d631715d58baeaca1f",
+    "bridged_tokens": [
+        {
+            "name": "TEST USDC",
+            "symbol": "USDC",
+            "decimals": 6,
+            "l1_token_address": "0x29A873159D5e14AcBd63913D4A7E2df04570c666",
+            "l1_bridge_address": "0x8586e05adc0C35aa11609023d4Ae6075Cb813b4C",
+            "l2_token_address": "0x6f373b346561036d98ea10fb3e60d2f459c872b1933b50b21fe6ef4fda3b75e",
+            "l2_bridge_address": "0x46e9237f5408b5f899e72125dd69bd55485a287aaf24663d3ebe00d237fc7ef",
+        }
+    ],
+    "l1_core_contract_address": "0x582CC5d9b509391232cd544cDF9da036e55833Af",
+    "l1_operator_address": "0x11bACdFbBcd3Febe5e8CEAa75E0Ef6444d9B45FB",
+    "l1_chain_id": "11155111",
+    "liquidation_fee": "0.2",
+}
+
+
+def make_http_client(rtt: float) -> HttpClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(rtt)
+        if request.url.path.endswith("/system/config"):
+            return httpx.Response(200, json=SYSTEM_CONFIG)
+        if "/auth/" in request.url.path:
+            return httpx.Response(200, json={"jwt_token": "jwt"})
+        return httpx.Response(200, json={})
+
+    return HttpClient(http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def start(accounts: int, http_client: HttpClient, cache: SystemConfigCache | None, eager: bool) -> float:
+    begin = time.perf_counter()
+    for i in range(accounts):
+        paradex = Paradex(
+            env=TESTNET,
+            l1_address=L1_ADDRESS,
+            l2_private_key=hex(0x1000 + i),
+            http_client=http_client,
+            auto_start_ws_reader=False,
+            config_cache=cache,
+        )
+        if eager and paradex.account is not None:
+            paradex.account.starknet  # noqa: B018
+    return time.perf_counter() - begin
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark client startup")
+    parser.add_argument("--accounts", type=int, nargs="+", default=[1, 10, 100], help="Numbers of accounts")
+    parser.add_argument("--rtt", type=float, default=50.0, help="Simulated round trip per request (ms)")
+    args = parser.parse_args()
+
+    http_client = make_http_client(args.rtt / 1000)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = SystemConfigCache(cache_dir=cache_dir)
+        start(1, http_client, cache, eager=False)  # warm the cache
+
+        print(f"{'accounts':>8}  {'fetch':>10}  {'disk cache':>12}  {'disk cache + eager':>20}")
+        for accounts in args.accounts:
+            fetch = start(accounts, http_client, None, eager=False)
+            cached = start(accounts, http_client, cache, eager=False)
+            eager = start(accounts, http_client, cache, eager=True)
+            print(f"{accounts:>8}  {fetch * 1e3:>8.1f}ms  {cached * 1e3:>10.1f}ms  {eager * 1e3:>18.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark WebSocket frame processing throughput.
+
+Replays synthetic BBO / order book / trades frames through
+`ParadexWebsocketClient.inject()` for every installed decoder and reports
+messages per second, with and without the unsubscribed-channel fast path.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from paradex_py.api.ws_client import ParadexWebsocketClient
+from paradex_py.api.ws_decoder import MSGSPEC_AVAILABLE, ORJSON_AVAILABLE
+from paradex_py.environment import TESTNET
+
+
+def build_frames(count: int) -> list[bytes]:
+    frames = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            channel = "bbo.BTC-USD-PERP"
+            data = {"market": "BTC-USD-PERP", "bid": f"{65000 + i % 100}.1", "bid_size": "1.5", "ask": "65100.2"}
+        elif kind == 1:
+            channel = "order_book.ETH-USD-PERP.snapshot@15@100ms"
+            levels = [{"side": "BUY", "price": f"{3000 - j}.5", "size": "2.1"} for j in range(15)]
+            data = {"market": "ETH-USD-PERP", "seq_no": i, "inserts": levels, "updates": [], "deletes": []}
+        else:
+            channel = "trades.ALL"
+            data = {"id": str(i), "market": "SOL-USD-PERP", "side": "SELL", "size": "10", "price": "150.25"}
+        frame = {"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}}
+        frames.append(json.dumps(frame).encode())
+    return frames
+
+
+async def run(decoder: str, frames: list[bytes], subscribed: list[str]) -> float:
+    client = ParadexWebsocketClient(env=TESTNET, decoder=decoder)
+
+    async def callback(ws_channel, message):
+        return None
+
+    for channel in subscribed:
+        client.callbacks[channel] = callback
+
+    start = time.perf_counter()
+    for frame in frames:
+        await client.inject(frame)
+    return len(frames) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark WebSocket frame decoding")
+    parser.add_argument("--frames", type=int, default=60_000, help="Number of frames to replay")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    frames = build_frames(args.frames)
+    decoders = ["json"] + (["orjson"] if ORJSON_AVAILABLE else []) + (["msgspec"] if MSGSPEC_AVAILABLE else [])
+    scenarios = {
+        "all channels": ["bbo.BTC-USD-PERP", "order_book.ETH-USD-PERP.snapshot@15@100ms", "trades.ALL"],
+        "bbo only": ["bbo.BTC-USD-PERP"],
+    }
+
+    print(f"{'decoder':<10}{'scenario':<16}{'msgs/sec':>12}")
+    for decoder in decoders:
+        for scenario, subscribed in scenarios.items():
+            rate = asyncio.run(run(decoder, frames, subscribed))
+            print(f"{decoder:<10}{scenario:<16}{rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
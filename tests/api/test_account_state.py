@@ -0,0 +1,135 @@
+"""Tests for AccountState (local account state kept in sync from WS + REST)."""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from paradex_py.api.account_state import AccountState
+from paradex_py.api.ws_client import ParadexWebsocketClient
+from paradex_py.environment import TESTNET
+from tests.mocks.ws import frame
+
+
+def order(order_id, status="OPEN", updated_at=100, client_id=None, market="BTC-USD-PERP", remaining_size="1"):
+    return {
+        "id": order_id,
+        "client_id": client_id,
+        "market": market,
+        "status": status,
+        "remaining_size": remaining_size,
+        "last_updated_at": updated_at,
+    }
+
+
+def rest_api_client(orders=(), positions=(), free_collateral="1000", usdc="5000"):
+    api_client = MagicMock()
+    api_client.fetch_orders = AsyncMock(return_value={"results": list(orders)})
+    api_client.fetch_positions = AsyncMock(return_value={"results": list(positions)})
+    api_client.fetch_balances = AsyncMock(
+        return_value={"results": [{"token": "USDC", "size": usdc, "last_updated_at": 50}]}
+    )
+    api_client.fetch_account_summary = AsyncMock(
+        return_value={"free_collateral": free_collateral, "settlement_asset": "USDC", "updated_at": 50}
+    )
+    return api_client
+
+
+class TestAccountState:
+    @pytest.mark.asyncio
+    async def test_seed_and_apply_updates(self):
+        ws_client = ParadexWebsocketClient(env=TESTNET)
+        api_client = rest_api_client(
+            orders=[order("1", client_id="c1")],
+            positions=[
+                {"market": "ETH-USD-PERP", "side": "SHORT", "size": "-2", "status": "OPEN", "last_updated_at": 1}
+            ],
+        )
+        updates = []
+        state = AccountState(ws_client, api_client, reconcile_interval=None, on_update=lambda ch, d: updates.append(d))
+
+        await state.start()
+        assert {"orders.ALL", "fills.ALL", "positions", "account", "balance_events"} <= set(ws_client.callbacks)
+        assert state.order_by_client_id("c1")["id"] == "1"
+        assert state.position_size("ETH-USD-PERP") == Decimal("-2")
+        assert state.free_collateral() == Decimal("1000")
+        assert state.balance() == Decimal("5000")
+
+        await ws_client.inject(frame("orders.ALL", order("2", client_id="c2", updated_at=200)))
+        await ws_client.inject(frame("orders.ALL", order("1", status="CLOSED", client_id="c1", updated_at=300)))
+        assert [o["id"] for o in state.open_orders()] == ["2"]
+        assert state.order_by_client_id("c1") is None
+
+        await ws_client.inject(frame("account", {"free_collateral": "900", "updated_at": 400}))
+        await ws_client.inject(frame("positions", {"market": "ETH-USD-PERP", "status": "CLOSED", "last_updated_at": 5}))
+        await ws_client.inject(frame("balance_events", {"created_at": 500, "settlement_asset_balance_after": "4990"}))
+        await ws_client.inject(frame("fills.ALL", {"id": "f1", "market": "BTC-USD-PERP"}))
+        await ws_client.inject(frame("fills.ALL", {"id": "f1", "market": "BTC-USD-PERP"}))
+        assert state.free_collateral() == Decimal("900")
+        assert state.position("ETH-USD-PERP") is None
+        assert state.balance("USDC") == Decimal("4990")
+        assert list(state.fills) == ["f1"]
+        assert len(updates) == 6
+
+        await state.stop()
+        assert "orders.ALL" not in ws_client.callbacks
+
+    def test_stale_updates_are_dropped(self):
+        state = AccountState(MagicMock(), MagicMock())
+
+        assert state.apply_order(order("1", updated_at=200, remaining_size="0.5"))
+        assert not state.apply_order(order("1", updated_at=100, remaining_size="1"))
+        assert state.order("1")["remaining_size"] == "0.5"
+
+        # A late OPEN update does not resurrect a closed order
+        assert state.apply_order(order("1", status="CLOSED", updated_at=300))
+        assert not state.apply_order(order("1", updated_at=250))
+        assert state.order("1") is None
+        assert state.stats().stale_updates == 2
+
+    @pytest.mark.asyncio
+    async def test_reconcile_corrects_missed_updates(self):
+        api_client = rest_api_client(orders=[order("1"), order("2")])
+        state = AccountState(MagicMock(), api_client)
+        await state.reconcile()
+
+        # Order 2 was filled and order 3 placed while disconnected
+        api_client.fetch_orders.return_value = {"results": [order("1"), order("3")]}
+        api_client.fetch_account_summary.return_value = {"free_collateral": "800", "updated_at": 60}
+
+        assert await state.reconcile() == 3
+        assert set(state.orders) == {"1", "3"}
+        assert state.free_collateral() == Decimal("800")
+        assert state.stats().reconcile_corrections == 3
+
+    @pytest.mark.asyncio
+    async def test_reconcile_ignores_closed_positions_not_held(self):
+        eth = {"market": "ETH-USD-PERP", "size": "-2", "status": "OPEN", "last_updated_at": 1}
+        btc = {"market": "BTC-USD-PERP", "size": "0", "status": "CLOSED", "last_updated_at": 1}
+        api_client = rest_api_client(positions=[eth, btc])
+        state = AccountState(MagicMock(), api_client)
+        await state.reconcile()
+        assert set(state.positions) == {"ETH-USD-PERP"}
+
+        assert await state.reconcile() == 0
+
+        # ETH closed while disconnected
+        api_client.fetch_positions.return_value = {"results": [{**eth, "status": "CLOSED", "last_updated_at": 2}, btc]}
+        assert await state.reconcile() == 1
+        assert state.positions == {}
+        assert await state.reconcile() == 0
+        assert state.stats().reconcile_corrections == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_api_client_runs_in_thread(self):
+        api_client = MagicMock()
+        api_client.fetch_orders.return_value = {"results": [order("1")]}
+        api_client.fetch_positions.return_value = {"results": []}
+        api_client.fetch_balances.return_value = {"results": []}
+        api_client.fetch_account_summary.return_value = {"free_collateral": "1", "updated_at": 1}
+        state = AccountState(MagicMock(), api_client, market="BTC-USD-PERP")
+
+        await state.reconcile()
+
+        api_client.fetch_orders.assert_called_once_with({"market": "BTC-USD-PERP"})
+        assert state.order("1") is not None
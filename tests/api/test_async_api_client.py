@@ -0,0 +1,232 @@
+"""Tests for the asyncio REST client."""
+
+import json
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from paradex_py.api.async_api_client import AsyncParadexApiClient
+from paradex_py.api.async_http_client import AsyncHttpClient
+from paradex_py.api.http_client import HttpMethod
+from paradex_py.api.protocols import DefaultRetryStrategy
+from paradex_py.common.order import Order, OrderSide, OrderType
+from paradex_py.environment import TESTNET
+from tests.mocks.api_client import MOCK_CONFIG
+
+API_URL = "https://api.testnet.paradex.trade/v1"
+
+
+class RecordingHandler:
+    """MockTransport handler that records requests and replays canned responses."""
+
+    def __init__(self, routes=None):
+        self.routes = routes or {}
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        key = (request.method, request.url.path)
+        response = self.routes.get(key)
+        if callable(response):
+            return response(request)
+        if response is None:
+            return httpx.Response(200, json={"results": []})
+        return response
+
+
+def make_client(handler, **kwargs) -> AsyncParadexApiClient:
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncParadexApiClient(env=TESTNET, http_client=http_client, **kwargs)
+
+
+class MockAccount:
+    l2_public_key = 0x1234
+    jwt_token = ""
+
+    def onboarding_headers(self):
+        return {"PARADEX-STARKNET-ACCOUNT": "0x1"}
+
+    def auth_headers(self):
+        return {"PARADEX-STARKNET-ACCOUNT": "0x1", "PARADEX-STARKNET-SIGNATURE": "sig"}
+
+    def set_jwt_token(self, jwt_token):
+        self.jwt_token = jwt_token
+
+    def sign_order(self, order):
+        return '["1","2"]'
+
+
+class TestAsyncHttpClient:
+    @pytest.mark.asyncio
+    async def test_request_returns_json(self):
+        handler = RecordingHandler({("GET", "/test"): httpx.Response(200, json={"ok": True})})
+        client = AsyncHttpClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        result = await client.request(url="https://example.com/test", http_method=HttpMethod.GET)
+
+        assert result == {"ok": True}
+        assert client.client.headers["Content-Type"] == "application/json"
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises(self):
+        error = {"error": "VALIDATION_ERROR", "message": "bad request", "data": None}
+        handler = RecordingHandler({("GET", "/test"): httpx.Response(400, json=error)})
+        client = AsyncHttpClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        with pytest.raises(ValueError, match="bad request"):
+            await client.request(url="https://example.com/test", http_method=HttpMethod.GET)
+
+    @pytest.mark.asyncio
+    async def test_retry_uses_async_sleep(self):
+        responses = iter([httpx.Response(503, json={}), httpx.Response(200, json={"ok": True})])
+        handler = RecordingHandler({("GET", "/test"): lambda request: next(responses)})
+        client = AsyncHttpClient(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            retry_strategy=DefaultRetryStrategy(max_retries=2, base_delay=0.5),
+        )
+
+        with patch("paradex_py.api.async_http_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await client.request(url="https://example.com/test", http_method=HttpMethod.GET)
+
+        assert result == {"ok": True}
+        assert len(handler.requests) == 2
+        mock_sleep.assert_awaited_once_with(0.5)
+
+    @pytest.mark.asyncio
+    async def test_request_hook_redacts_headers(self):
+        hook = MagicMock()
+        handler = RecordingHandler({("POST", "/test"): httpx.Response(200, json={})})
+        client = AsyncHttpClient(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), request_hook=hook
+        )
+
+        await client.request(
+            url="https://example.com/test", http_method=HttpMethod.POST, headers={"Authorization": "Bearer x"}
+        )
+
+        method, url, headers = hook.on_request.call_args[0]
+        assert (method, url) == ("POST", "https://example.com/test")
+        assert headers["Authorization"] == "[REDACTED]"
+        assert hook.on_response.call_args[0][2] == 200
+
+
+class TestAsyncParadexApiClient:
+    @pytest.mark.asyncio
+    async def test_public_endpoint(self):
+        handler = RecordingHandler(
+            {("GET", "/v1/markets"): httpx.Response(200, json={"results": [{"symbol": "BTC-USD-PERP"}]})}
+        )
+        client = make_client(handler)
+
+        result = await client.fetch_markets({"market": "BTC-USD-PERP"})
+
+        assert result["results"][0]["symbol"] == "BTC-USD-PERP"
+        assert str(handler.requests[0].url) == f"{API_URL}/markets?market=BTC-USD-PERP"
+
+    @pytest.mark.asyncio
+    async def test_fetch_system_config(self):
+        config = {k: v for k, v in MOCK_CONFIG.items() if k != "starknet_fullnode_rpc_base_url"}
+        handler = RecordingHandler({("GET", "/v1/system/config"): httpx.Response(200, json=config)})
+        client = make_client(handler)
+
+        system_config = await client.fetch_system_config()
+
+        assert system_config.starknet_chain_id == MOCK_CONFIG["starknet_chain_id"]
+        assert system_config.starknet_fullnode_rpc_base_url == MOCK_CONFIG["starknet_fullnode_rpc_base_url"]
+
+    @pytest.mark.asyncio
+    async def test_init_account_authenticates(self):
+        handler = RecordingHandler(
+            {
+                ("POST", "/v1/onboarding"): httpx.Response(200, json={}),
+                ("POST", "/v1/auth/0x1234"): httpx.Response(200, json={"jwt_token": "jwt-1"}),
+                ("GET", "/v1/orders"): httpx.Response(200, json={"results": []}),
+            }
+        )
+        client = make_client(handler)
+        account = MockAccount()
+
+        await client.init_account(account)  # type: ignore[arg-type]
+        await client.fetch_orders()
+
+        assert account.jwt_token == "jwt-1"  # noqa: S105
+        assert [r.url.path for r in handler.requests] == ["/v1/onboarding", "/v1/auth/0x1234", "/v1/orders"]
+        assert handler.requests[-1].headers["Authorization"] == "Bearer jwt-1"
+
+    @pytest.mark.asyncio
+    async def test_stale_token_is_refreshed_before_request(self):
+        handler = RecordingHandler({("POST", "/v1/auth/0x1234"): httpx.Response(200, json={"jwt_token": "jwt-2"})})
+        client = make_client(handler)
+        client.account = MockAccount()  # type: ignore[assignment]
+        client.auth_timestamp = 0
+
+        await client.fetch_positions()
+
+        assert [r.url.path for r in handler.requests] == ["/v1/auth/0x1234", "/v1/positions"]
+
+    @pytest.mark.asyncio
+    async def test_submit_order_with_account_signature(self):
+        handler = RecordingHandler({("POST", "/v1/orders"): httpx.Response(201, json={"id": "order-1"})})
+        client = make_client(handler)
+        client.account = MockAccount()  # type: ignore[assignment]
+        client.set_token("jwt")
+
+        order = Order(
+            market="BTC-USD-PERP",
+            order_type=OrderType.Limit,
+            order_side=OrderSide.Buy,
+            size=Decimal("0.1"),
+            limit_price=Decimal(50000),
+        )
+        result = await client.submit_order(order)
+
+        assert result == {"id": "order-1"}
+        body = json.loads(handler.requests[0].content)
+        assert body["signature"] == '["1","2"]'
+        assert body["price"] == "50000"
+
+    @pytest.mark.asyncio
+    async def test_submit_orders_batch_with_custom_signer(self):
+        signer = MagicMock()
+        signer.sign_batch.side_effect = lambda orders: [{**o, "signature": "custom"} for o in orders]
+        handler = RecordingHandler({("POST", "/v1/orders/batch"): httpx.Response(200, json={"orders": []})})
+        client = make_client(handler, auto_auth=False, signer=signer)
+
+        orders = [
+            Order(market="ETH-USD-PERP", order_type=OrderType.Market, order_side=OrderSide.Sell, size=Decimal(1))
+            for _ in range(3)
+        ]
+        await client.submit_orders_batch(orders)
+
+        body = json.loads(handler.requests[0].content)
+        assert [o["signature"] for o in body] == ["custom"] * 3
+
+    @pytest.mark.asyncio
+    async def test_cancel_orders_batch_requires_ids(self):
+        client = make_client(RecordingHandler(), auto_auth=False)
+
+        with pytest.raises(ValueError, match="Must provide either"):
+            await client.cancel_orders_batch()
+
+    @pytest.mark.asyncio
+    async def test_block_trades_list(self):
+        handler = RecordingHandler({("GET", "/v1/block-trades"): httpx.Response(200, json={"results": []})})
+        client = make_client(handler, auto_auth=False)
+
+        result = await client.list_block_trades(status="CREATED")
+
+        assert result.results == []
+        assert handler.requests[0].url.params["status"] == "CREATED"
+
+    @pytest.mark.asyncio
+    async def test_injected_async_http_client_keeps_options(self):
+        retry_strategy = DefaultRetryStrategy(max_retries=1)
+        wrapper = AsyncHttpClient(default_timeout=3.0, retry_strategy=retry_strategy)
+
+        async with AsyncParadexApiClient(env=TESTNET, http_client=wrapper) as client:
+            assert client.client is wrapper.client
+            assert client.default_timeout == 3.0
+            assert client.retry_strategy is retry_strategy
@@ -0,0 +1,214 @@
+"""Tests for recording and replaying WebSocket and REST traffic."""
+
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from paradex_py.api.async_http_client import AsyncHttpClient
+from paradex_py.api.capture import (
+    HTTP_RESPONSE,
+    REDACTED,
+    WS_FRAME,
+    ZSTD_AVAILABLE,
+    CaptureReplayer,
+    CaptureWriter,
+    read_capture,
+)
+from paradex_py.api.http_client import HttpClient
+from paradex_py.api.ws_client import ParadexWebsocketChannel, ParadexWebsocketClient
+from paradex_py.environment import TESTNET
+from tests.mocks.ws import frame
+
+
+def bbo_frame(n: int) -> str:
+    data = {"market": "BTC-USD-PERP", "bid": str(65000 + n), "ask": str(65001 + n), "seq_no": n}
+    return frame("bbo.BTC-USD-PERP", data)
+
+
+class ListWebSocket:
+    def __init__(self, frames: list):
+        self.frames = list(frames)
+
+    async def recv(self):
+        return self.frames.pop(0)
+
+
+async def collecting_client() -> tuple[ParadexWebsocketClient, list[int]]:
+    received: list[int] = []
+
+    async def on_bbo(ws_channel: ParadexWebsocketChannel, message: dict) -> None:
+        received.append(message["params"]["data"]["seq_no"])
+
+    client = ParadexWebsocketClient(env=TESTNET, auto_start_reader=False)
+    await client.subscribe(ParadexWebsocketChannel.BBO, on_bbo, params={"market": "BTC-USD-PERP"})
+    return client, received
+
+
+def test_write_and_read_records(tmp_path):
+    path = tmp_path / "session.pdxcap"
+    with CaptureWriter(path) as capture:
+        capture.ws_frame("text")
+        capture.ws_frame(b"\x00binary")
+        capture.http_response("GET", "https://api/v1/markets", {"market": "BTC-USD-PERP"}, 200, '{"results":[]}')
+    assert capture.records == 3
+
+    records = list(read_capture(path))
+    assert [(r.kind, r.payload) for r in records[:2]] == [(WS_FRAME, "text"), (WS_FRAME, b"\x00binary")]
+    assert records[2].kind == HTTP_RESPONSE
+    assert records[2].http() == {
+        "method": "GET",
+        "url": "https://api/v1/markets",
+        "params": {"market": "BTC-USD-PERP"},
+        "status": 200,
+        "body": '{"results":[]}',
+    }
+    timestamps = [r.timestamp_ns for r in records]
+    assert timestamps == sorted(timestamps)
+
+
+def test_jwt_tokens_are_redacted(tmp_path):
+    path = tmp_path / "session.pdxcap"
+    with CaptureWriter(path) as capture:
+        capture.http_response("POST", "https://api/v1/auth", None, 200, '{"jwt_token": "eyJhbGciOi.secret.sig"}')
+    [record] = read_capture(path)
+    assert json.loads(record.http()["body"]) == {"jwt_token": REDACTED}
+    assert b"secret" not in path.read_bytes()
+
+
+def test_concurrent_writes_do_not_interleave(tmp_path):
+    path = tmp_path / "session.pdxcap"
+    frames = [f"thread-{t}-" + "x" * (100 + n) for t in range(4) for n in range(200)]
+    with CaptureWriter(path) as capture:
+
+        def write(thread: int) -> None:
+            for frame in frames[thread * 200 : (thread + 1) * 200]:
+                capture.ws_frame(frame)
+
+        threads = [threading.Thread(target=write, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert capture.records == len(frames)
+    assert sorted(r.payload for r in read_capture(path)) == sorted(frames)
+
+
+def test_truncated_tail_and_append(tmp_path):
+    path = tmp_path / "session.pdxcap"
+    with CaptureWriter(path) as capture:
+        capture.ws_frame("one")
+        capture.ws_frame("two")
+    with open(path, "r+b") as f:
+        f.truncate(path.stat().st_size - 1)
+    assert [r.payload for r in read_capture(path)] == ["one"]
+
+    (tmp_path / "other.pdxcap").write_bytes(b"not a capture")
+    with pytest.raises(ValueError, match="not a version 1 capture"):
+        list(read_capture(tmp_path / "other.pdxcap"))
+
+    path.unlink()
+    for payload in ("one", "two"):
+        with CaptureWriter(path) as capture:
+            capture.ws_frame(payload)
+    assert [r.payload for r in read_capture(path)] == ["one", "two"]
+    if not ZSTD_AVAILABLE:
+        with pytest.raises(ValueError, match="requires the zstandard package"):
+            CaptureWriter(path, compress=True)
+
+
+@pytest.mark.asyncio
+async def test_record_ws_frames_and_replay(tmp_path):
+    path = tmp_path / "session.pdxcap"
+    frames = [bbo_frame(n) for n in range(1, 6)]
+    with CaptureWriter(path) as capture:
+        client, received = await collecting_client()
+        client.capture = capture
+        client.ws = ListWebSocket(frames)  # type: ignore[assignment]
+        for _ in frames:
+            assert await client.pump_once()
+    assert received == [1, 2, 3, 4, 5]
+
+    replayed, replayed_received = await collecting_client()
+    stats = await CaptureReplayer(path, speed=None).replay_ws(replayed)
+    assert replayed_received == [1, 2, 3, 4, 5]
+    assert stats.frames == 5
+    assert stats.frames_per_second > 0
+
+
+@pytest.mark.asyncio
+async def test_replay_keeps_recorded_spacing(tmp_path):
+    path = tmp_path / "session.pdxcap"
+    with CaptureWriter(path) as capture:
+        capture.ws_frame(bbo_frame(1))
+        time.sleep(0.2)
+        capture.ws_frame(bbo_frame(2))
+    with CaptureWriter(path) as capture:
+        # A second session restarts the clock; it is replayed after the first
+        capture.ws_frame(bbo_frame(3))
+
+    client, received = await collecting_client()
+    stats = await CaptureReplayer(path, speed=2.0).replay_ws(client)
+    assert received == [1, 2, 3]
+    assert 0.09 <= stats.elapsed < 1.0
+
+    with pytest.raises(ValueError, match="speed must be positive"):
+        CaptureReplayer(path, speed=0)
+
+
+def test_record_http_responses_and_replay(tmp_path):
+    path = tmp_path / "session.pdxcap"
+    answers = iter([{"n": 1}, {"n": 2}])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=next(answers))
+
+    with CaptureWriter(path) as capture:
+        client = HttpClient(http_client=httpx.Client(transport=httpx.MockTransport(handler)), capture=capture)
+        assert client.get("https://api.test", "markets", params={"market": "BTC-USD-PERP"}) == {"n": 1}
+        assert client.get("https://api.test", "markets", params={"market": "BTC-USD-PERP"}) == {"n": 2}
+
+    replayer = CaptureReplayer(path)
+    client = HttpClient(http_client=httpx.Client(transport=replayer.http_transport()))
+    responses = [client.get("https://api.test", "markets", params={"market": "BTC-USD-PERP"}) for _ in range(3)]
+    assert responses == [{"n": 1}, {"n": 2}, {"n": 2}]
+    response = client.client.get("https://api.test/markets", params={"market": "ETH-USD-PERP"})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_async_http_client_records_responses(tmp_path):
+    path = tmp_path / "session.pdxcap"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": []})
+
+    with CaptureWriter(path) as capture:
+        client = AsyncHttpClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), capture=capture)
+        assert await client.get("https://api.test", "markets") == {"results": []}
+        await client.client.aclose()
+
+    [record] = read_capture(path)
+    assert record.http()["url"] == "https://api.test/markets"
+    assert json.loads(record.http()["body"]) == {"results": []}
+
+
+@pytest.mark.asyncio
+async def test_compressed_capture(tmp_path):
+    pytest.importorskip("zstandard")
+    path = tmp_path / "session.pdxcap.zst"
+    frames = [bbo_frame(n) for n in range(1, 4)]
+    with CaptureWriter(path, compress=True) as capture:
+        for frame in frames:
+            capture.ws_frame(frame)
+    with CaptureWriter(path, compress=True) as capture:
+        capture.ws_frame(bbo_frame(4))
+    with pytest.raises(ValueError, match="was not written with compress=False"):
+        CaptureWriter(path)
+
+    client, received = await collecting_client()
+    stats = await CaptureReplayer(path, speed=None).replay_ws(client)
+    assert received == [1, 2, 3, 4]
+    assert stats.frames == 4
@@ -0,0 +1,104 @@
+"""Tests for the on-disk system config cache and lazy account setup."""
+
+import json
+from unittest.mock import patch
+
+import httpx
+
+from paradex_py import Paradex
+from paradex_py.account.account import ParadexAccount
+from paradex_py.account.utils import flatten_signature
+from paradex_py.api.config_cache import SystemConfigCache
+from paradex_py.api.http_client import HttpClient
+from paradex_py.environment import TESTNET
+from paradex_py.message.auth import build_auth_message
+from paradex_py.message.onboarding import build_onboarding_message
+from tests.mocks.api_client import MOCK_CONFIG, MockApiClient
+
+API_URL = "https://api.testnet.paradex.trade/v1"
+TEST_L1_ADDRESS = "0xd2c7314539dCe7752c8120af4eC2AA750Cf2035e"
+TEST_L2_PRIVATE_KEY = "0x543b6cf6c91817a87174aaea4fb370ac1c694e864d7740d728f8344d53e815"
+TEST_L2_ADDRESS = 0x129C135ED63DF9353885E292BE4426B8ED6122B13C6C0E1BB787288A1F5ADFA
+
+
+def test_store_and_load(tmp_path):
+    cache = SystemConfigCache(cache_dir=tmp_path)
+    config = MockApiClient().fetch_system_config()
+
+    assert cache.load(API_URL) is None
+    cache.store(API_URL, config)
+
+    assert cache.load(API_URL) == config
+    assert cache.load("https://api.prod.paradex.trade/v1") is None
+    cache.invalidate(API_URL)
+    assert cache.load(API_URL) is None
+
+
+def test_expired_foreign_and_corrupt_entries_are_ignored(tmp_path):
+    cache = SystemConfigCache(cache_dir=tmp_path, ttl=60)
+    cache.store(API_URL, MockApiClient().fetch_system_config())
+    path = cache.path(API_URL)
+    entry = json.loads(path.read_text())
+
+    path.write_text(json.dumps({**entry, "fetched_at": entry["fetched_at"] - 61}))
+    assert cache.load(API_URL) is None
+
+    path.write_text(json.dumps({**entry, "version": "0:old"}))
+    assert cache.load(API_URL) is None
+
+    path.write_text("{not json")
+    assert cache.load(API_URL) is None
+
+
+def test_paradex_fetches_config_once(tmp_path):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, json=MOCK_CONFIG)
+
+    cache = SystemConfigCache(cache_dir=tmp_path)
+    for _ in range(3):
+        paradex = Paradex(
+            env=TESTNET,
+            http_client=HttpClient(http_client=httpx.Client(transport=httpx.MockTransport(handler))),
+            auto_start_ws_reader=False,
+            config_cache=cache,
+        )
+        assert paradex.config.starknet_chain_id == MOCK_CONFIG["starknet_chain_id"]
+
+    assert requests == ["/v1/system/config"]
+
+
+def test_account_derives_keys_and_starknet_lazily():
+    config = MockApiClient().fetch_system_config()
+
+    with (
+        patch("paradex_py.account.account.KeyPair.from_private_key") as key_pair,
+        patch("paradex_py.account.account.FullNodeClient") as full_node_client,
+    ):
+        account = ParadexAccount(config=config, l1_address=TEST_L1_ADDRESS, l2_private_key=TEST_L2_PRIVATE_KEY)
+        key_pair.assert_not_called()
+        full_node_client.assert_not_called()
+
+    assert account.l2_address == TEST_L2_ADDRESS
+    assert account.starknet.address == TEST_L2_ADDRESS
+    assert account.starknet is account.starknet
+
+
+def test_auth_signatures_do_not_build_starknet_account():
+    config = MockApiClient().fetch_system_config()
+    account = ParadexAccount(config=config, l1_address=TEST_L1_ADDRESS, l2_private_key=TEST_L2_PRIVATE_KEY)
+
+    with patch("paradex_py.account.account.FullNodeClient") as full_node_client:
+        headers = account.auth_headers()
+        onboarding = account.onboarding_headers()
+        full_node_client.assert_not_called()
+
+    # Same signatures as signing the typed data through the Starknet account
+    message = build_auth_message(
+        account.l2_chain_id, int(headers["PARADEX-TIMESTAMP"]), int(headers["PARADEX-SIGNATURE-EXPIRATION"])
+    )
+    assert headers["PARADEX-STARKNET-SIGNATURE"] == flatten_signature(account.starknet.sign_message(message))
+    message = build_onboarding_message(account.l2_chain_id)
+    assert onboarding["PARADEX-STARKNET-SIGNATURE"] == flatten_signature(account.starknet.sign_message(message))
@@ -0,0 +1,144 @@
+"""Tests for HTTP connection pooling, warm-up and pool statistics."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from paradex_py import Paradex
+from paradex_py.api.api_client import ParadexApiClient
+from paradex_py.api.async_api_client import AsyncParadexApiClient
+from paradex_py.api.async_http_client import AsyncHttpClient
+from paradex_py.api.http_client import HTTP2_AVAILABLE, HttpClient, HttpMethod, HttpPoolConfig
+from paradex_py.environment import TESTNET
+
+
+class SlowKeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(0.05)  # long enough for concurrent requests to overlap
+        body = json.dumps({"server_time": "1"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowKeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+class RecordingHook:
+    def __init__(self):
+        self.connections = []
+
+    def on_request(self, method, url, headers):
+        pass
+
+    def on_response(self, method, url, status_code, duration_ms):
+        pass
+
+    def on_connection(self, method, url, reused, stats):
+        self.connections.append(reused)
+
+
+def test_pool_stats_and_connection_hook(server_url):
+    hook = RecordingHook()
+    client = HttpClient(pool_config=HttpPoolConfig(keepalive_expiry=30), request_hook=hook, collect_pool_stats=True)
+
+    client.request(f"{server_url}/system/time", HttpMethod.GET)
+    client.request(f"{server_url}/system/time", HttpMethod.GET)
+
+    stats = client.get_pool_stats()
+    assert (stats.requests, stats.new_connections, stats.reused_connections) == (2, 1, 1)
+    assert stats.tls_handshakes == 0
+    assert hook.connections == [False, True]
+
+    client.reset_pool_stats()
+    assert client.get_pool_stats().requests == 0
+
+
+def test_pool_stats_disabled_by_default(server_url):
+    client = HttpClient()
+    client.request(f"{server_url}/system/time", HttpMethod.GET)
+    assert client.get_pool_stats() is None
+
+
+def test_pool_config_limits():
+    client = HttpClient(pool_config=HttpPoolConfig(max_connections=4, max_keepalive_connections=2))
+    pool = client.client._transport._pool
+    assert pool._max_connections == 4
+    assert pool._max_keepalive_connections == 2
+
+
+@pytest.mark.skipif(HTTP2_AVAILABLE, reason="h2 is installed")
+def test_http2_requires_h2():
+    with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+        HttpClient(pool_config=HttpPoolConfig(http2=True))
+
+
+def test_warm_up_opens_connections(server_url):
+    client = ParadexApiClient(env=TESTNET, api_base_url=server_url, collect_pool_stats=True)
+
+    client.warm_up(connections=3)
+    client.fetch_system_time()
+
+    stats = client.get_pool_stats()
+    assert (stats.new_connections, stats.reused_connections) == (3, 1)
+
+
+def test_api_client_keeps_injected_http_client_options():
+    hook = RecordingHook()
+    http_client = HttpClient(default_timeout=3.0, request_hook=hook, collect_pool_stats=True)
+
+    client = ParadexApiClient(env=TESTNET, http_client=http_client)
+
+    assert client.client is http_client.client
+    assert client.default_timeout == 3.0
+    assert client.request_hook is hook
+    assert client.get_pool_stats() is not None
+
+
+def test_pool_config_is_rejected_with_injected_client():
+    pool_config = HttpPoolConfig(max_connections=4)
+    with pytest.raises(ValueError, match="pool_config"):
+        HttpClient(http_client=httpx.Client(), pool_config=pool_config)
+    with pytest.raises(ValueError, match="pool_config"):
+        AsyncHttpClient(http_client=httpx.AsyncClient(), pool_config=pool_config)
+    with pytest.raises(ValueError, match="pool_config"):
+        ParadexApiClient(env=TESTNET, http_client=HttpClient(), pool_config=pool_config)
+    with pytest.raises(ValueError, match="pool_config"):
+        AsyncParadexApiClient(env=TESTNET, http_client=httpx.AsyncClient(), pool_config=pool_config)
+    with pytest.raises(ValueError, match="pool_config"):
+        Paradex(env=TESTNET, http_client=HttpClient(), pool_config=pool_config)
+
+
+@pytest.mark.asyncio
+async def test_async_warm_up_opens_connections(server_url):
+    client = AsyncParadexApiClient(
+        env=TESTNET,
+        api_base_url=server_url,
+        pool_config=HttpPoolConfig(max_keepalive_connections=5),
+        collect_pool_stats=True,
+    )
+
+    await client.warm_up(connections=3)
+    await client.fetch_system_time()
+    await client.aclose()
+
+    stats = client.get_pool_stats()
+    assert (stats.new_connections, stats.reused_connections) == (3, 1)
@@ -0,0 +1,90 @@
+"""Tests for the derived key cache."""
+
+import dataclasses
+from unittest.mock import patch
+
+import pytest
+from starknet_py.common import int_from_hex
+
+from paradex_py.account.account import ParadexAccount
+from paradex_py.account.keystore import KeyStore
+from tests.mocks.api_client import MockApiClient
+
+TEST_L1_ADDRESS = "0xd2c7314539dCe7752c8120af4eC2AA750Cf2035e"
+TEST_L1_PRIVATE_KEY = "0xf8e4d1d772cdd44e5e77615ad11cc071c94e4c06dc21150d903f28e6aa6abdff"
+TEST_L2_ADDRESS = int_from_hex("0x129c135ed63df9353885e292be4426b8ed6122b13c6c0e1bb787288a1f5adfa")
+TEST_L2_PRIVATE_KEY = int_from_hex("0x543b6cf6c91817a87174aaea4fb370ac1c694e864d7740d728f8344d53e815")
+TEST_L2_PUBLIC_KEY = int_from_hex("0x2c144d2f2d4fc61b6f8967f3ba0012a87d90140bcfe5a3e92e8df83258c960f")
+PASSWORD = "keystore-test-password"  # noqa: S105
+
+
+def make_account(keystore: KeyStore, config=None, **keys) -> ParadexAccount:
+    keys = keys or {"l1_private_key": TEST_L1_PRIVATE_KEY}
+    return ParadexAccount(
+        config=config or MockApiClient().fetch_system_config(), l1_address=TEST_L1_ADDRESS, keystore=keystore, **keys
+    )
+
+
+def test_encrypted_keystore_skips_derivation(tmp_path):
+    path = tmp_path / "keystore.json"
+    keystore = KeyStore(path, password=PASSWORD)
+    make_account(keystore)
+    assert keystore.dirty
+    keystore.save()
+
+    assert hex(TEST_L2_PRIVATE_KEY)[2:] not in path.read_text()
+    assert (path.stat().st_mode & 0o777) == 0o600
+
+    reloaded = KeyStore(path, password=PASSWORD)
+    with (
+        patch("paradex_py.account.account.derive_stark_key") as derive,
+        patch("paradex_py.account.account.KeyPair.from_private_key") as key_pair,
+    ):
+        account = make_account(reloaded)
+        assert (account.l2_private_key, account.l2_public_key, account.l2_address) == (
+            TEST_L2_PRIVATE_KEY,
+            TEST_L2_PUBLIC_KEY,
+            TEST_L2_ADDRESS,
+        )
+        derive.assert_not_called()
+        key_pair.assert_not_called()
+    assert not reloaded.dirty
+
+
+def test_public_keystore_caches_address_only(tmp_path):
+    keystore = KeyStore(tmp_path / "keystore.json")
+    make_account(keystore)
+    keystore.save()
+
+    reloaded = KeyStore(tmp_path / "keystore.json")
+    assert reloaded.entries[TEST_L1_ADDRESS.lower()].encrypted_private_key is None
+    with patch("paradex_py.account.account.KeyPair.from_private_key") as key_pair:
+        account = make_account(reloaded)
+        assert account.l2_private_key == TEST_L2_PRIVATE_KEY
+        assert account.l2_address == TEST_L2_ADDRESS
+        key_pair.assert_not_called()
+
+
+def test_wrong_password_is_rejected(tmp_path):
+    keystore = KeyStore(tmp_path / "keystore.json", password=PASSWORD)
+    make_account(keystore)
+    keystore.save()
+
+    with pytest.raises(ValueError, match="wrong password"):
+        make_account(KeyStore(tmp_path / "keystore.json", password=PASSWORD + "?"))
+
+
+def test_stale_entries_are_replaced(tmp_path):
+    keystore = KeyStore(tmp_path / "keystore.json")
+    config = MockApiClient().fetch_system_config()
+    make_account(keystore, config=config)
+    keystore.save()
+
+    # Another L2 key for the same L1 address
+    account = make_account(keystore, config=config, l2_private_key="0x1234")
+    assert account.l2_address != TEST_L2_ADDRESS
+    assert keystore.entries[TEST_L1_ADDRESS.lower()].l2_address == account.l2_address
+
+    # Entries derived under another account class are not reused
+    other = dataclasses.replace(config, paraclear_account_hash="0x1")
+    assert keystore.get(TEST_L1_ADDRESS, other) is None
@@ -0,0 +1,136 @@
+"""Tests for the latency breakdown of order operations."""
+
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from paradex_py import ParadexSubkey
+from paradex_py.account.account import ParadexAccount
+from paradex_py.api.api_client import ParadexApiClient
+from paradex_py.api.async_api_client import AsyncParadexApiClient
+from paradex_py.common.latency import AUTH, DECODE, ENCODE, HASH, PAYLOAD, SEND, SERVER, SIGN, TOTAL
+from paradex_py.common.order import Order, OrderSide, OrderType
+from paradex_py.environment import TESTNET
+from tests.api.test_account import TEST_L1_ADDRESS, TEST_L2_PRIVATE_KEY
+from tests.mocks.api_client import MockApiClient
+
+ORDER_STAGES = {PAYLOAD, HASH, SIGN, AUTH, ENCODE, SEND, SERVER, DECODE, TOTAL}
+
+
+@pytest.fixture(scope="module")
+def account():
+    config = MockApiClient().fetch_system_config()
+    return ParadexAccount(config=config, l1_address=TEST_L1_ADDRESS, l2_private_key=TEST_L2_PRIVATE_KEY)
+
+
+def order() -> Order:
+    return Order("BTC-USD-PERP", OrderType.Limit, OrderSide.Buy, Decimal("0.01"), Decimal("60000"))
+
+
+class LatencyCollector:
+    def __init__(self):
+        self.latencies: list[tuple[str, dict[str, float]]] = []
+
+    def on_request(self, method, url, headers):
+        pass
+
+    def on_response(self, method, url, status_code, duration_ms):
+        pass
+
+    def on_latency(self, operation: str, spans_ms: dict[str, float]) -> None:
+        self.latencies.append((operation, spans_ms))
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.method in ("GET", "DELETE"):
+        return httpx.Response(200, json={"results": []})
+    body = json.loads(request.content)
+    return httpx.Response(200, json={"id": "1"} if isinstance(body, dict) else {"orders": body, "errors": []})
+
+
+def test_order_operations_record_stages(account):
+    hook = LatencyCollector()
+    client = ParadexApiClient(
+        env=TESTNET,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        auto_auth=False,
+        collect_latency=True,
+    )
+    client.request_hook = hook
+    client.account = account
+    client.set_token("jwt")
+
+    assert client.submit_order(order()) == {"id": "1"}
+    client.submit_orders_batch([order(), order()])
+    client.modify_order("1", order())
+    client.cancel_order("1")
+
+    stats = client.get_latency_stats()
+    assert stats is not None
+    assert set(stats) == {"submit_order", "submit_orders_batch", "modify_order", "cancel_order"}
+    assert set(stats["submit_order"]) == ORDER_STAGES
+    assert set(stats["cancel_order"]) == {AUTH, SEND, SERVER, DECODE, TOTAL}
+    assert stats["submit_order"][SIGN].p99_ms > 0
+
+    operation, spans = hook.latencies[0]
+    assert operation == "submit_order"
+    assert set(spans) == ORDER_STAGES
+    assert sum(ms for stage, ms in spans.items() if stage != TOTAL) <= spans[TOTAL]
+    assert [operation for operation, _ in hook.latencies[1:]] == ["submit_orders_batch", "modify_order", "cancel_order"]
+
+    # Requests outside of an order operation are sent as before and not recorded
+    client.fetch_orders()
+    assert set(client.get_latency_stats()) == set(stats)
+    client.reset_latency_stats()
+    assert client.get_latency_stats() == {}
+
+
+def test_latency_is_off_by_default(account):
+    client = ParadexApiClient(
+        env=TESTNET, http_client=httpx.Client(transport=httpx.MockTransport(handler)), auto_auth=False
+    )
+    client.account = account
+    client.set_token("jwt")
+    client.submit_order(order())
+    assert client.get_latency_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_records_stages(account):
+    client = AsyncParadexApiClient(
+        env=TESTNET,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        auto_auth=False,
+        collect_latency=True,
+    )
+    client.account = account
+    client.set_token("jwt")
+
+    assert await client.submit_order(order()) == {"id": "1"}
+    await client.cancel_orders_batch(order_ids=["1"])
+    await client.aclose()
+
+    last = client.latency.last("submit_order")
+    assert set(last) == ORDER_STAGES
+    assert set(client.get_latency_stats()) == {"submit_order", "cancel_orders_batch"}
+
+
+def test_subkey_client_collects_latency():
+    config = MockApiClient().fetch_system_config()
+    hook = LatencyCollector()
+    with (
+        patch.object(ParadexApiClient, "fetch_system_config", return_value=config),
+        patch.object(ParadexApiClient, "auth"),
+    ):
+        paradex = ParadexSubkey(
+            env=TESTNET,
+            l2_private_key=TEST_L2_PRIVATE_KEY,
+            l2_address=TEST_L1_ADDRESS,
+            request_hook=hook,
+            collect_latency=True,
+        )
+    assert paradex.api_client.latency is not None
+    assert paradex.api_client.request_hook is hook
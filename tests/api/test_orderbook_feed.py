@@ -0,0 +1,99 @@
+"""Tests for OrderBookFeed (local book kept in sync from WS + REST)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from paradex_py.api.orderbook_feed import OrderBookFeed
+from paradex_py.api.ws_client import ParadexWebsocketClient
+from paradex_py.environment import TESTNET
+from tests.mocks.ws import frame
+
+CHANNEL = "order_book.BTC-USD-PERP.deltas@15@100ms"
+
+
+def snapshot(seq_no):
+    return {"market": "BTC-USD-PERP", "seq_no": seq_no, "bids": [["100", "1"]], "asks": [["101", "1"]]}
+
+
+def book_frame(seq_no, price="100.5"):
+    data = {
+        "market": "BTC-USD-PERP",
+        "seq_no": seq_no,
+        "update_type": "d",
+        "inserts": [{"side": "BUY", "price": price, "size": "2"}],
+        "updates": [],
+        "deletes": [],
+    }
+    return frame(CHANNEL, data)
+
+
+class TestOrderBookFeed:
+    @pytest.mark.asyncio
+    async def test_seed_apply_and_resync(self):
+        ws_client = ParadexWebsocketClient(env=TESTNET)
+        api_client = MagicMock()
+        api_client.fetch_orderbook = AsyncMock(side_effect=[snapshot(5), snapshot(7)])
+        updates = []
+        feed = OrderBookFeed(ws_client, api_client, "BTC-USD-PERP", price_decimals=1, on_update=updates.append)
+
+        await feed.start()
+        assert CHANNEL in ws_client.callbacks
+        assert feed.book.seq_no == 5
+
+        await ws_client.inject(book_frame(6))
+        assert feed.book.best_bid()[0] == 1005
+        assert len(updates) == 1
+
+        # seq 7 missing: the feed resyncs from REST and replays seq 8
+        await ws_client.inject(book_frame(8, price="100.7"))
+        await feed._resync_task
+        assert feed.resyncs == 2
+        assert feed.book.in_sync
+        assert feed.book.seq_no == 8
+        assert feed.book.best_bid()[0] == 1007
+
+        await feed.stop()
+        assert CHANNEL not in ws_client.callbacks
+
+    @pytest.mark.asyncio
+    async def test_sync_api_client_runs_in_thread(self):
+        ws_client = ParadexWebsocketClient(env=TESTNET)
+        api_client = MagicMock()
+        api_client.fetch_orderbook = MagicMock(return_value=snapshot(1))
+        feed = OrderBookFeed(ws_client, api_client, "BTC-USD-PERP")
+
+        await feed.resync()
+
+        api_client.fetch_orderbook.assert_called_once_with("BTC-USD-PERP")
+        assert feed.book.in_sync
+        await asyncio.sleep(0)
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_running_resync(self):
+        ws_client = ParadexWebsocketClient(env=TESTNET)
+        release = asyncio.Event()
+
+        snapshots = [snapshot(5), snapshot(9)]
+
+        async def fetch_orderbook(market):
+            if len(snapshots) == 1:
+                await release.wait()
+            return snapshots.pop(0)
+
+        api_client = MagicMock()
+        api_client.fetch_orderbook = fetch_orderbook
+        feed = OrderBookFeed(ws_client, api_client, "BTC-USD-PERP", price_decimals=1)
+        await feed.start()
+
+        await ws_client.inject(book_frame(8))
+        await asyncio.sleep(0)
+        resync_task = feed._resync_task
+        assert resync_task is not None and not resync_task.done()
+
+        await feed.stop()
+        assert resync_task.cancelled()
+        release.set()
+        await asyncio.sleep(0)
+        assert feed.book.seq_no == 5
@@ -0,0 +1,139 @@
+"""Tests for cursor pagination iterators."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from paradex_py.api.generated.responses import PaginatedAPIResults
+from paradex_py.api.pagination import (
+    aiter_pages,
+    aiter_results,
+    aiter_results_windowed,
+    iter_pages,
+    iter_results,
+    iter_results_windowed,
+    split_time_range,
+)
+
+
+class FakeEndpoint:
+    """Serves `records` (timestamps) filtered by start_at/end_at, with integer cursors."""
+
+    def __init__(self, records, page_size=3):
+        self.records = records
+        self.default_page_size = page_size
+        self.calls: list[dict] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, params):
+        with self.lock:
+            self.calls.append(dict(params))
+        records = [r for r in self.records if params.get("start_at", 0) <= r <= params.get("end_at", 10**15)]
+        size = params.get("page_size", self.default_page_size)
+        offset = int(params.get("cursor", 0))
+        has_next = offset + size < len(records)
+        return {
+            "next": str(offset + size) if has_next else None,
+            "prev": None,
+            "results": records[offset : offset + size],
+        }
+
+
+class AsyncFakeEndpoint(FakeEndpoint):
+    async def __call__(self, params):
+        await asyncio.sleep(0)
+        return super().__call__(params)
+
+
+def test_split_time_range():
+    assert split_time_range(0, 99, 4) == [(0, 24), (25, 49), (50, 74), (75, 99)]
+    assert split_time_range(10, 12, 5) == [(10, 10), (11, 11), (12, 12)]
+    with pytest.raises(ValueError, match="windows"):
+        split_time_range(0, 10, 0)
+
+
+def test_iter_results_follows_cursors():
+    endpoint = FakeEndpoint(list(range(10)))
+
+    assert list(iter_results(endpoint, {"market": "BTC-USD-PERP"}, page_size=4)) == list(range(10))
+    assert [call.get("cursor") for call in endpoint.calls] == [None, "4", "8"]
+    assert all(call["market"] == "BTC-USD-PERP" and call["page_size"] == 4 for call in endpoint.calls)
+
+
+def test_iter_pages_prefetches_next_page():
+    endpoint = FakeEndpoint(list(range(9)))
+    pages = iter_pages(endpoint)
+
+    next(pages)
+    # The second page is requested while the first one is being consumed
+    for _ in range(100):
+        if len(endpoint.calls) == 2:
+            break
+        time.sleep(0.01)
+    assert len(endpoint.calls) == 2
+    pages.close()
+
+
+def test_iter_pages_typed_results():
+    pages = [
+        PaginatedAPIResults(next="c1", results=[{"id": 1}]),
+        PaginatedAPIResults(next=None, results=[{"id": 2}]),
+    ]
+
+    def fetch(params):
+        return pages[1] if params.get("cursor") == "c1" else pages[0]
+
+    assert list(iter_results(fetch)) == [{"id": 1}, {"id": 2}]
+
+
+def test_iter_results_windowed_keeps_window_order():
+    endpoint = FakeEndpoint(list(range(0, 100, 5)))
+
+    results = list(iter_results_windowed(endpoint, 0, 99, windows=4, page_size=2, max_buffered_pages=1))
+
+    assert results == list(range(0, 100, 5))
+    windows = {(call["start_at"], call["end_at"]) for call in endpoint.calls}
+    assert windows == {(0, 24), (25, 49), (50, 74), (75, 99)}
+
+
+def test_iter_results_windowed_propagates_errors():
+    def fetch(params):
+        if params["start_at"] > 0:
+            raise ValueError("boom")
+        return {"next": None, "results": [1]}
+
+    with pytest.raises(ValueError, match="boom"):
+        list(iter_results_windowed(fetch, 0, 9, windows=2))
+
+
+@pytest.mark.asyncio
+async def test_aiter_results_follows_cursors():
+    endpoint = AsyncFakeEndpoint(list(range(7)))
+
+    results = [r async for r in aiter_results(endpoint, page_size=3)]
+
+    assert results == list(range(7))
+    assert [call.get("cursor") for call in endpoint.calls] == [None, "3", "6"]
+
+
+@pytest.mark.asyncio
+async def test_aiter_pages_cancels_prefetch_on_early_exit():
+    endpoint = AsyncFakeEndpoint(list(range(9)))
+
+    pages = aiter_pages(endpoint)
+    first = await pages.__anext__()
+    await pages.aclose()
+
+    assert first["results"] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_aiter_results_windowed():
+    endpoint = AsyncFakeEndpoint(list(range(0, 100, 3)))
+
+    results = [r async for r in aiter_results_windowed(endpoint, 0, 99, windows=3, page_size=4)]
+
+    assert results == list(range(0, 100, 3))
+    assert {call["start_at"] for call in endpoint.calls} == {0, 33, 66}
@@ -0,0 +1,86 @@
+"""Tests for the multi-account manager."""
+
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from paradex_py import ParadexFleet
+from paradex_py.common.order import Order, OrderSide, OrderType
+from paradex_py.environment import TESTNET
+from tests.mocks.api_client import MOCK_CONFIG
+
+ACCOUNTS = {
+    "a": {"l1_address": "0x1", "l2_private_key": "0x1234"},
+    "b": {"l1_address": "0x2", "l2_private_key": "0x5678"},
+}
+
+
+class FakeExchange:
+    def __init__(self):
+        self.requests: list[tuple[str, str, str | None]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requests.append((request.method, path, request.headers.get("Authorization")))
+        if path == "/v1/system/config":
+            return httpx.Response(200, json=MOCK_CONFIG)
+        if path.startswith("/v1/auth/"):
+            return httpx.Response(200, json={"jwt_token": f"jwt-{request.headers['PARADEX-STARKNET-ACCOUNT']}"})
+        if path == "/v1/orders" and request.method == "POST":
+            if request.headers["Authorization"].endswith("-reject"):
+                return httpx.Response(400, json={"error": "INVALID", "message": "rejected"})
+            return httpx.Response(201, json={"id": "1", "status": "NEW"})
+        return httpx.Response(200, json={})
+
+
+def make_order() -> Order:
+    return Order(
+        market="BTC-USD-PERP",
+        order_type=OrderType.Limit,
+        order_side=OrderSide.Buy,
+        size=Decimal("0.01"),
+        limit_price=Decimal("65000"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_accounts_share_config_and_pool_but_not_jwt():
+    exchange = FakeExchange()
+    async with ParadexFleet(env=TESTNET, transport=httpx.MockTransport(exchange)) as fleet:
+        members = await fleet.add_accounts(ACCOUNTS)
+
+        assert [r for r in exchange.requests if r[1] == "/v1/system/config"] == [("GET", "/v1/system/config", None)]
+        assert members["a"].account.config is members["b"].account.config
+        assert members["a"].api_client.client._transport is members["b"].api_client.client._transport
+
+        results = await fleet.submit_orders({"a": make_order(), "b": [make_order(), make_order()]})
+
+        assert results["a"] == {"id": "1", "status": "NEW"}
+        order_auth = {auth for method, path, auth in exchange.requests if path.startswith("/v1/orders")}
+        assert order_auth == {f"Bearer jwt-{hex(m.account.l2_address)}" for m in fleet}
+        stats = fleet.stats()
+        assert stats["a"]["submit_order"].count == 1
+        assert stats["b"]["submit_orders_batch"].count == 1
+        assert fleet["b"].errors == 0
+
+
+@pytest.mark.asyncio
+async def test_failures_are_returned_per_account():
+    exchange = FakeExchange()
+    async with ParadexFleet(env=TESTNET, transport=httpx.MockTransport(exchange)) as fleet:
+        await fleet.add_accounts(ACCOUNTS)
+        fleet["b"].api_client.set_token("jwt-reject")
+        fleet["b"].api_client.auto_auth = False
+
+        results = await fleet.submit_orders({"a": make_order(), "b": make_order()})
+
+        assert results["a"]["status"] == "NEW"
+        assert isinstance(results["b"], Exception)
+        assert fleet["b"].errors == 1
+        assert fleet.stats()["b"]["submit_order"].count == 1
+
+        with pytest.raises(ValueError, match="already added"):
+            await fleet.add_account("a", **ACCOUNTS["a"])
+        with pytest.raises(ValueError, match="Unknown account"):
+            fleet["c"]
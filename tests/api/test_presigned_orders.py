@@ -0,0 +1,125 @@
+"""Tests for the pre-signed order cache."""
+
+import asyncio
+import json
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from paradex_py.account.account import ParadexAccount
+from paradex_py.account.presigned_orders import PresignedOrderCache
+from paradex_py.api.api_client import ParadexApiClient
+from paradex_py.common.order import Order, OrderSide, OrderType
+from paradex_py.environment import TESTNET
+from tests.api.test_account import TEST_L1_ADDRESS, TEST_L2_PRIVATE_KEY
+from tests.mocks.api_client import MockApiClient
+
+MARKET = "BTC-USD-PERP"
+SIZE = Decimal("0.01")
+
+
+@pytest.fixture(scope="module")
+def account():
+    config = MockApiClient().fetch_system_config()
+    return ParadexAccount(config=config, l1_address=TEST_L1_ADDRESS, l2_private_key=TEST_L2_PRIVATE_KEY)
+
+
+def test_ladder_signs_every_side_and_price(account):
+    cache = PresignedOrderCache(account)
+    entries = cache.presign_ladder(MARKET, prices=[Decimal("60000"), Decimal("60001")], size=SIZE)
+
+    assert len(entries) == len(cache) == 4
+    for entry in entries:
+        assert entry.order.signature == account.sign_order(entry.order)
+        assert entry.payload["signature"] == entry.order.signature
+        assert entry.payload["price"] == str(entry.order.limit_price)
+
+
+def test_take_is_single_use(account):
+    cache = PresignedOrderCache(account)
+    cache.presign_ladder(MARKET, prices=[Decimal("60000")], size=SIZE, sides=[OrderSide.Buy])
+
+    # Equal Decimals hit the same key
+    entry = cache.take(MARKET, OrderSide.Buy, Decimal("60000.0"), Decimal("0.010"))
+    assert entry is not None
+    assert entry.order.order_side == OrderSide.Buy
+    assert cache.take(MARKET, OrderSide.Buy, Decimal("60000"), SIZE) is None
+    assert cache.take(MARKET, OrderSide.Sell, Decimal("60000"), SIZE) is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_take_requires_matching_order_fields(account):
+    cache = PresignedOrderCache(account)
+    cache.presign_ladder(MARKET, prices=[Decimal("60000")], size=SIZE, sides=[OrderSide.Buy])
+    cache.presign_ladder(MARKET, prices=[Decimal("60001")], size=SIZE, sides=[OrderSide.Buy], reduce_only=True)
+
+    assert cache.take(MARKET, OrderSide.Buy, Decimal("60000"), SIZE, reduce_only=True) is None
+    assert cache.take(MARKET, OrderSide.Buy, Decimal("60000"), SIZE, order_type=OrderType.Market) is None
+    assert cache.take(MARKET, OrderSide.Buy, Decimal("60000"), SIZE, client_id="mine") is None
+    # Fields not given must have their `Order` defaults
+    assert cache.take(MARKET, OrderSide.Buy, Decimal("60001"), SIZE) is None
+    assert len(cache) == 2
+
+    assert cache.take(MARKET, OrderSide.Buy, Decimal("60000"), SIZE, instruction="GTC") is not None
+    assert cache.take(MARKET, OrderSide.Buy, Decimal("60001"), SIZE, reduce_only=True) is not None
+    assert cache.stats().misses == 4
+
+
+def test_expired_entries_are_not_handed_out(account):
+    cache = PresignedOrderCache(account, ttl=1)
+    stale = Order(MARKET, OrderType.Limit, OrderSide.Buy, SIZE, Decimal("60000"), signature_timestamp=1)
+    cache.presign([stale])
+    cache.presign_ladder(MARKET, prices=[Decimal("60001")], size=SIZE, sides=[OrderSide.Buy])
+
+    assert cache.prune() == 1
+    assert len(cache) == 1
+
+    cache.presign([Order(MARKET, OrderType.Limit, OrderSide.Buy, SIZE, Decimal("60000"), signature_timestamp=1)])
+    assert cache.take(MARKET, OrderSide.Buy, Decimal("60000"), SIZE) is None
+    assert cache.stats().expired == 2
+
+
+def test_bounded_size_evicts_oldest(account):
+    cache = PresignedOrderCache(account, max_size=2)
+    cache.presign_ladder(MARKET, prices=[Decimal(60000 + i) for i in range(3)], size=SIZE, sides=[OrderSide.Buy])
+
+    assert len(cache) == 2
+    assert cache.stats().evicted == 1
+    assert cache.take(MARKET, OrderSide.Buy, Decimal("60000"), SIZE) is None
+    assert cache.take(MARKET, OrderSide.Buy, Decimal("60002"), SIZE) is not None
+
+
+@pytest.mark.asyncio
+async def test_presign_ladder_async(account):
+    cache = PresignedOrderCache(account)
+    task = asyncio.create_task(cache.presign_ladder_async(MARKET, prices=[Decimal("60000")], size=SIZE))
+
+    entries = await task
+
+    assert len(entries) == len(cache) == 2
+
+
+def test_submit_presigned_order(account):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json={"id": "1"})
+
+    client = ParadexApiClient(
+        env=TESTNET, http_client=httpx.Client(transport=httpx.MockTransport(handler)), auto_auth=False
+    )
+    client.account = account
+    client.set_token("jwt")
+    [entry] = client.presigned_orders.presign_ladder(MARKET, [Decimal("60000")], SIZE, sides=[OrderSide.Sell])
+
+    # Miss: the cached GTC order is kept and a POST_ONLY order is signed on the spot
+    client.submit_presigned_order(MARKET, OrderSide.Sell, Decimal("60000"), SIZE, instruction="POST_ONLY")
+    client.submit_presigned_order(MARKET, OrderSide.Sell, Decimal("60000"), SIZE)
+
+    assert requests[0]["instruction"] == "POST_ONLY"
+    assert requests[0]["signature"] != entry.payload["signature"]
+    assert requests[1] == entry.payload
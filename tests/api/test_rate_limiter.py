@@ -0,0 +1,112 @@
+"""Tests for the client-side rate limiter."""
+
+import time
+
+import httpx
+import pytest
+
+from paradex_py.api.async_http_client import AsyncHttpClient
+from paradex_py.api.http_client import HttpClient, HttpMethod
+from paradex_py.api.rate_limiter import EndpointClass, RateLimit, RateLimiter, classify_endpoint
+
+API_URL = "https://api.testnet.paradex.trade/v1"
+
+
+@pytest.mark.parametrize(
+    "method,path,expected",
+    [
+        ("POST", "orders", EndpointClass.ORDERS),
+        ("PUT", "orders/123", EndpointClass.ORDERS),
+        ("DELETE", "orders/123", EndpointClass.CANCELS),
+        ("DELETE", "orders/batch", EndpointClass.CANCELS),
+        ("GET", "orders", EndpointClass.PRIVATE_GET),
+        ("GET", "funding/payments", EndpointClass.PRIVATE_GET),
+        ("GET", "funding/data", EndpointClass.PUBLIC_GET),
+        ("GET", "markets/summary", EndpointClass.PUBLIC_GET),
+        ("GET", "bbo/BTC-USD-PERP", EndpointClass.PUBLIC_GET),
+        ("GET", "system/time", EndpointClass.PUBLIC_GET),
+    ],
+)
+def test_classify_endpoint(method, path, expected):
+    assert classify_endpoint(method, f"{API_URL}/{path}") == expected
+
+
+def test_burst_then_paced():
+    limiter = RateLimiter(limits={EndpointClass.ORDERS: RateLimit(rate=10, burst=2)})
+
+    assert limiter.try_acquire(EndpointClass.ORDERS) == 0
+    assert limiter.try_acquire(EndpointClass.ORDERS) == 0
+    wait = limiter.try_acquire(EndpointClass.ORDERS)
+    assert 0.05 < wait <= 0.1
+    # Classes without a limit are never throttled
+    assert limiter.try_acquire(EndpointClass.CANCELS) == 0
+
+
+def test_acquire_waits():
+    limiter = RateLimiter(limits={EndpointClass.PRIVATE_GET: RateLimit(rate=50, burst=1)})
+
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire(EndpointClass.PRIVATE_GET)
+
+    assert time.monotonic() - start >= 0.07
+    stats = limiter.stats()
+    assert (stats.acquired, stats.delayed) == (5, 4)
+
+
+def test_shared_bucket_keeps_headroom_for_cancels():
+    limiter = RateLimiter(limits={}, shared=RateLimit(rate=1, burst=3), reserve={EndpointClass.PRIVATE_GET: 2})
+
+    assert limiter.try_acquire(EndpointClass.PRIVATE_GET) == 0
+    assert limiter.try_acquire(EndpointClass.PRIVATE_GET) > 0
+    assert limiter.try_acquire(EndpointClass.CANCELS) == 0
+    assert limiter.try_acquire(EndpointClass.CANCELS) == 0
+    assert limiter.try_acquire(EndpointClass.CANCELS) > 0
+    # Public reads are not part of the shared bucket by default
+    assert limiter.try_acquire(EndpointClass.PUBLIC_GET) == 0
+
+
+def test_update_from_headers():
+    limiter = RateLimiter(limits={EndpointClass.ORDERS: RateLimit(rate=100, burst=100)})
+
+    limiter.update_from_headers(EndpointClass.ORDERS, 200, {"x-ratelimit-remaining": "2"})
+    assert limiter.try_acquire(EndpointClass.ORDERS) == 0
+    assert limiter.try_acquire(EndpointClass.ORDERS) == 0
+    assert limiter.try_acquire(EndpointClass.ORDERS) > 0
+
+    limiter.update_from_headers(EndpointClass.ORDERS, 429, {"retry-after": "0.5"})
+    assert 0.4 < limiter.try_acquire(EndpointClass.ORDERS) <= 0.5
+    assert limiter.stats().server_throttles == 1
+
+    # Unparseable values are ignored
+    limiter.update_from_headers(EndpointClass.ORDERS, 429, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+
+def test_http_client_applies_limiter():
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "0.1"}
+        return httpx.Response(200, json={"server_time": "1"}, headers=headers)
+
+    limiter = RateLimiter()
+    client = HttpClient(http_client=httpx.Client(transport=httpx.MockTransport(handler)), rate_limiter=limiter)
+
+    client.request(f"{API_URL}/system/time", HttpMethod.GET)
+    start = time.monotonic()
+    client.request(f"{API_URL}/system/time", HttpMethod.GET)
+
+    assert time.monotonic() - start >= 0.08
+    assert limiter.stats().delayed == 1
+
+
+@pytest.mark.asyncio
+async def test_async_http_client_applies_limiter():
+    limiter = RateLimiter(limits={EndpointClass.ORDERS: RateLimit(rate=20, burst=1)})
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    client = AsyncHttpClient(http_client=httpx.AsyncClient(transport=transport), rate_limiter=limiter)
+
+    start = time.monotonic()
+    for _ in range(3):
+        await client.request(f"{API_URL}/orders", HttpMethod.POST, payload={})
+
+    assert time.monotonic() - start >= 0.08
+    assert limiter.stats().delayed == 2
@@ -24,12 +24,16 @@ class TestParadexAccountRpcVersion:
             mock_client_instance = MagicMock()
             mock_client.return_value = mock_client_instance
 
-            ParadexAccount(
+            account = ParadexAccount(
                 config=config,
                 l1_address=TEST_L1_ADDRESS,
                 l1_private_key=TEST_L1_PRIVATE_KEY,
             )
 
+            # The full-node client is only built on first use
+            mock_client.assert_not_called()
+            assert account.starknet is not None
+
             # Verify that FullNodeClient was called with the default RPC URL
             mock_client.assert_called_once()
             call_args = mock_client.call_args
@@ -45,13 +49,17 @@ class TestParadexAccountRpcVersion:
             mock_client_instance = MagicMock()
             mock_client.return_value = mock_client_instance
 
-            ParadexAccount(
+            account = ParadexAccount(
                 config=config,
                 l1_address=TEST_L1_ADDRESS,
                 l1_private_key=TEST_L1_PRIVATE_KEY,
                 rpc_version="v0_9",
             )
 
+            # The full-node client is only built on first use
+            mock_client.assert_not_called()
+            assert account.starknet is not None
+
             # Verify that FullNodeClient was called with the constructed URL
             mock_client.assert_called_once()
             call_args = mock_client.call_args
@@ -68,13 +76,17 @@ class TestParadexAccountRpcVersion:
             mock_client_instance = MagicMock()
             mock_client.return_value = mock_client_instance
 
-            ParadexAccount(
+            account = ParadexAccount(
                 config=config,
                 l1_address=TEST_L1_ADDRESS,
                 l2_private_key=TEST_L2_PRIVATE_KEY,
                 rpc_version="v0_8",
             )
 
+            # The full-node client is only built on first use
+            mock_client.assert_not_called()
+            assert account.starknet is not None
+
             # Verify that FullNodeClient was called with the correct version
             mock_client.assert_called_once()
             call_args = mock_client.call_args
@@ -108,6 +120,10 @@ class TestParadexRpcVersion:
                 rpc_version="v0_9",
             )
 
+            # The full-node client is only built on first use
+            mock_client.assert_not_called()
+            assert paradex.account.starknet is not None
+
             # Verify that FullNodeClient was called with the correct URL
             mock_client.assert_called_once()
             call_args = mock_client.call_args
@@ -136,6 +152,10 @@ class TestParadexRpcVersion:
                 rpc_version="v0_9",
             )
 
+            # The full-node client is only built on first use
+            mock_client.assert_not_called()
+            assert paradex.account.starknet is not None
+
             # Verify that FullNodeClient was called with the correct URL
             mock_client.assert_called_once()
             call_args = mock_client.call_args
@@ -163,6 +183,10 @@ class TestParadexRpcVersion:
                 l1_private_key=TEST_L1_PRIVATE_KEY,
             )
 
+            # The full-node client is only built on first use
+            mock_client.assert_not_called()
+            assert paradex.account.starknet is not None
+
             # Verify that FullNodeClient was called with default RPC URL
             mock_client.assert_called_once()
             call_args = mock_client.call_args
@@ -0,0 +1,83 @@
+"""Tests for parallel batch signing."""
+
+import json
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from paradex_py.account.account import ParadexAccount
+from paradex_py.account.signing_executor import SigningExecutor
+from paradex_py.api.api_client import ParadexApiClient
+from paradex_py.common.order import Order, OrderSide, OrderType
+from paradex_py.environment import TESTNET
+from tests.api.test_account import TEST_L1_ADDRESS, TEST_L2_PRIVATE_KEY
+from tests.mocks.api_client import MockApiClient
+
+
+@pytest.fixture(scope="module")
+def account():
+    config = MockApiClient().fetch_system_config()
+    return ParadexAccount(config=config, l1_address=TEST_L1_ADDRESS, l2_private_key=TEST_L2_PRIVATE_KEY)
+
+
+def make_orders(count: int) -> list[Order]:
+    return [
+        Order(
+            market="ETH-USD-PERP",
+            order_type=OrderType.Limit,
+            order_side=OrderSide.Buy if i % 2 else OrderSide.Sell,
+            size=Decimal("0.1"),
+            limit_price=Decimal(1500 + i),
+            signature_timestamp=1634736000000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_parallel_signatures_match_serial_in_order(account, backend):
+    orders = make_orders(6)
+    expected = [account.sign_order(order) for order in orders]
+
+    with SigningExecutor(max_workers=3, backend=backend, min_batch_size=2) as executor:
+        assert executor.sign_orders(account, orders) == expected
+
+
+def test_small_batch_is_signed_inline(account):
+    executor = SigningExecutor(max_workers=4, min_batch_size=8)
+    orders = make_orders(3)
+
+    assert executor.sign_orders(account, orders) == [account.sign_order(order) for order in orders]
+    assert executor._executor is None
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown signing backend"):
+        SigningExecutor(backend="gpu")
+
+
+def test_submit_orders_batch_uses_executor(account):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"orders": []})
+
+    executor = SigningExecutor(max_workers=2, backend="thread", min_batch_size=2)
+    client = ParadexApiClient(
+        env=TESTNET,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        auto_auth=False,
+        signing_executor=executor,
+    )
+    client.account = account
+    client.set_token("jwt")
+    orders = make_orders(4)
+
+    client.submit_orders_batch(orders)
+
+    body = json.loads(requests[0].content)
+    assert [o["signature"] for o in body] == [account.sign_order(order) for order in make_orders(4)]
+    assert [o["price"] for o in body] == ["1500", "1501", "1502", "1503"]
+    executor.shutdown()
@@ -0,0 +1,161 @@
+"""Tests for background JWT refresh."""
+
+import asyncio
+import base64
+import json
+import time
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from paradex_py.api.api_client import ParadexApiClient
+from paradex_py.api.async_api_client import AsyncParadexApiClient
+from paradex_py.api.token_manager import TokenManager, jwt_expiry
+from paradex_py.environment import TESTNET
+from tests.api.test_async_api_client import MockAccount
+
+
+def make_jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+class AuthHandler:
+    """Hands out a new token per auth call; other requests record the Authorization header."""
+
+    def __init__(self, lifetime: float = 300, fail: bool = False):
+        self.lifetime = lifetime
+        self.fail = fail
+        self.auth_calls = 0
+        self.authorizations: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/v1/auth/"):
+            self.auth_calls += 1
+            if self.fail:
+                return httpx.Response(500, json={"error": "down"})
+            token = make_jwt(time.time() + self.lifetime) + str(self.auth_calls)
+            return httpx.Response(200, json={"jwt_token": token})
+        self.authorizations.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"results": []})
+
+
+def test_jwt_expiry():
+    assert jwt_expiry(make_jwt(1700000000)) == 1700000000
+    assert jwt_expiry("not-a-jwt") is None
+
+
+def test_sync_background_refresh():
+    # Token lifetime shorter than the margin: refreshed back to back
+    handler = AuthHandler(lifetime=0.2)
+    client = ParadexApiClient(env=TESTNET, http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    client.account = MockAccount()
+    client.auth()
+    manager = TokenManager(client, refresh_margin=0.15, retry_delay=0.01)
+
+    manager.start()
+    assert client.auth_provider is manager
+    deadline = time.time() + 5
+    while manager.stats().refreshes < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    manager.stop()
+
+    stats = manager.stats()
+    assert stats.refreshes >= 2
+    assert stats.failures == 0
+    assert stats.max_latency >= stats.last_latency > 0
+    assert client.auth_provider is None
+    assert manager.get_token() == client.account.jwt_token
+    assert client.client.headers["Authorization"] == f"Bearer {client.account.jwt_token}"
+
+
+def test_requests_use_current_token_without_auth_round_trip():
+    handler = AuthHandler()
+    client = ParadexApiClient(env=TESTNET, http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    client.account = MockAccount()
+    client.auth()
+    manager = TokenManager(client)
+    manager.start()
+    # Stale by the client's own 4 minute rule; the manager still vouches for the token
+    client.auth_timestamp = 0
+
+    client.fetch_orders()
+    manager.stop()
+
+    assert handler.auth_calls == 1
+    assert handler.authorizations == [f"Bearer {client.account.jwt_token}"]
+
+
+def test_expiring_token_falls_back_to_request_path():
+    handler = AuthHandler()
+    client = ParadexApiClient(env=TESTNET, http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    client.account = MockAccount()
+    client.account.jwt_token = make_jwt(time.time() + 1)
+    client.auth_provider = TokenManager(client, retry_delay=5)
+
+    assert client.auth_provider.refresh_if_needed() is None
+    client.fetch_orders()
+
+    assert handler.auth_calls == 1
+
+
+def test_failed_refresh_is_counted():
+    handler = AuthHandler(fail=True)
+    client = ParadexApiClient(env=TESTNET, http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    client.account = MockAccount()
+    manager = TokenManager(client)
+
+    assert manager.refresh() is False
+
+    stats = manager.stats()
+    assert (stats.refreshes, stats.failures) == (0, 1)
+    assert stats.last_error is not None
+
+
+def test_sync_client_ws_reauth_needs_event_loop():
+    client = ParadexApiClient(env=TESTNET, http_client=httpx.Client(transport=httpx.MockTransport(AuthHandler())))
+    ws_client = AsyncMock()
+    ws_client._reader_task = None
+    with pytest.raises(ValueError, match="needs the event loop"):
+        TokenManager(client, ws_client=ws_client).start()
+
+
+@pytest.mark.asyncio
+async def test_sync_background_refresh_reauthenticates_ws():
+    handler = AuthHandler(lifetime=0.2)
+    client = ParadexApiClient(env=TESTNET, http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    client.account = MockAccount()
+    ws_client = AsyncMock()
+    manager = TokenManager(client, refresh_margin=0.15, retry_delay=0.01, ws_client=ws_client)
+
+    # Refreshes run on the manager thread, re-auth on this loop
+    manager.start()
+    for _ in range(500):
+        if ws_client._send_auth_id.await_count >= 2:
+            break
+        await asyncio.sleep(0.01)
+    manager.stop()
+    await asyncio.sleep(0.05)
+
+    assert ws_client._send_auth_id.await_count >= 2
+    ws_client._send_auth_id.assert_awaited_with(ws_client.ws, client.account.jwt_token)
+
+
+@pytest.mark.asyncio
+async def test_async_background_refresh_reauthenticates_ws():
+    handler = AuthHandler(lifetime=0.2)
+    client = AsyncParadexApiClient(env=TESTNET, http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    client.account = MockAccount()
+    ws_client = AsyncMock()
+    manager = TokenManager(client, refresh_margin=0.15, retry_delay=0.01, ws_client=ws_client)
+
+    manager.start()
+    for _ in range(500):
+        if manager.stats().refreshes >= 2:
+            break
+        await asyncio.sleep(0.01)
+    manager.stop()
+
+    assert manager.stats().refreshes >= 2
+    ws_client._send_auth_id.assert_awaited_with(ws_client.ws, client.account.jwt_token)
@@ -0,0 +1,106 @@
+"""Tests for typed REST response decoding."""
+
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from paradex_py.api.api_client import ParadexApiClient
+from paradex_py.api.async_api_client import AsyncParadexApiClient
+from paradex_py.api.async_http_client import AsyncHttpClient
+from paradex_py.api.http_client import HttpClient
+from paradex_py.api.typed_responses import TypedResponseDecoder
+from paradex_py.environment import TESTNET
+
+BBO = {
+    "market": "BTC-USD-PERP",
+    "bid": "65000.1",
+    "bid_size": "0.12",
+    "ask": "65000.2",
+    "ask_size": "0.3",
+    "seq_no": 42,
+    "last_updated_at": 1700000000000,
+}
+MARKETS = {
+    "results": [
+        {"symbol": "BTC-USD-PERP", "price_tick_size": "0.1", "order_size_increment": "0.001"},
+        {"symbol": "ETH-USD-PERP", "price_tick_size": "0.01", "order_size_increment": "0.01"},
+    ]
+}
+
+
+def test_from_markets_precisions():
+    decoder = TypedResponseDecoder.from_markets(MARKETS)
+
+    assert decoder.precision("BTC-USD-PERP") == (1, 3)
+    assert decoder.precision("ETH-USD-PERP") == (2, 2)
+    assert decoder.precision("SOL-USD-PERP") == (8, 8)
+
+
+def test_decode_bbo_and_orderbook():
+    decoder = TypedResponseDecoder.from_markets(MARKETS)
+
+    bbo = decoder.bbo(BBO)
+    assert (bbo.bid, bbo.bid_size, bbo.ask, bbo.ask_size) == (650001, 120, 650002, 300)
+    assert bbo.bid_price() == Decimal("65000.1")
+    assert not hasattr(bbo, "__dict__")
+
+    empty = decoder.bbo({"market": "BTC-USD-PERP", "bid": "", "ask": None})
+    assert empty.bid is None and empty.ask_price() is None
+
+    book = decoder.orderbook({"market": "ETH-USD-PERP", "bids": [["3000.5", "1"]], "asks": [["3001", "2.5"]]})
+    assert book.bids == [(300050, 100)]
+    assert book.asks == [(300100, 250)]
+
+
+def test_decode_orders_fills_positions():
+    decoder = TypedResponseDecoder.from_markets(MARKETS)
+
+    orders = decoder.orders(
+        {
+            "results": [
+                {
+                    "id": "1",
+                    "client_id": "c1",
+                    "market": "BTC-USD-PERP",
+                    "side": "BUY",
+                    "type": "LIMIT",
+                    "status": "OPEN",
+                    "price": "65000",
+                    "size": "0.5",
+                    "remaining_size": "0.25",
+                    "avg_fill_price": "64999.95",
+                }
+            ]
+        }
+    )
+    assert (orders[0].price, orders[0].size, orders[0].remaining_size) == (650000, 500, 250)
+    assert orders[0].avg_fill_price == "64999.95"
+
+    fills = decoder.fills({"results": [{"id": "f1", "market": "BTC-USD-PERP", "price": "65000.1", "size": "0.001"}]})
+    assert (fills[0].price, fills[0].size) == (650001, 1)
+
+    positions = decoder.positions({"results": [{"market": "ETH-USD-PERP", "side": "SHORT", "size": "-1.5"}]})
+    assert positions[0].size == -150
+
+
+def test_sync_client_typed_methods():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=BBO))
+    http_client = HttpClient(http_client=httpx.Client(transport=transport))
+    client = ParadexApiClient(env=TESTNET, http_client=http_client)
+    client.response_decoder = TypedResponseDecoder.from_markets(MARKETS)
+
+    assert client.fetch_bbo_typed("BTC-USD-PERP").ask == 650002
+
+
+@pytest.mark.asyncio
+async def test_async_client_typed_methods():
+    book = {"market": "BTC-USD-PERP", "seq_no": 7, "bids": [["1.5", "2"]], "asks": []}
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=book))
+    http_client = AsyncHttpClient(http_client=httpx.AsyncClient(transport=transport))
+    client = AsyncParadexApiClient(env=TESTNET, http_client=http_client)
+
+    snapshot = await client.fetch_orderbook_typed("BTC-USD-PERP")
+
+    assert snapshot.seq_no == 7
+    assert snapshot.bids == [(150_000_000, 200_000_000)]
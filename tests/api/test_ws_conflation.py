@@ -0,0 +1,128 @@
+"""Tests for conflating (latest-state) WebSocket subscriptions."""
+
+import asyncio
+import json
+
+import pytest
+
+from paradex_py.api.ws_client import ParadexWebsocketChannel, ParadexWebsocketClient
+from paradex_py.api.ws_conflation import ConflatingCallback, market_key
+from paradex_py.environment import TESTNET
+
+
+def message(channel: str, market: str, bid: str) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "method": "subscription",
+        "params": {"channel": channel, "data": {"market": market, "bid": bid}},
+    }
+
+
+class SlowCallback:
+    """Callback that blocks until released, recording what it received."""
+
+    def __init__(self):
+        self.received: list[tuple[str, str]] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, ws_channel, msg):
+        await self.release.wait()
+        data = msg["params"]["data"]
+        self.received.append((data["market"], data["bid"]))
+
+
+class TestConflatingCallback:
+    def test_market_key(self):
+        assert market_key(message("bbo.BTC-USD-PERP", "BTC-USD-PERP", "1")) == "BTC-USD-PERP"
+        assert market_key({"id": 1}) == ""
+        assert market_key(object()) == ""
+
+    @pytest.mark.asyncio
+    async def test_delivers_latest_per_market(self):
+        callback = SlowCallback()
+        conflator = ConflatingCallback(callback)
+
+        await conflator(ParadexWebsocketChannel.MARKETS_SUMMARY, message("markets_summary", "BTC-USD-PERP", "1"))
+        await asyncio.sleep(0)  # first update is now in the callback
+        for bid in ("2", "3", "4"):
+            await conflator(ParadexWebsocketChannel.MARKETS_SUMMARY, message("markets_summary", "BTC-USD-PERP", bid))
+        await conflator(ParadexWebsocketChannel.MARKETS_SUMMARY, message("markets_summary", "ETH-USD-PERP", "10"))
+        callback.release.set()
+        await conflator.join()
+
+        assert callback.received == [("BTC-USD-PERP", "1"), ("BTC-USD-PERP", "4"), ("ETH-USD-PERP", "10")]
+        assert conflator.stats() == {
+            "delivered": 3,
+            "coalesced": 2,
+            "pending": 0,
+            "coalesced_by_key": {"BTC-USD-PERP": 2},
+        }
+
+    @pytest.mark.asyncio
+    async def test_callback_error_does_not_stop_delivery(self):
+        received = []
+
+        async def callback(ws_channel, msg):
+            if msg["params"]["data"]["bid"] == "1":
+                raise RuntimeError("boom")
+            received.append(msg["params"]["data"]["bid"])
+
+        conflator = ConflatingCallback(callback)
+        await conflator(ParadexWebsocketChannel.BBO, message("bbo.BTC-USD-PERP", "BTC-USD-PERP", "1"))
+        await conflator.join()
+        await conflator(ParadexWebsocketChannel.BBO, message("bbo.BTC-USD-PERP", "BTC-USD-PERP", "2"))
+        await conflator.join()
+
+        assert received == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_close_discards_pending(self):
+        callback = SlowCallback()
+        conflator = ConflatingCallback(callback)
+        await conflator(ParadexWebsocketChannel.BBO, message("bbo.BTC-USD-PERP", "BTC-USD-PERP", "1"))
+        await asyncio.sleep(0)
+        await conflator(ParadexWebsocketChannel.BBO, message("bbo.BTC-USD-PERP", "BTC-USD-PERP", "2"))
+
+        await conflator.close()
+
+        assert conflator.stats()["pending"] == 0
+        assert callback.received == []
+
+
+class TestClientConflation:
+    @pytest.mark.asyncio
+    async def test_subscribe_conflate_bbo(self):
+        client = ParadexWebsocketClient(env=TESTNET)
+        callback = SlowCallback()
+        await client.subscribe(ParadexWebsocketChannel.BBO, callback, params={"market": "BTC-USD-PERP"}, conflate=True)
+
+        for bid in ("1", "2", "3"):
+            await client.inject(json.dumps(message("bbo.BTC-USD-PERP", "BTC-USD-PERP", bid)))
+            await asyncio.sleep(0)
+        callback.release.set()
+        await client.conflators["bbo.BTC-USD-PERP"].join()
+
+        assert callback.received == [("BTC-USD-PERP", "1"), ("BTC-USD-PERP", "3")]
+        assert client.get_conflation_stats()["bbo.BTC-USD-PERP"]["coalesced"] == 1
+
+        await client.unsubscribe_by_name("bbo.BTC-USD-PERP")
+        assert client.get_conflation_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_unsupported_channel(self):
+        client = ParadexWebsocketClient(env=TESTNET)
+        with pytest.raises(ValueError, match="not supported"):
+            await client.subscribe(
+                ParadexWebsocketChannel.ORDERS, SlowCallback(), params={"market": "ALL"}, conflate=True
+            )
+
+    @pytest.mark.asyncio
+    async def test_order_book_deltas_rejected(self):
+        client = ParadexWebsocketClient(env=TESTNET)
+        with pytest.raises(ValueError, match="snapshot"):
+            await client.subscribe(
+                ParadexWebsocketChannel.ORDER_BOOK,
+                SlowCallback(),
+                params={"market": "BTC-USD-PERP", "feed_type": "deltas"},
+                conflate=True,
+            )
@@ -0,0 +1,147 @@
+"""Tests for WebSocket frame decoders and the client fast path."""
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import BaseModel
+
+from paradex_py.api.ws_client import ParadexWebsocketChannel, ParadexWebsocketClient
+from paradex_py.api.ws_decoder import (
+    MSGSPEC_AVAILABLE,
+    ORJSON_AVAILABLE,
+    WsDecoder,
+    get_decoder,
+    peek_channel,
+)
+from paradex_py.environment import TESTNET
+from tests.mocks.ws import frame
+
+BBO_FRAME = frame(
+    "bbo.BTC-USD-PERP", {"market": "BTC-USD-PERP", "bid": "65000.1", "ask": "65000.2", "channel": "nested"}
+)
+
+AVAILABLE_DECODERS = ["json"]
+if ORJSON_AVAILABLE:
+    AVAILABLE_DECODERS.append("orjson")
+if MSGSPEC_AVAILABLE:
+    AVAILABLE_DECODERS.append("msgspec")
+
+
+class BboData(BaseModel):
+    market: str
+    bid: str
+    ask: str
+
+
+class BboParams(BaseModel):
+    channel: str
+    data: BboData
+
+
+class BboFrame(BaseModel):
+    params: BboParams
+
+
+def make_ws_client(**kwargs) -> ParadexWebsocketClient:
+    return ParadexWebsocketClient(env=TESTNET, **kwargs)
+
+
+class TestPeekChannel:
+    def test_subscription_frame(self):
+        assert peek_channel(BBO_FRAME) == "bbo.BTC-USD-PERP"
+
+    def test_bytes_frame(self):
+        assert peek_channel(BBO_FRAME.encode()) == "bbo.BTC-USD-PERP"
+
+    def test_rpc_response_is_not_peeked(self):
+        frame = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"channel": "bbo.BTC-USD-PERP"}})
+        assert peek_channel(frame) is None
+
+    def test_channel_inside_data_is_ignored(self):
+        frame = json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": "subscription",
+                "params": {"data": {"channel": "fake"}, "channel": "trades.ALL"},
+            }
+        )
+        assert peek_channel(frame) is None
+
+
+class TestDecoders:
+    @pytest.mark.parametrize("name", AVAILABLE_DECODERS)
+    def test_decode_matches_stdlib(self, name):
+        assert get_decoder(name).decode(BBO_FRAME) == json.loads(BBO_FRAME)
+
+    @pytest.mark.parametrize("name", AVAILABLE_DECODERS)
+    def test_decode_typed_pydantic(self, name):
+        frame = get_decoder(name).decode_typed(BBO_FRAME.encode(), BboFrame)
+        assert frame.params.data.bid == "65000.1"
+
+    def test_unknown_decoder(self):
+        with pytest.raises(ValueError, match="Unknown WebSocket decoder"):
+            get_decoder("yaml")
+
+    def test_decode_typed_rejects_unknown_type(self):
+        with pytest.raises(ValueError, match="cannot decode into"):
+            WsDecoder().decode_typed(BBO_FRAME, dict)
+
+    @pytest.mark.skipif(not MSGSPEC_AVAILABLE, reason="msgspec not installed")
+    def test_msgspec_struct(self):
+        import msgspec
+
+        class Params(msgspec.Struct):
+            channel: str
+
+        class Frame(msgspec.Struct):
+            params: Params
+
+        frame = get_decoder("msgspec").decode_typed(BBO_FRAME, Frame)
+        assert frame.params.channel == "bbo.BTC-USD-PERP"
+
+
+class TestClientFastPath:
+    def test_decoder_option(self):
+        assert make_ws_client(decoder="json").decoder.name == "json"
+        decoder = WsDecoder()
+        assert make_ws_client(decoder=decoder).decoder is decoder
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_channel_is_not_decoded(self):
+        client = make_ws_client(decoder="json")
+        client.decoder.decode = lambda raw: pytest.fail("frame should not be decoded")  # type: ignore[method-assign]
+
+        await client._process_message(BBO_FRAME)
+
+    @pytest.mark.asyncio
+    async def test_dict_callback_with_bytes_frame(self):
+        client = make_ws_client()
+        callback = AsyncMock()
+        client.callbacks["bbo.BTC-USD-PERP"] = callback
+
+        await client._process_message(BBO_FRAME.encode())
+
+        callback.assert_awaited_once_with(ParadexWebsocketChannel.BBO, json.loads(BBO_FRAME))
+
+    @pytest.mark.asyncio
+    async def test_typed_callback(self):
+        client = make_ws_client()
+        callback = AsyncMock()
+        await client.subscribe_by_name("bbo.BTC-USD-PERP", callback, model=BboFrame)
+
+        await client.inject(BBO_FRAME)
+
+        ws_channel, frame = callback.call_args[0]
+        assert ws_channel == ParadexWebsocketChannel.BBO
+        assert isinstance(frame, BboFrame)
+        assert frame.params.data.ask == "65000.2"
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_drops_model(self):
+        client = make_ws_client()
+        await client.subscribe_by_name("bbo.BTC-USD-PERP", AsyncMock(), model=BboFrame)
+
+        await client.unsubscribe_by_name("bbo.BTC-USD-PERP")
+
+        assert "bbo.BTC-USD-PERP" not in client.channel_models
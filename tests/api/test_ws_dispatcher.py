@@ -0,0 +1,268 @@
+"""Tests for per-channel WebSocket callback dispatch."""
+
+import asyncio
+
+import pytest
+
+from paradex_py.api.ws_client import ParadexWebsocketChannel, ParadexWebsocketClient
+from paradex_py.api.ws_dispatcher import ChannelDispatcher, OverflowPolicy
+from paradex_py.environment import TESTNET
+from tests.mocks.ws import frame
+
+
+async def deliver(channel_name, callback, ws_channel, message):
+    await callback(ws_channel, message)
+
+
+class TestChannelDispatcher:
+    @pytest.mark.asyncio
+    async def test_preserves_order_per_channel(self):
+        dispatcher = ChannelDispatcher(deliver, maxsize=10)
+        received = []
+
+        async def callback(ws_channel, message):
+            await asyncio.sleep(0)
+            received.append(message)
+
+        for i in range(20):
+            await dispatcher.dispatch("orders.ALL", callback, ParadexWebsocketChannel.ORDERS, i)
+        await dispatcher.join()
+
+        assert received == list(range(20))
+        stats = dispatcher.stats()["orders.ALL"]
+        assert stats["enqueued"] == stats["processed"] == 20
+        assert stats["depth"] == 0
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_channel_does_not_block_others(self):
+        dispatcher = ChannelDispatcher(deliver, maxsize=10)
+        release = asyncio.Event()
+        fast = []
+
+        async def slow(ws_channel, message):
+            await release.wait()
+
+        async def quick(ws_channel, message):
+            fast.append(message)
+
+        await dispatcher.dispatch("fills.ALL", slow, ParadexWebsocketChannel.FILLS, 0)
+        for i in range(3):
+            await dispatcher.dispatch("bbo.BTC-USD-PERP", quick, ParadexWebsocketChannel.BBO, i)
+        await asyncio.sleep(0.01)
+
+        assert fast == [0, 1, 2]
+        assert dispatcher.stats()["fills.ALL"]["processed"] == 0
+        release.set()
+        await dispatcher.join()
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self):
+        dispatcher = ChannelDispatcher(deliver, maxsize=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        release = asyncio.Event()
+        received = []
+
+        async def callback(ws_channel, message):
+            await release.wait()
+            received.append(message)
+
+        await dispatcher.dispatch("trades.ALL", callback, ParadexWebsocketChannel.TRADES, 0)
+        await asyncio.sleep(0)  # worker picks up message 0 and blocks
+        for i in range(1, 5):
+            await dispatcher.dispatch("trades.ALL", callback, ParadexWebsocketChannel.TRADES, i)
+        release.set()
+        await dispatcher.join()
+
+        assert received == [0, 3, 4]
+        stats = dispatcher.stats()["trades.ALL"]
+        assert stats["dropped"] == 2
+        assert stats["max_depth"] == 2
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_conflate_latest_per_channel_override(self):
+        dispatcher = ChannelDispatcher(deliver, maxsize=100)
+        dispatcher.set_overflow_policy("bbo.BTC-USD-PERP", OverflowPolicy.CONFLATE_LATEST)
+        release = asyncio.Event()
+        received = []
+
+        async def callback(ws_channel, message):
+            await release.wait()
+            received.append(message)
+
+        await dispatcher.dispatch("bbo.BTC-USD-PERP", callback, ParadexWebsocketChannel.BBO, 0)
+        await asyncio.sleep(0)
+        for i in range(1, 10):
+            await dispatcher.dispatch("bbo.BTC-USD-PERP", callback, ParadexWebsocketChannel.BBO, i)
+        release.set()
+        await dispatcher.join()
+
+        assert received == [0, 9]
+        assert dispatcher.stats()["bbo.BTC-USD-PERP"]["conflated"] == 8
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_block_applies_backpressure(self):
+        dispatcher = ChannelDispatcher(deliver, maxsize=1)
+        release = asyncio.Event()
+
+        async def callback(ws_channel, message):
+            await release.wait()
+
+        await dispatcher.dispatch("orders.ALL", callback, ParadexWebsocketChannel.ORDERS, 0)
+        await asyncio.sleep(0)
+        await dispatcher.dispatch("orders.ALL", callback, ParadexWebsocketChannel.ORDERS, 1)
+        blocked = asyncio.create_task(dispatcher.dispatch("orders.ALL", callback, ParadexWebsocketChannel.ORDERS, 2))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await dispatcher.join()
+        assert dispatcher.stats()["orders.ALL"]["processed"] == 3
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_callback_error_keeps_worker_alive(self):
+        dispatcher = ChannelDispatcher(deliver, maxsize=10)
+        received = []
+
+        async def callback(ws_channel, message):
+            if message == 0:
+                raise RuntimeError("boom")
+            received.append(message)
+
+        await dispatcher.dispatch("orders.ALL", callback, ParadexWebsocketChannel.ORDERS, 0)
+        await dispatcher.dispatch("orders.ALL", callback, ParadexWebsocketChannel.ORDERS, 1)
+        await dispatcher.join()
+
+        assert received == [1]
+        assert dispatcher.stats()["orders.ALL"]["errors"] == 1
+        await dispatcher.close()
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            ChannelDispatcher(deliver, maxsize=0)
+        with pytest.raises(ValueError):
+            ChannelDispatcher(deliver).maxsize = 0
+
+    @pytest.mark.asyncio
+    async def test_policy_and_size_changes_apply_to_existing_queues(self):
+        dispatcher = ChannelDispatcher(deliver, maxsize=100)
+        release = asyncio.Event()
+        received = []
+
+        async def callback(ws_channel, message):
+            await release.wait()
+            received.append(message)
+
+        await dispatcher.dispatch("bbo.BTC-USD-PERP", callback, ParadexWebsocketChannel.BBO, 0)
+        await asyncio.sleep(0)
+        for i in range(1, 6):
+            await dispatcher.dispatch("bbo.BTC-USD-PERP", callback, ParadexWebsocketChannel.BBO, i)
+
+        # The running channel now keeps only its latest pending message
+        dispatcher.set_overflow_policy("bbo.BTC-USD-PERP", OverflowPolicy.CONFLATE_LATEST)
+        assert dispatcher.stats()["bbo.BTC-USD-PERP"]["depth"] == 1
+        await dispatcher.dispatch("bbo.BTC-USD-PERP", callback, ParadexWebsocketChannel.BBO, 6)
+        release.set()
+        await dispatcher.join()
+        assert received == [0, 6]
+        assert dispatcher.stats()["bbo.BTC-USD-PERP"]["conflated"] == 5
+
+        # Growing a blocking queue releases a producer waiting for room
+        release.clear()
+        dispatcher.set_overflow_policy("bbo.BTC-USD-PERP", None)
+        dispatcher.maxsize = 1
+        await dispatcher.dispatch("bbo.BTC-USD-PERP", callback, ParadexWebsocketChannel.BBO, 7)
+        await asyncio.sleep(0)
+        await dispatcher.dispatch("bbo.BTC-USD-PERP", callback, ParadexWebsocketChannel.BBO, 8)
+        blocked = asyncio.create_task(dispatcher.dispatch("bbo.BTC-USD-PERP", callback, ParadexWebsocketChannel.BBO, 9))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        dispatcher.maxsize = 10
+        await asyncio.wait_for(blocked, 1)
+        release.set()
+        await dispatcher.join()
+        assert received == [0, 6, 7, 8, 9]
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_remove_cancels_worker_and_drops_queue(self):
+        dispatcher = ChannelDispatcher(deliver, maxsize=10)
+        release = asyncio.Event()
+        received = []
+
+        async def callback(ws_channel, message):
+            await release.wait()
+            received.append(message)
+
+        for i in range(3):
+            await dispatcher.dispatch("trades.ALL", callback, ParadexWebsocketChannel.TRADES, i)
+        await asyncio.sleep(0)
+        worker = dispatcher._workers["trades.ALL"]
+
+        await dispatcher.remove("trades.ALL")
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert worker.cancelled()
+        assert received == []
+        assert dispatcher.stats() == {}
+        await dispatcher.remove("trades.ALL")  # Unknown channels are ignored
+
+        # A new subscription starts from an empty queue
+        await dispatcher.dispatch("trades.ALL", callback, ParadexWebsocketChannel.TRADES, 3)
+        await dispatcher.join()
+        assert received == [3]
+        await dispatcher.close()
+
+
+class TestClientDispatch:
+    def test_disabled_by_default(self):
+        client = ParadexWebsocketClient(env=TESTNET)
+        assert client.dispatcher is None
+        assert client.get_queue_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_client_routes_through_queues(self):
+        client = ParadexWebsocketClient(env=TESTNET, dispatch_queue_size=8, overflow_policy="drop_oldest")
+        received = []
+
+        async def callback(ws_channel, message):
+            received.append((ws_channel, message["params"]["data"]["seq"]))
+
+        client.callbacks["orders.ALL"] = callback
+        for i in range(3):
+            await client.inject(frame("orders.ALL", {"seq": i}))
+        await client.dispatcher.join()  # type: ignore[union-attr]
+
+        assert received == [(ParadexWebsocketChannel.ORDERS, i) for i in range(3)]
+        assert client.dispatcher.overflow_policy is OverflowPolicy.DROP_OLDEST  # type: ignore[union-attr]
+        assert client.get_queue_stats()["orders.ALL"]["processed"] == 3
+
+        await client.close()
+        assert client.dispatcher._workers == {}  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_removes_channel_worker(self):
+        client = ParadexWebsocketClient(env=TESTNET, dispatch_queue_size=8)
+        received = []
+
+        async def callback(ws_channel, message):
+            seq = message["params"]["data"]["seq"]
+            received.append(seq)
+            if seq == 0:
+                # A callback may unsubscribe its own channel
+                await client.unsubscribe_by_name("orders.ALL")
+
+        client.callbacks["orders.ALL"] = callback
+        for i in range(3):
+            await client.inject(frame("orders.ALL", {"seq": i}))
+        await asyncio.sleep(0.01)
+
+        assert received == [0]
+        assert client.dispatcher._workers == {}  # type: ignore[union-attr]
+        assert client.get_queue_stats() == {}
+        await client.close()
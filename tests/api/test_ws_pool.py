@@ -0,0 +1,119 @@
+"""Tests for the sharded WebSocket pool."""
+
+import asyncio
+import json
+
+import pytest
+from websockets import State
+
+from paradex_py.api.ws_client import ParadexWebsocketChannel
+from paradex_py.api.ws_pool import ParadexWebsocketPool
+from paradex_py.environment import TESTNET
+from tests.mocks.ws import frame, wait_for
+
+MARKETS = [f"M{i}-USD-PERP" for i in range(40)]
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.state = State.OPEN
+        self.sent: list[dict] = []
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def send(self, data: str) -> None:
+        message = json.loads(data)
+        self.sent.append(message)
+        if message["method"] == "subscribe":
+            ack = {"jsonrpc": "2.0", "id": message["id"], "result": {"channel": message["params"]["channel"]}}
+            self.queue.put_nowait(json.dumps(ack))
+
+    async def recv(self) -> str:
+        return await self.queue.get()
+
+    async def close(self) -> None:
+        self.state = State.CLOSED
+
+    def push(self, channel: str, count: int) -> None:
+        for i in range(count):
+            self.queue.put_nowait(frame(channel, {"seq": i}))
+
+
+async def connector(url: str, headers: dict) -> FakeWebSocket:
+    return FakeWebSocket()
+
+
+def make_pool(**kwargs) -> ParadexWebsocketPool:
+    return ParadexWebsocketPool(
+        env=TESTNET, connector=connector, reader_sleep_on_no_connection=0.001, ws_timeout=1, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_channels_are_sharded_by_market():
+    received: list[str] = []
+
+    async def on_message(channel, message):
+        received.append(message["params"]["channel"])
+
+    async with make_pool(connections=4, groups={"M0-USD-PERP": 3}) as pool:
+        for market in MARKETS[:8]:
+            bbo = await pool.subscribe(ParadexWebsocketChannel.BBO, on_message, params={"market": market})
+            trades = await pool.subscribe(ParadexWebsocketChannel.TRADES, on_message, params={"market": market})
+            assert bbo == trades
+        summary = await pool.subscribe(ParadexWebsocketChannel.MARKETS_SUMMARY, on_message)
+
+        assert pool.client_for("bbo.M0-USD-PERP") is pool.clients[3]
+        assert pool.client_for("markets_summary") is pool.clients[summary]
+        assert len({s.connection for s in pool.subscriptions.values()}) > 1
+        await wait_for(lambda: len(pool.get_subscriptions()) == 17 and all(pool.get_subscriptions().values()))
+
+        # Every connection has its own reader
+        for market in MARKETS[:8]:
+            pool.client_for(f"bbo.{market}").ws.push(f"bbo.{market}", 2)
+        await wait_for(lambda: len(received) == 16)
+
+        stats = pool.get_stats()
+        assert stats["channels"]["bbo.M1-USD-PERP"]["frames"] == 2
+        assert sum(c["channels"] for c in stats["connections"]) == 17
+        assert all(c["connected"] for c in stats["connections"])
+
+
+@pytest.mark.asyncio
+async def test_rebalance_moves_markets_off_busy_connection():
+    received: list[str] = []
+
+    async def on_message(channel, message):
+        received.append(message["params"]["channel"])
+
+    async with make_pool(connections=2) as pool:
+        hot = [m for m in MARKETS if pool.shard_for(m) == 0][:3]
+        for market in hot:
+            await pool.subscribe(ParadexWebsocketChannel.BBO, on_message, params={"market": market})
+        busy = pool.clients[0]
+        pool.reset_stats()
+        for market, frames in zip(hot, (40, 60, 50), strict=True):
+            busy.ws.push(f"bbo.{market}", frames)
+        await wait_for(lambda: len(received) == 150)
+
+        moves = await pool.rebalance()
+
+        # The busiest market moves; the remaining 90 msg/s are within twice the other connection's 60
+        assert moves == [(hot[1], 0, 1)]
+        moved = f"bbo.{hot[1]}"
+        assert pool.client_for(moved) is pool.clients[1]
+        assert moved not in busy.callbacks
+        assert {"method": "unsubscribe", "channel": moved} in [
+            {"method": m["method"], "channel": m["params"]["channel"]} for m in busy.ws.sent
+        ]
+
+        pool.clients[1].ws.push(moved, 1)
+        await wait_for(lambda: len(received) == 151)
+        assert received[-1] == moved
+
+        # Quiet period: nothing to move
+        assert await pool.rebalance() == []
+
+
+def test_pinned_markets_are_validated():
+    with pytest.raises(ValueError, match="no connection"):
+        make_pool(connections=2, groups={"BTC-USD-PERP": 2})
@@ -0,0 +1,177 @@
+"""Tests for pipelined resubscription and reconnect backoff."""
+
+import asyncio
+import json
+
+import pytest
+from websockets import State
+from websockets.exceptions import ConnectionClosedError
+
+from paradex_py.api.protocols import JitteredBackoffStrategy
+from paradex_py.api.ws_client import ParadexWebsocketClient
+from paradex_py.environment import TESTNET
+from tests.mocks.ws import wait_for
+
+CHANNELS = [f"bbo.MARKET-{i}-USD-PERP" for i in range(20)]
+
+
+class AckingWebSocket:
+    """Acknowledges subscribe frames by request id once the reader asks for them."""
+
+    def __init__(self, reject: set[str] | None = None):
+        self.state = State.OPEN
+        self.sent: list[dict] = []
+        self.reject = reject or set()
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.sent_before_first_ack: int | None = None
+
+    async def send(self, data: str) -> None:
+        message = json.loads(data)
+        self.sent.append(message)
+        if message["method"] == "subscribe":
+            channel = message["params"]["channel"]
+            if channel in self.reject:
+                ack = {"jsonrpc": "2.0", "id": message["id"], "error": {"code": -32600, "message": "rejected"}}
+            else:
+                ack = {"jsonrpc": "2.0", "id": message["id"], "result": {"channel": channel}}
+            self.queue.put_nowait(json.dumps(ack))
+
+    async def recv(self) -> str:
+        item = await self.queue.get()
+        if isinstance(item, Exception):
+            raise item
+        if self.sent_before_first_ack is None:
+            self.sent_before_first_ack = len(self.subscribes)
+        return item
+
+    async def close(self) -> None:
+        self.state = State.CLOSED
+
+    def drop(self) -> None:
+        self.state = State.CLOSED
+        self.queue.put_nowait(ConnectionClosedError(None, None))
+
+    @property
+    def subscribes(self) -> list[dict]:
+        return [m for m in self.sent if m["method"] == "subscribe"]
+
+
+class Connector:
+    def __init__(self, failures: int = 0, reject: set[str] | None = None):
+        self.failures = failures
+        self.reject = reject
+        self.sockets: list[AckingWebSocket] = []
+
+    async def __call__(self, url: str, headers: dict) -> AckingWebSocket:
+        if self.failures:
+            self.failures -= 1
+            raise OSError("connection refused")
+        ws = AckingWebSocket(reject=self.reject)
+        self.sockets.append(ws)
+        return ws
+
+
+async def noop(channel, message):
+    pass
+
+
+async def subscribed_client(connector: Connector, **kwargs) -> ParadexWebsocketClient:
+    client = ParadexWebsocketClient(
+        env=TESTNET,
+        connector=connector,
+        reconnect_strategy=JitteredBackoffStrategy(base_delay=0.001, max_delay=0.01),
+        reader_sleep_on_no_connection=0.001,
+        **kwargs,
+    )
+    await client.connect()
+    for channel in CHANNELS:
+        await client.subscribe_by_name(channel, noop)
+    await wait_for(lambda: all(client.get_subscriptions().get(c) for c in CHANNELS))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_is_pipelined_and_timed():
+    connector = Connector()
+    client = await subscribed_client(connector)
+    try:
+        assert client.get_reconnect_stats()["last_resubscribe_time"] is None
+
+        connector.sockets[0].drop()
+        await wait_for(lambda: client.get_reconnect_stats()["last_resubscribe_time"] is not None)
+
+        new_ws = connector.sockets[1]
+        assert client.ws is new_ws
+        # Every frame went out before the first acknowledgement was read
+        assert new_ws.sent_before_first_ack == len(CHANNELS)
+        assert [m["params"]["channel"] for m in new_ws.subscribes] == CHANNELS
+        assert len({m["id"] for m in new_ws.subscribes}) == len(CHANNELS)
+        assert client.get_subscriptions() == dict.fromkeys(CHANNELS, True)
+        assert client.get_pending_subscriptions() == []
+
+        stats = client.get_reconnect_stats()
+        assert stats["reconnects"] == 1
+        assert stats["last_resubscribed_channels"] == len(CHANNELS)
+        assert 0 <= stats["last_connect_time"] <= stats["last_resubscribe_time"] <= stats["max_resubscribe_time"]
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_backs_off_until_connected():
+    connector = Connector()
+    client = await subscribed_client(connector)
+    try:
+        connector.failures = 3
+        connector.sockets[0].drop()
+        await wait_for(lambda: client.get_reconnect_stats()["last_resubscribe_time"] is not None)
+
+        stats = client.get_reconnect_stats()
+        assert stats["reconnects"] == 1
+        assert stats["failed_attempts"] == 3
+        assert len(connector.sockets) == 2
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_gives_up_after_max_retries():
+    connector = Connector(failures=10)
+    client = ParadexWebsocketClient(
+        env=TESTNET,
+        connector=connector,
+        auto_start_reader=False,
+        reconnect_strategy=JitteredBackoffStrategy(max_retries=2, base_delay=0.001),
+    )
+    await client._reconnect()
+
+    assert client.ws is None
+    assert client.get_reconnect_stats()["failed_attempts"] == 3
+    assert not client._reconnecting
+
+
+@pytest.mark.asyncio
+async def test_rejected_resubscriptions_are_counted():
+    connector = Connector()
+    client = await subscribed_client(connector)
+    try:
+        connector.reject = {CHANNELS[0]}
+        connector.sockets[0].drop()
+        await wait_for(lambda: client.get_reconnect_stats()["last_resubscribe_time"] is not None)
+
+        assert client.get_reconnect_stats()["subscribe_errors"] == 1
+        assert CHANNELS[0] not in client.get_subscriptions()
+    finally:
+        await client.close()
+
+
+def test_jittered_backoff_delays():
+    strategy = JitteredBackoffStrategy(base_delay=0.5, max_delay=4.0)
+    for attempt in range(10):
+        assert 0 <= strategy.get_delay(attempt) <= min(4.0, 0.5 * 2**attempt)
+    assert strategy.get_delay(5000) <= 4.0
+    assert strategy.should_retry(5000, None, OSError())
+
+    bounded = JitteredBackoffStrategy(max_retries=2)
+    assert bounded.should_retry(1, None, OSError())
+    assert not bounded.should_retry(2, None, OSError())
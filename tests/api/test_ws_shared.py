@@ -0,0 +1,97 @@
+"""Tests for publishing WebSocket market data to shared memory."""
+
+import asyncio
+import json
+import time
+
+import pytest
+from websockets import State
+
+from paradex_py.api.ws_client import ParadexWebsocketClient
+from paradex_py.api.ws_shared import SharedBookPublisher, SharedMarketDataProcess
+from paradex_py.common.shared_book import SharedBookTable
+from paradex_py.environment import TESTNET
+from tests.mocks.ws import frame
+
+
+def bbo_frame(market: str, bid: str, ask: str) -> str:
+    data = {"market": market, "bid": bid, "bid_size": "1.5", "ask": ask, "ask_size": "2", "seq_no": 7}
+    return frame(f"bbo.{market}", data)
+
+
+class QuotingWebSocket:
+    """Answers every BBO subscription with one quote."""
+
+    def __init__(self):
+        self.state = State.OPEN
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def send(self, data: str) -> None:
+        message = json.loads(data)
+        if message["method"] == "subscribe":
+            channel = message["params"]["channel"]
+            self.queue.put_nowait(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": {"channel": channel}}))
+            self.queue.put_nowait(bbo_frame(channel.split(".")[1], "100.5", "101"))
+
+    async def recv(self) -> str:
+        return await self.queue.get()
+
+    async def close(self) -> None:
+        self.state = State.CLOSED
+
+
+async def quoting_connector(url: str, headers: dict) -> QuotingWebSocket:
+    return QuotingWebSocket()
+
+
+@pytest.mark.asyncio
+async def test_publisher_writes_bbo_and_order_book():
+    with (
+        SharedBookTable.create(["BTC-USD-PERP"], depth=1, decimals=2) as bbo_table,
+        SharedBookTable.create(["ETH-USD-PERP"], depth=2, decimals=2) as book_table,
+    ):
+        client = ParadexWebsocketClient(env=TESTNET, auto_start_reader=False)
+        bbo = SharedBookPublisher(bbo_table)
+        book = SharedBookPublisher(book_table)
+        await bbo.subscribe(client)
+        await book.subscribe(client)
+        assert sorted(client.callbacks) == ["bbo.BTC-USD-PERP", "order_book.ETH-USD-PERP.snapshot@15@100ms"]
+
+        await client.inject(bbo_frame("BTC-USD-PERP", "65000.5", "65001"))
+        levels = [
+            {"side": "SELL", "price": "3001", "size": "1"},
+            {"side": "BUY", "price": "2999", "size": "2"},
+            {"side": "BUY", "price": "3000", "size": "3"},
+            {"side": "SELL", "price": "3002", "size": "4"},
+            {"side": "BUY", "price": "2998", "size": "5"},
+        ]
+        await client.inject(
+            frame("order_book.ETH-USD-PERP.snapshot@15@100ms", {"market": "ETH-USD-PERP", "inserts": levels})
+        )
+
+        assert bbo_table.bbo("BTC-USD-PERP") == (6500050, 150, 6500100, 200)
+        assert bbo_table.read("BTC-USD-PERP").seq_no == 7
+        snapshot = book_table.read("ETH-USD-PERP")
+        assert snapshot.bids == [(300000, 300), (299900, 200)]
+        assert snapshot.asks == [(300100, 100), (300200, 400)]
+        assert (bbo.updates, book.updates) == (1, 1)
+
+        await client.inject(frame("bbo.BTC-USD-PERP", {"market": "BTC-USD-PERP", "bid": "1.234", "bid_size": "1"}))
+        assert bbo.errors == 1
+
+
+def test_reader_process_publishes_to_shared_memory():
+    markets = ["BTC-USD-PERP", "ETH-USD-PERP"]
+    with SharedMarketDataProcess(
+        env=TESTNET, markets=markets, decimals=2, ws_kwargs={"connector": quoting_connector}
+    ) as feed:
+        reader = SharedBookTable.attach(feed.name)
+        try:
+            deadline = time.monotonic() + 30
+            while any(reader.bbo(m) is None for m in markets) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert [reader.bbo(m) for m in markets] == [(10050, 150, 10100, 200)] * 2
+        finally:
+            reader.close()
+        assert feed.is_alive()
+    assert not feed.is_alive()
@@ -0,0 +1,118 @@
+"""Tests for WebSocket hot-path counters and lazy logging."""
+
+import json
+import logging
+
+import pytest
+from pydantic import BaseModel
+
+from paradex_py.api.ws_client import ParadexWebsocketClient
+from paradex_py.api.ws_stats import WsStats
+from paradex_py.environment import TESTNET
+from tests.mocks.ws import frame
+
+
+class Params(BaseModel):
+    channel: str
+
+
+class Frame(BaseModel):
+    params: Params
+
+
+class ReprCountingCallback:
+    def __init__(self):
+        self.calls = 0
+        self.reprs = 0
+
+    async def __call__(self, ws_channel, message):
+        self.calls += 1
+
+    def __repr__(self):
+        self.reprs += 1
+        return "ReprCountingCallback()"
+
+
+class TestWsStats:
+    def test_record_and_reset(self):
+        stats = WsStats()
+        stats.record_frame("bbo.BTC-USD-PERP", 100, 0.5)
+        stats.record_frame(None, 20)
+        stats.record_callback("bbo.BTC-USD-PERP", 0.25, failed=True)
+
+        snapshot = stats.snapshot()
+        assert snapshot["frames_received"] == 2
+        assert snapshot["bytes_received"] == 120
+        assert snapshot["channels"]["bbo.BTC-USD-PERP"] == {
+            "frames": 1,
+            "bytes": 100,
+            "decode_time": 0.5,
+            "callback_time": 0.25,
+            "callback_errors": 1,
+        }
+
+        stats.reset()
+        assert stats.snapshot()["frames_received"] == 0
+        assert stats.channels == {}
+
+
+class TestClientStats:
+    def test_disabled_by_default(self):
+        client = ParadexWebsocketClient(env=TESTNET)
+        assert client.stats is None
+        assert client.get_stats() == {}
+        client.reset_stats()
+
+    @pytest.mark.asyncio
+    async def test_counts_frames_per_channel(self):
+        client = ParadexWebsocketClient(env=TESTNET, collect_stats=True)
+        callback = ReprCountingCallback()
+        client.callbacks["bbo.BTC-USD-PERP"] = callback
+        await client.subscribe_by_name("trades.ALL", callback, model=Frame)
+
+        await client.inject(frame("bbo.BTC-USD-PERP", {}))
+        await client.inject(frame("bbo.BTC-USD-PERP", {}).encode())
+        await client.inject(frame("trades.ALL", {}))
+        await client.inject(frame("markets_summary.ALL", {}))
+        await client.inject(json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"channel": "trades.ALL"}}))
+
+        stats = client.get_stats()
+        assert stats["frames_received"] == 5
+        assert stats["channels"]["bbo.BTC-USD-PERP"]["frames"] == 2
+        assert stats["channels"]["trades.ALL"]["frames"] == 1
+        assert stats["channels"]["markets_summary.ALL"]["frames"] == 1
+        assert stats["channels"]["markets_summary.ALL"]["callback_time"] == 0
+        assert callback.calls == 3
+
+        client.reset_stats()
+        assert client.get_stats()["frames_received"] == 0
+
+    @pytest.mark.asyncio
+    async def test_callback_errors_are_counted(self):
+        client = ParadexWebsocketClient(env=TESTNET, collect_stats=True)
+
+        async def failing(ws_channel, message):
+            raise RuntimeError("boom")
+
+        client.callbacks["bbo.BTC-USD-PERP"] = failing
+
+        with pytest.raises(RuntimeError):
+            await client._process_message(frame("bbo.BTC-USD-PERP", {}))
+
+        assert client.get_stats()["channels"]["bbo.BTC-USD-PERP"]["callback_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_debug_message_not_formatted_when_disabled(self):
+        logger = logging.getLogger("test_ws_stats.lazy")
+        logger.setLevel(logging.INFO)
+        client = ParadexWebsocketClient(env=TESTNET, logger=logger)
+        callback = ReprCountingCallback()
+        client.callbacks["bbo.BTC-USD-PERP"] = callback
+
+        await client.inject(frame("bbo.BTC-USD-PERP", {}))
+        assert (callback.calls, callback.reprs) == (1, 0)
+
+        logger.setLevel(logging.DEBUG)
+        await client.inject(frame("bbo.BTC-USD-PERP", {}))
+        assert callback.calls == 2
+        assert callback.reprs > 0
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from paradex_py.common.latency import (
+    AUTH,
+    SIGN,
+    TOTAL,
+    LatencyHistogram,
+    LatencyRecorder,
+    current_spans,
+    timed_stage,
+)
+
+
+def test_histogram_percentiles_are_within_bucket_precision():
+    histogram = LatencyHistogram()
+    rng = random.Random(7)
+    values = [rng.randint(1_000, 50_000_000) for _ in range(10_000)]
+    for value in values:
+        histogram.record(value)
+    values.sort()
+
+    assert (histogram.count, histogram.min, histogram.max) == (10_000, values[0], values[-1])
+    assert histogram.mean == pytest.approx(sum(values) / len(values))
+    for percentile in (50, 90, 99, 99.9):
+        exact = values[int(len(values) * percentile / 100) - 1]
+        assert exact <= histogram.percentile(percentile) <= exact * 1.016
+    assert histogram.percentile(100) == values[-1]
+
+
+def test_histogram_small_values_and_merge():
+    a, b = LatencyHistogram(), LatencyHistogram()
+    for value in range(100):
+        a.record(value)
+    b.record(-5)
+    b.record(10**12)
+    assert a.percentile(50) == 49
+    assert LatencyHistogram().percentile(99) == 0
+
+    a.merge(b)
+    assert (a.count, a.min, a.max) == (102, 0, 10**12)
+    assert a.percentile(100) == 10**12
+    assert len(a.counts) == len(b.counts)
+
+
+def test_recorder_collects_stages_per_operation():
+    recorder = LatencyRecorder()
+    seen = []
+    assert current_spans() is None
+    with timed_stage(SIGN):
+        pass  # No operation running: nothing recorded
+
+    for _ in range(3):
+        with recorder.operation("submit_order", lambda operation, spans: seen.append((operation, spans))) as spans:
+            assert current_spans() is spans
+            with timed_stage(SIGN):
+                pass
+            with timed_stage(SIGN):
+                pass
+            with timed_stage(AUTH):
+                # Nested stages belong to the enclosing one
+                assert current_spans() is None
+                with timed_stage(SIGN):
+                    pass
+    assert current_spans() is None
+
+    summary = recorder.summary()["submit_order"]
+    assert list(summary) == [SIGN, AUTH, TOTAL]
+    assert summary[TOTAL].count == 3
+    assert recorder.histogram("submit_order", SIGN).count == 3
+    assert [operation for operation, _ in seen] == ["submit_order"] * 3
+    assert set(seen[-1][1]) == {SIGN, AUTH, TOTAL}
+    assert recorder.last("submit_order") == seen[-1][1]
+
+    with pytest.raises(RuntimeError), recorder.operation("cancel_order"):
+        raise RuntimeError
+    assert recorder.histogram("cancel_order").count == 1
+
+    recorder.reset()
+    assert recorder.summary() == {}
+    assert recorder.last("submit_order") is None
@@ -1,6 +1,16 @@
 from decimal import Decimal
 
-from paradex_py.common.order import Order, OrderSide, OrderType
+import pytest
+
+from paradex_py.common.order import (
+    FixedPointOrder,
+    Order,
+    OrderSide,
+    OrderType,
+    format_quantums,
+    round_quantums,
+    to_quantums,
+)
 
 
 def test_order_type_values():
@@ -166,3 +176,47 @@ def test_order_side_chain_side():
     """Test that order side chain side works correctly."""
     assert OrderSide.Buy.chain_side() == "1"
     assert OrderSide.Sell.chain_side() == "2"
+
+
+def test_quantum_conversions():
+    assert to_quantums("65000.1") == 6500010000000
+    assert to_quantums(Decimal("0.00000001")) == 1
+    assert to_quantums(0.1) == 10000000
+    assert to_quantums(3) == 300000000
+    with pytest.raises(ValueError, match="decimals"):
+        to_quantums("0.000000001")
+
+    assert format_quantums(6500010000000) == "65000.1"
+    assert format_quantums(-50000000) == "-0.5"
+    assert format_quantums(300000000) == "3"
+
+    assert round_quantums(1234, 100) == 1200
+    assert round_quantums(1234, 100, up=True) == 1300
+    assert round_quantums(1200, 100, up=True) == 1200
+
+
+def test_fixed_point_order_matches_decimal_order():
+    kwargs = {"market": "BTC-USD-PERP", "order_type": OrderType.StopLimit, "order_side": OrderSide.Sell}
+    order = Order(**kwargs, size=Decimal("0.25"), limit_price=Decimal("65000.1"), trigger_price=Decimal(64000))
+    fixed = FixedPointOrder(**kwargs, size="0.25", limit_price=65000.1, trigger_price=64000)
+    fixed.signature_timestamp = order.signature_timestamp
+
+    assert (fixed.chain_size(), fixed.chain_price()) == (order.chain_size(), order.chain_price())
+    assert fixed.dump_to_dict() == {**order.dump_to_dict(), "trigger_price": "64000"}
+    assert fixed.size == Decimal("0.25")
+    assert fixed.remaining == Decimal("0.25")
+
+    market = FixedPointOrder("BTC-USD-PERP", OrderType.Market, OrderSide.Buy, size=Decimal(1))
+    assert market.chain_price() == "0"
+    assert "price" not in market.dump_to_dict()
+
+
+def test_fixed_point_order_round_to_market():
+    market = {"price_tick_size": "0.1", "order_size_increment": "0.001"}
+
+    buy = FixedPointOrder("BTC-USD-PERP", OrderType.Limit, OrderSide.Buy, size="0.0129", limit_price="65000.17")
+    sell = FixedPointOrder("BTC-USD-PERP", OrderType.Limit, OrderSide.Sell, size="0.0129", limit_price="65000.11")
+
+    assert buy.round_to_market(market).limit_price == Decimal("65000.1")
+    assert sell.round_to_market(market).limit_price == Decimal("65000.2")
+    assert buy.size == sell.size == Decimal("0.012")
@@ -0,0 +1,169 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from paradex_py.common.fixed_point import decimals_of, from_fixed, to_fixed
+from paradex_py.common.order import OrderSide
+from paradex_py.common.orderbook import BookSide, OrderBook
+
+SNAPSHOT = {
+    "market": "BTC-USD-PERP",
+    "seq_no": 10,
+    "last_updated_at": 1681462770114,
+    "bids": [["100.0", "1"], ["99.5", "2"], ["99", "3"]],
+    "asks": [["100.5", "1.5"], ["101", "2"], ["102", "4"]],
+}
+
+
+def delta(seq_no, inserts=(), updates=(), deletes=()):
+    return {
+        "market": "BTC-USD-PERP",
+        "seq_no": seq_no,
+        "update_type": "d",
+        "inserts": list(inserts),
+        "updates": list(updates),
+        "deletes": list(deletes),
+    }
+
+
+def level(side, price, size="0"):
+    return {"side": side, "price": price, "size": size}
+
+
+def make_book():
+    book = OrderBook("BTC-USD-PERP", price_decimals=1, size_decimals=2)
+    book.load_snapshot(SNAPSHOT)
+    return book
+
+
+def test_fixed_point_round_trip():
+    assert to_fixed("65000.25", 2) == 6500025
+    assert to_fixed("-0.5", 3) == -500
+    assert to_fixed("3", 2) == 300
+    assert to_fixed("1.500", 1) == 15
+    assert to_fixed(Decimal("0.01"), 2) == 1
+    assert from_fixed(6500025, 2) == Decimal("65000.25")
+    assert decimals_of("0.001") == 3
+    assert decimals_of("10") == 0
+    with pytest.raises(ValueError):
+        to_fixed("1.234", 2)
+
+
+def test_snapshot_best_levels():
+    book = make_book()
+    assert book.in_sync
+    assert book.seq_no == 10
+    assert book.best_bid() == (1000, 100)
+    assert book.best_ask() == (1005, 150)
+    assert book.spread() == 5
+    assert book.bids.levels(2) == [(1000, 100), (995, 200)]
+    assert book.asks.levels() == [(1005, 150), (1010, 200), (1020, 400)]
+
+
+def test_apply_deltas():
+    book = make_book()
+    assert book.apply_update(
+        delta(
+            11,
+            inserts=[level("BUY", "100.2", "0.5")],
+            updates=[level("SELL", "101", "1")],
+            deletes=[level("SELL", "100.5")],
+        )
+    )
+    assert book.best_bid() == (1002, 50)
+    assert book.best_ask() == (1010, 100)
+    assert book.seq_no == 11
+
+
+def test_depth_queries():
+    book = make_book()
+    assert book.depth_at_price(OrderSide.Buy, book.to_price_units("99.5")) == 200
+    assert book.depth_at_price(OrderSide.Buy, book.to_price_units("99.7")) == 0
+    assert book.cumulative_depth(OrderSide.Buy, book.to_price_units("99.5")) == 300
+    assert book.cumulative_depth(OrderSide.Sell, book.to_price_units("101.5")) == 350
+    assert book.cumulative_depth(OrderSide.Sell, book.to_price_units("100")) == 0
+    assert book.asks.cumulative_size(2) == 350
+
+    # Cumulative arrays are rebuilt after an update
+    book.apply_update(delta(11, deletes=[level("SELL", "100.5")]))
+    assert book.asks.cumulative_size(2) == 600
+
+
+def test_vwap():
+    book = make_book()
+    # Buy 2.5: 1.5 @ 100.5 + 1 @ 101
+    assert book.vwap(OrderSide.Sell, book.to_size_units("2.5")) == Decimal("100.7")
+    assert book.vwap(OrderSide.Buy, book.to_size_units("1")) == Decimal("100")
+    assert book.vwap(OrderSide.Sell, book.to_size_units("100")) is None
+
+
+def test_gap_buffers_until_snapshot():
+    book = make_book()
+    assert not book.apply_update(delta(12, inserts=[level("BUY", "100.1", "1")]))
+    assert not book.in_sync
+    assert book.gaps == 1
+    assert not book.apply_update(delta(13, updates=[level("BUY", "100.1", "2")]))
+
+    # Fresh snapshot at seq 11: buffered deltas 12 and 13 are replayed
+    book.load_snapshot({**SNAPSHOT, "seq_no": 11})
+    assert book.in_sync
+    assert book.seq_no == 13
+    assert book.best_bid() == (1001, 200)
+
+
+def test_stale_buffered_deltas_are_skipped():
+    book = OrderBook("BTC-USD-PERP", price_decimals=1, size_decimals=2)
+    assert not book.apply_update(delta(9, inserts=[level("BUY", "200", "1")]))
+    book.load_snapshot(SNAPSHOT)
+    assert book.best_bid() == (1000, 100)
+
+
+def test_ws_snapshot_replaces_book():
+    book = make_book()
+    book.apply_update(
+        {
+            "seq_no": 50,
+            "update_type": "s",
+            "inserts": [level("BUY", "90", "1"), level("SELL", "91", "1")],
+            "updates": [],
+            "deletes": [],
+        }
+    )
+    assert book.in_sync
+    assert book.best_bid() == (900, 100)
+    assert book.best_ask() == (910, 100)
+    assert len(book.bids) == 1
+
+
+@pytest.mark.parametrize("side", [OrderSide.Buy, OrderSide.Sell])
+def test_book_side_queries_match_brute_force(side):
+    rng = random.Random(3)
+    book_side = BookSide(side)
+    levels: dict[int, int] = {}
+    for step in range(2000):
+        price = rng.randint(900, 1100)
+        # Mostly size changes of existing levels, some inserts and deletes
+        size = 0 if rng.random() < 0.2 else rng.randint(1, 50)
+        book_side.set(price, size)
+        if size:
+            levels[price] = size
+        else:
+            levels.pop(price, None)
+        if step % 7:
+            continue
+
+        best_first = sorted(levels.items(), reverse=side == OrderSide.Buy)
+        count = rng.randint(0, len(best_first) + 1)
+        assert book_side.cumulative_size(count) == sum(size for _, size in best_first[:count])
+        limit = rng.randint(900, 1100)
+        better = [size for price, size in best_first if (price - limit) * (1 if side == OrderSide.Buy else -1) >= 0]
+        assert book_side.depth_to_price(limit) == sum(better)
+
+        target = rng.randint(1, sum(levels.values()) + 10)
+        expected, remaining = 0, target
+        for price, size in best_first:
+            take = min(size, remaining)
+            expected += take * price
+            remaining -= take
+        assert book_side.notional_for_size(target) == (expected if remaining == 0 else None)
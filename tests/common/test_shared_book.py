@@ -0,0 +1,111 @@
+import multiprocessing
+
+import pytest
+
+from paradex_py.common import shared_book
+from paradex_py.common.shared_book import SharedBookTable
+
+MARKETS = ["BTC-USD-PERP", "ETH-USD-PERP", "SOL-USD-PERP"]
+
+
+@pytest.fixture
+def table():
+    table = SharedBookTable.create(MARKETS, depth=3, decimals=2)
+    yield table
+    table.close()
+    table.unlink()
+
+
+def test_write_and_read_levels(table):
+    assert table.read("BTC-USD-PERP") is None
+    assert table.bbo("BTC-USD-PERP") is None
+
+    table.write("ETH-USD-PERP", bids=[(300000, 5), (299900, 7)], asks=[(300100, 1)], seq_no=42, last_updated_at=99)
+
+    book = table.read("ETH-USD-PERP")
+    assert book.bids == [(300000, 5), (299900, 7)]
+    assert book.asks == [(300100, 1)]
+    assert (book.seq_no, book.last_updated_at, book.sequence) == (42, 99, 2)
+    assert table.bbo(table.index("ETH-USD-PERP")) == (300000, 5, 300100, 1)
+    assert table.read("BTC-USD-PERP") is None
+
+    # Levels beyond the table depth are dropped, fewer levels clear the rest
+    table.write("ETH-USD-PERP", bids=[(1, 1), (2, 2), (3, 3), (4, 4)], asks=[])
+    book = table.read("ETH-USD-PERP")
+    assert book.bids == [(1, 1), (2, 2), (3, 3)]
+    assert book.asks == []
+    assert table.bbo("ETH-USD-PERP") is None
+    assert table.sequence("ETH-USD-PERP") == 4
+
+
+def test_attach_reads_layout(table):
+    reader = SharedBookTable.attach(table.name)
+    try:
+        assert reader.markets == MARKETS
+        assert (reader.depth, reader.decimals, reader.owner) == (3, 2, False)
+        # Every slot starts a cache line, also with an odd number of market names
+        bases = [reader._base(i) for i in range(len(MARKETS))]
+        assert bases == [table._base(market) for market in MARKETS]
+        assert all(base % shared_book.CACHE_LINE_WORDS == 0 for base in bases)
+        assert bases[-1] + reader.slot_words <= reader._shm.size // 8
+        table.write("SOL-USD-PERP", bids=[(15000, 10)], asks=[(15001, 20)])
+        assert reader.bbo("SOL-USD-PERP") == (15000, 10, 15001, 20)
+        with pytest.raises(ValueError, match="unknown market"):
+            reader.read("DOGE-USD-PERP")
+    finally:
+        reader.close()
+
+
+def test_invalid_tables_are_rejected():
+    with pytest.raises(ValueError, match="at least one market"):
+        SharedBookTable.create([])
+    with pytest.raises(ValueError, match="limited to 32 bytes"):
+        SharedBookTable.create(["X" * 33])
+
+
+def test_slot_left_mid_write_raises_until_repaired(table, monkeypatch):
+    monkeypatch.setattr(shared_book, "WRITER_TIMEOUT", 0.05)
+    table.write("BTC-USD-PERP", bids=[(100, 1)], asks=[(101, 1)])
+    # A writer killed between the two sequence increments
+    table._words[table._base("BTC-USD-PERP")] += 1
+
+    with pytest.raises(ValueError, match="BTC-USD-PERP was left mid-write"):
+        table.read("BTC-USD-PERP")
+    assert table.bbo("ETH-USD-PERP") is None
+
+    assert table.repair() == ["BTC-USD-PERP"]
+    assert table.repair() == []
+    book = table.read("BTC-USD-PERP")
+    assert (book.bids, book.asks, book.sequence) == ([], [], 4)
+    table.write("BTC-USD-PERP", bids=[(100, 2)], asks=[(101, 2)])
+    assert table.bbo("BTC-USD-PERP") == (100, 2, 101, 2)
+
+
+def read_until_published(table_name: str, results) -> None:
+    reader = SharedBookTable.attach(table_name)
+    try:
+        while reader.sequence("BTC-USD-PERP") < 200:
+            book = reader.read("BTC-USD-PERP")
+            if book is not None:
+                # Each write stores price == size == n; a torn read would mix two writes
+                assert {level for pair in book.bids + book.asks for level in pair} == {book.seq_no}
+        results.put(reader.read("BTC-USD-PERP").seq_no)
+    finally:
+        reader.close()
+
+
+def test_readers_in_other_processes_see_consistent_books(table):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    workers = [context.Process(target=read_until_published, args=(table.name, results)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for n in range(1, 101):
+        table.write("BTC-USD-PERP", bids=[(n, n)] * 3, asks=[(n, n)] * 3, seq_no=n)
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+
+    assert [results.get(timeout=5) for _ in workers] == [100, 100]
+    # Exiting readers must not have unlinked the segment
+    SharedBookTable.attach(table.name).close()
@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+import pytest
+
+from paradex_py.account.account import ParadexAccount
+from paradex_py.account.order_hasher import OrderHasher
+from paradex_py.account.utils import (
+    flatten_signature,
+    typed_data_to_message_hash,
+    unflatten_signature,
+    verify_message_signature,
+)
+from paradex_py.common.order import FixedPointOrder, Order, OrderSide, OrderType
+from paradex_py.message.order import build_modify_order_message, build_order_message
+from tests.api.test_account import TEST_L1_ADDRESS, TEST_L2_PRIVATE_KEY
+from tests.mocks.api_client import MockApiClient
+
+CHAIN_ID = 1
+ADDRESS = 0x129C135ED63DF9353885E292BE4426B8ED6122B13C6C0E1BB787288A1F5ADFA
+
+
+def make_order(**kwargs) -> Order:
+    params = {
+        "market": "ETH-USD-PERP",
+        "order_type": OrderType.Limit,
+        "order_side": OrderSide.Buy,
+        "size": Decimal("0.1"),
+        "limit_price": Decimal("1500.25"),
+        "signature_timestamp": 1634736000000,
+    }
+    params.update(kwargs)
+    return Order(**params)
+
+
+@pytest.mark.parametrize(
+    "order",
+    [
+        make_order(),
+        make_order(order_side=OrderSide.Sell, market="BTC-USD-PERP", size=Decimal("12.5")),
+        make_order(order_type=OrderType.Market, limit_price=Decimal(0)),
+        make_order(order_type=OrderType.StopLimit, trigger_price=Decimal(1400)),
+    ],
+)
+def test_order_hash_matches_typed_data(order):
+    hasher = OrderHasher(CHAIN_ID, ADDRESS)
+    expected = typed_data_to_message_hash(build_order_message(CHAIN_ID, order), ADDRESS)
+    assert hasher.order_hash(order) == expected
+
+
+def test_fixed_point_order_hash_matches_typed_data():
+    order = FixedPointOrder(
+        "ETH-USD-PERP", OrderType.Limit, OrderSide.Buy, size="0.1", limit_price="1500.25", signature_timestamp=1
+    )
+    hasher = OrderHasher(CHAIN_ID, ADDRESS)
+    expected = typed_data_to_message_hash(build_order_message(CHAIN_ID, make_order(signature_timestamp=1)), ADDRESS)
+    assert hasher.order_hash(order) == expected
+
+
+def test_modify_order_hash_matches_typed_data():
+    order = make_order(order_id="1681462103821101699438490000")
+    hasher = OrderHasher(CHAIN_ID, ADDRESS)
+    expected = typed_data_to_message_hash(build_modify_order_message(CHAIN_ID, order), ADDRESS)
+    assert hasher.order_hash(order) == expected
+
+
+def test_account_sign_order_signature_is_valid():
+    config = MockApiClient().fetch_system_config()
+    account = ParadexAccount(config=config, l1_address=TEST_L1_ADDRESS, l2_private_key=TEST_L2_PRIVATE_KEY)
+    order = make_order()
+
+    signature = account.sign_order(order)
+
+    # Same signature as the generic typed-data signing path
+    assert signature == flatten_signature(
+        account.starknet.sign_message(build_order_message(account.l2_chain_id, order))
+    )
+    msg_hash = typed_data_to_message_hash(build_order_message(account.l2_chain_id, order), account.l2_address)
+    assert verify_message_signature(msg_hash, unflatten_signature(signature), account.l2_public_key)
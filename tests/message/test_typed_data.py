@@ -0,0 +1,106 @@
+import json
+from decimal import Decimal
+
+import pytest
+from starknet_py.serialization.data_serializers.byte_array_serializer import ByteArraySerializer
+from starknet_py.utils.typed_data import TypedData
+
+from paradex_py.account import typed_data as typed_data_module
+from paradex_py.account.typed_data import compile_typed_data, message_hash
+from paradex_py.common.order import Order, OrderSide, OrderType
+from paradex_py.message.auth import build_auth_message, build_fullnode_message, byte_array_felts
+from paradex_py.message.onboarding import build_onboarding_message
+from paradex_py.message.order import build_modify_order_message, build_order_message
+
+CHAIN_ID = 0x505249564154455F534E5F504F54435F5345504F4C4941
+ADDRESS = 0x129C135ED63DF9353885E292BE4426B8ED6122B13C6C0E1BB787288A1F5ADFA
+
+ORDER = Order(
+    market="ETH-USD-PERP",
+    order_type=OrderType.Limit,
+    order_side=OrderSide.Sell,
+    size=Decimal("0.1"),
+    limit_price=Decimal("1500.25"),
+    signature_timestamp=1634736000000,
+    order_id="1681462103821101699438490000",
+)
+ARRAY_MESSAGE = {
+    "domain": {"name": "Paradex", "chainId": "0x1", "version": "1"},
+    "primaryType": "Batch",
+    "types": {
+        "StarkNetDomain": [
+            {"name": "name", "type": "felt"},
+            {"name": "chainId", "type": "felt"},
+            {"name": "version", "type": "felt"},
+        ],
+        "Batch": [
+            {"name": "ids", "type": "felt*"},
+            {"name": "legs", "type": "Leg*"},
+            {"name": "tag", "type": "string"},
+        ],
+        "Leg": [{"name": "market", "type": "felt"}, {"name": "size", "type": "felt"}],
+    },
+    "message": {
+        "ids": ["0x1", 2, "3"],
+        "legs": [{"market": "BTC-USD-PERP", "size": "100"}, {"market": "ETH-USD-PERP", "size": 5}],
+        "tag": "batch",
+    },
+}
+REVISION_1_MESSAGE = {
+    "domain": {"name": "Paradex", "chainId": "0x1", "version": "1", "revision": "1"},
+    "primaryType": "Request",
+    "types": {
+        "StarknetDomain": [
+            {"name": "name", "type": "shortstring"},
+            {"name": "version", "type": "shortstring"},
+            {"name": "chainId", "type": "shortstring"},
+            {"name": "revision", "type": "shortstring"},
+        ],
+        "Request": [{"name": "method", "type": "shortstring"}, {"name": "amount", "type": "u128"}],
+    },
+    "message": {"method": "POST", "amount": "12"},
+}
+
+
+@pytest.mark.parametrize(
+    "typed_data",
+    [
+        build_auth_message(CHAIN_ID, 1750000000, 1750086400),
+        build_onboarding_message(CHAIN_ID),
+        build_fullnode_message(CHAIN_ID, hex(ADDRESS), json.dumps({"method": "starknet_call"}), 1750000000, "1.0.0"),
+        build_order_message(CHAIN_ID, ORDER),
+        build_modify_order_message(CHAIN_ID, ORDER),
+        ARRAY_MESSAGE,
+        REVISION_1_MESSAGE,
+    ],
+    ids=["auth", "onboarding", "fullnode", "order", "modify_order", "arrays", "revision_1"],
+)
+def test_message_hash_matches_starknet_py(typed_data):
+    expected = TypedData.from_dict(typed_data).message_hash(ADDRESS)
+
+    assert message_hash(typed_data, ADDRESS) == expected
+    # Second call uses the compiled types and domain
+    assert message_hash(typed_data, ADDRESS) == expected
+    assert message_hash(TypedData.from_dict(typed_data), ADDRESS) == expected
+
+
+def test_compiled_once_per_types_and_domain():
+    first = compile_typed_data(build_auth_message(CHAIN_ID, 1, 2))
+    second = compile_typed_data(build_auth_message(CHAIN_ID, 3, 4))
+    other_chain = compile_typed_data(build_auth_message(1, 1, 2))
+
+    assert first is not None
+    assert first is second
+    assert first is not other_chain
+    assert compile_typed_data(REVISION_1_MESSAGE) is None
+    assert len(typed_data_module._COMPILED) <= typed_data_module._MAX_COMPILED
+
+
+@pytest.mark.parametrize("value", ["", "hello", "x" * 31, "y" * 62, json.dumps({"params": ["z" * 40]})])
+def test_byte_array_felts_matches_serializer(value):
+    assert byte_array_felts(value) == list(ByteArraySerializer().serialize(value))
+
+
+def test_byte_array_felts_rejects_non_ascii():
+    with pytest.raises(ValueError, match="ascii"):
+        byte_array_felts("prix €")
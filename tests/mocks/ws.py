@@ -0,0 +1,19 @@
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+
+def frame(channel: str, data: Any) -> str:
+    """JSON-RPC subscription frame as sent by the Paradex WebSocket API."""
+    return json.dumps({"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}})
+
+
+async def wait_for(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    """Poll `predicate` until it is true, failing with `TimeoutError` after `timeout` seconds."""
+
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout)